@@ -42,7 +42,7 @@ from argilla_server.contexts import accounts
 from argilla_server.database import get_async_db
 from argilla_server.logging import configure_logging
 from argilla_server.models import User, Workspace
-from argilla_server.search_engine import get_search_engine
+from argilla_server.search_engine import close_search_engine, get_search_engine, open_search_engine
 from argilla_server.settings import settings
 from argilla_server.static_rewrite import RewriteStaticFiles
 from argilla_server.jobs.queues import REDIS_CONNECTION
@@ -61,6 +61,8 @@ async def app_lifespan(app: FastAPI):
 
     yield
 
+    await close_search_engine()
+
 
 def configure_share_your_progress(app: FastAPI):
     if settings.enable_share_your_progress is False:
@@ -208,7 +210,8 @@ def configure_common_middleware(app: FastAPI):
         allow_headers=["*"],
     )
 
-    app.add_middleware(BrotliMiddleware, minimum_size=512, quality=7)
+    # NOTE: Files are not compressed so range requests and their Content-Range headers refer to the stored bytes
+    app.add_middleware(BrotliMiddleware, minimum_size=512, quality=7, excluded_handlers=[r"/api/v1/file/"])
 
 
 def configure_api_router(app: FastAPI):
@@ -341,6 +344,9 @@ async def configure_search_engine():
         logging.getLogger("opensearch").setLevel(logging.ERROR)
         logging.getLogger("opensearch_transport").setLevel(logging.ERROR)
 
+    # The shared engine instance will be reused by request handlers (and jobs running in the same event loop)
+    await open_search_engine()
+
     @backoff.on_exception(backoff.expo, ConnectionError, max_time=60)
     async def ping_search_engine():
         async for search_engine in get_search_engine():
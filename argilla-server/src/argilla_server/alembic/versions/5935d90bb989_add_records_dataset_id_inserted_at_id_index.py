@@ -0,0 +1,42 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""add records dataset_id inserted_at id index
+
+Revision ID: 5935d90bb989
+Revises: 580a6553186f
+Create Date: 2026-10-17 10:12:41.318204
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5935d90bb989"
+down_revision = "580a6553186f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_records_dataset_id_inserted_at_id",
+        "records",
+        ["dataset_id", "inserted_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_records_dataset_id_inserted_at_id", table_name="records")
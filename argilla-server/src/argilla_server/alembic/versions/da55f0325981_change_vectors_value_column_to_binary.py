@@ -0,0 +1,95 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""change vectors value column to binary
+
+Revision ID: da55f0325981
+Revises: 4cb82c256e57
+Create Date: 2026-10-17 12:40:03.118524
+
+"""
+
+import struct
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "da55f0325981"
+down_revision = "4cb82c256e57"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.add_column("vectors", sa.Column("packed_value", sa.LargeBinary(), nullable=True))
+
+    _convert_values(
+        source_column=sa.column("value", sa.JSON()),
+        target_column=sa.column("packed_value", sa.LargeBinary()),
+        convert=_pack_value,
+    )
+
+    with op.batch_alter_table("vectors") as batch_op:
+        batch_op.drop_column("value")
+        batch_op.alter_column("packed_value", new_column_name="value", nullable=False)
+
+
+def downgrade() -> None:
+    op.add_column("vectors", sa.Column("json_value", sa.JSON(), nullable=True))
+
+    _convert_values(
+        source_column=sa.column("value", sa.LargeBinary()),
+        target_column=sa.column("json_value", sa.JSON()),
+        convert=_unpack_value,
+    )
+
+    with op.batch_alter_table("vectors") as batch_op:
+        batch_op.drop_column("value")
+        batch_op.alter_column("json_value", new_column_name="value", nullable=False)
+
+
+def _convert_values(source_column: sa.ColumnClause, target_column: sa.ColumnClause, convert) -> None:
+    bind = op.get_bind()
+    vectors = sa.table("vectors", sa.column("id", sa.Uuid()), source_column, target_column)
+
+    last_id = None
+    while True:
+        query = sa.select(vectors.c.id, vectors.c.value).order_by(vectors.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(vectors.c.id > last_id)
+
+        rows = bind.execute(query).all()
+        if not rows:
+            return
+
+        bind.execute(
+            vectors.update().where(vectors.c.id == sa.bindparam("vector_id")),
+            [{"vector_id": id, target_column.name: convert(value)} for id, value in rows],
+        )
+
+        last_id = rows[-1][0]
+
+
+def _pack_value(value: list) -> bytes:
+    # NOTE: Same format used by `argilla_server.models.vectors.pack_vector_value` for float32 values
+    return b"f" + struct.pack(f"<{len(value)}f", *value)
+
+
+def _unpack_value(value: bytes) -> list:
+    format, items = value[:1].decode(), value[1:]
+
+    return list(struct.unpack(f"<{len(items) // struct.calcsize(format)}{format}", items))
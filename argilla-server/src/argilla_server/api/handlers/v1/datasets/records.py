@@ -12,13 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 import uuid
 
 from fastapi import APIRouter, Depends, Query, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 import argilla_server.search_engine as search_engine
 from argilla_server.api.policies.v1 import DatasetPolicy, RecordPolicy, authorize, is_authorized
@@ -47,7 +47,7 @@ from argilla_server.api.schemas.v1.suggestions import (
     SuggestionFilterScope,
 )
 from argilla_server.api.handlers.v1.workspaces import list_workspace_users
-from argilla_server.contexts import datasets, search, records
+from argilla_server.contexts import datasets, datasets_schemas, search, records
 from argilla_server.database import get_async_db
 from argilla_server.enums import RecordSortField, SuggestionType
 from argilla_server.errors.future import MissingVectorError, NotFoundError, UnprocessableEntityError
@@ -70,8 +70,9 @@ from argilla_server.search_engine import (
     get_search_engine,
 )
 from argilla_server.security import auth
+from argilla_server.settings import settings
 from argilla_server.telemetry import TelemetryClient, get_telemetry_client
-from argilla_server.utils import parse_query_param, parse_uuids
+from argilla_server.utils import decode_cursor, encode_cursor, parse_query_param, parse_uuids
 
 LIST_DATASET_RECORDS_LIMIT_DEFAULT = 50
 LIST_DATASET_RECORDS_LIMIT_LE = 1000
@@ -134,6 +135,8 @@ async def _get_search_responses(
     offset: int,
     search_records_query: Optional[SearchRecordsQuery] = None,
     user: Optional[User] = None,
+    search_after: Optional[List[Any]] = None,
+    source_vectors_settings: Optional[List[VectorSettings]] = None,
 ) -> "SearchResponses":
     search_records_query = search_records_query or SearchRecordsQuery()
 
@@ -173,6 +176,9 @@ async def _get_search_responses(
     if text_query and text_query.field and not await Field.get_by(db, name=text_query.field, dataset_id=dataset.id):
         raise UnprocessableEntityError(f"Field `{text_query.field}` not found in dataset `{dataset.id}`.")
 
+    if vector_query and search_after is not None:
+        raise UnprocessableEntityError("Cursor pagination is not supported for similarity search.")
+
     if vector_query and vector_settings:
         similarity_search_params = {
             "dataset": dataset,
@@ -190,7 +196,10 @@ async def _get_search_responses(
         if offset >= similarity_search_params["max_results"]:
             return SearchResponses(items=[], total=0)
 
-        responses = await search_engine.similarity_search(**similarity_search_params)
+        if dataset.exact_similarity_search:
+            responses = await search.exact_similarity_search(db, search_engine, **similarity_search_params)
+        else:
+            responses = await search_engine.similarity_search(**similarity_search_params)
         responses.items = responses.items[offset:]
 
         return responses
@@ -210,10 +219,68 @@ async def _get_search_responses(
             search_params["filter"] = _to_search_engine_filter(filters, user=user)
         if sort:
             search_params["sort"] = _to_search_engine_sort(sort, user=user)
+        if search_after is not None:
+            search_params["search_after"] = search_after
+        if source_vectors_settings is not None:
+            search_params["with_source"] = True
+            search_params["source_vectors_settings"] = source_vectors_settings
 
         return await search_engine.search(**search_params)
 
 
+async def _get_source_vectors_settings(
+    dataset: Dataset, include: Optional[RecordIncludeParam]
+) -> Optional[List[VectorSettings]]:
+    """Returns the vectors settings to read from the search engine documents when the search results can be served
+    from them, or `None` if the records must be read from the database."""
+    if not settings.search_engine_records_from_source:
+        return None
+
+    if include is None:
+        return []
+
+    if include.with_responses or include.with_suggestions or include.with_response_suggestions:
+        return None
+
+    if include.with_all_vectors:
+        return await dataset.awaitable_attrs.vectors_settings
+    if include.with_some_vector:
+        return [vs for vs in await dataset.awaitable_attrs.vectors_settings if vs.name in include.vectors]
+
+    return []
+
+
+def _decode_search_records_cursor(
+    cursor: Optional[str], offset: int, sort: Optional[List[Order]]
+) -> Optional[List[Any]]:
+    if cursor is None:
+        return None
+
+    if offset > 0:
+        raise UnprocessableEntityError("`offset` cannot be used together with `cursor`.")
+
+    # NOTE: Cursors have a value for each sort order, or the score when not sorting, followed by the record id
+    values = decode_cursor(cursor, length=len(sort) + 1 if sort else 2)
+    *sort_values, record_id = values
+
+    if not sort and not isinstance(sort_values[0], (int, float)):
+        raise UnprocessableEntityError("Invalid cursor")
+
+    try:
+        UUID(record_id)
+    except (TypeError, ValueError, AttributeError):
+        raise UnprocessableEntityError("Invalid cursor")
+
+    return values
+
+
+def _search_records_next_cursor(search_responses: SearchResponses, limit: int) -> Optional[str]:
+    if len(search_responses.items) < limit or not search_responses.next_search_after:
+        return None
+
+    return encode_cursor(search_responses.next_search_after)
+
+
 async def _validate_search_records_query(db: "AsyncSession", query: SearchRecordsQuery, dataset: Dataset):
     try:
         await search.validate_search_records_query(db, query, dataset)
@@ -288,11 +355,20 @@ async def list_dataset_records(
     include: Optional[RecordIncludeParam] = Depends(parse_record_include_param),
     offset: int = 0,
     limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    cursor: Optional[str] = Query(None, description="The `next_cursor` value returned by the previous page"),
+    include_total: bool = Query(True, description="Whether to compute the total number of records"),
     current_user: User = Security(auth.get_current_user),
 ):
     dataset = await Dataset.get_or_raise(db, dataset_id)
     await authorize(current_user, DatasetPolicy.list_records_with_all_responses(dataset))
 
+    after = None
+    if cursor is not None:
+        if offset > 0:
+            raise UnprocessableEntityError("`offset` cannot be used together with `cursor`.")
+
+        after = _decode_list_records_cursor(cursor)
+
     if include and include.with_response_suggestions:
         workspace_users = await list_workspace_users(
             db=db, workspace_id=dataset.workspace_id, current_user=current_user
@@ -318,10 +394,29 @@ async def list_dataset_records(
         dataset_id=dataset.id,
         offset=offset,
         limit=limit,
+        after=after,
+        with_total=include_total,
         **include_args,
     )
 
-    return Records(items=dataset_records, total=total)
+    result = Records(items=dataset_records)
+    if include_total:
+        result.total = total
+    if len(dataset_records) == limit:
+        last_record = dataset_records[-1]
+        result.next_cursor = encode_cursor([last_record.inserted_at.isoformat(), str(last_record.id)])
+
+    return result
+
+
+def _decode_list_records_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    values = decode_cursor(cursor)
+
+    try:
+        inserted_at, record_id = values
+        return datetime.fromisoformat(inserted_at), UUID(record_id)
+    except (TypeError, ValueError):
+        raise UnprocessableEntityError("Invalid cursor")
 
 
 @router.delete("/datasets/{dataset_id}/records", status_code=status.HTTP_204_NO_CONTENT)
@@ -365,17 +460,10 @@ async def search_current_user_dataset_records(
     include: Optional[RecordIncludeParam] = Depends(parse_record_include_param),
     offset: int = Query(0, ge=0),
     limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    cursor: Optional[str] = Query(None, description="The `next_cursor` value returned by the previous page"),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(
-        db,
-        dataset_id,
-        options=[
-            selectinload(Dataset.fields),
-            selectinload(Dataset.metadata_properties),
-            selectinload(Dataset.questions),
-        ],
-    )
+    dataset = await datasets_schemas.get_dataset_with_schema(db, dataset_id)
 
     if include and include.with_response_suggestions and not current_user.is_annotator:
         workspace_users: UsersSchema = await list_workspace_users(
@@ -389,6 +477,8 @@ async def search_current_user_dataset_records(
 
     await _validate_search_records_query(db, body, dataset)
 
+    source_vectors_settings = await _get_source_vectors_settings(dataset, include)
+
     search_responses = await _get_search_responses(
         db=db,
         search_engine=search_engine,
@@ -397,6 +487,8 @@ async def search_current_user_dataset_records(
         limit=limit,
         offset=offset,
         user=current_user,
+        search_after=_decode_search_records_cursor(cursor, offset, body.sort),
+        source_vectors_settings=source_vectors_settings,
     )
 
     record_id_score_map: Dict[UUID, Dict[str, Union[float, SearchRecord, None]]] = {
@@ -404,31 +496,43 @@ async def search_current_user_dataset_records(
         for response in search_responses.items
     }
 
-    records = await datasets.get_records_by_ids(
-        db=db,
-        dataset_id=dataset_id,
-        records_ids=list(record_id_score_map.keys()),
-        include=include,
-        user_id=current_user.id,
-        workspace_user_ids=workspace_user_ids,
-    )
+    if source_vectors_settings is not None and all(item.record for item in search_responses.items):
+        records = await search.build_records_from_search_items(
+            db, dataset, search_responses.items, source_vectors_settings
+        )
+    else:
+        records = await datasets.get_records_by_ids(
+            db=db,
+            dataset_id=dataset_id,
+            records_ids=list(record_id_score_map.keys()),
+            include=include,
+            user_id=current_user.id,
+            workspace_user_ids=workspace_user_ids,
+        )
 
     if include and include.with_response_suggestions and not current_user.is_annotator:
         records = add_suggestions_from_responses(records, current_user, workspace_users, dataset)
 
     for record in records:
-        record.dataset = dataset
-        record.metadata_ = await _filter_record_metadata_for_user(record, current_user)
+        if not record.is_relationship_loaded("dataset"):
+            record.dataset = dataset
 
+    await _filter_records_metadata_for_user(records, current_user)
+
+    for record in records:
         record_id_score_map[record.id]["search_record"] = SearchRecord(
             record=RecordSchema.model_validate(record),
             query_score=record_id_score_map[record.id]["query_score"],
         )
 
-    return SearchRecordsResult(
+    result = SearchRecordsResult(
         items=[record["search_record"] for record in record_id_score_map.values()],
         total=search_responses.total,
     )
+    if next_cursor := _search_records_next_cursor(search_responses, limit):
+        result.next_cursor = next_cursor
+
+    return result
 
 
 @router.post(
@@ -446,14 +550,17 @@ async def search_dataset_records(
     include: Optional[RecordIncludeParam] = Depends(parse_record_include_param),
     offset: int = Query(0, ge=0),
     limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    cursor: Optional[str] = Query(None, description="The `next_cursor` value returned by the previous page"),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id, options=[selectinload(Dataset.fields)])
+    dataset = await datasets_schemas.get_dataset_with_schema(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.search_records_with_all_responses(dataset))
 
     await _validate_search_records_query(db, body, dataset)
 
+    source_vectors_settings = await _get_source_vectors_settings(dataset, include)
+
     search_responses = await _get_search_responses(
         db=db,
         search_engine=search_engine,
@@ -461,6 +568,8 @@ async def search_dataset_records(
         search_records_query=body,
         limit=limit,
         offset=offset,
+        search_after=_decode_search_records_cursor(cursor, offset, body.sort),
+        source_vectors_settings=source_vectors_settings,
     )
 
     record_id_score_map = {
@@ -468,12 +577,17 @@ async def search_dataset_records(
         for response in search_responses.items
     }
 
-    records = await datasets.get_records_by_ids(
-        db=db,
-        dataset_id=dataset_id,
-        records_ids=list(record_id_score_map.keys()),
-        include=include,
-    )
+    if source_vectors_settings is not None and all(item.record for item in search_responses.items):
+        records = await search.build_records_from_search_items(
+            db, dataset, search_responses.items, source_vectors_settings
+        )
+    else:
+        records = await datasets.get_records_by_ids(
+            db=db,
+            dataset_id=dataset_id,
+            records_ids=list(record_id_score_map.keys()),
+            include=include,
+        )
 
     for record in records:
         record_id_score_map[record.id]["search_record"] = SearchRecord(
@@ -481,10 +595,14 @@ async def search_dataset_records(
             query_score=record_id_score_map[record.id]["query_score"],
         )
 
-    return SearchRecordsResult(
+    result = SearchRecordsResult(
         items=[record["search_record"] for record in record_id_score_map.values()],
         total=search_responses.total,
     )
+    if next_cursor := _search_records_next_cursor(search_responses, limit):
+        result.next_cursor = next_cursor
+
+    return result
 
 
 @router.get(
@@ -515,12 +633,17 @@ async def list_dataset_records_search_suggestions_options(
     )
 
 
-async def _filter_record_metadata_for_user(record: Record, user: User) -> Optional[Dict[str, Any]]:
-    if record.metadata_ is None:
-        return None
+async def _filter_records_metadata_for_user(records: Sequence[Record], user: User) -> None:
+    # NOTE: Records belong to the same dataset, so metadata visibility only depends on the metadata name
+    visible_metadata: Dict[str, bool] = {}
+
+    for record in records:
+        if record.metadata_ is None:
+            continue
+
+        for metadata_name in record.metadata_.keys() - visible_metadata.keys():
+            visible_metadata[metadata_name] = await is_authorized(
+                user, RecordPolicy.get_metadata(record, metadata_name)
+            )
 
-    metadata = {}
-    for metadata_name in list(record.metadata_.keys()):
-        if await is_authorized(user, RecordPolicy.get_metadata(record, metadata_name)):
-            metadata[metadata_name] = record.metadata_[metadata_name]
-    return metadata
+        record.metadata_ = {name: value for name, value in record.metadata_.items() if visible_metadata[name]}
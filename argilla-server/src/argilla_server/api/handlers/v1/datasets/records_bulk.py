@@ -12,20 +12,31 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Security
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from starlette import status
 
 from argilla_server.api.policies.v1 import DatasetPolicy, authorize
-from argilla_server.api.schemas.v1.records_bulk import RecordsBulk, RecordsBulkCreate, RecordsBulkUpsert
+from argilla_server.api.schemas.v1.records import RecordUpsert
+from argilla_server.api.schemas.v1.records_bulk import (
+    RecordsBulk,
+    RecordsBulkCreate,
+    RecordsBulkStreamSummary,
+    RecordsBulkUpsert,
+)
 from argilla_server.bulk.records_bulk import CreateRecordsBulk, UpsertRecordsBulk
+from argilla_server.contexts import datasets_schemas
 from argilla_server.database import get_async_db
-from argilla_server.models import Dataset, User
+from argilla_server.errors.future import UnprocessableEntityError
+from argilla_server.models import User
 from argilla_server.search_engine import SearchEngine, get_search_engine
 from argilla_server.security import auth
+from argilla_server.settings import settings
 
 router = APIRouter()
 
@@ -43,16 +54,7 @@ async def create_dataset_records_bulk(
     search_engine: SearchEngine = Depends(get_search_engine),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(
-        db,
-        dataset_id,
-        options=[
-            selectinload(Dataset.fields),
-            selectinload(Dataset.questions),
-            selectinload(Dataset.metadata_properties),
-            selectinload(Dataset.vectors_settings),
-        ],
-    )
+    dataset = await datasets_schemas.get_dataset_with_schema(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.create_records(dataset))
 
@@ -68,17 +70,69 @@ async def upsert_dataset_records_bulk(
     search_engine: SearchEngine = Depends(get_search_engine),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(
-        db,
-        dataset_id,
-        options=[
-            selectinload(Dataset.fields),
-            selectinload(Dataset.questions),
-            selectinload(Dataset.metadata_properties),
-            selectinload(Dataset.vectors_settings),
-        ],
-    )
+    dataset = await datasets_schemas.get_dataset_with_schema(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.upsert_records(dataset))
 
     return await UpsertRecordsBulk(db, search_engine).upsert_records_bulk(dataset, records_bulk_upsert)
+
+
+@router.put("/datasets/{dataset_id}/records/bulk/stream", response_model=RecordsBulkStreamSummary)
+async def upsert_dataset_records_bulk_stream(
+    *,
+    dataset_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    search_engine: SearchEngine = Depends(get_search_engine),
+    current_user: User = Security(auth.get_current_user),
+):
+    """Upserts the records of a NDJSON request body, with one record per line, without a limit of records."""
+    dataset = await datasets_schemas.get_dataset_with_schema(db, dataset_id)
+
+    await authorize(current_user, DatasetPolicy.upsert_records(dataset))
+
+    return await UpsertRecordsBulk(db, search_engine).upsert_records_bulk_stream(
+        dataset,
+        _records_upsert_from_ndjson(request),
+        chunk_size=settings.records_bulk_stream_chunk_size,
+    )
+
+
+async def _records_upsert_from_ndjson(request: Request) -> AsyncIterator[RecordUpsert]:
+    position, buffer = 0, bytearray()
+    async for data in request.stream():
+        line_start, search_start = 0, len(buffer)
+        buffer += data
+
+        while (line_end := buffer.find(b"\n", search_start)) != -1:
+            line = buffer[line_start:line_end]
+            if line.strip():
+                yield _parse_record_upsert(line, position)
+                position += 1
+
+            line_start = search_start = line_end + 1
+
+        del buffer[:line_start]
+        _validate_line_size(buffer, position)
+
+    if buffer.strip():
+        yield _parse_record_upsert(buffer, position)
+
+
+def _validate_line_size(line: bytearray, position: int) -> None:
+    if len(line) > settings.records_bulk_stream_max_line_size:
+        raise UnprocessableEntityError(
+            f"Record at position {position} is not valid because it is larger than "
+            f"{settings.records_bulk_stream_max_line_size} bytes"
+        )
+
+
+def _parse_record_upsert(line: bytearray, position: int) -> RecordUpsert:
+    _validate_line_size(line, position)
+
+    try:
+        return RecordUpsert.model_validate_json(line)
+    except ValidationError as ex:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", position, *error["loc"])} for error in ex.errors(include_url=False)]
+        ) from ex
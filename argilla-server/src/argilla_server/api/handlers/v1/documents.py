@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 from uuid import UUID
 from typing import TYPE_CHECKING, List, Union
@@ -83,8 +84,8 @@ async def add_document(
 
     if file_data is not None:
         object_path = files.get_pdf_s3_object_path(document_create.id)
-        existing_files = files.list_objects(
-            client, workspace.name, prefix=object_path, include_version=False, recursive=False
+        existing_files = await asyncio.to_thread(
+            files.list_objects, client, workspace.name, prefix=object_path, include_version=False, recursive=False
         )
         # file_data_bytes = base64.b64decode(file_data)
         file_data_bytes = await file_data.read()
@@ -105,7 +106,8 @@ async def add_document(
             put_object = True
 
         if put_object:
-            response = files.put_object(
+            response = await asyncio.to_thread(
+                files.put_object,
                 client,
                 bucket=workspace.name,
                 object=object_path,
@@ -220,7 +222,7 @@ async def delete_documents_by_workspace_id(
     _LOGGER.info(f"Deleting {len(documents)} documents")
     for document in documents:
         object_path = files.get_pdf_s3_object_path(document.id)
-        files.delete_object(client, workspace.name, object_path)
+        await asyncio.to_thread(files.delete_object, client, workspace.name, object_path)
 
     return len(documents)
 
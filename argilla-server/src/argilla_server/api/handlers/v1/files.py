@@ -1,7 +1,8 @@
+import asyncio
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, Security
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Response, UploadFile, Security, status
 from fastapi.responses import StreamingResponse
 from minio import Minio, S3Error
 
@@ -13,39 +14,81 @@ from argilla_server.security import auth
 
 _LOGGER = logging.getLogger("files")
 
+# NOTE: Objects can be replaced by new versions, so clients must revalidate them using the ETag
+FILE_CACHE_CONTROL = "private, no-cache"
+
 router = APIRouter(tags=["files"])
 
 @router.get("/file/{bucket}/{object:path}")
 async def get_file(
     *,
-    bucket: str, 
-    object: str, 
+    bucket: str,
+    object: str,
     version_id: Optional[str] = None,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_none_match: Optional[str] = Header(None),
     client: Minio = Depends(files.get_minio_client),
-    current_user: Optional[User] = Security(auth.get_optional_current_user)
-    ):
-
+    current_user: Optional[User] = Security(auth.get_optional_current_user),
+):
     # TODO Check if the current user is in the workspace to have access to the s3 bucket of the same name
     # if current_user is not None or current_user.role != "owner":
     #     await authorize(current_user, FilePolicy.get(bucket))
 
     try:
-        file_response = files.get_object(client, bucket, object, version_id=version_id, include_versions=True)
+        stat = await asyncio.to_thread(files.stat_object, client, bucket, object, version_id=version_id)
+
+        cache_headers = {"Cache-Control": FILE_CACHE_CONTROL, "Accept-Ranges": "bytes"}
+        if stat.etag:
+            cache_headers["ETag"] = stat.etag
+
+        if if_none_match and _etag_matches(if_none_match, stat.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+        byte_range = _parse_byte_range(range_header, stat.size)
+        if byte_range is None:
+            offset, length = 0, 0
+        else:
+            offset, length = byte_range[0], byte_range[1] - byte_range[0] + 1
+
+        # NOTE: Versions are only listed for whole downloads of versioned objects, ranges are requested by viewers
+        file_response = await asyncio.to_thread(
+            files.get_object,
+            client,
+            bucket,
+            object,
+            include_versions=byte_range is None and files.is_versioned_object(object),
+            offset=offset,
+            length=length,
+            stat=stat,
+        )
+
+        headers = {**file_response.http_headers, **cache_headers}
+        if byte_range is None:
+            status_code = status.HTTP_200_OK
+            if stat.size is not None:
+                headers["Content-Length"] = str(stat.size)
+        else:
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            headers["Content-Range"] = f"bytes {byte_range[0]}-{byte_range[1]}/{stat.size}"
+            headers["Content-Length"] = str(length)
 
         return StreamingResponse(
-            file_response.response, 
-            media_type=file_response.metadata.content_type, 
-            headers=file_response.http_headers
+            files.iter_object(file_response.response),
+            status_code=status_code,
+            media_type=file_response.metadata.content_type,
+            headers=headers,
         )
+    except HTTPException:
+        raise
     except S3Error as se:
         _LOGGER.error(f"Error getting object '{bucket}/{object}': {se}")
         raise HTTPException(status_code=404, detail=f"No object at path '{object}' was found") from se
-    
+
     except Exception as e:
         _LOGGER.error(f"Error getting object '{bucket}/{object}': {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-    
+
 @router.post("/file/{bucket}/{object:path}", response_model=ObjectMetadata)
 async def put_file(
     *,
@@ -60,8 +103,9 @@ async def put_file(
     await authorize(current_user, FilePolicy.put_object(bucket))
     
     try:
-        response = files.put_object(client, bucket, object, 
-                                    data=file.file, size=file.size, content_type=file.content_type)
+        response = await asyncio.to_thread(
+            files.put_object, client, bucket, object, data=file.file, size=file.size, content_type=file.content_type
+        )
         return response
     except S3Error as se:
         raise HTTPException(status_code=500, detail=f"Internal server error: {se.message}") from se
@@ -82,7 +126,15 @@ async def list_objects(
     await authorize(current_user, FilePolicy.list(bucket))
 
     try:
-        objects = files.list_objects(client, bucket, prefix=prefix, include_version=include_version, recursive=recursive, start_after=start_after)
+        objects = await asyncio.to_thread(
+            files.list_objects,
+            client,
+            bucket,
+            prefix=prefix,
+            include_version=include_version,
+            recursive=recursive,
+            start_after=start_after,
+        )
         return objects
     except S3Error as se:
         _LOGGER.error(f"Error listing objects in '{bucket}/{prefix}': {se}")
@@ -109,10 +161,52 @@ async def delete_files(
     await authorize(current_user, FilePolicy.delete(bucket))
 
     try:
-        files.delete_object(client, bucket, object, version_id=version_id)
+        await asyncio.to_thread(files.delete_object, client, bucket, object, version_id=version_id)
         return {"message": "File deleted"}
     except S3Error as se:
         raise HTTPException(status_code=500, detail="Internal server error") from se
     except Exception as e:
         raise e
 
+
+def _etag_matches(if_none_match: str, etag: Optional[str]) -> bool:
+    if not etag:
+        return False
+
+    for value in if_none_match.split(","):
+        value = value.strip()
+        if value == "*" or value.removeprefix("W/").strip('"') == etag.strip('"'):
+            return True
+
+    return False
+
+
+def _parse_byte_range(range_header: Optional[str], size: Optional[int]) -> Optional[Tuple[int, int]]:
+    """Returns the first and last bytes positions of a single `bytes` range, or `None` to send the whole object.
+
+    Multiple ranges and other units are not supported, so the whole object is sent for them.
+    """
+    if not range_header or size is None:
+        return None
+
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    start, _, end = ranges.strip().partition("-")
+    try:
+        if start:
+            first, last = int(start), int(end) if end else size - 1
+        else:
+            first, last = max(size - int(end), 0), size - 1
+    except ValueError:
+        return None
+
+    if first > last or first >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail=f"Range '{range_header}' is not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+
+    return first, min(last, size - 1)
@@ -21,6 +21,7 @@ from argilla_server.contexts import accounts
 from argilla_server.database import get_async_db
 from argilla_server.errors.future import NotFoundError
 from argilla_server.models import Workspace, WorkspaceUser
+from argilla_server.models.memberships import expire_workspace_memberships
 from argilla_server.security.authentication.oauth2 import OAuth2ClientProvider
 from argilla_server.security.authentication.userinfo import UserInfo
 from argilla_server.security.settings import settings
@@ -107,5 +108,6 @@ async def get_access_token(
                     autocommit=False,
                 )
         await db.commit()
+        expire_workspace_memberships(user_id=oauth_user.id)
 
     return Token(access_token=accounts.generate_user_token(oauth_user))
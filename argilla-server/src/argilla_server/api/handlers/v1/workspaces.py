@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from uuid import UUID
 from typing import Union
 
@@ -63,7 +64,7 @@ async def create_workspace(
     await authorize(current_user, WorkspacePolicy.create)
 
     try:
-        files.create_bucket(minio_client, workspace_create.name)
+        await asyncio.to_thread(files.create_bucket, minio_client, workspace_create.name)
     except Exception as e:
         raise GenericServerError(e)
 
@@ -91,7 +92,7 @@ async def delete_workspace(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
     try:
-        await files.delete_bucket(minio_client, workspace.name)
+        await asyncio.to_thread(files.delete_bucket, minio_client, workspace.name)
     except Exception as e:
         # Log the error but continue with workspace deletion
         print(f"Error deleting bucket for workspace {workspace.name}: {str(e)}")
@@ -122,6 +122,7 @@ class Dataset(BaseModel):
     name: str
     guidelines: Optional[str] = None
     allow_extra_metadata: bool
+    exact_similarity_search: bool
     status: DatasetStatus
     distribution: DatasetDistribution
     metadata: Optional[Dict[str, Any]] = None
@@ -152,6 +153,7 @@ class DatasetCreate(BaseModel):
     name: DatasetName
     guidelines: Optional[DatasetGuidelines] = None
     allow_extra_metadata: bool = True
+    exact_similarity_search: bool = False
     distribution: DatasetDistributionCreate = DatasetOverlapDistributionCreate(
         strategy=DatasetDistributionStrategy.overlap,
         min_submitted=1,
@@ -164,10 +166,11 @@ class DatasetUpdate(UpdateSchema):
     name: Optional[DatasetName] = None
     guidelines: Optional[DatasetGuidelines] = None
     allow_extra_metadata: Optional[bool] = None
+    exact_similarity_search: Optional[bool] = None
     distribution: Optional[DatasetDistributionUpdate] = None
     metadata_: Optional[Dict[str, Any]] = Field(None, alias="metadata")
 
-    __non_nullable_fields__ = {"name", "allow_extra_metadata", "distribution"}
+    __non_nullable_fields__ = {"name", "allow_extra_metadata", "exact_similarity_search", "distribution"}
 
 
 class HubDatasetMappingItem(BaseModel):
@@ -275,6 +275,7 @@ class Records(BaseModel):
     items: List[Record]
     # TODO(@frascuchon): Make it required once fetch records without metadata filter computes also the total
     total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class RecordsCreate(BaseModel):
@@ -394,3 +395,4 @@ class SearchRecord(BaseModel):
 class SearchRecordsResult(BaseModel):
     items: List[SearchRecord]
     total: int = 0
+    next_cursor: Optional[str] = None
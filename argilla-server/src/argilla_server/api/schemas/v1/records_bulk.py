@@ -18,12 +18,12 @@ from uuid import UUID
 from pydantic import BaseModel, Field, field_validator
 
 from argilla_server.api.schemas.v1.records import Record, RecordCreate, RecordUpsert
+from argilla_server.constants import RECORDS_BULK_UPSERT_MAX_ITEMS
 
 RECORDS_BULK_CREATE_MIN_ITEMS = 1
 RECORDS_BULK_CREATE_MAX_ITEMS = 500
 
 RECORDS_BULK_UPSERT_MIN_ITEMS = 1
-RECORDS_BULK_UPSERT_MAX_ITEMS = 500
 
 
 class RecordsBulk(BaseModel):
@@ -34,6 +34,11 @@ class RecordsBulkWithUpdatedItemIds(RecordsBulk):
     updated_item_ids: List[UUID]
 
 
+class RecordsBulkStreamSummary(BaseModel):
+    created_items: int
+    updated_items: int
+
+
 class RecordsBulkCreate(BaseModel):
     items: List[RecordCreate] = Field(
         ..., min_length=RECORDS_BULK_CREATE_MIN_ITEMS, max_length=RECORDS_BULK_CREATE_MAX_ITEMS
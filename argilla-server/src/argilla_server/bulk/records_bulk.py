@@ -12,40 +12,52 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Sequence, Tuple, Union
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
 from uuid import UUID
 
 from datetime import UTC
 from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from argilla_server.api.schemas.v1.records import RecordCreate, RecordUpsert
 from argilla_server.api.schemas.v1.records_bulk import (
     RecordsBulk,
     RecordsBulkCreate,
+    RecordsBulkStreamSummary,
     RecordsBulkUpsert,
     RecordsBulkWithUpdatedItemIds,
 )
 from argilla_server.api.schemas.v1.responses import UserResponseCreate
 from argilla_server.api.schemas.v1.suggestions import SuggestionCreate
-from argilla_server.models.database import DatasetUser
-from argilla_server.webhooks.v1.enums import RecordEvent
-from argilla_server.webhooks.v1.records import notify_record_event as notify_record_event_v1
-from argilla_server.contexts import distribution
+from argilla_server.contexts import datasets_progress, distribution, search
 from argilla_server.contexts.records import (
     fetch_records_by_external_ids_as_dict,
     fetch_records_by_ids_as_dict,
 )
+from argilla_server.enums import ResponseStatus
 from argilla_server.errors.future import UnprocessableEntityError
 from argilla_server.models import Dataset, Record, Response, Suggestion, Vector
 from argilla_server.models.database import DatasetUser
 from argilla_server.search_engine import SearchEngine
-from argilla_server.validators.records import RecordsBulkCreateValidator, RecordUpsertValidator
-from argilla_server.webhooks.v1.enums import RecordEvent
-from argilla_server.webhooks.v1.records import notify_record_event as notify_record_event_v1
+from argilla_server.validators.records import (
+    RecordsBulkCreateValidator,
+    RecordsValidationPlan,
+    RecordUpsertValidator,
+)
+from argilla_server.webhooks.v1.enums import RecordBulkEvent, RecordEvent
+from argilla_server.webhooks.v1.records import (
+    notify_record_bulk_event as notify_record_bulk_event_v1,
+    notify_record_events as notify_record_events_v1,
+)
+
+T = TypeVar("T")
 
 
 class CreateRecordsBulk:
@@ -68,29 +80,41 @@ class CreateRecordsBulk:
 
         self._db.add_all(records)
         await self._db.flush(records)
-        await self._upsert_records_relationships(records, bulk_create.items)
+        vectors = await self._upsert_records_relationships(records, bulk_create.items, created_records=records)
         await distribution.unsafe_update_records_status(self._db, records)
 
         await self._db.commit()
 
-        await _preload_records_relationships_before_index(self._db, records)
+        await search.upsert_vectors_matrices(dataset, vectors)
+        _set_records_relationships_targets(dataset, records)
         await self._search_engine.index_records(dataset, records)
+        datasets_progress.expire_dataset_progress(dataset.id)
 
-        for record in records:
-            await notify_record_event_v1(self._db, RecordEvent.created, record)
+        await notify_record_events_v1(self._db, RecordEvent.created, records)
+        await notify_record_bulk_event_v1(self._db, RecordBulkEvent.created, dataset, records)
 
         return RecordsBulk(items=records)
 
-    async def _upsert_records_relationships(self, records: List[Record], records_create: List[RecordCreate]) -> None:
+    async def _upsert_records_relationships(
+        self,
+        records: List[Record],
+        records_create: List[RecordCreate],
+        created_records: List[Record],
+    ) -> List[Vector]:
+        """Upserts the suggestions, vectors and responses of the records, returning the upserted vectors."""
         records_and_suggestions = list(zip(records, [r.suggestions for r in records_create]))
         records_and_responses = list(zip(records, [r.responses for r in records_create]))
         records_and_vectors = list(zip(records, [r.vectors for r in records_create]))
         # The asyncio.gather version is replaced by the following three await calls to avoid the following error:
         # https://github.com/sqlalchemy/sqlalchemy/discussions/9312
 
-        await self._upsert_records_suggestions(records_and_suggestions)
-        await self._upsert_records_vectors(records_and_vectors)
-        await self._upsert_records_responses(records_and_responses)
+        suggestions = await self._upsert_records_suggestions(records_and_suggestions)
+        vectors = await self._upsert_records_vectors(records_and_vectors)
+        responses = await self._upsert_records_responses(records_and_responses)
+
+        _set_created_records_relationships(created_records, responses, suggestions, vectors)
+
+        return vectors
 
     async def _upsert_records_suggestions(
         self, records_and_suggestions: List[Tuple[Record, List[SuggestionCreate]]]
@@ -163,14 +187,79 @@ class UpsertRecordsBulk(CreateRecordsBulk):
     async def upsert_records_bulk(
         self, dataset: Dataset, bulk_upsert: RecordsBulkUpsert, raise_on_error: bool = True
     ) -> RecordsBulkWithUpdatedItemIds:
-        found_records = await self._fetch_existing_dataset_records(dataset, bulk_upsert.items)
+        records, found_records = await self._write_records(dataset, bulk_upsert.items, raise_on_error)
+
+        await self._search_engine.index_records(dataset, records)
+        datasets_progress.expire_dataset_progress(dataset.id)
 
-        records = []
-        for idx, record_upsert in enumerate(bulk_upsert.items):
+        await self._notify_upsert_record_events(dataset, records)
+
+        return RecordsBulkWithUpdatedItemIds(
+            items=records,
+            updated_item_ids=[record.id for record in found_records.values()],
+        )
+
+    async def upsert_records_bulk_stream(
+        self, dataset: Dataset, records_upsert: AsyncIterable[RecordUpsert], chunk_size: int
+    ) -> RecordsBulkStreamSummary:
+        """Upserts the records in chunks of `chunk_size` records, indexing each chunk while the next one is written
+        to the database, so only a couple of chunks are kept in memory at once.
+
+        Every chunk is committed on its own, so the chunks before an invalid one are kept.
+        """
+        created_items, updated_items = 0, 0
+        indexing: Optional[Tuple[List[Record], asyncio.Task]] = None
+
+        try:
+            async for position, items in _chunked(records_upsert, chunk_size):
+                try:
+                    bulk_upsert = RecordsBulkUpsert(items=items)
+                except ValidationError as ex:
+                    raise UnprocessableEntityError(
+                        f"Records from position {position} to {position + len(items) - 1} are not valid because "
+                        f"{ex.errors()[0]['msg']}"
+                    ) from ex
+
+                records, found_records = await self._write_records(dataset, bulk_upsert.items, position=position)
+                found_records_ids = {record.id for record in found_records.values()}
+                updated_records_count = sum(1 for record in records if record.id in found_records_ids)
+                created_items += len(records) - updated_records_count
+                updated_items += updated_records_count
+
+                # NOTE: Records being indexed are detached so the next chunks don't load or change the same instances
+                for record in records:
+                    self._db.expunge(record)
+
+                # NOTE: Indexing requests are sent one after the other so a stale document never overwrites a newer one
+                if indexing is not None:
+                    previous_indexing, indexing = indexing, None
+                    await self._finish_records_indexing(dataset, *previous_indexing)
+
+                indexing = (records, asyncio.create_task(self._search_engine.index_records(dataset, records)))
+        finally:
+            if indexing is not None:
+                await self._finish_records_indexing(dataset, *indexing)
+
+        return RecordsBulkStreamSummary(created_items=created_items, updated_items=updated_items)
+
+    async def _write_records(
+        self,
+        dataset: Dataset,
+        records_upsert: List[RecordUpsert],
+        raise_on_error: bool = True,
+        position: int = 0,
+    ) -> Tuple[List[Record], Dict[Union[str, UUID], Record]]:
+        """Validates and upserts the records with their relationships, committing them and leaving every relationship
+        needed to index them loaded."""
+        found_records = await self._fetch_existing_dataset_records(dataset, records_upsert)
+        validation_plan = await RecordsValidationPlan.compile_for_bulk(self._db, dataset, records_upsert)
+
+        records, valid_records_upsert, created_records = [], [], []
+        for idx, record_upsert in enumerate(records_upsert, start=position):
             record = found_records.get(record_upsert.id) or found_records.get(record_upsert.external_id)
 
             try:
-                await RecordUpsertValidator.validate(record_upsert, dataset, record)
+                await RecordUpsertValidator.validate(record_upsert, dataset, record, validation_plan)
             except Exception as ex:
                 if raise_on_error:
                     raise UnprocessableEntityError(f"Record at position {idx} is not valid because {ex}") from ex
@@ -185,6 +274,7 @@ class UpsertRecordsBulk(CreateRecordsBulk):
                     external_id=record_upsert.external_id,
                     dataset_id=dataset.id,
                 )
+                created_records.append(record)
             else:
                 if record_upsert.is_set("metadata"):
                     record.metadata_ = record_upsert.metadata
@@ -195,23 +285,38 @@ class UpsertRecordsBulk(CreateRecordsBulk):
                     record.updated_at = datetime.utcnow()
 
             records.append(record)
+            valid_records_upsert.append(record_upsert)
 
         self._db.add_all(records)
         await self._db.flush(records)
-        await self._upsert_records_relationships(records, bulk_upsert.items)
+        vectors = await self._upsert_records_relationships(records, valid_records_upsert, created_records)
         await distribution.unsafe_update_records_status(self._db, records)
 
         await self._db.commit()
 
-        await _preload_records_relationships_before_index(self._db, records)
-        await self._search_engine.index_records(dataset, records)
-
-        await self._notify_upsert_record_events(records)
+        # NOTE: Vectors matrices are only changed once the vectors are committed
+        await search.upsert_vectors_matrices(dataset, vectors)
 
-        return RecordsBulkWithUpdatedItemIds(
-            items=records,
-            updated_item_ids=[record.id for record in found_records.values()],
+        # NOTE: Relationships of created records are already set, existing records can have others not in the bulk
+        created_records_ids = {record.id for record in created_records}
+        await _preload_records_relationships_before_index(
+            self._db, [record for record in records if record.id not in created_records_ids]
         )
+        _set_records_relationships_targets(dataset, records)
+
+        return records, found_records
+
+    async def _finish_records_indexing(self, dataset: Dataset, records: List[Record], task: asyncio.Task) -> None:
+        await task
+
+        # NOTE: A failed write of the next chunk must be rolled back before notifying the events of this one
+        if not self._db.is_active:
+            await self._db.rollback()
+            await self._db.refresh(dataset)
+
+        datasets_progress.expire_dataset_progress(dataset.id)
+
+        await self._notify_upsert_record_events(dataset, records)
 
     async def _fetch_existing_dataset_records(
         self,
@@ -227,15 +332,78 @@ class UpsertRecordsBulk(CreateRecordsBulk):
 
         return {**records_by_external_id, **records_by_id}
 
-    async def _notify_upsert_record_events(self, records: List[Record]) -> None:
-        for record in records:
-            if record.inserted_at == record.updated_at:
-                await notify_record_event_v1(self._db, RecordEvent.created, record)
-            else:
-                await notify_record_event_v1(self._db, RecordEvent.updated, record)
+    async def _notify_upsert_record_events(self, dataset: Dataset, records: List[Record]) -> None:
+        created_records = [record for record in records if record.inserted_at == record.updated_at]
+        updated_records = [record for record in records if record.inserted_at != record.updated_at]
+
+        await notify_record_events_v1(self._db, RecordEvent.created, created_records)
+        await notify_record_events_v1(self._db, RecordEvent.updated, updated_records)
+        await notify_record_bulk_event_v1(self._db, RecordBulkEvent.created, dataset, created_records)
+        await notify_record_bulk_event_v1(self._db, RecordBulkEvent.updated, dataset, updated_records)
+
+
+def _set_created_records_relationships(
+    records: List[Record],
+    responses: List[Response],
+    suggestions: List[Suggestion],
+    vectors: List[Vector],
+) -> None:
+    """Sets the relationships of records created by a bulk from the upserted rows, so they are not selected again
+    before indexing them."""
+    responses_by_record_id, suggestions_by_record_id, vectors_by_record_id = (
+        defaultdict(list),
+        defaultdict(list),
+        defaultdict(list),
+    )
+    for response in responses:
+        responses_by_record_id[response.record_id].append(response)
+    for suggestion in suggestions:
+        suggestions_by_record_id[suggestion.record_id].append(suggestion)
+    for vector in vectors:
+        vectors_by_record_id[vector.record_id].append(vector)
+
+    for record in records:
+        record_responses = responses_by_record_id[record.id]
+
+        set_committed_value(record, "responses", record_responses)
+        set_committed_value(
+            record,
+            "responses_submitted",
+            [response for response in record_responses if response.status == ResponseStatus.submitted],
+        )
+        set_committed_value(record, "suggestions", suggestions_by_record_id[record.id])
+        set_committed_value(record, "vectors", vectors_by_record_id[record.id])
+
+
+def _set_records_relationships_targets(dataset: Dataset, records: List[Record]) -> None:
+    # NOTE: Dataset schema instances are already loaded, so they are set instead of lazy loaded by the search engine
+    vectors_settings_by_id = {vector_settings.id: vector_settings for vector_settings in dataset.vectors_settings}
+
+    for record in records:
+        set_committed_value(record, "dataset", dataset)
+
+        for suggestion in record.suggestions:
+            set_committed_value(suggestion, "question", dataset.question_by_id(suggestion.question_id))
+        for vector in record.vectors:
+            set_committed_value(vector, "vector_settings", vectors_settings_by_id.get(vector.vector_settings_id))
+
+
+async def _chunked(items: AsyncIterable[T], chunk_size: int) -> AsyncIterator[Tuple[int, List[T]]]:
+    position, chunk = 0, []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield position, chunk
+            position, chunk = position + len(chunk), []
+
+    if chunk:
+        yield position, chunk
 
 
 async def _preload_records_relationships_before_index(db: "AsyncSession", records: Sequence[Record]) -> None:
+    if not records:
+        return
+
     await db.execute(
         select(Record)
         .filter(Record.id.in_([record.id for record in records]))
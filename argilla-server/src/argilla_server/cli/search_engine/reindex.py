@@ -12,12 +12,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import asyncio
-from typing import AsyncGenerator, List, Optional
+from datetime import datetime
+from typing import AsyncGenerator, AsyncIterator, List, Optional, Set
 from uuid import UUID
 
 import typer
 from rich.progress import Progress
-from sqlalchemy import func, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -27,13 +28,15 @@ from argilla_server.database import AsyncSessionLocal
 from argilla_server.models import Dataset, Record, Response, Suggestion
 from argilla_server.search_engine import SearchEngine, get_search_engine
 
+DEFAULT_NUM_WORKERS = 2
+
 
 class Reindexer:
     YIELD_PER = 100
 
     @classmethod
-    async def reindex_dataset(cls, db: AsyncSession, search_engine: SearchEngine, dataset_id: UUID) -> Dataset:
-        dataset = (
+    async def get_dataset(cls, db: AsyncSession, dataset_id: UUID) -> Dataset:
+        return (
             await db.execute(
                 select(Dataset)
                 .filter_by(id=dataset_id)
@@ -46,39 +49,76 @@ class Reindexer:
             )
         ).scalar_one()
 
-        await search_engine.delete_index(dataset)
-        await search_engine.create_index(dataset)
+    @classmethod
+    async def list_dataset_ids(cls, db: AsyncSession) -> List[UUID]:
+        return (await db.execute(select(Dataset.id).order_by(Dataset.inserted_at.asc()))).scalars().all()
+
+    @classmethod
+    async def reindex_dataset_records(
+        cls, db: AsyncSession, search_engine: SearchEngine, dataset: Dataset
+    ) -> AsyncGenerator[List[Record], None]:
+        updated_since = datetime.utcnow()
+
+        # Records are indexed into a new index which replaces the live one once all of them have been indexed,
+        # so the dataset can be searched during the whole reindex process.
+        async with search_engine.shadow_index(dataset) as index_name:
+            async for records in cls._index_records_stream(
+                search_engine, dataset, cls._stream_dataset_records(db, dataset), index_name
+            ):
+                yield records
+
+            if index_name is not None:
+                # Changes made while the new index was populated only reached the live index, so updated records are
+                # indexed again and deleted records are removed from the new index before it replaces the live one
+                catch_up_started_at = datetime.utcnow()
+                updated_records_stream = cls._stream_dataset_records(db, dataset, updated_since=updated_since)
+                async for _ in cls._index_records_stream(search_engine, dataset, updated_records_stream, index_name):
+                    pass
+
+                updated_since = catch_up_started_at
+                await search_engine.delete_records_not_in(
+                    dataset, await cls.list_dataset_record_ids(db, dataset), index_name=index_name
+                )
 
-        return dataset
+        # Records updated until the new index replaced the live one are indexed again, now into the live index
+        updated_records_stream = cls._stream_dataset_records(db, dataset, updated_since=updated_since)
+        async for _ in cls._index_records_stream(search_engine, dataset, updated_records_stream):
+            pass
 
     @classmethod
-    async def reindex_datasets(cls, db: AsyncSession, search_engine: SearchEngine) -> AsyncGenerator[Dataset, None]:
-        stream = await db.stream(
-            select(Dataset)
-            .order_by(Dataset.inserted_at.asc())
-            .options(
-                selectinload(Dataset.fields),
-                selectinload(Dataset.questions),
-                selectinload(Dataset.metadata_properties),
-                selectinload(Dataset.vectors_settings),
-            )
-            .execution_options(yield_per=cls.YIELD_PER)
-        )
+    async def list_dataset_record_ids(cls, db: AsyncSession, dataset: Dataset) -> Set[UUID]:
+        return set((await db.execute(select(Record.id).filter_by(dataset_id=dataset.id))).scalars().all())
+
+    @classmethod
+    async def count_datasets(cls, db: AsyncSession) -> int:
+        return (await db.execute(select(func.count(Dataset.id)))).scalar_one()
 
-        async for dataset in stream.scalars():
-            await search_engine.delete_index(dataset)
-            await search_engine.create_index(dataset)
+    @classmethod
+    async def count_dataset_records(cls, db: AsyncSession, dataset: Dataset) -> int:
+        return (await db.execute(select(func.count(Record.id)).filter_by(dataset_id=dataset.id))).scalar_one()
 
-            yield dataset
+    @classmethod
+    async def get_all_index_names(cls, search_engine: SearchEngine) -> List[str]:
+        index_names = await search_engine.get_all_index_names()
+        return index_names
 
     @classmethod
-    async def reindex_dataset_records(
-        cls, db: AsyncSession, search_engine: SearchEngine, dataset: Dataset
-    ) -> AsyncGenerator[list[Record], None]:
+    async def _stream_dataset_records(
+        cls, db: AsyncSession, dataset: Dataset, updated_since: Optional[datetime] = None
+    ) -> AsyncGenerator[List[Record], None]:
+        query = select(Record).filter_by(dataset_id=dataset.id)
+
+        if updated_since is not None:
+            query = query.where(
+                or_(
+                    Record.updated_at >= updated_since,
+                    Record.id.in_(select(Response.record_id).where(Response.updated_at >= updated_since)),
+                    Record.id.in_(select(Suggestion.record_id).where(Suggestion.updated_at >= updated_since)),
+                )
+            )
+
         stream = await db.stream(
-            select(Record)
-            .filter_by(dataset_id=dataset.id)
-            .order_by(Record.inserted_at.asc())
+            query.order_by(Record.inserted_at.asc())
             .options(
                 selectinload(Record.responses).selectinload(Response.user),
                 selectinload(Record.suggestions).selectinload(Suggestion.question),
@@ -88,29 +128,41 @@ class Reindexer:
         )
 
         async for records_partition in stream.partitions():
-            records = [record for (record,) in records_partition]
+            yield [record for (record,) in records_partition]
 
-            await search_engine.index_records(dataset, records)
+    @classmethod
+    async def _index_records_stream(
+        cls,
+        search_engine: SearchEngine,
+        dataset: Dataset,
+        records_stream: AsyncIterator[List[Record]],
+        index_name: Optional[str] = None,
+    ) -> AsyncGenerator[List[Record], None]:
+        # Each partition is indexed while the next one is fetched from the database
+        indexing_task, indexing_records = None, None
 
-            yield records
+        try:
+            async for records in records_stream:
+                if indexing_task is not None:
+                    await indexing_task
+                    yield indexing_records
 
-    @classmethod
-    async def count_datasets(cls, db: AsyncSession) -> int:
-        return (await db.execute(select(func.count(Dataset.id)))).scalar_one()
+                indexing_task = asyncio.create_task(
+                    search_engine.index_records(dataset, records, index_name=index_name)
+                )
+                indexing_records = records
 
-    @classmethod
-    async def count_dataset_records(cls, db: AsyncSession, dataset: Dataset) -> int:
-        return (await db.execute(select(func.count(Record.id)).filter_by(dataset_id=dataset.id))).scalar_one()
-    
-    @classmethod
-    async def get_all_index_names(cls, search_engine: SearchEngine) -> List[str]:
-        index_names = await search_engine.get_all_index_names()
-        return index_names
+            if indexing_task is not None:
+                await indexing_task
+                yield indexing_records
+        finally:
+            if indexing_task is not None and not indexing_task.done():
+                indexing_task.cancel()
 
 
 async def _reindex_dataset(db: AsyncSession, search_engine: SearchEngine, progress: Progress, dataset_id: UUID) -> None:
     try:
-        dataset = await Reindexer.reindex_dataset(db, search_engine, dataset_id)
+        dataset = await Reindexer.get_dataset(db, dataset_id)
     except NoResultFound as e:
         echo_in_panel(
             f"Dataset with id={dataset_id} not found.",
@@ -128,21 +180,36 @@ async def _reindex_dataset(db: AsyncSession, search_engine: SearchEngine, progre
     progress.advance(task)
 
 
-async def _reindex_datasets(db: AsyncSession, search_engine: SearchEngine, progress: Progress) -> None:
-    task = progress.add_task("reindexing datasets...", total=await Reindexer.count_datasets(db))
+async def _reindex_datasets(search_engine: SearchEngine, progress: Progress, num_workers: int) -> None:
+    async with AsyncSessionLocal() as db:
+        dataset_ids = await Reindexer.list_dataset_ids(db)
 
-    async for dataset in Reindexer.reindex_datasets(db, search_engine):
-        try:
-            await _reindex_dataset_records(db, search_engine, progress, dataset)
-        except Exception as e:
-            echo_in_panel(
-                f"Failed to reindex dataset `{dataset.name}`: {str(e)}",
-                title="Reindexing Error",
-                title_align="left",
-                success=False,
-            )
-        finally:
-            progress.advance(task)
+    task = progress.add_task("reindexing datasets...", total=len(dataset_ids))
+
+    pending_dataset_ids = asyncio.Queue()
+    for dataset_id in dataset_ids:
+        pending_dataset_ids.put_nowait(dataset_id)
+
+    async def reindex_worker() -> None:
+        # Every worker uses its own session because sessions cannot be shared between concurrent tasks
+        async with AsyncSessionLocal() as db:
+            while not pending_dataset_ids.empty():
+                dataset_id = pending_dataset_ids.get_nowait()
+
+                try:
+                    dataset = await Reindexer.get_dataset(db, dataset_id)
+                    await _reindex_dataset_records(db, search_engine, progress, dataset)
+                except Exception as e:
+                    echo_in_panel(
+                        f"Failed to reindex dataset with id={dataset_id}: {str(e)}",
+                        title="Reindexing Error",
+                        title_align="left",
+                        success=False,
+                    )
+                finally:
+                    progress.advance(task)
+
+    await asyncio.gather(*[reindex_worker() for _ in range(max(num_workers, 1))])
 
 
 async def _reindex_dataset_records(
@@ -157,14 +224,14 @@ async def _reindex_dataset_records(
         progress.advance(task, advance=len(records))
 
 
-async def _reindex(dataset_id: Optional[UUID] = None) -> None:
-    async with AsyncSessionLocal() as db:
-        async for search_engine in get_search_engine():
-            with Progress() as progress:
-                if dataset_id is not None:
+async def _reindex(dataset_id: Optional[UUID] = None, num_workers: int = DEFAULT_NUM_WORKERS) -> None:
+    async for search_engine in get_search_engine():
+        with Progress() as progress:
+            if dataset_id is not None:
+                async with AsyncSessionLocal() as db:
                     await _reindex_dataset(db, search_engine, progress, dataset_id)
-                else:
-                    await _reindex_datasets(db, search_engine, progress)
+            else:
+                await _reindex_datasets(search_engine, progress, num_workers)
 
 async def list_indexes() -> None:
     async for search_engine in get_search_engine():
@@ -175,8 +242,9 @@ async def list_indexes() -> None:
 
 def reindex(
     dataset_id: Optional[UUID] = typer.Option(None, help="The id of a dataset to be reindexed"),
+    num_workers: int = typer.Option(DEFAULT_NUM_WORKERS, help="Number of datasets to reindex concurrently"),
 ) -> None:
-    asyncio.run(_reindex(dataset_id))
+    asyncio.run(_reindex(dataset_id, num_workers))
 
 def list() -> None:
     asyncio.run(list_indexes())
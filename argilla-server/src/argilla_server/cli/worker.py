@@ -24,14 +24,24 @@ DEFAULT_NUM_WORKERS = 2
 def worker(
     queues: List[str] = typer.Option([DEFAULT_QUEUE.name, HIGH_QUEUE.name], help="Name of queues to listen"),
     num_workers: int = typer.Option(DEFAULT_NUM_WORKERS, help="Number of workers to start"),
+    fork_jobs: bool = typer.Option(
+        False,
+        help="Run every job in a forked work horse process instead of inside the worker process. "
+        "Jobs run inside the worker process by default so HTTP connections to webhooks are reused between jobs",
+    ),
 ) -> None:
+    from rq.job import Job
+    from rq.worker import Worker
     from rq.worker_pool import WorkerPool
     from argilla_server.jobs.queues import REDIS_CONNECTION
+    from argilla_server.jobs.workers import InProcessJob, InProcessWorker
 
     worker_pool = WorkerPool(
         connection=REDIS_CONNECTION,
         queues=queues,
         num_workers=num_workers,
+        worker_class=Worker if fork_jobs else InProcessWorker,
+        job_class=Job if fork_jobs else InProcessJob,
     )
 
     worker_pool.start()
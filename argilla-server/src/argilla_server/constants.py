@@ -20,6 +20,7 @@ DATABASE_POSTGRESQL = "postgresql"
 
 SEARCH_ENGINE_ELASTICSEARCH = "elasticsearch"
 SEARCH_ENGINE_OPENSEARCH = "opensearch"
+SEARCH_ENGINE_EMBEDDED = "embedded"
 
 DEFAULT_USERNAME = "argilla"
 DEFAULT_PASSWORD = "1234"
@@ -30,6 +31,29 @@ DEFAULT_DATABASE_SQLITE_TIMEOUT = 5
 DEFAULT_DATABASE_POSTGRESQL_POOL_SIZE = 15
 DEFAULT_DATABASE_POSTGRESQL_MAX_OVERFLOW = 10
 
+DEFAULT_SEARCH_ENGINE_MAX_CONNECTIONS = 10
+
+DEFAULT_WEBHOOKS_MAX_CONNECTIONS_PER_HOST = 10
+DEFAULT_WEBHOOKS_MAX_CONCURRENT_DELIVERIES = 5
+
+DEFAULT_DATASETS_SCHEMA_CACHE_SIZE = 1000
+DEFAULT_DATASETS_SCHEMA_CACHE_TTL = 60
+
+DEFAULT_EXACT_SIMILARITY_SEARCH_BATCH_SIZE = 65536
+
+DEFAULT_DATASET_PROGRESS_CACHE_TTL = 5
+
+DEFAULT_DATASET_LAST_ACTIVITY_GRANULARITY = 60
+
+RECORDS_BULK_UPSERT_MAX_ITEMS = 500
+
+DEFAULT_RECORDS_BULK_STREAM_CHUNK_SIZE = 500
+DEFAULT_RECORDS_BULK_STREAM_MAX_LINE_SIZE = 10 * 1024 * 1024
+
+DEFAULT_WORKSPACE_MEMBERSHIP_CACHE_TTL = 10
+
+DEFAULT_USERS_CACHE_TTL = 30
+
 DEFAULT_MAX_KEYWORD_LENGTH = 128
 DEFAULT_TELEMETRY_KEY = "WyZq54dI9Ar1BWCr7JxOk80DpboFnVFk"
 
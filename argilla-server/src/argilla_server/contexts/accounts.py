@@ -11,23 +11,33 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import hashlib
 import secrets
-from typing import Iterable, List, Sequence, Union
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Sequence, Tuple, Union
 from uuid import UUID
 
 import bcrypt
-from sqlalchemy import exists, select
+from sqlalchemy import exists, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import make_transient_to_detached, selectinload
+from sqlalchemy.orm.util import identity_key
 
 from argilla_server.contexts import datasets
 from argilla_server.enums import UserRole
 from argilla_server.errors.future import NotUniqueError, UnprocessableEntityError
 from argilla_server.models import User, Workspace, WorkspaceUser
+from argilla_server.models.memberships import expire_workspace_memberships
 from argilla_server.security.authentication.jwt import JWT
 from argilla_server.security.authentication.userinfo import UserInfo
+from argilla_server.settings import settings
 from argilla_server.validators.users import UserCreateValidator
 
+USERS_CACHE_MAX_SIZE = 1000
+
+_users_cache: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
 
 async def create_workspace_user(db: AsyncSession, workspace_user_attrs: dict) -> WorkspaceUser:
     workspace_id = workspace_user_attrs["workspace_id"]
@@ -37,6 +47,7 @@ async def create_workspace_user(db: AsyncSession, workspace_user_attrs: dict) ->
         raise NotUniqueError(f"Workspace user with workspace_id `{workspace_id}` and user_id `{user_id}` is not unique")
 
     workspace_user = await WorkspaceUser.create(db, workspace_id=workspace_id, user_id=user_id)
+    expire_workspace_memberships(user_id=user_id, workspace_id=workspace_id)
 
     # TODO: Once we delete API v0 endpoint we can reduce this to refresh only the user.
     await db.refresh(workspace_user, attribute_names=["workspace", "user"])
@@ -45,7 +56,10 @@ async def create_workspace_user(db: AsyncSession, workspace_user_attrs: dict) ->
 
 
 async def delete_workspace_user(db: AsyncSession, workspace_user: WorkspaceUser) -> WorkspaceUser:
-    return await workspace_user.delete(db)
+    workspace_user = await workspace_user.delete(db)
+    expire_workspace_memberships(user_id=workspace_user.user_id, workspace_id=workspace_user.workspace_id)
+
+    return workspace_user
 
 
 async def list_workspaces(db: AsyncSession) -> List[Workspace]:
@@ -82,7 +96,10 @@ async def delete_workspace(db: AsyncSession, workspace: Workspace):
     if await datasets.list_datasets(db, workspace_id=workspace.id):
         raise NotUniqueError(f"Cannot delete the workspace {workspace.id}. This workspace has some datasets linked")
 
-    return await workspace.delete(db)
+    workspace = await workspace.delete(db)
+    expire_workspace_memberships(workspace_id=workspace.id)
+
+    return workspace
 
 
 async def user_exists(db: AsyncSession, user_id: UUID) -> bool:
@@ -99,6 +116,29 @@ async def get_user_by_api_key(db: AsyncSession, api_key: str) -> Union[User, Non
     return result.scalar_one_or_none()
 
 
+async def get_cached_user_by_username(db: AsyncSession, username: str) -> Union[User, None]:
+    """Same as `get_user_by_username` but caching the user for `users_cache_ttl` seconds.
+
+    Used to resolve the user of every authenticated request. The workspaces of the returned user are not loaded.
+    """
+    return await _get_cached_user(db, ("username", username), lambda: get_user_by_username(db, username))
+
+
+async def get_cached_user_by_api_key(db: AsyncSession, api_key: str) -> Union[User, None]:
+    """Same as `get_user_by_api_key` but caching the user for `users_cache_ttl` seconds.
+
+    Used to resolve the user of every authenticated request. The workspaces of the returned user are not loaded.
+    """
+    api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+
+    return await _get_cached_user(db, ("api_key", api_key_hash), lambda: get_user_by_api_key(db, api_key))
+
+
+def expire_cached_user(user_id: UUID) -> None:
+    for key in [key for key, (_, row) in _users_cache.items() if row["id"] == user_id]:
+        del _users_cache[key]
+
+
 async def list_users(db: "AsyncSession") -> Sequence[User]:
     # TODO: After removing API v0 implementation we can remove the workspaces eager loading
     # because is not used in the new API v1 endpoints.
@@ -176,11 +216,18 @@ async def update_user(db: AsyncSession, user: User, user_attrs: dict) -> User:
     if "password" in user_attrs:
         user_attrs["password_hash"] = hash_password(user_attrs.pop("password"))
 
-    return await user.update(db, **user_attrs)
+    user = await user.update(db, **user_attrs)
+    expire_cached_user(user.id)
+
+    return user
 
 
 async def delete_user(db: AsyncSession, user: User) -> User:
-    return await user.delete(db)
+    user = await user.delete(db)
+    expire_workspace_memberships(user_id=user.id)
+    expire_cached_user(user.id)
+
+    return user
 
 
 async def authenticate_user(db: AsyncSession, username: str, password: str):
@@ -229,3 +276,41 @@ def _dummy_verify():
 
 def _generate_random_password() -> str:
     return secrets.token_urlsafe()
+
+
+async def _get_cached_user(db: AsyncSession, key: Hashable, get_user) -> Union[User, None]:
+    if settings.users_cache_ttl <= 0:
+        return await get_user()
+
+    expires_at, row = _users_cache.get(key, (0, None))
+    if expires_at > time.monotonic():
+        return _attach_user(db, row)
+
+    user = await get_user()
+    if user is None:
+        _users_cache.pop(key, None)
+        return None
+
+    _users_cache[key] = (
+        time.monotonic() + settings.users_cache_ttl,
+        {attr.key: getattr(user, attr.key) for attr in inspect(user).mapper.column_attrs},
+    )
+    _users_cache.move_to_end(key)
+
+    while len(_users_cache) > USERS_CACHE_MAX_SIZE:
+        _users_cache.popitem(last=False)
+
+    return user
+
+
+def _attach_user(db: AsyncSession, row: Dict[str, Any]) -> User:
+    # NOTE: Users already in the session are reused so pending changes on them are not overridden
+    user = db.identity_map.get(identity_key(User, row["id"]))
+    if user is not None:
+        return user
+
+    user = User(**row)
+    make_transient_to_detached(user)
+    db.add(user)
+
+    return user
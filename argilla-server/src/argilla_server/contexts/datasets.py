@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import defaultdict
+import time
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
@@ -26,9 +27,9 @@ from uuid import UUID
 
 import sqlalchemy
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import Select, and_, or_, case, func, select, exists
+from sqlalchemy import Select, and_, or_, case, event, func, select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import contains_eager, joinedload, selectinload
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
 
 from argilla_server.api.schemas.v1.fields import FieldCreate
 from argilla_server.api.schemas.v1.metadata_properties import MetadataPropertyCreate, MetadataPropertyUpdate
@@ -50,12 +51,13 @@ from argilla_server.webhooks.v1.enums import DatasetEvent, ResponseEvent
 from argilla_server.webhooks.v1.responses import (
     build_response_event as build_response_event_v1,
     notify_response_event as notify_response_event_v1,
+    notify_response_events as notify_response_events_v1,
 )
 from argilla_server.webhooks.v1.datasets import (
     build_dataset_event as build_dataset_event_v1,
     notify_dataset_event as notify_dataset_event_v1,
 )
-from argilla_server.contexts import distribution
+from argilla_server.contexts import datasets_progress, datasets_schemas, distribution, search
 from argilla_server.database import get_async_db  # noqa: F401
 from argilla_server.enums import DatasetStatus, UserRole
 from argilla_server.errors.future import NotUniqueError, UnprocessableEntityError
@@ -76,7 +78,8 @@ from argilla_server.models import (
     ResponseStatus,
 )
 from argilla_server.models.suggestions import SuggestionCreateWithRecordId
-from argilla_server.search_engine import SearchEngine
+from argilla_server.search_engine import RecordDelta, SearchEngine
+from argilla_server.settings import settings
 from argilla_server.validators.datasets import DatasetCreateValidator, DatasetPublishValidator, DatasetUpdateValidator
 from argilla_server.validators.responses import (
     ResponseCreateValidator,
@@ -96,7 +99,21 @@ NOT_VISIBLE_FOR_ANNOTATORS_ALLOWED_ROLES = [UserRole.admin]
 CREATE_DATASET_VECTOR_SETTINGS_MAX_COUNT = 5
 
 
+DATASETS_LAST_ACTIVITY_TOUCHES_MAX_SIZE = 10000
+DATASETS_LAST_ACTIVITY_TOUCHES_SESSION_INFO_KEY = "datasets_last_activity_touches"
+
+# NOTE: When each dataset last activity was updated by this process, so the dataset row of busy datasets is not
+# updated (and locked) on every annotation
+_datasets_last_activity_touches: "OrderedDict[UUID, float]" = OrderedDict()
+
+
 async def _touch_dataset_last_activity_at(db: AsyncSession, dataset: Dataset) -> None:
+    now = time.monotonic()
+
+    touched_at = _datasets_last_activity_touches.get(dataset.id)
+    if touched_at is not None and now - touched_at < settings.dataset_last_activity_granularity:
+        return
+
     await db.execute(
         sqlalchemy.update(Dataset)
         .where(Dataset.id == dataset.id)
@@ -106,6 +123,30 @@ async def _touch_dataset_last_activity_at(db: AsyncSession, dataset: Dataset) ->
         )
     )
 
+    # NOTE: Touches are only recorded once committed (see `_record_datasets_last_activity_touches`)
+    db.info.setdefault(DATASETS_LAST_ACTIVITY_TOUCHES_SESSION_INFO_KEY, {})[dataset.id] = now
+
+
+@event.listens_for(Session, "after_commit")
+def _record_datasets_last_activity_touches(session: Session) -> None:
+    for dataset_id, touched_at in session.info.pop(DATASETS_LAST_ACTIVITY_TOUCHES_SESSION_INFO_KEY, {}).items():
+        _datasets_last_activity_touches[dataset_id] = touched_at
+        _datasets_last_activity_touches.move_to_end(dataset_id)
+
+    while len(_datasets_last_activity_touches) > DATASETS_LAST_ACTIVITY_TOUCHES_MAX_SIZE:
+        _datasets_last_activity_touches.popitem(last=False)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_datasets_last_activity_touches(session: Session) -> None:
+    session.info.pop(DATASETS_LAST_ACTIVITY_TOUCHES_SESSION_INFO_KEY, None)
+
+
+async def _touch_record_updated_at(db: AsyncSession, record_id: UUID) -> None:
+    # NOTE: Deleted responses and suggestions leave no rows with a newer update date, so the update date of the record
+    # is changed for the reindex to find the records changed while it was running
+    await db.execute(sqlalchemy.update(Record).where(Record.id == record_id).values(updated_at=datetime.utcnow()))
+
 
 async def list_datasets(db: AsyncSession, user: Optional[User] = None, **filters) -> Sequence[Dataset]:
     """
@@ -141,6 +182,7 @@ async def create_dataset(db: AsyncSession, dataset_attrs: dict) -> Dataset:
         name=dataset_attrs["name"],
         guidelines=dataset_attrs["guidelines"],
         allow_extra_metadata=dataset_attrs["allow_extra_metadata"],
+        exact_similarity_search=dataset_attrs["exact_similarity_search"],
         distribution=dataset_attrs["distribution"],
         metadata_=dataset_attrs["metadata"],
         workspace_id=dataset_attrs["workspace_id"],
@@ -177,6 +219,10 @@ async def publish_dataset(db: AsyncSession, search_engine: SearchEngine, dataset
 async def update_dataset(db: AsyncSession, dataset: Dataset, dataset_attrs: dict) -> Dataset:
     await DatasetUpdateValidator.validate(db, dataset, dataset_attrs)
 
+    if dataset_attrs.get("exact_similarity_search") and not dataset.exact_similarity_search:
+        # NOTE: Vectors matrices are not kept in sync while disabled so they are built again on the first search
+        await search.drop_vectors_matrices(await dataset.awaitable_attrs.vectors_settings)
+
     dataset = await dataset.update(db, **dataset_attrs)
 
     dataset_jobs.update_dataset_records_status_job.delay(dataset.id)
@@ -188,9 +234,13 @@ async def update_dataset(db: AsyncSession, dataset: Dataset, dataset_attrs: dict
 
 async def delete_dataset(db: AsyncSession, search_engine: SearchEngine, dataset: Dataset) -> Dataset:
     deleted_dataset_event_v1 = await build_dataset_event_v1(db, DatasetEvent.deleted, dataset)
+    vectors_settings = await dataset.awaitable_attrs.vectors_settings
 
     dataset = await dataset.delete(db)
 
+    await datasets_schemas.expire_dataset_schema(dataset.id)
+    await search.drop_vectors_matrices(vectors_settings)
+
     await search_engine.delete_index(dataset)
     await deleted_dataset_event_v1.notify(db)
 
@@ -208,7 +258,7 @@ async def create_field(db: AsyncSession, dataset: Dataset, field_create: FieldCr
     if await Field.get_by(db, name=field_create.name, dataset_id=dataset.id):
         raise NotUniqueError(f"Field with name `{field_create.name}` already exists for dataset with id `{dataset.id}`")
 
-    return await Field.create(
+    field = await Field.create(
         db,
         name=field_create.name,
         title=field_create.title,
@@ -217,6 +267,10 @@ async def create_field(db: AsyncSession, dataset: Dataset, field_create: FieldCr
         dataset_id=dataset.id,
     )
 
+    await datasets_schemas.expire_dataset_schema(dataset.id)
+
+    return field
+
 
 async def update_field(db: AsyncSession, field: Field, field_update: "FieldUpdate") -> Field:
     if field_update.settings and field_update.settings.type != field.settings["type"]:
@@ -225,18 +279,30 @@ async def update_field(db: AsyncSession, field: Field, field_update: "FieldUpdat
         )
 
     params = field_update.model_dump(exclude_unset=True)
-    return await field.update(db, **params)
+    field = await field.update(db, **params)
+
+    await datasets_schemas.expire_dataset_schema(field.dataset_id)
+
+    return field
 
 
 async def delete_field(db: AsyncSession, field: Field) -> Field:
     if field.dataset.is_ready:
         raise UnprocessableEntityError("Fields cannot be deleted for a published dataset")
 
-    return await field.delete(db)
+    field = await field.delete(db)
+
+    await datasets_schemas.expire_dataset_schema(field.dataset_id)
+
+    return field
 
 
 async def delete_metadata_property(db: AsyncSession, metadata_property: MetadataProperty) -> MetadataProperty:
-    return await metadata_property.delete(db)
+    metadata_property = await metadata_property.delete(db)
+
+    await datasets_schemas.expire_dataset_schema(metadata_property.dataset_id)
+
+    return metadata_property
 
 
 async def create_metadata_property(
@@ -260,6 +326,8 @@ async def create_metadata_property(
         dataset_id=dataset.id,
     )
 
+    await datasets_schemas.expire_dataset_schema(dataset.id)
+
     if dataset.is_ready:
         await search_engine.configure_metadata_property(dataset, metadata_property)
 
@@ -271,12 +339,16 @@ async def update_metadata_property(
     metadata_property: MetadataProperty,
     metadata_property_update: MetadataPropertyUpdate,
 ):
-    return await metadata_property.update(
+    metadata_property = await metadata_property.update(
         db,
         title=metadata_property_update.title or metadata_property.title,
         allowed_roles=_allowed_roles_for_metadata_property_create(metadata_property_update),
     )
 
+    await datasets_schemas.expire_dataset_schema(metadata_property.dataset_id)
+
+    return metadata_property
+
 
 async def count_vectors_settings_by_dataset_id(db: AsyncSession, dataset_id: UUID) -> int:
     return (await db.execute(select(func.count(VectorSettings.id)).filter_by(dataset_id=dataset_id))).scalar_one()
@@ -286,12 +358,21 @@ async def update_vector_settings(
     db: AsyncSession, vector_settings: VectorSettings, vector_settings_update: "VectorSettingsUpdate"
 ) -> VectorSettings:
     params = vector_settings_update.model_dump(exclude_unset=True)
-    return await vector_settings.update(db, **params)
+    vector_settings = await vector_settings.update(db, **params)
+
+    await datasets_schemas.expire_dataset_schema(vector_settings.dataset_id)
+
+    return vector_settings
 
 
 async def delete_vector_settings(db: AsyncSession, vector_settings: VectorSettings) -> VectorSettings:
     # TODO: for now the search engine does not allow to delete vector settings
-    return await vector_settings.delete(db)
+    vector_settings = await vector_settings.delete(db)
+
+    await datasets_schemas.expire_dataset_schema(vector_settings.dataset_id)
+    await search.drop_vectors_matrices([vector_settings])
+
+    return vector_settings
 
 
 async def create_vector_settings(
@@ -316,6 +397,8 @@ async def create_vector_settings(
         dataset_id=dataset.id,
     )
 
+    await datasets_schemas.expire_dataset_schema(dataset.id)
+
     if dataset.is_ready:
         await search_engine.configure_index_vectors(vector_settings)
 
@@ -405,8 +488,8 @@ async def get_user_dataset_metrics(
     user: User,
     dataset: Dataset,
 ) -> dict:
-    total_records = (await get_dataset_progress(db, search_engine, dataset))["total"]
-    result = await search_engine.get_dataset_user_progress(dataset, user)
+    progress, result = await datasets_progress.get_dataset_and_user_progress(search_engine, dataset, user)
+    total_records = progress.get("total", 0)
 
     submitted_responses = result.get("submitted", 0)
     discarded_responses = result.get("discarded", 0)
@@ -427,7 +510,7 @@ async def get_dataset_progress(
     search_engine: SearchEngine,
     dataset: Dataset,
 ) -> dict:
-    result = await search_engine.get_dataset_progress(dataset)
+    result = await datasets_progress.get_dataset_progress(search_engine, dataset)
     users = await get_users_with_responses_for_dataset(db, dataset)
 
     return {
@@ -520,10 +603,10 @@ async def create_response(
 
     await db.commit()
 
-    await distribution.update_record_status(search_engine, record.id)
-
-    await _load_users_from_responses([response])
-    await search_engine.update_record_response(response)
+    await _load_users_from_responses(response)
+    await distribution.update_record_status(
+        search_engine, record.id, RecordDelta(record_id=record.id, upserted_responses=[response])
+    )
 
     await notify_response_event_v1(db, ResponseEvent.created, response)
 
@@ -554,10 +637,10 @@ async def update_response(
 
     await db.commit()
 
-    await distribution.update_record_status(search_engine, response.record_id)
-
     await _load_users_from_responses(response)
-    await search_engine.update_record_response(response)
+    await distribution.update_record_status(
+        search_engine, response.record_id, RecordDelta(record_id=response.record_id, upserted_responses=[response])
+    )
 
     await notify_response_event_v1(db, ResponseEvent.updated, response)
 
@@ -589,10 +672,10 @@ async def upsert_response(
     )
     await db.commit()
 
-    await distribution.update_record_status(search_engine, record.id)
-
     await _load_users_from_responses(response)
-    await search_engine.update_record_response(response)
+    await distribution.update_record_status(
+        search_engine, record.id, RecordDelta(record_id=record.id, upserted_responses=[response])
+    )
 
     if response.inserted_at == response.updated_at:
         await notify_response_event_v1(db, ResponseEvent.created, response)
@@ -602,18 +685,95 @@ async def upsert_response(
     return response
 
 
+async def upsert_responses(
+    db: AsyncSession,
+    records: List[Record],
+    user: User,
+    responses_upserts: List[ResponseUpsert],
+    autocommit: bool = True,
+) -> List[Response]:
+    """Upserts the responses of a user for the given records in a single transaction.
+
+    Responses must be validated with `ResponseUpsertValidator` beforehand. The upserted responses are returned in the
+    same order as `responses_upserts`. Once committed, `notify_upserted_responses` must be called with them.
+    """
+    if len(responses_upserts) == 0:
+        return []
+
+    # NOTE: Only the last response for each record is upserted, like when upserting them one at a time
+    responses_schemas = {
+        response_upsert.record_id: {
+            "values": jsonable_encoder(response_upsert.values),
+            "status": response_upsert.status,
+            "record_id": response_upsert.record_id,
+            "user_id": user.id,
+        }
+        for response_upsert in responses_upserts
+    }
+
+    responses = await Response.upsert_many(
+        db,
+        objects=list(responses_schemas.values()),
+        constraints=[Response.record_id, Response.user_id],
+        autocommit=False,
+    )
+
+    datasets_by_id = {record.dataset_id: record.dataset for record in records}
+    for dataset in datasets_by_id.values():
+        await _touch_dataset_last_activity_at(db, dataset)
+    await DatasetUser.upsert_many(
+        db,
+        objects=[{"dataset_id": dataset_id, "user_id": user.id} for dataset_id in datasets_by_id],
+        constraints=[DatasetUser.dataset_id, DatasetUser.user_id],
+        autocommit=False,
+    )
+    if autocommit:
+        await db.commit()
+
+    responses_by_record_id = {response.record_id: response for response in responses}
+
+    return [responses_by_record_id[response_upsert.record_id] for response_upsert in responses_upserts]
+
+
+async def notify_upserted_responses(
+    db: AsyncSession, search_engine: SearchEngine, records: List[Record], responses: List[Response]
+) -> None:
+    """Updates the status of the records of responses upserted with `upsert_responses` and sends their events."""
+    responses = list({response.id: response for response in responses}.values())
+    if len(responses) == 0:
+        return
+
+    await _load_users_from_responses(responses)
+
+    dataset_id_by_record_id = {record.id: record.dataset_id for record in records}
+    responses_by_dataset_id = defaultdict(list)
+    for response in responses:
+        responses_by_dataset_id[dataset_id_by_record_id[response.record_id]].append(response)
+
+    for dataset_id, dataset_responses in responses_by_dataset_id.items():
+        await distribution.update_records_status_with_responses(search_engine, dataset_id, dataset_responses)
+
+    await notify_response_events_v1(
+        db, ResponseEvent.created, [response for response in responses if response.inserted_at == response.updated_at]
+    )
+    await notify_response_events_v1(
+        db, ResponseEvent.updated, [response for response in responses if response.inserted_at != response.updated_at]
+    )
+
+
 async def delete_response(db: AsyncSession, search_engine: SearchEngine, response: Response) -> Response:
     deleted_response_event_v1 = await build_response_event_v1(db, ResponseEvent.deleted, response)
 
     response = await response.delete(db, autocommit=False)
+    await _touch_record_updated_at(db, response.record_id)
     await _touch_dataset_last_activity_at(db, response.record.dataset)
 
     await db.commit()
 
-    await distribution.update_record_status(search_engine, response.record_id)
-
     await _load_users_from_responses(response)
-    await search_engine.delete_record_response(response)
+    await distribution.update_record_status(
+        search_engine, response.record_id, RecordDelta(record_id=response.record_id, deleted_responses=[response])
+    )
 
     await deleted_response_event_v1.notify(db)
 
@@ -660,10 +820,16 @@ async def delete_suggestions(
     await Suggestion.delete_many(
         db=db,
         conditions=[Suggestion.id.in_(suggestions_ids), Suggestion.record_id == record.id],
+        autocommit=False,
     )
+    await _touch_record_updated_at(db, record.id)
 
-    for suggestion in suggestions:
-        await search_engine.delete_record_suggestion(suggestion)
+    await db.commit()
+
+    if suggestions:
+        await search_engine.update_records(
+            record.dataset, [RecordDelta(record_id=record.id, deleted_suggestions=list(suggestions))]
+        )
 
 
 async def list_suggestions_by_id_and_record_id(
@@ -682,7 +848,10 @@ async def list_suggestions_by_id_and_record_id(
 
 
 async def delete_suggestion(db: AsyncSession, search_engine: SearchEngine, suggestion: Suggestion) -> Suggestion:
-    suggestion = await suggestion.delete(db)
+    suggestion = await suggestion.delete(db, autocommit=False)
+    await _touch_record_updated_at(db, suggestion.record_id)
+
+    await db.commit()
 
     await search_engine.delete_record_suggestion(suggestion)
 
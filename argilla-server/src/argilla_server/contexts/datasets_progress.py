@@ -0,0 +1,71 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+from uuid import UUID
+
+from argilla_server.models import Dataset, User
+from argilla_server.search_engine import SearchEngine
+from argilla_server.settings import settings
+
+T = TypeVar("T")
+
+DATASETS_PROGRESS_CACHE_MAX_SIZE = 1000
+
+_cache: "OrderedDict[UUID, Dict[Hashable, Tuple[float, Any]]]" = OrderedDict()
+
+
+async def get_dataset_progress(search_engine: SearchEngine, dataset: Dataset) -> dict:
+    """Returns the dataset progress computed by the search engine, cached for `dataset_progress_cache_ttl` seconds."""
+    return await _get_cached(dataset.id, "dataset", lambda: search_engine.get_dataset_progress(dataset))
+
+
+async def get_dataset_and_user_progress(search_engine: SearchEngine, dataset: Dataset, user: User) -> Tuple[dict, dict]:
+    return await _get_cached(
+        dataset.id,
+        ("user", user.id),
+        lambda: search_engine.get_dataset_and_user_progress(dataset, user),
+    )
+
+
+def expire_dataset_progress(dataset_id: UUID) -> None:
+    """Drops the cached progress of a dataset. Contexts changing records or responses of a dataset must call it.
+
+    Changes done by other processes (e.g. background jobs) are visible once the cached values expire.
+    """
+    _cache.pop(dataset_id, None)
+
+
+async def _get_cached(dataset_id: UUID, key: Hashable, compute: Callable[[], Awaitable[T]]) -> T:
+    if settings.dataset_progress_cache_ttl <= 0:
+        return await compute()
+
+    now = time.monotonic()
+
+    entries = _cache.get(dataset_id, {})
+    expires_at, value = entries.get(key, (0, None))
+    if expires_at > now:
+        return value
+
+    value = await compute()
+
+    _cache.setdefault(dataset_id, {})[key] = (now + settings.dataset_progress_cache_ttl, value)
+    _cache.move_to_end(dataset_id)
+
+    while len(_cache) > DATASETS_PROGRESS_CACHE_MAX_SIZE:
+        _cache.popitem(last=False)
+
+    return value
@@ -0,0 +1,148 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Type
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
+from argilla_server.jobs.queues import REDIS_CONNECTION
+from argilla_server.models import Dataset, Field, MetadataProperty, Question, VectorSettings
+from argilla_server.models.base import DatabaseModel
+from argilla_server.settings import settings
+
+DATASET_SCHEMA_RELATIONSHIPS: Dict[str, Type[DatabaseModel]] = {
+    "fields": Field,
+    "questions": Question,
+    "metadata_properties": MetadataProperty,
+    "vectors_settings": VectorSettings,
+}
+
+
+@dataclass(frozen=True)
+class _DatasetSchemaCacheEntry:
+    version: int
+    rows: Dict[str, List[Dict[str, Any]]]
+    expires_at: Optional[float] = None
+
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at <= time.monotonic()
+
+
+_cache: "OrderedDict[UUID, _DatasetSchemaCacheEntry]" = OrderedDict()
+_versions: Dict[UUID, int] = {}
+
+
+async def get_dataset_with_schema(db: AsyncSession, dataset_id: UUID) -> Dataset:
+    """Returns the dataset with its fields, questions, metadata properties and vectors settings loaded.
+
+    The dataset schema is cached in memory and versioned, so only the dataset row is read from the database while
+    the schema is not changed. Contexts changing the schema of a dataset must call `expire_dataset_schema`.
+    Cached schemas are reloaded after `datasets_schema_cache_ttl` seconds, so server processes not sharing the
+    versions through Redis don't use a stale schema forever.
+    """
+    if settings.datasets_schema_cache_size <= 0:
+        return await _get_dataset_with_schema_from_db(db, dataset_id)
+
+    version = await _get_dataset_schema_version(dataset_id)
+
+    entry = _cache.get(dataset_id)
+    if entry is None or entry.version != version or entry.is_expired():
+        dataset = await _get_dataset_with_schema_from_db(db, dataset_id)
+        _cache_dataset_schema(dataset, version)
+        return dataset
+
+    _cache.move_to_end(dataset_id)
+
+    dataset = await Dataset.get_or_raise(db, dataset_id)
+    for relationship, model in DATASET_SCHEMA_RELATIONSHIPS.items():
+        instances = [_attach_instance(db, model, row) for row in entry.rows[relationship]]
+        for instance in instances:
+            set_committed_value(instance, "dataset", dataset)
+
+        set_committed_value(dataset, relationship, instances)
+
+    return dataset
+
+
+async def expire_dataset_schema(dataset_id: UUID) -> None:
+    _cache.pop(dataset_id, None)
+    _versions[dataset_id] = _versions.get(dataset_id, 0) + 1
+
+    if settings.datasets_schema_cache_use_redis:
+        await asyncio.to_thread(REDIS_CONNECTION.incr, _dataset_schema_version_redis_key(dataset_id))
+
+
+async def _get_dataset_with_schema_from_db(db: AsyncSession, dataset_id: UUID) -> Dataset:
+    return await Dataset.get_or_raise(
+        db,
+        dataset_id,
+        options=[selectinload(getattr(Dataset, relationship)) for relationship in DATASET_SCHEMA_RELATIONSHIPS],
+    )
+
+
+async def _get_dataset_schema_version(dataset_id: UUID) -> int:
+    if settings.datasets_schema_cache_use_redis:
+        return int(await asyncio.to_thread(REDIS_CONNECTION.get, _dataset_schema_version_redis_key(dataset_id)) or 0)
+
+    return _versions.get(dataset_id, 0)
+
+
+def _dataset_schema_version_redis_key(dataset_id: UUID) -> str:
+    return f"datasets:{dataset_id}:schema:version"
+
+
+def _cache_dataset_schema(dataset: Dataset, version: int) -> None:
+    expires_at = None
+    if settings.datasets_schema_cache_ttl > 0:
+        expires_at = time.monotonic() + settings.datasets_schema_cache_ttl
+
+    _cache[dataset.id] = _DatasetSchemaCacheEntry(
+        version=version,
+        rows={
+            relationship: [_instance_row(instance) for instance in getattr(dataset, relationship)]
+            for relationship in DATASET_SCHEMA_RELATIONSHIPS
+        },
+        expires_at=expires_at,
+    )
+    _cache.move_to_end(dataset.id)
+
+    while len(_cache) > settings.datasets_schema_cache_size:
+        _cache.popitem(last=False)
+
+
+def _instance_row(instance: DatabaseModel) -> Dict[str, Any]:
+    return {attr.key: copy.deepcopy(getattr(instance, attr.key)) for attr in inspect(instance).mapper.column_attrs}
+
+
+def _attach_instance(db: AsyncSession, model: Type[DatabaseModel], row: Dict[str, Any]) -> DatabaseModel:
+    # NOTE: Instances already in the session are reused so pending changes on them are not overridden
+    instance = db.identity_map.get(identity_key(model, row["id"]))
+    if instance is not None:
+        return instance
+
+    instance = model(**copy.deepcopy(row))
+    make_transient_to_detached(instance)
+    db.add(instance)
+
+    return instance
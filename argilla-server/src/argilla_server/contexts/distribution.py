@@ -13,38 +13,59 @@
 #  limitations under the License.
 
 import backoff
+import dataclasses
 import sqlalchemy
 
-from typing import List
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server.webhooks.v1.enums import RecordEvent
-from argilla_server.webhooks.v1.records import notify_record_event as notify_record_event_v1
-from argilla_server.enums import DatasetDistributionStrategy, RecordStatus
-from argilla_server.models import Record
-from argilla_server.search_engine.base import SearchEngine
+from argilla_server.webhooks.v1.records import (
+    notify_record_event as notify_record_event_v1,
+    notify_record_events as notify_record_events_v1,
+)
+from argilla_server.contexts import datasets_progress
+from argilla_server.enums import DatasetDistributionStrategy, RecordStatus, ResponseStatus
+from argilla_server.models import Dataset, Record, Response
+from argilla_server.search_engine.base import RecordDelta, SearchEngine
 from argilla_server.database import _get_async_db
 
 MAX_TIME_RETRY_SQLALCHEMY_ERROR = 15
 
 
 async def unsafe_update_records_status(db: AsyncSession, records: List[Record]):
-    await db.execute(
-        select(Record)
-        .where(Record.id.in_([record.id for record in records]))
-        .options(selectinload(Record.dataset), selectinload(Record.responses_submitted))
-    )
-
+    records_by_dataset_id = defaultdict(list)
     for record in records:
-        await _update_record_status(db, record)
+        records_by_dataset_id[record.dataset_id].append(record)
+
+    for dataset_id, dataset_records in records_by_dataset_id.items():
+        dataset = await Dataset.get_or_raise(db, dataset_id)
+
+        records_status = await _compute_records_status(db, dataset, [record.id for record in dataset_records])
+        if len(records_status) == 0:
+            continue
+
+        updated_at = await _save_records_status(db, records_status)
+
+        # NOTE: Keep the in-memory records in sync without marking them as modified, so no extra UPDATE is emitted
+        for record in dataset_records:
+            if record.id in records_status:
+                set_committed_value(record, "status", records_status[record.id])
+                set_committed_value(record, "updated_at", updated_at)
 
 
 @backoff.on_exception(backoff.expo, sqlalchemy.exc.SQLAlchemyError, max_time=MAX_TIME_RETRY_SQLALCHEMY_ERROR)
-async def update_record_status(search_engine: SearchEngine, record_id: UUID) -> Record:
+async def update_record_status(
+    search_engine: SearchEngine, record_id: UUID, record_delta: Optional[RecordDelta] = None
+) -> Record:
+    """Recomputes the status of a record, sending the changes of `record_delta` along with it to the search engine."""
     async for db in _get_async_db(isolation_level="SERIALIZABLE"):
         record = await Record.get_or_raise(
             db,
@@ -58,7 +79,9 @@ async def update_record_status(search_engine: SearchEngine, record_id: UUID) ->
         await _update_record_status(db, record)
         await db.commit()
 
-        await search_engine.partial_record_update(record, status=record.status)
+        record_delta = record_delta or RecordDelta(record_id=record.id)
+        await search_engine.update_records(record.dataset, [dataclasses.replace(record_delta, status=record.status)])
+        datasets_progress.expire_dataset_progress(record.dataset_id)
 
         await notify_record_event_v1(db, RecordEvent.updated, record)
 
@@ -68,6 +91,139 @@ async def update_record_status(search_engine: SearchEngine, record_id: UUID) ->
         return record
 
 
+@backoff.on_exception(backoff.expo, sqlalchemy.exc.SQLAlchemyError, max_time=MAX_TIME_RETRY_SQLALCHEMY_ERROR)
+async def update_records_status(search_engine: SearchEngine, dataset_id: UUID, record_ids: List[UUID]) -> List[Record]:
+    """Recomputes the status of a batch of records from the same dataset returning the ones that have changed."""
+    async for db in _get_async_db(isolation_level="SERIALIZABLE"):
+        dataset = await Dataset.get_or_raise(db, dataset_id)
+
+        records_status = await _compute_records_status(db, dataset, record_ids)
+        if len(records_status) == 0:
+            return []
+
+        await _save_records_status(db, records_status)
+        await db.commit()
+
+        await search_engine.partial_records_update(
+            dataset, {record_id: {"status": status} for record_id, status in records_status.items()}
+        )
+        datasets_progress.expire_dataset_progress(dataset.id)
+
+        records = (
+            (
+                await db.execute(
+                    select(Record).where(Record.id.in_(records_status.keys()), Record.dataset_id == dataset.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        await notify_record_events_v1(db, RecordEvent.updated, records)
+        await notify_record_events_v1(
+            db, RecordEvent.completed, [record for record in records if record.is_completed()]
+        )
+
+        return records
+
+
+@backoff.on_exception(backoff.expo, sqlalchemy.exc.SQLAlchemyError, max_time=MAX_TIME_RETRY_SQLALCHEMY_ERROR)
+async def update_records_status_with_responses(
+    search_engine: SearchEngine, dataset_id: UUID, responses: List[Response]
+) -> List[Record]:
+    """Recomputes the status of the records of the given upserted responses from the same dataset.
+
+    The responses and the new records status are sent to the search engine in a single request. Like in
+    `update_record_status`, record events are notified for all the records and not only for the changed ones.
+    """
+    record_ids = list({response.record_id for response in responses})
+
+    async for db in _get_async_db(isolation_level="SERIALIZABLE"):
+        dataset = await Dataset.get_or_raise(db, dataset_id)
+
+        records_status = await _compute_records_status(db, dataset, record_ids)
+        if len(records_status) > 0:
+            await _save_records_status(db, records_status)
+            await db.commit()
+
+        responses_by_record_id = defaultdict(list)
+        for response in responses:
+            responses_by_record_id[response.record_id].append(response)
+
+        await search_engine.update_records(
+            dataset,
+            [
+                RecordDelta(
+                    record_id=record_id,
+                    status=records_status.get(record_id),
+                    upserted_responses=responses_by_record_id[record_id],
+                )
+                for record_id in record_ids
+            ],
+        )
+        datasets_progress.expire_dataset_progress(dataset.id)
+
+        records = (
+            (
+                await db.execute(
+                    select(Record)
+                    .where(Record.id.in_(record_ids), Record.dataset_id == dataset.id)
+                    .execution_options(populate_existing=True)
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        await notify_record_events_v1(db, RecordEvent.updated, records)
+        await notify_record_events_v1(
+            db, RecordEvent.completed, [record for record in records if record.is_completed()]
+        )
+
+        return records
+
+
+async def _save_records_status(db: AsyncSession, records_status: Dict[UUID, RecordStatus]) -> datetime:
+    updated_at = datetime.utcnow()
+    await Record.update_many(
+        db,
+        [{"id": record_id, "status": status, "updated_at": updated_at} for record_id, status in records_status.items()],
+        autocommit=False,
+    )
+
+    return updated_at
+
+
+async def _compute_records_status(
+    db: AsyncSession, dataset: Dataset, record_ids: List[UUID]
+) -> Dict[UUID, RecordStatus]:
+    """Returns the new status for the records whose status has changed."""
+    if dataset.distribution_strategy != DatasetDistributionStrategy.overlap:
+        raise NotImplementedError(f"unsupported distribution strategy `{dataset.distribution_strategy}`")
+
+    result = await db.execute(
+        select(Record.id, Record.status, func.count(Response.id))
+        .outerjoin(Response, and_(Response.record_id == Record.id, Response.status == ResponseStatus.submitted))
+        .where(Record.id.in_(record_ids), Record.dataset_id == dataset.id)
+        .group_by(Record.id, Record.status)
+    )
+
+    records_status = {}
+    for record_id, current_status, responses_submitted_count in result.all():
+        status = _record_status_with_overlap_strategy(dataset, responses_submitted_count)
+        if status != current_status:
+            records_status[record_id] = status
+
+    return records_status
+
+
+def _record_status_with_overlap_strategy(dataset: Dataset, responses_submitted_count: int) -> RecordStatus:
+    if responses_submitted_count >= dataset.distribution["min_submitted"]:
+        return RecordStatus.completed
+
+    return RecordStatus.pending
+
+
 async def _update_record_status(db: AsyncSession, record: Record) -> Record:
     if record.dataset.distribution_strategy == DatasetDistributionStrategy.overlap:
         return await _update_record_status_with_overlap_strategy(db, record)
@@ -76,9 +232,6 @@ async def _update_record_status(db: AsyncSession, record: Record) -> Record:
 
 
 async def _update_record_status_with_overlap_strategy(db: AsyncSession, record: Record) -> Record:
-    if len(record.responses_submitted) >= record.dataset.distribution["min_submitted"]:
-        record.status = RecordStatus.completed
-    else:
-        record.status = RecordStatus.pending
+    record.status = _record_status_with_overlap_strategy(record.dataset, len(record.responses_submitted))
 
     return await record.save(db, autocommit=False)
@@ -12,22 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import io
 import os
 import shutil
 import json
+import sqlite3
 import hashlib
 import uuid
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 from uuid import UUID
 from urllib3 import HTTPResponse
 
 from fastapi import HTTPException
 from minio import Minio, S3Error
+from minio.datatypes import Object
 from minio.versioningconfig import VersioningConfig
 from minio.helpers import ObjectWriteResult
 from minio.commonconfig import ENABLED
@@ -38,9 +41,54 @@ from argilla_server.api.schemas.v1.files import FileObjectResponse
 
 EXCLUDED_VERSIONING_PREFIXES = ["pdf"]
 
+# NOTE: Objects are read and written in chunks so memory usage does not depend on the objects size
+OBJECT_CHUNK_SIZE = 256 * 1024
+OBJECT_PART_SIZE = 16 * 1024 * 1024
+
+# NOTE: Objects of local buckets are indexed by name in an SQLite database, so listings do not walk the bucket
+OBJECTS_INDEX_FILE_NAME = ".objects.sqlite"
+OBJECTS_INDEX_VERSION = 1
+OBJECTS_INDEX_BUSY_TIMEOUT_SECONDS = 30
+
+_OBJECTS_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    object_name TEXT NOT NULL,
+    version_id TEXT NOT NULL,
+    etag TEXT,
+    size INTEGER,
+    content_type TEXT,
+    last_modified REAL,
+    is_latest INTEGER NOT NULL,
+    metadata TEXT,
+    PRIMARY KEY (object_name, version_id)
+)
+"""
+
 _LOGGER = logging.getLogger("argilla")
 
 
+class _FileSlice(io.RawIOBase):
+    """Reads up to `length` bytes of a file from its current position."""
+
+    def __init__(self, file: BinaryIO, length: int):
+        self._file = file
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._file.read(min(len(buffer), self._remaining))
+        buffer[: len(data)] = data
+        self._remaining -= len(data)
+
+        return len(data)
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
 class LocalFileStorage:
     """Local file storage implementation that mimics Minio client interface."""
 
@@ -91,21 +139,21 @@ class LocalFileStorage:
         bucket_path = self._get_bucket_path(bucket_name)
         bucket_path.mkdir(parents=True, exist_ok=True)
 
-        if not isinstance(data, bytes):
-            data_bytes = data.read()
-        else:
-            data_bytes = data
+        if isinstance(data, bytes):
+            data = io.BytesIO(data)
 
-        # Generate content-based version ID and ETag
-        content_hash = compute_hash(data_bytes)
         version_id = str(uuid.uuid4())
 
         version_path = self._get_version_path(bucket_name, object_name).with_suffix(f".{version_id}")
         version_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write data to version file
+        # Write data to version file, computing the content-based ETag on the way
+        content_md5 = hashlib.md5()
         with open(version_path, "wb") as f:
-            f.write(data_bytes)
+            while chunk := data.read(OBJECT_CHUNK_SIZE):
+                content_md5.update(chunk)
+                f.write(chunk)
+        content_hash = content_md5.hexdigest()
 
         object_path = self._get_object_path(bucket_name, object_name)
         object_path.parent.mkdir(parents=True, exist_ok=True)
@@ -122,6 +170,22 @@ class LocalFileStorage:
         with open(meta_path, "w") as f:
             json.dump(metadata, f)
 
+        stats = version_path.stat()
+        with self._objects_index(bucket_name) as index:
+            index.execute("UPDATE objects SET is_latest = 0 WHERE object_name = ?", (object_name,))
+            index.execute(
+                "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?, 1, ?)",
+                (
+                    object_name,
+                    version_id,
+                    content_hash,
+                    stats.st_size,
+                    metadata["content_type"],
+                    stats.st_mtime,
+                    json.dumps(metadata),
+                ),
+            )
+
         return ObjectWriteResult(
             bucket_name=bucket_name,
             object_name=object_name,
@@ -132,29 +196,34 @@ class LocalFileStorage:
             location=None,
         )
 
-    def get_object(self, bucket_name: str, object_name: str, version_id: Optional[str] = None) -> HTTPResponse:
+    def get_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        offset: int = 0,
+        length: int = 0,
+        version_id: Optional[str] = None,
+    ) -> HTTPResponse:
         if version_id:
-            version_path = self._get_version_path(bucket_name, object_name).with_suffix(f".{version_id}")
-            if not version_path.exists():
+            path = self._get_version_path(bucket_name, object_name).with_suffix(f".{version_id}")
+            if not path.exists():
                 raise S3Error("NoSuchKey", "The specified version does not exist", object_name, "", "", None)
-            with open(version_path, "rb") as f:
-                content = f.read()
         else:
-            object_path = self._get_object_path(bucket_name, object_name)
-            if not object_path.exists():
+            path = self._get_object_path(bucket_name, object_name)
+            if not path.exists():
                 raise S3Error("NoSuchKey", "The specified key does not exist", object_name, "", "", None)
-            with open(object_path, "rb") as f:
-                content = f.read()
 
         # The metadata is not needed for the HTTPResponse, but kept for consistency
         # with the original implementation's metadata fetching.
         meta_path = self._get_object_path(bucket_name, object_name).with_suffix(".metadata.json")
         if not meta_path.exists():
             raise S3Error("NoSuchKey", "The specified key does not exist", object_name, "", "", None)
-        with open(meta_path, "r") as f:
-            json.load(f)
 
-        return HTTPResponse(body=io.BytesIO(content), preload_content=False)
+        # NOTE: The file is read while the response is streamed, like the Minio client responses
+        file = open(path, "rb")
+        file.seek(offset)
+
+        return HTTPResponse(body=_FileSlice(file, length) if length else file, preload_content=False)
 
     def stat_object(self, bucket_name: str, object_name: str, version_id: Optional[str] = None) -> ObjectMetadata:
         if version_id:
@@ -196,6 +265,11 @@ class LocalFileStorage:
             version_path = self._get_version_path(bucket_name, object_name).with_suffix(f".{version_id}")
             if version_path.exists():
                 version_path.unlink()
+
+                with self._objects_index(bucket_name) as index:
+                    index.execute(
+                        "DELETE FROM objects WHERE object_name = ? AND version_id = ?", (object_name, version_id)
+                    )
         else:
             object_path = self._get_object_path(bucket_name, object_name)
             if object_path.exists():
@@ -206,6 +280,10 @@ class LocalFileStorage:
                 if meta_path.exists():
                     meta_path.unlink()
 
+                # NOTE: Like in versioned Minio buckets, previous versions are still listed with `include_version`
+                with self._objects_index(bucket_name) as index:
+                    index.execute("UPDATE objects SET is_latest = 0 WHERE object_name = ?", (object_name,))
+
     def list_objects(
         self,
         bucket_name: str,
@@ -213,50 +291,107 @@ class LocalFileStorage:
         recursive: bool = False,
         include_version: bool = False,
         start_after: Optional[str] = None,
-    ) -> List[ObjectMetadata]:
+    ) -> Iterator[Object]:
         bucket_path = self._get_bucket_path(bucket_name)
         if not bucket_path.exists():
             raise S3Error("NoSuchBucket", "The specified bucket does not exist", bucket_name, "", "", None)
 
-        pattern = "**/*" if recursive else "*"
-        files = list(bucket_path.glob(pattern))
-
-        if prefix:
-            files = [f for f in files if str(f.relative_to(bucket_path)).startswith(prefix)]
+        prefix = prefix or ""
+        query = "SELECT * FROM objects WHERE object_name >= ?"
+        parameters = [prefix]
+        if start_after:
+            query += " AND object_name > ?"
+            parameters.append(start_after)
+        if not include_version:
+            query += " AND is_latest = 1"
+        query += " ORDER BY object_name, last_modified"
+
+        objects = []
+        with self._objects_index(bucket_name) as index:
+            for row in index.execute(query, parameters):
+                object_name, version_id, etag, size, content_type, last_modified, is_latest, metadata = row
+                # NOTE: Rows are sorted by name, so the objects with the prefix are the ones before the first without it
+                if not object_name.startswith(prefix):
+                    break
+                if not recursive and "/" in object_name[len(prefix) :]:
+                    continue
+
+                objects.append(
+                    Object(
+                        bucket_name,
+                        object_name,
+                        last_modified=datetime.fromtimestamp(last_modified, tz=timezone.utc),
+                        etag=etag,
+                        size=size,
+                        metadata=json.loads(metadata),
+                        version_id=(version_id or None) if include_version else None,
+                        is_latest=("true" if is_latest else "false") if include_version else None,
+                        content_type=content_type,
+                    )
+                )
 
-        files = [
-            f for f in files if f.is_file() and not f.name.endswith(".metadata.json") and ".versions" not in str(f)
-        ]
+        yield from objects
 
-        files.sort()
+    @contextlib.contextmanager
+    def _objects_index(self, bucket_name: str) -> Iterator[sqlite3.Connection]:
+        """Opens the objects index of a bucket, building it from the bucket files if it does not exist yet."""
+        connection = sqlite3.connect(
+            self._get_bucket_path(bucket_name) / OBJECTS_INDEX_FILE_NAME, timeout=OBJECTS_INDEX_BUSY_TIMEOUT_SECONDS
+        )
+        try:
+            if connection.execute("PRAGMA user_version").fetchone()[0] != OBJECTS_INDEX_VERSION:
+                self._build_objects_index(connection, bucket_name)
 
-        if start_after:
-            files = [f for f in files if str(f.relative_to(bucket_path)) > start_after]
-
-        for file_path in files:
-            object_name = str(file_path.relative_to(bucket_path))
-            stats = file_path.stat()
-
-            # Get metadata from file
-            meta_path = file_path.with_suffix(".metadata.json")
-            if not meta_path.exists():
-                continue  # Skip objects without metadata
-
-            with open(meta_path, "r") as f:
-                metadata = json.load(f)
-
-            obj = ObjectMetadata(
-                bucket_name=bucket_name,
-                object_name=object_name,
-                etag=metadata.get("etag"),
-                size=stats.st_size,
-                last_modified=stats.st_mtime,
-                metadata=metadata,
-                content_type=metadata.get("content_type", "application/octet-stream"),
-                version_id=metadata.get("version_id") if include_version else None,
-            )
+            with connection:
+                yield connection
+        finally:
+            connection.close()
 
-            yield obj
+    def _build_objects_index(self, connection: sqlite3.Connection, bucket_name: str) -> None:
+        # NOTE: The write lock is taken before checking the version again so the index is built by a single process
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if connection.execute("PRAGMA user_version").fetchone()[0] != OBJECTS_INDEX_VERSION:
+                connection.execute(_OBJECTS_INDEX_SCHEMA)
+                connection.executemany(
+                    "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?, 1, ?)",
+                    self._walk_objects(bucket_name),
+                )
+                connection.execute(f"PRAGMA user_version = {OBJECTS_INDEX_VERSION}")
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+
+    def _walk_objects(self, bucket_name: str) -> Iterator[tuple]:
+        """Yields the index rows of the current objects stored in the bucket directory."""
+        bucket_path = self._get_bucket_path(bucket_name)
+        for dir_path, dir_names, file_names in os.walk(bucket_path):
+            if Path(dir_path) == bucket_path and ".versions" in dir_names:
+                dir_names.remove(".versions")
+
+            for file_name in file_names:
+                if file_name.endswith(".metadata.json") or file_name.startswith(OBJECTS_INDEX_FILE_NAME):
+                    continue
+
+                file_path = Path(dir_path) / file_name
+                meta_path = file_path.with_suffix(".metadata.json")
+                if not file_path.is_file() or not meta_path.exists():
+                    continue  # Skip objects without metadata
+
+                with open(meta_path, "r") as f:
+                    metadata = json.load(f)
+
+                stats = file_path.stat()
+                yield (
+                    file_path.relative_to(bucket_path).as_posix(),
+                    metadata.get("version_id") or "",
+                    metadata.get("etag"),
+                    stats.st_size,
+                    metadata.get("content_type", "application/octet-stream"),
+                    stats.st_mtime,
+                    json.dumps(metadata),
+                )
 
 
 def get_minio_client() -> Optional[Union[Minio, LocalFileStorage]]:
@@ -323,13 +458,12 @@ def list_objects(
     return ListObjectsResponse(objects=objects)
 
 
-def get_object(
+def stat_object(
     client: Union[Minio, LocalFileStorage],
     bucket: str,
     object: str,
     version_id: Optional[str] = None,
-    include_versions=False,
-) -> FileObjectResponse:
+) -> ObjectMetadata:
     try:
         stat = client.stat_object(bucket, object, version_id=version_id)
     except S3Error as se:
@@ -343,8 +477,31 @@ def get_object(
         else:
             raise se
 
+    if isinstance(stat, Object):
+        return ObjectMetadata.from_minio_object(stat)
+
+    return stat
+
+
+def get_object(
+    client: Union[Minio, LocalFileStorage],
+    bucket: str,
+    object: str,
+    version_id: Optional[str] = None,
+    include_versions=False,
+    offset: int = 0,
+    length: int = 0,
+    stat: Optional[ObjectMetadata] = None,
+) -> FileObjectResponse:
+    """Gets the object content from `offset` and up to `length` bytes (the whole object when 0).
+
+    Callers that already have the object `stat` can pass it to skip the stat request.
+    """
+    if stat is None:
+        stat = stat_object(client, bucket, object, version_id=version_id)
+
     try:
-        obj = client.get_object(bucket, object, version_id=stat.version_id)
+        obj = client.get_object(bucket, object, version_id=stat.version_id, offset=offset, length=length)
 
         if include_versions:
             versions = list_objects(client, bucket, prefix=object, include_version=include_versions)
@@ -361,6 +518,19 @@ def get_object(
         raise HTTPException(status_code=500, detail=f"Internal server error: {getattr(e, 'message', str(e))}")
 
 
+def is_versioned_object(object: str, excluded_prefixes: List[str] = EXCLUDED_VERSIONING_PREFIXES) -> bool:
+    return not any(object.startswith(f"{prefix}/") for prefix in excluded_prefixes)
+
+
+def iter_object(response: HTTPResponse, chunk_size: int = OBJECT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yields the content of an object response in chunks, releasing the response once it is consumed."""
+    try:
+        yield from response.stream(chunk_size)
+    finally:
+        response.close()
+        response.release_conn()
+
+
 def put_object(
     client: Union[Minio, LocalFileStorage],
     bucket: str,
@@ -369,7 +539,7 @@ def put_object(
     content_type: str = None,
     size: int = None,
     metadata: Dict[str, Any] = None,
-    part_size: int = 100 * 1024 * 1024,
+    part_size: int = OBJECT_PART_SIZE,
 ) -> ObjectMetadata:
     if isinstance(data, bytes):
         data_bytes_io = io.BytesIO(data)
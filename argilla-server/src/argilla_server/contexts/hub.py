@@ -17,14 +17,17 @@ import os
 import base64
 import json
 
-from uuid import uuid4
+from collections import defaultdict
+from uuid import UUID, uuid4
 from pathlib import Path
-from typing import Any, Optional, List
+from typing import Any, Dict, Optional, List
 from typing_extensions import Self
 from tempfile import TemporaryDirectory
 
+import numpy
 from PIL import Image
-from sqlalchemy.orm import selectinload
+from sqlalchemy import LargeBinary, select, type_coerce
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from huggingface_hub import HfApi, DatasetCard, DatasetCardData
@@ -32,7 +35,8 @@ from datasets import Dataset as HFDataset, NamedSplit, load_dataset, features
 
 from argilla_server.contexts import info
 from argilla_server.database import get_sync_db
-from argilla_server.models.database import Dataset, Record, Field, Question, MetadataProperty, VectorSettings
+from argilla_server.models.database import Dataset, Record, Field, Question, MetadataProperty, Vector, VectorSettings
+from argilla_server.models.vectors import NUMPY_DTYPES, vector_value_buffer, vector_value_dtype
 from argilla_server.search_engine import SearchEngine
 from argilla_server.bulk.records_bulk import UpsertRecordsBulk
 from argilla_server.api.schemas.v1.datasets import (
@@ -84,8 +88,9 @@ class HubDataset:
         self._reset_row_idx()
 
         batched_dataset = self.dataset.batch(batch_size=BATCH_SIZE)
-        for batch in batched_dataset:
-            await self._import_batch_to(db, search_engine, batch, dataset)
+        async with search_engine.bulk_load(dataset):
+            for batch in batched_dataset:
+                await self._import_batch_to(db, search_engine, batch, dataset)
 
     def _reset_row_idx(self) -> None:
         self.row_idx = RESET_ROW_IDX
@@ -243,21 +248,38 @@ class HubDatasetExporter:
 
     def _rows_generator(self):
         for session in get_sync_db():
-            query = (
-                session.query(Record)
+            result = session.execute(
+                select(Record)
                 .filter_by(dataset_id=self.dataset.id)
                 .order_by(Record.inserted_at.asc())
                 .options(
                     selectinload(Record.responses),
                     selectinload(Record.suggestions),
-                    selectinload(Record.vectors),
                 )
+                .execution_options(yield_per=HUB_RECORDS_YIELD_PER)
             )
 
-            for record in query.yield_per(HUB_RECORDS_YIELD_PER):
-                yield self._record_to_row(record)
+            for records in result.scalars().partitions():
+                records_vectors_values = self._records_vectors_values(session, records)
+                for record in records:
+                    yield self._record_to_row(record, records_vectors_values[record.id])
 
-    def _record_to_row(self, record: Record) -> dict:
+    def _records_vectors_values(self, session: Session, records: List[Record]) -> Dict[UUID, Dict[UUID, numpy.ndarray]]:
+        # NOTE: Packed vector values are read as NumPy arrays over their bytes instead of as lists of Python floats
+        result = session.execute(
+            select(Vector.record_id, Vector.vector_settings_id, type_coerce(Vector.value, LargeBinary)).filter(
+                Vector.record_id.in_([record.id for record in records])
+            )
+        )
+
+        records_vectors_values = defaultdict(dict)
+        for record_id, vector_settings_id, value in result:
+            vector_value = numpy.frombuffer(vector_value_buffer(value), dtype=NUMPY_DTYPES[vector_value_dtype(value)])
+            records_vectors_values[record_id][vector_settings_id] = vector_value.astype(numpy.float32, copy=False)
+
+        return records_vectors_values
+
+    def _record_to_row(self, record: Record, vectors_values: Dict[UUID, numpy.ndarray]) -> dict:
         return (
             self._row_attributes(record)
             | self._row_fields(record)
@@ -266,7 +288,7 @@ class HubDatasetExporter:
             | self._row_metadata(record)
             # TODO: Is not possible to add extra metadata because the features need to be specified (even if with NULL) for all records.
             # | self._row_extra_metadata(record)
-            | self._row_vectors(record)
+            | self._row_vectors(vectors_values)
         )
 
     def _row_attributes(self, record: Record) -> dict:
@@ -368,11 +390,11 @@ class HubDatasetExporter:
 
         return row_extra_metadata
 
-    def _row_vectors(self, record: Record) -> dict:
+    def _row_vectors(self, vectors_values: Dict[UUID, numpy.ndarray]) -> dict:
         row_vectors = {}
         for vector_settings in self.dataset.vectors_settings:
             feature_name = self._feature_name_for_vector_settings(vector_settings)
-            feature_value = record.vector_value_by_vector_settings(vector_settings)
+            feature_value = vectors_values.get(vector_settings.id)
 
             row_vectors[feature_name] = feature_value
 
@@ -16,6 +16,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import argilla_server.errors.future as errors
+from argilla_server.contexts import datasets_schemas
 from argilla_server.api.schemas.v1.questions import (
     QuestionCreate,
     QuestionUpdate,
@@ -36,7 +37,7 @@ async def create_question(db: AsyncSession, dataset: Dataset, question_create: Q
 
     QuestionCreateValidator.validate(question_create, dataset)
 
-    return await Question.create(
+    question = await Question.create(
         db,
         name=question_create.name,
         title=question_create.title,
@@ -46,16 +47,28 @@ async def create_question(db: AsyncSession, dataset: Dataset, question_create: Q
         dataset_id=dataset.id,
     )
 
+    await datasets_schemas.expire_dataset_schema(dataset.id)
+
+    return question
+
 
 async def update_question(db: AsyncSession, question: Question, question_update: QuestionUpdate) -> Question:
     QuestionUpdateValidator.validate(question_update, question)
 
     params = question_update.model_dump(exclude_unset=True)
 
-    return await question.update(db, **params)
+    question = await question.update(db, **params)
+
+    await datasets_schemas.expire_dataset_schema(question.dataset_id)
+
+    return question
 
 
 async def delete_question(db: AsyncSession, question: Question) -> Question:
     QuestionDeleteValidator.validate(question.dataset)
 
-    return await question.delete(db)
+    question = await question.delete(db)
+
+    await datasets_schemas.expire_dataset_schema(question.dataset_id)
+
+    return question
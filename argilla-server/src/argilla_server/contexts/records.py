@@ -17,18 +17,21 @@ from typing import Dict, Iterable, Sequence, Union, List, Tuple, Optional
 from uuid import UUID
 
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import select, and_, or_, func, Select
+from sqlalchemy import select, and_, or_, func, tuple_, Select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, contains_eager
 
 from argilla_server.api.schemas.v1.records import RecordUpdate
 from argilla_server.api.schemas.v1.vectors import Vector as VectorSchema
+from argilla_server.contexts import datasets_progress, search
 from argilla_server.models import Dataset, Record, VectorSettings, Vector, Response, ResponseStatus, Suggestion
 from argilla_server.search_engine import SearchEngine
 from argilla_server.validators.records import RecordUpdateValidator
-from argilla_server.webhooks.v1.enums import RecordEvent
+from argilla_server.webhooks.v1.enums import RecordBulkEvent, RecordEvent
 from argilla_server.webhooks.v1.records import (
+    build_record_bulk_event as build_record_bulk_event_v1,
     build_record_event as build_record_event_v1,
+    build_record_events as build_record_events_v1,
     notify_record_event as notify_record_event_v1,
 )
 
@@ -43,7 +46,9 @@ async def list_dataset_records(
     with_vectors: Union[bool, List[str]] = False,
     with_response_suggestions: bool = False,
     workspace_user_ids: Optional[Iterable[UUID]] = None,
-) -> Tuple[Sequence[Record], int]:
+    after: Optional[Tuple[datetime, UUID]] = None,
+    with_total: bool = True,
+) -> Tuple[Sequence[Record], Optional[int]]:
     query = _build_list_records_query(
         dataset_id=dataset_id,
         offset=offset,
@@ -53,10 +58,14 @@ async def list_dataset_records(
         with_vectors=with_vectors,
         with_response_suggestions=with_response_suggestions,
         workspace_user_ids=workspace_user_ids,
+        after=after,
     )
 
     records = (await db.scalars(query)).unique().all()
-    total = await db.scalar(select(func.count(Record.id)).filter_by(dataset_id=dataset_id))
+
+    total = None
+    if with_total:
+        total = await db.scalar(select(func.count(Record.id)).filter_by(dataset_id=dataset_id))
 
     return records, total
 
@@ -103,9 +112,14 @@ def _build_list_records_query(
     with_vectors: Union[bool, List[str]] = False,
     with_response_suggestions: bool = False,
     workspace_user_ids: Optional[Iterable[UUID]] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
 ) -> Select:
     query = select(Record).filter_by(dataset_id=dataset_id)
 
+    if after is not None:
+        # NOTE: Keyset pagination so deep pages don't need to scan all the previous records like OFFSET does
+        query = query.where(tuple_(Record.inserted_at, Record.id) > tuple_(*after))
+
     if with_response_suggestions and workspace_user_ids:
         query = query.outerjoin(
             Response,
@@ -139,7 +153,7 @@ def _build_list_records_query(
     if limit is not None:
         query = query.limit(limit)
 
-    return query.order_by(Record.inserted_at)
+    return query.order_by(Record.inserted_at, Record.id)
 
 
 async def _preload_record_relationships_before_index(db: AsyncSession, record: Record) -> None:
@@ -164,6 +178,8 @@ async def update_record(
 
     await RecordUpdateValidator.validate(record_update, dataset, record)
 
+    vectors = []
+
     if record_update.is_set("fields"):
         record.fields = record_update.fields
 
@@ -173,6 +189,8 @@ async def update_record(
     if record_update.is_set("suggestions"):
         # Delete all suggestions and replace them with the new ones
         await Suggestion.delete_many(db, [Suggestion.record_id == record.id], autocommit=False)
+        # NOTE: Deleted suggestions leave no rows with a newer update date, so the record one is always updated
+        record.updated_at = datetime.utcnow()
         await db.refresh(record, attribute_names=["suggestions"])
 
         record.suggestions = [
@@ -188,7 +206,7 @@ async def update_record(
         ]
 
     if record_update.vectors:
-        await Vector.upsert_many(
+        vectors = await Vector.upsert_many(
             db,
             objects=[
                 VectorSchema(
@@ -206,8 +224,12 @@ async def update_record(
     record.updated_at = datetime.utcnow()
     await record.save(db, autocommit=True)
 
+    # NOTE: Vectors matrices are only changed once the vectors are committed
+    await search.upsert_vectors_matrices(dataset, vectors)
+
     await _preload_record_relationships_before_index(db, record)
     await search_engine.index_records(record.dataset, [record])
+    datasets_progress.expire_dataset_progress(record.dataset_id)
 
     await notify_record_event_v1(db, RecordEvent.updated, record)
 
@@ -219,6 +241,8 @@ async def delete_record(db: AsyncSession, search_engine: "SearchEngine", record:
     record = await record.delete(db=db, autocommit=True)
 
     await search_engine.delete_records(dataset=record.dataset, records=[record])
+    await search.delete_vectors_matrices_records(record.dataset, [record.id])
+    datasets_progress.expire_dataset_progress(record.dataset_id)
 
     await deleted_record_event_v1.notify(db)
 
@@ -232,11 +256,9 @@ async def delete_records(
 
     records = (await db.execute(select(Record).filter(*params).order_by(Record.inserted_at.asc()))).scalars().all()
 
-    deleted_record_events_v1 = []
-    for record in records:
-        deleted_record_events_v1.append(
-            await build_record_event_v1(db, RecordEvent.deleted, record),
-        )
+    # NOTE: Events payloads must be built before the records are deleted
+    deleted_record_events_v1 = await build_record_events_v1(db, RecordEvent.deleted, records)
+    deleted_record_bulk_event_v1 = await build_record_bulk_event_v1(db, RecordBulkEvent.deleted, dataset, records)
 
     records = await Record.delete_many(
         db,
@@ -245,6 +267,9 @@ async def delete_records(
     )
 
     await search_engine.delete_records(dataset=dataset, records=records)
+    await search.delete_vectors_matrices_records(dataset, [record.id for record in records])
+    datasets_progress.expire_dataset_progress(dataset.id)
 
-    for deleted_record_event_v1 in deleted_record_events_v1:
-        await deleted_record_event_v1.notify(db)
+    await deleted_record_events_v1.notify(db)
+    if deleted_record_bulk_event_v1:
+        await deleted_record_bulk_event_v1.notify(db)
@@ -11,12 +11,14 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any, List, Mapping
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import LargeBinary, func, select, type_coerce
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from argilla_server.api.schemas.v1.records import (
     FilterScope,
@@ -26,7 +28,18 @@ from argilla_server.api.schemas.v1.records import (
 )
 from argilla_server.api.schemas.v1.responses import ResponseFilterScope
 from argilla_server.api.schemas.v1.suggestions import SuggestionFilterScope
-from argilla_server.models import MetadataProperty, Question, Suggestion, Dataset
+from argilla_server.enums import SimilarityOrder
+from argilla_server.models import MetadataProperty, Question, Record, Suggestion, Dataset, Vector, VectorSettings
+from argilla_server.search_engine import (
+    Filter,
+    SearchEngine,
+    SearchResponseItem,
+    SearchResponses,
+    TextQuery,
+    get_vectors_matrix_store,
+)
+
+EXACT_SIMILARITY_SEARCH_CANDIDATES_PAGE_SIZE = 1000
 
 
 class SearchRecordsQueryValidator:
@@ -83,6 +96,188 @@ async def validate_search_records_query(db: AsyncSession, query: SearchRecordsQu
     await SearchRecordsQueryValidator.validate(db, dataset, query)
 
 
+async def build_records_from_search_items(
+    db: AsyncSession,
+    dataset: Dataset,
+    items: List[SearchResponseItem],
+    vectors_settings: List[VectorSettings],
+) -> List[Record]:
+    """Builds the records for the search items using the record attributes read from the search engine.
+
+    The returned records are not attached to the session. Attributes not served by the search engine are
+    loaded from the database with a single query.
+    """
+    records = []
+    vectors_settings_by_name = {vector_settings.name: vector_settings for vector_settings in vectors_settings}
+
+    for item in items:
+        record = Record(
+            id=item.record_id,
+            dataset_id=dataset.id,
+            external_id=item.record["external_id"],
+            status=item.record["status"],
+            fields=item.record.get("fields"),
+            metadata_=item.record.get("metadata"),
+            inserted_at=item.record["inserted_at"],
+            updated_at=item.record["updated_at"],
+        )
+        set_committed_value(record, "dataset", dataset)
+
+        if vectors_settings:
+            vectors = []
+            for name, value in item.record.get("vectors", {}).items():
+                vector = Vector(value=value, record_id=record.id, vector_settings_id=vectors_settings_by_name[name].id)
+                set_committed_value(vector, "vector_settings", vectors_settings_by_name[name])
+                vectors.append(vector)
+
+            set_committed_value(record, "vectors", vectors)
+
+        records.append(record)
+
+    missing_columns = []
+    if any("fields" not in item.record for item in items):
+        missing_columns.append(Record.fields)
+    if any("metadata" not in item.record for item in items):
+        missing_columns.append(Record.metadata_)
+
+    if missing_columns:
+        rows = await db.execute(select(Record.id, *missing_columns).where(Record.id.in_([r.id for r in records])))
+        values_by_record_id = {row[0]: row[1:] for row in rows}
+
+        for record in records:
+            for column, value in zip(missing_columns, values_by_record_id.get(record.id, ())):
+                setattr(record, column.key, value)
+
+    return records
+
+
+async def exact_similarity_search(
+    db: AsyncSession,
+    search_engine: SearchEngine,
+    dataset: Dataset,
+    vector_settings: VectorSettings,
+    value: Optional[List[float]] = None,
+    record: Optional[Record] = None,
+    query: Optional[Union[TextQuery, str]] = None,
+    filter: Optional[Filter] = None,
+    max_results: int = 100,
+    order: SimilarityOrder = SimilarityOrder.most_similar,
+    threshold: Optional[float] = None,
+) -> SearchResponses:
+    """Same as `SearchEngine.similarity_search` but scoring all the dataset vectors instead of using approximate kNN.
+
+    Text queries and filters are resolved to the matching record ids with the search engine and only those
+    vectors are scored.
+    """
+    if bool(value) == bool(record):
+        raise ValueError("Must provide either vector value or record to compute the similarity search")
+
+    vector_value = value
+    record_id = None
+
+    if not vector_value:
+        record_id = record.id
+        vector_value = record.vector_value_by_vector_settings(vector_settings)
+
+    if not vector_value:
+        raise ValueError("Cannot find a vector value to apply with provided info")
+
+    vectors_matrix_store = get_vectors_matrix_store()
+    if not await vectors_matrix_store.is_current(vector_settings):
+        await _build_vectors_matrix(db, vector_settings)
+
+    candidates_ids = None
+    if query or filter:
+        candidates_ids = await _search_records_ids(search_engine, dataset, query, filter)
+
+    top_k = await vectors_matrix_store.top_k(
+        vector_settings,
+        vector_value,
+        max_results,
+        order=order,
+        candidates_ids=candidates_ids,
+        excluded_id=record_id,
+    )
+
+    items = [
+        SearchResponseItem(record_id=record_id, score=score)
+        for record_id, score in top_k
+        if threshold is None or score >= threshold
+    ]
+
+    return SearchResponses(items=items, total=len(items))
+
+
+async def upsert_vectors_matrices(dataset: Dataset, vectors: Iterable[Vector]) -> None:
+    if not dataset.exact_similarity_search:
+        return
+
+    values_by_vector_settings_id: Dict[UUID, Dict[UUID, List[float]]] = defaultdict(dict)
+    for vector in vectors:
+        values_by_vector_settings_id[vector.vector_settings_id][vector.record_id] = vector.value
+
+    vectors_matrix_store = get_vectors_matrix_store()
+    for vector_settings in await dataset.awaitable_attrs.vectors_settings:
+        if vector_settings.id in values_by_vector_settings_id:
+            await vectors_matrix_store.upsert(vector_settings, values_by_vector_settings_id[vector_settings.id])
+
+
+async def delete_vectors_matrices_records(dataset: Dataset, records_ids: Iterable[UUID]) -> None:
+    if not dataset.exact_similarity_search:
+        return
+
+    records_ids = list(records_ids)
+
+    vectors_matrix_store = get_vectors_matrix_store()
+    for vector_settings in await dataset.awaitable_attrs.vectors_settings:
+        await vectors_matrix_store.delete(vector_settings, records_ids)
+
+
+async def drop_vectors_matrices(vectors_settings: Iterable[VectorSettings]) -> None:
+    vectors_matrix_store = get_vectors_matrix_store()
+    for vector_settings in vectors_settings:
+        await vectors_matrix_store.drop(vector_settings)
+
+
+async def _build_vectors_matrix(db: AsyncSession, vector_settings: VectorSettings) -> None:
+    async def load_vectors() -> List[Tuple[UUID, bytes]]:
+        # NOTE: Packed values are read as they are stored, so they are not decoded to Python floats
+        result = await db.execute(
+            select(Vector.record_id, type_coerce(Vector.value, LargeBinary))
+            .where(Vector.vector_settings_id == vector_settings.id)
+            .order_by(Vector.record_id)
+        )
+
+        return result.all()
+
+    await get_vectors_matrix_store().build(vector_settings, load_vectors)
+
+
+async def _search_records_ids(
+    search_engine: SearchEngine,
+    dataset: Dataset,
+    query: Optional[Union[TextQuery, str]],
+    filter: Optional[Filter],
+) -> Set[UUID]:
+    records_ids = set()
+    search_after = None
+
+    while True:
+        responses = await search_engine.search(
+            dataset,
+            query=query,
+            filter=filter,
+            limit=EXACT_SIMILARITY_SEARCH_CANDIDATES_PAGE_SIZE,
+            search_after=search_after,
+        )
+        records_ids.update(item.record_id for item in responses.items)
+
+        if len(responses.items) < EXACT_SIMILARITY_SEARCH_CANDIDATES_PAGE_SIZE:
+            return records_ids
+
+        search_after = responses.next_search_after
+
+
 async def get_dataset_suggestion_agents_by_question(db: AsyncSession, dataset_id: UUID) -> List[Mapping[str, Any]]:
     if db.bind.dialect.name == postgresql.dialect.name:
         return await _get_dataset_suggestion_agents_by_question_postgresql(db, dataset_id)
@@ -14,12 +14,17 @@
 
 from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from argilla_server.jobs.queues import REDIS_CONNECTION
 from argilla_server.models import Webhook
 from argilla_server.validators.webhooks import WebhookCreateValidator
 
+ENABLED_WEBHOOKS_SESSION_INFO_KEY = "enabled_webhooks"
+WEBHOOKS_CACHE_GENERATION_REDIS_KEY = "webhooks:cache:generation"
+
 
 async def list_webhooks(db: AsyncSession) -> Sequence[Webhook]:
     result = await db.execute(select(Webhook).order_by(Webhook.inserted_at.asc()))
@@ -33,6 +38,18 @@ async def list_enabled_webhooks(db: AsyncSession) -> Sequence[Webhook]:
     return result.scalars().all()
 
 
+async def list_enabled_webhooks_cached(db: AsyncSession) -> Sequence[Webhook]:
+    """Same as `list_enabled_webhooks` but the result is cached in the session for its whole lifetime.
+
+    Notifying events for every item of a bulk operation would otherwise query the enabled webhooks once per item.
+    The cache is dropped as soon as the session flushes any change to a webhook.
+    """
+    if ENABLED_WEBHOOKS_SESSION_INFO_KEY not in db.info:
+        db.info[ENABLED_WEBHOOKS_SESSION_INFO_KEY] = await list_enabled_webhooks(db)
+
+    return db.info[ENABLED_WEBHOOKS_SESSION_INFO_KEY]
+
+
 async def create_webhook(db: AsyncSession, webhook_attrs: dict) -> Webhook:
     webhook = Webhook(**webhook_attrs)
 
@@ -42,8 +59,36 @@ async def create_webhook(db: AsyncSession, webhook_attrs: dict) -> Webhook:
 
 
 async def update_webhook(db: AsyncSession, webhook: Webhook, webhook_attrs: dict) -> Webhook:
-    return await webhook.update(db, **webhook_attrs)
+    webhook = await webhook.update(db, **webhook_attrs)
+
+    expire_webhooks_cache()
+
+    return webhook
 
 
 async def delete_webhook(db: AsyncSession, webhook: Webhook) -> Webhook:
-    return await webhook.delete(db)
+    webhook = await webhook.delete(db)
+
+    expire_webhooks_cache()
+
+    return webhook
+
+
+def get_webhooks_cache_generation() -> int:
+    return int(REDIS_CONNECTION.get(WEBHOOKS_CACHE_GENERATION_REDIS_KEY) or 0)
+
+
+def expire_webhooks_cache() -> None:
+    """Invalidates the webhooks cached by the workers delivering events (see `notify_event_job`)."""
+    REDIS_CONNECTION.incr(WEBHOOKS_CACHE_GENERATION_REDIS_KEY)
+
+
+@event.listens_for(Session, "after_flush")
+def _expire_enabled_webhooks_cache(session: Session, flush_context) -> None:
+    if ENABLED_WEBHOOKS_SESSION_INFO_KEY not in session.info:
+        return
+
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, Webhook):
+            session.info.pop(ENABLED_WEBHOOKS_SESSION_INFO_KEY, None)
+            return
@@ -104,6 +104,17 @@ class SortOrder(StrEnum):
     desc = "desc"
 
 
+class SearchEngineRefreshPolicy(StrEnum):
+    true = "true"  # Refresh affected shards immediately after the operation
+    wait_for = "wait_for"  # Wait for the next periodic refresh before returning
+    false = "false"  # Do not wait, changes will be visible after the next periodic refresh
+
+
+class VectorsStorageDtype(StrEnum):
+    float32 = "float32"
+    float16 = "float16"
+
+
 class SimilarityOrder(StrEnum):
     most_similar = "most_similar"
     least_similar = "least_similar"
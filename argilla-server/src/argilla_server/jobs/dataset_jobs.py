@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import List, Optional
 from uuid import UUID
 
 from rq import Retry
@@ -19,35 +20,38 @@ from rq.decorators import job
 
 from sqlalchemy import select
 
-from argilla_server.models import Record, Response
+from argilla_server.models import Record
 from argilla_server.database import AsyncSessionLocal
 from argilla_server.jobs.queues import DEFAULT_QUEUE, JOB_TIMEOUT_DISABLED
 from argilla_server.search_engine.base import SearchEngine
 from argilla_server.settings import settings
 from argilla_server.contexts import distribution
 
-JOB_RECORDS_YIELD_PER = 100
+JOB_RECORDS_BATCH_SIZE = 500
 
 
 @job(DEFAULT_QUEUE, timeout=JOB_TIMEOUT_DISABLED, retry=Retry(max=3))
 async def update_dataset_records_status_job(dataset_id: UUID) -> None:
     """This Job updates the status of all the records in the dataset when the distribution strategy changes."""
 
-    record_ids = []
+    async with SearchEngine.get_by_name(settings.search_engine) as search_engine:
+        last_record_id = None
+
+        while True:
+            record_ids = await _list_dataset_record_ids_batch(dataset_id, after_record_id=last_record_id)
+            if len(record_ids) == 0:
+                break
+
+            # NOTE: We are updating the records status outside the listing transaction to avoid database locks with SQLite.
+            await distribution.update_records_status(search_engine, dataset_id, record_ids)
+
+            last_record_id = record_ids[-1]
+
+
+async def _list_dataset_record_ids_batch(dataset_id: UUID, after_record_id: Optional[UUID] = None) -> List[UUID]:
+    query = select(Record.id).where(Record.dataset_id == dataset_id).order_by(Record.id).limit(JOB_RECORDS_BATCH_SIZE)
+    if after_record_id is not None:
+        query = query.where(Record.id > after_record_id)
 
     async with AsyncSessionLocal() as db:
-        stream = await db.stream(
-            select(Record.id)
-            .join(Response)
-            .where(Record.dataset_id == dataset_id)
-            .order_by(Record.inserted_at.asc())
-            .execution_options(yield_per=JOB_RECORDS_YIELD_PER)
-        )
-
-        async for record_id in stream.scalars():
-            record_ids.append(record_id)
-
-    # NOTE: We are updating the records status outside the database transaction to avoid database locks with SQLite.
-    async with SearchEngine.get_by_name(settings.search_engine) as search_engine:
-        for record_id in record_ids:
-            await distribution.update_record_status(search_engine, record_id)
+        return (await db.execute(query)).scalars().all()
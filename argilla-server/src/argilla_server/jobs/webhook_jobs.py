@@ -12,44 +12,136 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import time
 import httpx
 
-from typing import List
+from typing import Dict, Iterable, List, Optional
 
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from rq.job import Retry, Job
 from rq.decorators import job
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.encoders import jsonable_encoder
 
-from argilla_server.webhooks.v1.commons import notify_event
+from argilla_server.webhooks.v1.commons import get_http_client, notify_event
 from argilla_server.database import AsyncSessionLocal
-from argilla_server.jobs.queues import HIGH_QUEUE
+from argilla_server.jobs.queues import HIGH_QUEUE, REDIS_CONNECTION
+from argilla_server.settings import settings
 from argilla_server.contexts import webhooks
 from argilla_server.models import Webhook
 
+NOTIFY_EVENT_JOB_RETRY = Retry(max=3, interval=[10, 60, 180])
+NOTIFY_EVENT_JOB_POSTPONE_SECONDS = 1
+
+# NOTE: In-flight counters expire if they are not updated for a while so a worker dying in the middle
+# of a delivery doesn't leave the webhook slots taken forever.
+WEBHOOK_IN_FLIGHT_DELIVERIES_TTL_SECONDS = 60
+
+_cached_webhooks: Dict[UUID, Webhook] = {}
+_cached_webhooks_generation: Optional[int] = None
+
 
 async def enqueue_notify_events(db: AsyncSession, event: str, timestamp: datetime, data: dict) -> List[Job]:
-    enabled_webhooks = await webhooks.list_enabled_webhooks(db)
+    return await enqueue_notify_events_many(db, event, timestamp, [data])
+
+
+async def enqueue_notify_events_many(
+    db: AsyncSession, event: str, timestamp: datetime, data_items: Iterable[dict]
+) -> List[Job]:
+    enabled_webhooks = [
+        webhook for webhook in await webhooks.list_enabled_webhooks_cached(db) if event in webhook.events
+    ]
     if len(enabled_webhooks) == 0:
         return []
 
-    enqueued_jobs = []
-    jsonable_data = jsonable_encoder(data)
-    for enabled_webhook in enabled_webhooks:
-        if event in enabled_webhook.events:
-            enqueue_job = notify_event_job.delay(enabled_webhook.id, event, timestamp, jsonable_data)
-            enqueued_jobs.append(enqueue_job)
+    jobs_data = []
+    for data in data_items:
+        jsonable_data = jsonable_encoder(data)
+        for enabled_webhook in enabled_webhooks:
+            jobs_data.append(
+                HIGH_QUEUE.prepare_data(
+                    notify_event_job,
+                    args=(enabled_webhook.id, event, timestamp, jsonable_data),
+                    retry=NOTIFY_EVENT_JOB_RETRY,
+                )
+            )
 
-    return enqueued_jobs
+    # All the jobs are enqueued using a single Redis pipeline
+    return HIGH_QUEUE.enqueue_many(jobs_data)
 
 
-@job(HIGH_QUEUE, retry=Retry(max=3, interval=[10, 60, 180]))
+@job(HIGH_QUEUE, retry=NOTIFY_EVENT_JOB_RETRY)
 async def notify_event_job(webhook_id: UUID, event: str, timestamp: datetime, data: dict) -> None:
-    async with AsyncSessionLocal() as db:
-        webhook = await Webhook.get_or_raise(db, webhook_id)
+    webhook = await _get_webhook(webhook_id)
+
+    if not _acquire_webhook_delivery_slot(webhook.id):
+        HIGH_QUEUE.enqueue_in(
+            timedelta(seconds=NOTIFY_EVENT_JOB_POSTPONE_SECONDS),
+            notify_event_job,
+            webhook_id,
+            event,
+            timestamp,
+            data,
+            retry=NOTIFY_EVENT_JOB_RETRY,
+        )
+        return
+
+    try:
+        response = notify_event(webhook, event, timestamp, data, client=get_http_client(webhook.url))
+    finally:
+        _release_webhook_delivery_slot(webhook.id)
 
-    response = notify_event(webhook, event, timestamp, data)
     response.raise_for_status()
+
+
+async def _get_webhook(webhook_id: UUID) -> Webhook:
+    global _cached_webhooks_generation
+
+    generation = webhooks.get_webhooks_cache_generation()
+    if generation != _cached_webhooks_generation:
+        _cached_webhooks.clear()
+        _cached_webhooks_generation = generation
+
+    webhook = _cached_webhooks.get(webhook_id)
+    if webhook is None:
+        async with AsyncSessionLocal() as db:
+            webhook = await Webhook.get_or_raise(db, webhook_id)
+
+        _cached_webhooks[webhook_id] = webhook
+
+    return webhook
+
+
+def _acquire_webhook_delivery_slot(webhook_id: UUID) -> bool:
+    in_flight_key = _webhook_in_flight_deliveries_key(webhook_id)
+    rate_key = f"webhooks:{webhook_id}:deliveries:{int(time.time())}"
+
+    pipeline = REDIS_CONNECTION.pipeline()
+    pipeline.incr(in_flight_key)
+    pipeline.expire(in_flight_key, WEBHOOK_IN_FLIGHT_DELIVERIES_TTL_SECONDS)
+    if settings.webhooks_max_deliveries_per_second:
+        pipeline.incr(rate_key)
+        pipeline.expire(rate_key, 2)
+    results = pipeline.execute()
+
+    in_flight_deliveries = results[0]
+    deliveries_this_second = results[2] if settings.webhooks_max_deliveries_per_second else 0
+
+    if in_flight_deliveries > settings.webhooks_max_concurrent_deliveries or (
+        settings.webhooks_max_deliveries_per_second
+        and deliveries_this_second > settings.webhooks_max_deliveries_per_second
+    ):
+        _release_webhook_delivery_slot(webhook_id)
+        return False
+
+    return True
+
+
+def _release_webhook_delivery_slot(webhook_id: UUID) -> None:
+    REDIS_CONNECTION.decr(_webhook_in_flight_deliveries_key(webhook_id))
+
+
+def _webhook_in_flight_deliveries_key(webhook_id: UUID) -> str:
+    return f"webhooks:{webhook_id}:in_flight_deliveries"
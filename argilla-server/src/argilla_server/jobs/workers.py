@@ -0,0 +1,50 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+from typing import Any, Coroutine
+
+from rq.job import Job
+from rq.worker import SimpleWorker
+
+from argilla_server.database import async_engine
+
+
+class InProcessJob(Job):
+    """
+    Job running coroutines on an event loop that is closed once the job finishes.
+
+    Pooled database connections are bound to the event loop that opened them, so they are released before
+    closing it and the next job running in the same process opens its own connections.
+    """
+
+    def _execute(self) -> Any:
+        result = self.func(*self.args, **self.kwargs)
+        if asyncio.iscoroutine(result):
+            return asyncio.run(_run_releasing_database_connections(result))
+
+        return result
+
+
+class InProcessWorker(SimpleWorker):
+    """Worker running jobs inside the worker process so process-wide clients are reused between jobs."""
+
+    job_class = InProcessJob
+
+
+async def _run_releasing_database_connections(coroutine: Coroutine) -> Any:
+    try:
+        return await coroutine
+    finally:
+        await async_engine.dispose()
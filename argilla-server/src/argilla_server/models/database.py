@@ -15,16 +15,20 @@
 import secrets
 import base64
 from datetime import datetime
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
 from sqlalchemy import Enum as SAEnum, PrimaryKeyConstraint
 from sqlalchemy import (
     JSON,
     ForeignKey,
+    Index,
     String,
     Text,
     UniqueConstraint,
+    and_,
+    exists,
+    select,
     sql,
 )
 from sqlalchemy.engine.default import DefaultExecutionContext
@@ -44,10 +48,16 @@ from argilla_server.enums import (
     RecordStatus,
 )
 from argilla_server.models.base import DatabaseModel
+from argilla_server.models.memberships import cache_workspace_membership, get_cached_workspace_membership
 from argilla_server.models.metadata_properties import MetadataPropertySettings
 from argilla_server.models.mixins import inserted_at_current_value
+from argilla_server.models.vectors import PackedVector
 from pydantic import TypeAdapter
 
+# NOTE: Building a TypeAdapter compiles its validation schema, so they are built once and reused for every instance
+_question_settings_adapter = TypeAdapter(QuestionSettings)
+_metadata_property_settings_adapter = TypeAdapter(MetadataPropertySettings)
+
 # Include here the data model ref to be accessible for automatic alembic migration scripts
 __all__ = [
     "Dataset",
@@ -178,7 +188,7 @@ class Suggestion(DatabaseModel):
 class Vector(DatabaseModel):
     __tablename__ = "vectors"
 
-    value: Mapped[List[Any]] = mapped_column(JSON)
+    value: Mapped[List[Any]] = mapped_column(PackedVector)
     record_id: Mapped[UUID] = mapped_column(ForeignKey("records.id", ondelete="CASCADE"), index=True)
     vector_settings_id: Mapped[UUID] = mapped_column(ForeignKey("vectors_settings.id", ondelete="CASCADE"), index=True)
 
@@ -262,7 +272,10 @@ class Record(DatabaseModel):
         order_by=Vector.inserted_at.asc(),
     )
 
-    __table_args__ = (UniqueConstraint("external_id", "dataset_id", name="record_external_id_dataset_id_uq"),)
+    __table_args__ = (
+        UniqueConstraint("external_id", "dataset_id", name="record_external_id_dataset_id_uq"),
+        Index("ix_records_dataset_id_inserted_at_id", "dataset_id", "inserted_at", "id"),
+    )
 
     def is_completed(self) -> bool:
         return self.status == RecordStatus.completed
@@ -301,7 +314,7 @@ class Question(DatabaseModel):
 
     @property
     def parsed_settings(self) -> QuestionSettings:
-        return TypeAdapter(QuestionSettings).validate_python(self.settings)
+        return _question_settings_adapter.validate_python(self.settings)
 
     @property
     def is_text(self) -> bool:
@@ -378,7 +391,7 @@ class MetadataProperty(DatabaseModel):
 
     @property
     def parsed_settings(self) -> MetadataPropertySettings:
-        return TypeAdapter(MetadataPropertySettings).validate_python(self.settings)
+        return _metadata_property_settings_adapter.validate_python(self.settings)
 
     @property
     def visible_for_annotators(self) -> bool:
@@ -426,6 +439,7 @@ class Dataset(DatabaseModel):
     name: Mapped[str] = mapped_column(index=True)
     guidelines: Mapped[Optional[str]] = mapped_column(Text)
     allow_extra_metadata: Mapped[bool] = mapped_column(default=True, server_default=sql.true())
+    exact_similarity_search: Mapped[bool] = mapped_column(default=False, server_default=sql.false())
     status: Mapped[DatasetStatus] = mapped_column(DatasetStatusEnum, default=DatasetStatus.draft, index=True)
     distribution: Mapped[dict] = mapped_column(MutableDict.as_mutable(JSON))
     metadata_: Mapped[Optional[dict]] = mapped_column("metadata", JSON, nullable=True)
@@ -490,29 +504,37 @@ class Dataset(DatabaseModel):
         return DatasetDistributionStrategy(self.distribution["strategy"])
 
     def field_by_name(self, name: str) -> Union["Field", None]:
-        for field in self.fields:
-            if field.name == name:
-                return field
+        return self._collection_index("fields", "name").get(name)
 
     def metadata_property_by_name(self, name: str) -> Union["MetadataProperty", None]:
-        for metadata_property in self.metadata_properties:
-            if metadata_property.name == name:
-                return metadata_property
+        return self._collection_index("metadata_properties", "name").get(name)
 
     def question_by_id(self, question_id: UUID) -> Union[Question, None]:
-        for question in self.questions:
-            if question.id == question_id:
-                return question
+        return self._collection_index("questions", "id").get(question_id)
 
     def question_by_name(self, name: str) -> Union[Question, None]:
-        for question in self.questions:
-            if question.name == name:
-                return question
+        return self._collection_index("questions", "name").get(name)
 
     def vector_settings_by_name(self, name: str) -> Union["VectorSettings", None]:
-        for vector_settings in self.vectors_settings:
-            if vector_settings.name == name:
-                return vector_settings
+        return self._collection_index("vectors_settings", "name").get(name)
+
+    def _collection_index(self, relationship: str, attribute: str) -> Dict[Any, Any]:
+        # NOTE: Lookups are done once per record on bulk operations so the index is built once and reused while
+        # the loaded collection is not replaced or resized.
+        collection = getattr(self, relationship)
+        indexes = self.__dict__.setdefault("_collection_indexes", {})
+
+        cached = indexes.get((relationship, attribute))
+        if cached is not None and cached[0] is collection and cached[1] == len(collection):
+            return cached[2]
+
+        index = {}
+        for item in collection:
+            index.setdefault(getattr(item, attribute), item)
+
+        indexes[(relationship, attribute)] = (collection, len(collection), index)
+
+        return index
 
     def __repr__(self):
         return (
@@ -610,20 +632,31 @@ class User(DatabaseModel):
         return self.role == UserRole.annotator
 
     async def is_member(self, workspace_id: UUID) -> bool:
-        # TODO: Change query to use exists may improve performance
-        return (
-            await WorkspaceUser.get_by(self.current_async_session, workspace_id=workspace_id, user_id=self.id)
-            is not None
-        )
+        is_member = get_cached_workspace_membership(self.id, workspace_id)
+        if is_member is None:
+            is_member = await self.current_async_session.scalar(
+                select(exists().where(WorkspaceUser.workspace_id == workspace_id, WorkspaceUser.user_id == self.id))
+            )
+            cache_workspace_membership(self.id, workspace_id, is_member)
+
+        return is_member
 
     async def is_member_of_workspace_name(self, workspace_name: str) -> bool:
-        workspace = await Workspace.get_by(self.current_async_session, name=workspace_name)
-        if not workspace:
-            return False
-        return (
-            await WorkspaceUser.get_by(self.current_async_session, workspace_id=workspace.id, user_id=self.id)
-            is not None
+        result = await self.current_async_session.execute(
+            select(Workspace.id, WorkspaceUser.user_id)
+            .outerjoin(
+                WorkspaceUser, and_(WorkspaceUser.workspace_id == Workspace.id, WorkspaceUser.user_id == self.id)
+            )
+            .where(Workspace.name == workspace_name)
         )
+        row = result.first()
+        if row is None:
+            return False
+
+        is_member = row.user_id is not None
+        cache_workspace_membership(self.id, row.id, is_member)
+
+        return is_member
 
     def __repr__(self):
         return (
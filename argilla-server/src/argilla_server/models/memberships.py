@@ -0,0 +1,65 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+
+from argilla_server.settings import settings
+
+__all__ = ["get_cached_workspace_membership", "cache_workspace_membership", "expire_workspace_memberships"]
+
+WORKSPACE_MEMBERSHIPS_CACHE_MAX_SIZE = 10000
+
+_cache: "OrderedDict[Tuple[UUID, UUID], Tuple[float, bool]]" = OrderedDict()
+
+
+def get_cached_workspace_membership(user_id: UUID, workspace_id: UUID) -> Optional[bool]:
+    """Returns whether the user is a member of the workspace, or `None` if it is not cached or has expired."""
+    if settings.workspace_membership_cache_ttl <= 0:
+        return None
+
+    expires_at, is_member = _cache.get((user_id, workspace_id), (0, None))
+    if expires_at <= time.monotonic():
+        return None
+
+    return is_member
+
+
+def cache_workspace_membership(user_id: UUID, workspace_id: UUID, is_member: bool) -> None:
+    if settings.workspace_membership_cache_ttl <= 0:
+        return
+
+    key = (user_id, workspace_id)
+
+    _cache[key] = (time.monotonic() + settings.workspace_membership_cache_ttl, is_member)
+    _cache.move_to_end(key)
+
+    while len(_cache) > WORKSPACE_MEMBERSHIPS_CACHE_MAX_SIZE:
+        _cache.popitem(last=False)
+
+
+def expire_workspace_memberships(user_id: Optional[UUID] = None, workspace_id: Optional[UUID] = None) -> None:
+    """Drops the cached memberships of a user, of a workspace or of a user in a workspace.
+
+    Contexts adding or removing workspace users must call it. Changes done by other processes are visible once the
+    cached memberships expire.
+    """
+    if user_id is not None and workspace_id is not None:
+        _cache.pop((user_id, workspace_id), None)
+        return
+
+    for key in [key for key in _cache if key[0] == user_id or key[1] == workspace_id]:
+        del _cache[key]
@@ -0,0 +1,108 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import struct
+import sys
+from array import array
+from typing import List, Optional
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+from argilla_server.enums import VectorsStorageDtype
+from argilla_server.settings import settings
+
+__all__ = [
+    "NUMPY_DTYPES",
+    "PackedVector",
+    "pack_vector_value",
+    "unpack_vector_value",
+    "vector_value_buffer",
+    "vector_value_dtype",
+]
+
+# NOTE: Packed values start with the `struct` format character of their items, followed by the items as little-endian
+_FORMAT_BY_DTYPE = {
+    VectorsStorageDtype.float32: b"f",
+    VectorsStorageDtype.float16: b"e",
+}
+_ITEM_SIZE_BY_FORMAT = {b"f": 4, b"e": 2}
+
+# NumPy dtypes to read the buffer of packed values (see `vector_value_buffer`)
+NUMPY_DTYPES = {VectorsStorageDtype.float32: "<f4", VectorsStorageDtype.float16: "<f2"}
+
+
+def pack_vector_value(value: List[float], dtype: VectorsStorageDtype = VectorsStorageDtype.float32) -> bytes:
+    format = _FORMAT_BY_DTYPE[dtype]
+
+    if format == b"f":
+        items = array("f", value)
+        if sys.byteorder == "big":
+            items.byteswap()
+
+        return format + items.tobytes()
+
+    return format + struct.pack(f"<{len(value)}{format.decode()}", *value)
+
+
+def unpack_vector_value(data: bytes) -> List[float]:
+    format, items = data[:1], vector_value_buffer(data)
+
+    if format == b"f":
+        values = array("f")
+        values.frombytes(items)
+        if sys.byteorder == "big":
+            values.byteswap()
+
+        return values.tolist()
+
+    return list(struct.unpack(f"<{len(items) // _ITEM_SIZE_BY_FORMAT[format]}{format.decode()}", items))
+
+
+def vector_value_buffer(data: bytes) -> memoryview:
+    """Returns the little-endian items of a packed vector value without copying them.
+
+    The buffer can be read with `numpy.frombuffer` (`<f4` or `<f2` dtypes) or written to a file as is.
+    """
+    if data[:1] not in _ITEM_SIZE_BY_FORMAT:
+        raise ValueError(f"Unknown packed vector value format {data[:1]!r}")
+
+    return memoryview(data)[1:]
+
+
+def vector_value_dtype(data: bytes) -> VectorsStorageDtype:
+    for dtype, format in _FORMAT_BY_DTYPE.items():
+        if data[:1] == format:
+            return dtype
+
+    raise ValueError(f"Unknown packed vector value format {data[:1]!r}")
+
+
+class PackedVector(TypeDecorator):
+    """Stores vector values as packed floats instead of JSON arrays, using the `vectors_storage_dtype` setting."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[List[float]], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+
+        return pack_vector_value(value, settings.vectors_storage_dtype)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[List[float]]:
+        if value is None:
+            return None
+
+        return unpack_vector_value(value)
@@ -18,9 +18,19 @@ from ..settings import settings
 from .base import *  # noqa
 from .base import SearchEngine
 from .elasticsearch import ElasticSearchEngine
+from .embedded import EmbeddedSearchEngine
 from .opensearch import OpenSearchEngine
+from .vectors_matrix import VectorsMatrixStore, get_vectors_matrix_store
 
 
 async def get_search_engine() -> AsyncGenerator[SearchEngine, None]:
     async with SearchEngine.get_by_name(settings.search_engine) as engine:
         yield engine
+
+
+async def open_search_engine() -> SearchEngine:
+    return await SearchEngine.open_shared_instance(settings.search_engine)
+
+
+async def close_search_engine() -> None:
+    await SearchEngine.close_shared_instances()
@@ -11,15 +11,20 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import asyncio
 import dataclasses
 from abc import ABCMeta, abstractmethod
 from contextlib import asynccontextmanager
 from typing import (
+    Any,
     AsyncGenerator,
+    Dict,
     Generic,
     Iterable,
     List,
     Optional,
+    Set,
+    Tuple,
     Union,
     TypeVar,
     Literal,
@@ -29,6 +34,7 @@ from uuid import UUID
 from argilla_server.enums import (
     MetadataPropertyType,
     RecordSortField,
+    RecordStatus,
     ResponseStatus,
     ResponseStatusFilter,
     SimilarityOrder,
@@ -58,6 +64,7 @@ __all__ = [
     "AndFilter",
     "Filter",
     "Order",
+    "RecordDelta",
 ]
 
 
@@ -108,6 +115,18 @@ class AndFilter:
 Filter = Union[AndFilter, TermsFilter, RangeFilter]
 
 
+@dataclasses.dataclass
+class RecordDelta:
+    """Changes of a record to apply to its search engine document at once."""
+
+    record_id: UUID
+    status: Optional[RecordStatus] = None
+    upserted_responses: List[Response] = dataclasses.field(default_factory=list)
+    deleted_responses: List[Response] = dataclasses.field(default_factory=list)
+    upserted_suggestions: List[Suggestion] = dataclasses.field(default_factory=list)
+    deleted_suggestions: List[Suggestion] = dataclasses.field(default_factory=list)
+
+
 @dataclasses.dataclass
 class Order:
     scope: FilterScope
@@ -135,11 +154,16 @@ class UserResponseStatusFilter(BaseModel):
 class SearchResponseItem(BaseModel):
     record_id: UUID
     score: Optional[float] = None
+    # NOTE: Record attributes read from the search engine document. Only set when searching `with_source`.
+    # Attributes the search engine cannot serve as stored in the database are not included.
+    record: Optional[Dict[str, Any]] = None
 
 
 class SearchResponses(BaseModel):
     items: List[SearchResponseItem]
     total: int = 0
+    # NOTE: Sort values of the last item. Pass them as `search_after` to get the next page of results.
+    next_search_after: Optional[List[Any]] = None
 
 
 class SortBy(BaseModel):
@@ -181,6 +205,8 @@ MetadataMetrics = Union[TermsMetrics, IntegerMetadataMetrics, FloatMetadataMetri
 
 class SearchEngine(metaclass=ABCMeta):
     registered_classes = {}
+    # Process-wide engine instances (and the event loop owning their connection pools) indexed by engine name
+    shared_instances: Dict[str, Tuple["SearchEngine", asyncio.AbstractEventLoop]] = {}
 
     @classmethod
     @abstractmethod
@@ -207,15 +233,68 @@ class SearchEngine(metaclass=ABCMeta):
 
         return decorator
 
+    @classmethod
+    def _get_engine_class(cls, engine_name: str):
+        if engine_name not in cls.registered_classes:
+            raise ValueError(f"No engine class registered for '{engine_name}'")
+
+        return cls.registered_classes[engine_name]
+
+    @classmethod
+    def get_shared_instance(cls, engine_name: str) -> Optional["SearchEngine"]:
+        """Returns the shared engine instance for the running event loop, if any has been opened."""
+        engine_name = engine_name.lower().strip()
+
+        shared = cls.shared_instances.get(engine_name)
+        if shared is None:
+            return None
+
+        engine, loop = shared
+        try:
+            if loop is asyncio.get_running_loop():
+                return engine
+        except RuntimeError:
+            pass
+
+        return None
+
+    @classmethod
+    async def open_shared_instance(cls, engine_name: str) -> "SearchEngine":
+        """
+        Creates the process-wide engine instance for the running event loop. The instance (and its HTTP connection
+        pool) will be reused by `get_by_name` until `close_shared_instances` is called.
+        """
+        engine_name = engine_name.lower().strip()
+
+        engine = cls.get_shared_instance(engine_name)
+        if engine is not None:
+            return engine
+
+        engine_class = cls._get_engine_class(engine_name)
+        engine = await engine_class.new_instance()
+        cls.shared_instances[engine_name] = (engine, asyncio.get_running_loop())
+
+        return engine
+
+    @classmethod
+    async def close_shared_instances(cls) -> None:
+        shared_instances = list(cls.shared_instances.values())
+        cls.shared_instances.clear()
+
+        for engine, _ in shared_instances:
+            await engine.close()
+
     @classmethod
     @asynccontextmanager
     async def get_by_name(cls, engine_name: str) -> AsyncGenerator["SearchEngine", None]:
         engine_name = engine_name.lower().strip()
 
-        if engine_name not in cls.registered_classes:
-            raise ValueError(f"No engine class registered for '{engine_name}'")
+        shared_engine = cls.get_shared_instance(engine_name)
+        if shared_engine is not None:
+            yield shared_engine
+            return
 
-        engine_class = cls.registered_classes[engine_name]
+        engine_class = cls._get_engine_class(engine_name)
 
         engine = None
 
@@ -228,6 +307,11 @@ class SearchEngine(metaclass=ABCMeta):
             if engine is not None:
                 await engine.close()
 
+    @asynccontextmanager
+    async def bulk_load(self, dataset: Dataset) -> AsyncGenerator[None, None]:
+        """Defers index refreshes for the dataset while large amounts of records are being indexed"""
+        yield
+
     @abstractmethod
     async def get_all_index_names(self) -> List[str]:
         pass
@@ -244,18 +328,39 @@ class SearchEngine(metaclass=ABCMeta):
     async def configure_metadata_property(self, dataset: Dataset, metadata_property: MetadataProperty):
         pass
 
+    @asynccontextmanager
+    async def shadow_index(self, dataset: Dataset) -> AsyncGenerator[Optional[str], None]:
+        """
+        Yields the name of a new index for the dataset that can be populated using `index_records` and will replace
+        the live index on exit. Engines without index aliases support recreate the live index instead.
+        """
+        await self.delete_index(dataset)
+        await self.create_index(dataset)
+
+        yield None
+
     @abstractmethod
-    async def index_records(self, dataset: Dataset, records: Iterable[Record]):
+    async def index_records(self, dataset: Dataset, records: Iterable[Record], index_name: Optional[str] = None):
         pass
 
     @abstractmethod
     async def partial_record_update(self, record: Record, **update):
         pass
 
+    @abstractmethod
+    async def partial_records_update(self, dataset: Dataset, records_updates: Dict[UUID, dict]):
+        pass
+
     @abstractmethod
     async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
         pass
 
+    @abstractmethod
+    async def delete_records_not_in(
+        self, dataset: Dataset, records_ids: Set[UUID], index_name: Optional[str] = None
+    ) -> int:
+        """Deletes the indexed records of the dataset whose ids are not in `records_ids` and returns how many were"""
+
     @abstractmethod
     async def update_record_response(self, response: Response):
         pass
@@ -264,6 +369,28 @@ class SearchEngine(metaclass=ABCMeta):
     async def delete_record_response(self, response: Response):
         pass
 
+    async def update_records(self, dataset: Dataset, records_deltas: Iterable[RecordDelta]):
+        """Applies the changes of the given record deltas, one per record, to the dataset records documents.
+
+        Engines supporting it should apply all the changes with a single request.
+        """
+        records_updates = {}
+        for record_delta in records_deltas:
+            for response in record_delta.deleted_responses:
+                await self.delete_record_response(response)
+            for response in record_delta.upserted_responses:
+                await self.update_record_response(response)
+            for suggestion in record_delta.deleted_suggestions:
+                await self.delete_record_suggestion(suggestion)
+            for suggestion in record_delta.upserted_suggestions:
+                await self.update_record_suggestion(suggestion)
+
+            if record_delta.status is not None:
+                records_updates[record_delta.record_id] = {"status": record_delta.status}
+
+        if records_updates:
+            await self.partial_records_update(dataset, records_updates)
+
     @abstractmethod
     async def update_record_suggestion(self, suggestion: Suggestion):
         pass
@@ -280,6 +407,13 @@ class SearchEngine(metaclass=ABCMeta):
     async def get_dataset_user_progress(self, dataset: Dataset, user: User) -> dict:
         pass
 
+    async def get_dataset_and_user_progress(self, dataset: Dataset, user: User) -> Tuple[dict, dict]:
+        """Returns both `get_dataset_progress` and `get_dataset_user_progress` results.
+
+        Engines supporting it should compute both with a single request.
+        """
+        return await self.get_dataset_progress(dataset), await self.get_dataset_user_progress(dataset, user)
+
     @abstractmethod
     async def search(
         self,
@@ -289,6 +423,9 @@ class SearchEngine(metaclass=ABCMeta):
         sort: Optional[List[Order]] = None,
         offset: int = 0,
         limit: int = 100,
+        search_after: Optional[List[Any]] = None,
+        with_source: bool = False,
+        source_vectors_settings: Optional[List[VectorSettings]] = None,
     ) -> SearchResponses:
         pass
 
@@ -15,13 +15,21 @@
 import dataclasses
 import logging
 from abc import abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Union
+from datetime import datetime
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
 from elasticsearch8 import AsyncElasticsearch
 from opensearchpy import AsyncOpenSearch
 
-from argilla_server.enums import MetadataPropertyType, RecordSortField, ResponseStatusFilter, SimilarityOrder
+from argilla_server.enums import (
+    MetadataPropertyType,
+    RecordSortField,
+    ResponseStatusFilter,
+    SearchEngineRefreshPolicy,
+    SimilarityOrder,
+)
 from argilla_server.models import (
     Dataset,
     Field,
@@ -45,6 +53,7 @@ from argilla_server.search_engine.base import (
     MetadataMetrics,
     Order,
     RangeFilter,
+    RecordDelta,
     RecordFilterScope,
     ResponseFilterScope,
     SearchEngine,
@@ -58,9 +67,14 @@ from argilla_server.search_engine.base import (
 
 
 def es_index_name_for_dataset(dataset: Dataset):
+    # This name will resolve to an alias once the dataset has been reindexed
     return f"rg.{dataset.id}"
 
 
+def es_shadow_index_name_for_dataset(dataset: Dataset) -> str:
+    return f"{es_index_name_for_dataset(dataset)}.{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}"
+
+
 def es_terms_query(field_name: str, values: List[str]) -> dict:
     return {"terms": {field_name: values}}
 
@@ -315,8 +329,16 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
     max_result_window: int = 500000
     # See https://www.elastic.co/guide/en/elasticsearch/reference/current/mapping-settings-limit.html#mapping-settings-limit
     default_total_fields_limit: int = 2000
+    # See https://www.elastic.co/guide/en/elasticsearch/reference/current/docs-refresh.html
+    refresh_policy: SearchEngineRefreshPolicy = SearchEngineRefreshPolicy.true
+    # See https://www.elastic.co/guide/en/elasticsearch/reference/current/index-modules.html#index-refresh-interval-setting
+    refresh_interval: Optional[str] = None
+    # Number of document ids fetched per request when listing all the documents of an index
+    ids_page_size: int = 5000
 
     client: Union[AsyncElasticsearch, AsyncOpenSearch] = dataclasses.field(init=False)
+    # Number of running bulk loads indexed by index name
+    _bulk_loading_indices: Dict[str, int] = dataclasses.field(init=False, default_factory=dict)
 
     _LOGGER = logging.getLogger(__name__)
 
@@ -330,7 +352,52 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
     async def delete_index(self, dataset: Dataset):
         index_name = es_index_name_for_dataset(dataset)
 
-        await self._delete_index_request(index_name)
+        # Aliases cannot be deleted using the index API, so we delete the index behind the alias instead
+        for concrete_index_name in await self._get_alias_indices_request(index_name) or [index_name]:
+            await self._delete_index_request(concrete_index_name)
+
+    @asynccontextmanager
+    async def shadow_index(self, dataset: Dataset) -> AsyncGenerator[str, None]:
+        alias = es_index_name_for_dataset(dataset)
+        index_name = es_shadow_index_name_for_dataset(dataset)
+
+        settings = {**self._configure_index_settings(), "refresh_interval": "-1"}
+        await self._create_index_request(index_name, self._configure_index_mappings(dataset), settings)
+
+        self._bulk_loading_indices[index_name] = 1
+        try:
+            yield index_name
+        except BaseException:
+            await self._delete_index_request(index_name)
+            raise
+        finally:
+            del self._bulk_loading_indices[index_name]
+
+        await self._put_index_settings_request(index_name, {"refresh_interval": self.refresh_interval})
+        await self._refresh_index_request(index_name)
+
+        await self._swap_index_alias(alias, index_name)
+
+    @asynccontextmanager
+    async def bulk_load(self, dataset: Dataset) -> AsyncGenerator[None, None]:
+        index_name = es_index_name_for_dataset(dataset)
+
+        if not self._bulk_loading_indices.get(index_name):
+            # See https://www.elastic.co/guide/en/elasticsearch/reference/current/tune-for-indexing-speed.html#_unset_or_increase_the_refresh_interval
+            await self._put_index_settings_request(index_name, {"refresh_interval": "-1"})
+
+        self._bulk_loading_indices[index_name] = self._bulk_loading_indices.get(index_name, 0) + 1
+
+        try:
+            yield
+        finally:
+            self._bulk_loading_indices[index_name] -= 1
+
+            if self._bulk_loading_indices[index_name] == 0:
+                del self._bulk_loading_indices[index_name]
+
+                await self._put_index_settings_request(index_name, {"refresh_interval": self.refresh_interval})
+                await self._refresh_index_request(index_name)
 
     async def configure_metadata_property(self, dataset: Dataset, metadata_property: MetadataProperty):
         mapping = es_mapping_for_metadata_property(metadata_property)
@@ -344,8 +411,8 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         mappings = self._mapping_for_vector_settings(vector_settings)
         await self.put_index_mapping_request(index, mappings)
 
-    async def index_records(self, dataset: Dataset, records: Iterable[Record]):
-        index_name = es_index_name_for_dataset(dataset)
+    async def index_records(self, dataset: Dataset, records: Iterable[Record], index_name: Optional[str] = None):
+        index_name = index_name or es_index_name_for_dataset(dataset)
 
         bulk_actions = [
             {
@@ -358,18 +425,59 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             for record in records
         ]
 
-        await self._bulk_op_request(bulk_actions)
+        await self._bulk_op_request(bulk_actions, refresh=self._refresh_policy_for_index(index_name))
 
     async def partial_record_update(self, record: Record, **update):
         index_name = es_index_name_for_dataset(record.dataset)
         await self._update_document_request(index_name=index_name, id=str(record.id), body={"doc": update})
 
+    async def partial_records_update(self, dataset: Dataset, records_updates: Dict[UUID, dict]):
+        index_name = es_index_name_for_dataset(dataset)
+
+        bulk_actions = [
+            {"_op_type": "update", "_id": record_id, "_index": index_name, "doc": update}
+            for record_id, update in records_updates.items()
+        ]
+
+        await self._bulk_op_request(bulk_actions, refresh=self._refresh_policy_for_index(index_name))
+
     async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
         index_name = es_index_name_for_dataset(dataset)
 
         bulk_actions = [{"_op_type": "delete", "_id": record.id, "_index": index_name} for record in records]
 
-        await self._bulk_op_request(bulk_actions)
+        await self._bulk_op_request(bulk_actions, refresh=self._refresh_policy_for_index(index_name))
+
+    async def delete_records_not_in(
+        self, dataset: Dataset, records_ids: Set[UUID], index_name: Optional[str] = None
+    ) -> int:
+        index_name = index_name or es_index_name_for_dataset(dataset)
+
+        # NOTE: Indexed documents are not searchable until the index is refreshed (shadow indices are never refreshed
+        # while they are being populated)
+        await self._refresh_index_request(index_name)
+
+        stale_ids, search_after = [], None
+        while True:
+            response = await self._index_search_request(
+                index_name,
+                query={"match_all": {}},
+                size=self.ids_page_size,
+                sort=[{"id": "asc"}],
+                search_after=search_after,
+            )
+            hits = response["hits"]["hits"]
+            if not hits:
+                break
+
+            stale_ids.extend(hit["_id"] for hit in hits if UUID(hit["_id"]) not in records_ids)
+            search_after = hits[-1]["sort"]
+
+        if stale_ids:
+            bulk_actions = [{"_op_type": "delete", "_id": id, "_index": index_name} for id in stale_ids]
+            await self._bulk_op_request(bulk_actions, refresh=self._refresh_policy_for_index(index_name))
+
+        return len(stale_ids)
 
     async def update_record_response(self, response: Response) -> None:
         record = response.record
@@ -421,6 +529,75 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             },
         )
 
+    async def update_records(self, dataset: Dataset, records_deltas: Iterable[RecordDelta]):
+        index_name = es_index_name_for_dataset(dataset)
+
+        bulk_actions = [
+            {
+                "_op_type": "update",
+                "_id": record_delta.record_id,
+                "_index": index_name,
+                "script": {
+                    "source": """
+                            if (params.status != null) {
+                                ctx._source.status = params.status
+                            }
+
+                            if (ctx._source.responses != null) {
+                                for (int i=ctx._source.responses.length-1; i>=0; i--) {
+                                    if (params.responses_ids.contains(ctx._source.responses[i].id)) {
+                                        ctx._source.responses.remove(i);
+                                    }
+                                }
+                            }
+
+                            if (!params.responses.isEmpty()) {
+                                if (ctx._source.responses == null) {
+                                    ctx._source.responses = []
+                                }
+
+                                ctx._source.responses.addAll(params.responses)
+                            }
+
+                            if (ctx._source.suggestions != null) {
+                                for (def question_name : params.deleted_suggestions) {
+                                    ctx._source.suggestions.remove(question_name)
+                                }
+                            }
+
+                            if (!params.suggestions.isEmpty()) {
+                                if (ctx._source.suggestions == null) {
+                                    ctx._source.suggestions = [:]
+                                }
+
+                                ctx._source.suggestions.putAll(params.suggestions)
+                            }
+                        """,
+                    "params": {
+                        "status": record_delta.status,
+                        "responses": [
+                            self._map_record_response_to_es(response) for response in record_delta.upserted_responses
+                        ],
+                        "responses_ids": [
+                            str(response.id)
+                            for response in record_delta.upserted_responses + record_delta.deleted_responses
+                        ],
+                        "suggestions": self._map_record_suggestions_to_es(record_delta.upserted_suggestions),
+                        "deleted_suggestions": [
+                            suggestion.question.name for suggestion in record_delta.deleted_suggestions
+                        ],
+                    },
+                },
+            }
+            for record_delta in records_deltas
+        ]
+
+        if bulk_actions:
+            # NOTE: Deltas are sent after committing the changes to the database, so errors must not be silenced
+            await self._bulk_op_request(
+                bulk_actions, refresh=self._refresh_policy_for_index(index_name), raise_on_error=True
+            )
+
     async def update_record_suggestion(self, suggestion: Suggestion):
         index_name = es_index_name_for_dataset(suggestion.record.dataset)
 
@@ -449,7 +626,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         metrics = await self._compute_terms_metrics_for(index_name, "status")
 
-        return {"total": metrics.total, **{metric.term: metric.count for metric in metrics.values}}
+        return self._terms_metrics_to_progress(metrics)
 
     async def get_dataset_user_progress(self, dataset: Dataset, user: User) -> dict:
         if dataset.is_draft:
@@ -460,12 +637,33 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         result = await self._compute_terms_metrics_for(
             index_name,
             field_name=es_field_for_response_property("status"),
-            query=es_nested_query(
-                path="responses",
-                query=es_term_query(es_field_for_response_property("user_id"), str(user.id)),
-            ),
+            query=self._user_responses_query(user),
+        )
+        return self._terms_metrics_to_progress(result)
+
+    async def get_dataset_and_user_progress(self, dataset: Dataset, user: User) -> Tuple[dict, dict]:
+        if dataset.is_draft:
+            return {}, {}
+
+        index_name = es_index_name_for_dataset(dataset)
+
+        response = await self._index_search_request(
+            index_name,
+            query={"match_all": {}},
+            aggregations={
+                "dataset_progress": self._terms_metrics_aggregation("status"),
+                "user_progress": self._terms_metrics_aggregation(
+                    es_field_for_response_property("status"), query=self._user_responses_query(user)
+                ),
+            },
+            size=0,
+        )
+        aggregations = response["aggregations"]
+
+        return (
+            self._terms_metrics_to_progress(self._terms_metrics_from_aggregation(aggregations["dataset_progress"])),
+            self._terms_metrics_to_progress(self._terms_metrics_from_aggregation(aggregations["user_progress"])),
         )
-        return {"total": result.total, **{metric.term: metric.count for metric in result.values}}
 
     async def search(
         self,
@@ -476,6 +674,9 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         offset: int = 0,
         limit: int = 100,
         user_id: Optional[str] = None,
+        search_after: Optional[List[Any]] = None,
+        with_source: bool = False,
+        source_vectors_settings: Optional[List[VectorSettings]] = None,
     ) -> SearchResponses:
         # See https://www.elastic.co/guide/en/elasticsearch/reference/current/search-search.html
         index = es_index_name_for_dataset(dataset)
@@ -499,10 +700,27 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
                 }
             }
 
-        es_sort = self.build_elasticsearch_sort(sort) if sort else None
-        response = await self._index_search_request(index, query=es_query, size=limit, from_=offset, sort=es_sort)
+        # NOTE: The record id is used as tiebreaker so results have a total order and they can be paginated
+        # using `search_after` (see https://www.elastic.co/guide/en/elasticsearch/reference/current/paginate-search-results.html#search-after)
+        es_sort = self.build_elasticsearch_sort(sort) if sort else [{"_score": "desc"}]
+        es_sort.append({"id": "asc"})
+
+        response = await self._index_search_request(
+            index,
+            query=es_query,
+            size=limit,
+            from_=None if search_after else offset,
+            sort=es_sort,
+            search_after=search_after,
+            source=self._records_source_includes(dataset, source_vectors_settings or []) if with_source else False,
+        )
+
+        search_responses = self._process_search_response(response)
+        if with_source:
+            for item, hit in zip(search_responses.items, response["hits"]["hits"]):
+                item.record = self._map_es_document_to_record(dataset, hit["_source"], source_vectors_settings or [])
 
-        return self._process_search_response(response)
+        return search_responses
 
     async def similarity_search(
         self,
@@ -629,6 +847,55 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         return document
 
+    @classmethod
+    def _records_source_includes(cls, dataset: Dataset, vectors_settings: List[VectorSettings]) -> List[str]:
+        includes = ["external_id", "status", RecordSortField.inserted_at.value, RecordSortField.updated_at.value]
+
+        if cls._records_source_has_fields(dataset):
+            includes.append("fields")
+        if cls._records_source_has_metadata(dataset):
+            includes.append("metadata")
+
+        includes.extend(es_field_for_vector_settings(vector_settings) for vector_settings in vectors_settings)
+
+        return includes
+
+    @classmethod
+    def _map_es_document_to_record(
+        cls, dataset: Dataset, document: dict, vectors_settings: List[VectorSettings]
+    ) -> Dict[str, Any]:
+        record = {
+            "external_id": document.get("external_id"),
+            "status": document["status"],
+            "inserted_at": datetime.fromisoformat(document[RecordSortField.inserted_at.value]),
+            "updated_at": datetime.fromisoformat(document[RecordSortField.updated_at.value]),
+        }
+
+        if cls._records_source_has_fields(dataset):
+            record["fields"] = document.get("fields", {})
+        if cls._records_source_has_metadata(dataset):
+            record["metadata"] = document.get("metadata")
+
+        if vectors_settings:
+            vectors = document.get("vectors", {})
+            record["vectors"] = {
+                vector_settings.name: vectors[es_path_for_vector_settings(vector_settings)]
+                for vector_settings in vectors_settings
+                if es_path_for_vector_settings(vector_settings) in vectors
+            }
+
+        return record
+
+    @staticmethod
+    def _records_source_has_fields(dataset: Dataset) -> bool:
+        # NOTE: Image fields are not stored and custom fields are stored as strings (see `_map_record_fields_to_es`)
+        return not any(field.is_image or field.is_custom for field in dataset.fields)
+
+    @staticmethod
+    def _records_source_has_metadata(dataset: Dataset) -> bool:
+        # NOTE: Only metadata with a metadata property is stored (see `_map_record_metadata_to_es`)
+        return not dataset.allow_extra_metadata
+
     @staticmethod
     def _map_record_suggestions_to_es(suggestions: List[Suggestion]) -> dict:
         return {
@@ -678,19 +945,51 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
     async def _compute_terms_metrics_for(
         self, index_name: str, field_name: str, query: Optional[dict] = None
     ) -> TermsMetrics:
-        query = query or {"match_all": {}}
+        aggregation_name = "terms_metrics"
+
+        response = await self._index_search_request(
+            index_name,
+            query={"match_all": {}},
+            aggregations={aggregation_name: self._terms_metrics_aggregation(field_name, query)},
+            size=0,
+        )
 
-        total_terms = await self.__value_count_aggregation(index_name, field_name=field_name, query=query)
+        return self._terms_metrics_from_aggregation(response["aggregations"][aggregation_name])
+
+    def _terms_metrics_aggregation(self, field_name: str, query: Optional[dict] = None) -> dict:
+        # NOTE: Values are counted and bucketed by the same request, so the terms size is not bound to the values count
+        return {
+            "filter": query or {"match_all": {}},
+            "aggs": {
+                "count_values": {"value_count": {"field": field_name}},
+                "terms_agg": {"terms": {"field": field_name, "size": self.max_terms_size}},
+            },
+        }
+
+    @staticmethod
+    def _terms_metrics_from_aggregation(aggregation: dict) -> TermsMetrics:
+        total_terms = aggregation["count_values"]["value"]
         if total_terms == 0:
             return TermsMetrics(total=total_terms)
 
-        terms_buckets = await self._terms_aggregation(index_name, field_name=field_name, query=query, size=total_terms)
         terms_values = [
-            TermsMetrics.TermCount(term=bucket["key"], count=bucket["doc_count"]) for bucket in terms_buckets
+            TermsMetrics.TermCount(term=bucket["key"], count=bucket["doc_count"])
+            for bucket in aggregation["terms_agg"]["buckets"]
         ]
 
         return TermsMetrics(total=total_terms, values=terms_values)
 
+    @staticmethod
+    def _terms_metrics_to_progress(metrics: TermsMetrics) -> dict:
+        return {"total": metrics.total, **{metric.term: metric.count for metric in metrics.values}}
+
+    @staticmethod
+    def _user_responses_query(user: User) -> dict:
+        return es_nested_query(
+            path="responses",
+            query=es_term_query(es_field_for_response_property("user_id"), str(user.id)),
+        )
+
     async def _metrics_for_terms_property(
         self, index_name: str, metadata_property: MetadataProperty, query: Optional[dict] = None
     ) -> TermsMetrics:
@@ -725,12 +1024,13 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         hits = response["hits"]["hits"]
 
         if score_threshold is not None:
-            hits = filter(lambda hit: hit["_score"] >= score_threshold, hits)
+            hits = [hit for hit in hits if hit["_score"] >= score_threshold]
 
         items = [SearchResponseItem(record_id=UUID(hit["_id"]), score=hit["_score"]) for hit in hits]
         total = response["hits"]["total"]["value"]
+        next_search_after = hits[-1].get("sort") if hits else None
 
-        return SearchResponses(items=items, total=total)
+        return SearchResponses(items=items, total=total, next_search_after=next_search_after)
 
     @staticmethod
     def _build_text_query(dataset: Dataset, text: Optional[Union[TextQuery, str]] = None) -> dict:
@@ -811,7 +1111,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
     def _configure_index_settings(self) -> dict:
         """Defines settings configuration for the index. Depending on which backend is used, this may differ"""
-        return {
+        settings = {
             # See https://www.elastic.co/guide/en/elasticsearch/reference/current/mapping-settings-limit.html#mapping-settings-limit
             "index.mapping.total_fields.limit": self.default_total_fields_limit,
             "max_result_window": self.max_result_window,
@@ -819,6 +1119,32 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             "number_of_replicas": self.number_of_replicas,
         }
 
+        if self.refresh_interval:
+            settings["refresh_interval"] = self.refresh_interval
+
+        return settings
+
+    async def _swap_index_alias(self, alias: str, index_name: str) -> None:
+        actions = [{"add": {"index": index_name, "alias": alias}}]
+
+        current_index_names = await self._get_alias_indices_request(alias)
+        if not current_index_names and await self._index_exists_request(alias):
+            # Datasets indexed before using aliases have a concrete index with the alias name
+            current_index_names = [alias]
+
+        # See https://www.elastic.co/guide/en/elasticsearch/reference/current/indices-aliases.html
+        # All actions are applied atomically, so the alias always resolves to one index.
+        actions.extend({"remove_index": {"index": name}} for name in current_index_names if name != index_name)
+
+        await self._update_aliases_request(actions)
+
+    def _refresh_policy_for_index(self, index_name: str) -> SearchEngineRefreshPolicy:
+        # Refreshes are deferred to the end of the bulk load
+        if index_name in self._bulk_loading_indices:
+            return SearchEngineRefreshPolicy.false
+
+        return self.refresh_policy
+
     def _response_filter_to_es_filter(self, filter: Filter) -> dict:
         scope: ResponseFilterScope = filter.scope
         if scope.question:
@@ -930,22 +1256,6 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         return fields
 
-    async def _terms_aggregation(self, index_name: str, field_name: str, query: dict, size: int) -> List[dict]:
-        aggregation_name = "terms_agg"
-
-        terms_agg = {aggregation_name: {"terms": {"field": field_name, "size": min(size, self.max_terms_size)}}}
-
-        response = await self._index_search_request(index_name, query=query, aggregations=terms_agg, size=0)
-        return response["aggregations"][aggregation_name]["buckets"]
-
-    async def __value_count_aggregation(self, index_name: str, field_name: str, query: dict) -> int:
-        aggregation_name = "count_values"
-
-        value_count_agg = {aggregation_name: {"value_count": {"field": field_name}}}
-
-        response = await self._index_search_request(index_name, query=query, aggregations=value_count_agg, size=0)
-        return response["aggregations"][aggregation_name]["value"]
-
     async def __stats_aggregation(self, index_name: str, field_name: str, query: dict) -> dict:
         # See https://www.elastic.co/guide/en/elasticsearch/reference/current/search-aggregations-metrics-stats-aggregation.html
         aggregation_name = "numeric_stats"
@@ -999,6 +1309,8 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         from_: Optional[int] = None,
         sort: Optional[dict] = None,
         aggregations: Optional[dict] = None,
+        search_after: Optional[List[Any]] = None,
+        source: Union[bool, List[str]] = False,
     ) -> dict:
         """Executes request for search documents on a index"""
 
@@ -1007,5 +1319,26 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         """Executes request for check if index exists"""
 
     @abstractmethod
-    async def _bulk_op_request(self, actions: List[Dict[str, Any]]):
-        """Executes request for bulk operations"""
+    async def _put_index_settings_request(self, index_name: str, settings: dict):
+        """Executes request for index settings (partial) update"""
+
+    @abstractmethod
+    async def _refresh_index_request(self, index_name: str):
+        """Executes request for index refresh"""
+
+    @abstractmethod
+    async def _get_alias_indices_request(self, alias: str) -> List[str]:
+        """Executes request for the index names behind an alias. Returns an empty list if the alias does not exist"""
+
+    @abstractmethod
+    async def _update_aliases_request(self, actions: List[dict]):
+        """Executes request for atomic alias updates"""
+
+    @abstractmethod
+    async def _bulk_op_request(
+        self,
+        actions: List[Dict[str, Any]],
+        refresh: SearchEngineRefreshPolicy = SearchEngineRefreshPolicy.true,
+        raise_on_error: bool = False,
+    ):
+        """Executes request for bulk operations. Failed actions are logged, or raised if `raise_on_error` is set"""
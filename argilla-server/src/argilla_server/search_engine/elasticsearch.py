@@ -13,12 +13,13 @@
 #  limitations under the License.
 
 import dataclasses
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
 from elasticsearch8 import AsyncElasticsearch, helpers
 
 from argilla_server.constants import SEARCH_ENGINE_ELASTICSEARCH
+from argilla_server.enums import SearchEngineRefreshPolicy
 from argilla_server.models import VectorSettings
 from argilla_server.search_engine import SearchEngine
 from argilla_server.search_engine.commons import (
@@ -54,12 +55,15 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
             ca_certs=settings.elasticsearch_ca_path,
             retry_on_timeout=True,
             max_retries=5,
+            connections_per_node=settings.search_engine_max_connections,
         )
         return cls(
             config=config,
             number_of_shards=settings.es_records_index_shards,
             number_of_replicas=settings.es_records_index_replicas,
             default_total_fields_limit=settings.es_mapping_total_fields_limit,
+            refresh_policy=settings.search_engine_refresh_policy,
+            refresh_interval=settings.search_engine_refresh_interval,
         )
 
     async def close(self):
@@ -137,28 +141,51 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
         from_: Optional[int] = None,
         sort: Optional[dict] = None,
         aggregations: Optional[dict] = None,
+        search_after: Optional[List[Any]] = None,
+        source: Union[bool, List[str]] = False,
     ) -> dict:
         return await self.client.search(
             index=index,
             query=query,
             from_=from_,
             size=size,
-            source=False,
+            source=source,
             aggregations=aggregations,
             sort=sort,
+            search_after=search_after,
             track_total_hits=True,
         )
 
     async def _index_exists_request(self, index_name: str) -> bool:
         return await self.client.indices.exists(index=index_name)
 
-    async def _bulk_op_request(self, actions: List[Dict[str, Any]]):
+    async def _put_index_settings_request(self, index_name: str, settings: dict):
+        await self.client.indices.put_settings(index=index_name, settings=settings)
+
+    async def _refresh_index_request(self, index_name: str):
+        await self.client.indices.refresh(index=index_name)
+
+    async def _get_alias_indices_request(self, alias: str) -> List[str]:
+        if not await self.client.indices.exists_alias(name=alias):
+            return []
+
+        return list(await self.client.indices.get_alias(name=alias))
+
+    async def _update_aliases_request(self, actions: List[dict]):
+        await self.client.indices.update_aliases(actions=actions)
+
+    async def _bulk_op_request(
+        self,
+        actions: List[Dict[str, Any]],
+        refresh: SearchEngineRefreshPolicy = SearchEngineRefreshPolicy.true,
+        raise_on_error: bool = False,
+    ):
         # https://www.elastic.co/guide/en/elasticsearch/reference/current/docs-refresh.html
         _, errors = await helpers.async_bulk(
             client=self.client,
             actions=actions,
-            raise_on_error=False,
-            refresh=True,
+            raise_on_error=raise_on_error,
+            refresh=refresh.value,
         )
 
         for error in errors:
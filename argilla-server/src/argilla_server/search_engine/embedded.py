@@ -0,0 +1,949 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import dataclasses
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar, Union
+from uuid import UUID
+
+from argilla_server.constants import SEARCH_ENGINE_EMBEDDED
+from argilla_server.enums import MetadataPropertyType, ResponseStatusFilter, SimilarityOrder, SortOrder
+from argilla_server.models import (
+    Dataset,
+    Field,
+    MetadataProperty,
+    Record,
+    Response,
+    Suggestion,
+    User,
+    VectorSettings,
+)
+from argilla_server.search_engine.base import (
+    AndFilter,
+    Filter,
+    FilterScope,
+    FloatMetadataMetrics,
+    IntegerMetadataMetrics,
+    MetadataFilterScope,
+    MetadataMetrics,
+    Order,
+    RangeFilter,
+    RecordDelta,
+    RecordFilterScope,
+    ResponseFilterScope,
+    SearchEngine,
+    SearchResponseItem,
+    SearchResponses,
+    SuggestionFilterScope,
+    TermsFilter,
+    TermsMetrics,
+    TextQuery,
+)
+from argilla_server.settings import settings
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+T = TypeVar("T")
+
+# NOTE: Text rows are stored per field and for all the fields of a record together under this name
+ALL_FIELDS_TEXT_NAME = "*"
+
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+
+SIMILARITY_SEARCH_BATCH_SIZE = 10000
+
+_SCHEMA_STATEMENTS = [
+    "CREATE TABLE IF NOT EXISTS indices (name TEXT PRIMARY KEY)",
+    """
+    CREATE TABLE IF NOT EXISTS documents (
+        index_name TEXT NOT NULL,
+        id TEXT NOT NULL,
+        document TEXT NOT NULL,
+        PRIMARY KEY (index_name, id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS documents_text (
+        rowid INTEGER PRIMARY KEY,
+        index_name TEXT NOT NULL,
+        id TEXT NOT NULL,
+        field TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_documents_text_index_name_id ON documents_text (index_name, id)",
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts
+    USING fts5(content, tokenize = "unicode61 remove_diacritics 2")
+    """,
+]
+
+
+def index_name_for_dataset(dataset: Dataset) -> str:
+    return f"rg.{dataset.id}"
+
+
+@SearchEngine.register(engine_name=SEARCH_ENGINE_EMBEDDED)
+@dataclasses.dataclass
+class EmbeddedSearchEngine(SearchEngine):
+    """
+    Search engine running in the server process and storing the records documents in a local SQLite database.
+
+    Documents have the same shape as the Elasticsearch/OpenSearch ones and are stored as JSON. Text queries use an
+    SQLite FTS5 index while filters, sorting and aggregations are SQL queries over the JSON documents, so documents
+    are only read into memory for the records returned by a search. Similarity search computes the brute-force
+    cosine similarity of the vectors of the matching documents in batches.
+    """
+
+    path: str
+
+    _connection: sqlite3.Connection = dataclasses.field(init=False)
+    _lock: threading.Lock = dataclasses.field(init=False, default_factory=threading.Lock)
+
+    def __post_init__(self):
+        self._connection = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.create_function("random_score", 2, _random_score, deterministic=True)
+
+        with self._connection:
+            for statement in _SCHEMA_STATEMENTS:
+                self._connection.execute(statement)
+
+    @classmethod
+    async def new_instance(cls) -> "EmbeddedSearchEngine":
+        return cls(path=settings.search_engine_embedded_path or os.path.join(settings.home_path, "search.db"))
+
+    async def close(self):
+        await self._run(lambda: self._connection.close())
+
+    async def ping(self) -> bool:
+        return await self._run(lambda: self._connection.execute("SELECT 1").fetchone() == (1,))
+
+    async def info(self) -> dict:
+        return {"version": {"number": sqlite3.sqlite_version, "distribution": SEARCH_ENGINE_EMBEDDED}}
+
+    async def get_all_index_names(self) -> List[str]:
+        return await self._run(lambda: [row[0] for row in self._connection.execute("SELECT name FROM indices")])
+
+    async def create_index(self, dataset: Dataset):
+        index_name = index_name_for_dataset(dataset)
+
+        def create_index():
+            with self._connection:
+                self._connection.execute("INSERT OR IGNORE INTO indices (name) VALUES (?)", (index_name,))
+
+        await self._run(create_index)
+
+    async def delete_index(self, dataset: Dataset):
+        index_name = index_name_for_dataset(dataset)
+
+        def delete_index():
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM documents_fts WHERE rowid IN (SELECT rowid FROM documents_text WHERE index_name = ?)",
+                    (index_name,),
+                )
+                self._connection.execute("DELETE FROM documents_text WHERE index_name = ?", (index_name,))
+                self._connection.execute("DELETE FROM documents WHERE index_name = ?", (index_name,))
+                self._connection.execute("DELETE FROM indices WHERE name = ?", (index_name,))
+
+        await self._run(delete_index)
+
+    async def configure_metadata_property(self, dataset: Dataset, metadata_property: MetadataProperty):
+        # Documents are schemaless, so there is nothing to configure
+        pass
+
+    async def index_records(self, dataset: Dataset, records: Iterable[Record], index_name: Optional[str] = None):
+        index_name = index_name or index_name_for_dataset(dataset)
+
+        documents = [
+            (_normalize_document(self._map_record_to_document(record)), self._map_record_fields_to_texts(record))
+            for record in records
+        ]
+
+        def index_documents():
+            with self._connection:
+                self._delete_documents_text(index_name, [document["id"] for document, _ in documents])
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO documents (index_name, id, document) VALUES (?, ?, ?)",
+                    [(index_name, document["id"], json.dumps(document)) for document, _ in documents],
+                )
+
+                for document, texts in documents:
+                    for field, text in texts.items():
+                        cursor = self._connection.execute(
+                            "INSERT INTO documents_text (index_name, id, field) VALUES (?, ?, ?)",
+                            (index_name, document["id"], field),
+                        )
+                        self._connection.execute(
+                            "INSERT INTO documents_fts (rowid, content) VALUES (?, ?)", (cursor.lastrowid, text)
+                        )
+
+        await self._run(index_documents)
+
+    async def partial_record_update(self, record: Record, **update):
+        await self.partial_records_update(record.dataset, {record.id: update})
+
+    async def partial_records_update(self, dataset: Dataset, records_updates: Dict[UUID, dict]):
+        updates = {str(record_id): _normalize_document(update) for record_id, update in records_updates.items()}
+
+        await self._update_documents(
+            index_name_for_dataset(dataset),
+            list(updates.keys()),
+            lambda document: {**document, **updates[document["id"]]},
+        )
+
+    async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
+        await self._delete_documents(index_name_for_dataset(dataset), [str(record.id) for record in records])
+
+    async def delete_records_not_in(
+        self, dataset: Dataset, records_ids: Set[UUID], index_name: Optional[str] = None
+    ) -> int:
+        index_name = index_name or index_name_for_dataset(dataset)
+
+        def list_documents_ids():
+            return [
+                row[0]
+                for row in self._connection.execute("SELECT id FROM documents WHERE index_name = ?", (index_name,))
+            ]
+
+        stale_ids = [id for id in await self._run(list_documents_ids) if UUID(id) not in records_ids]
+        await self._delete_documents(index_name, stale_ids)
+
+        return len(stale_ids)
+
+    async def _delete_documents(self, index_name: str, ids: List[str]) -> None:
+        def delete_documents():
+            with self._connection:
+                self._delete_documents_text(index_name, ids)
+                self._connection.executemany(
+                    "DELETE FROM documents WHERE index_name = ? AND id = ?", [(index_name, id) for id in ids]
+                )
+
+        await self._run(delete_documents)
+
+    async def update_record_response(self, response: Response):
+        record = response.record
+        es_response = _normalize_document(self._map_record_response_to_document(response))
+
+        def update_response(document: dict) -> dict:
+            responses = [r for r in document.get("responses", []) if r["id"] != es_response["id"]]
+            return {**document, "responses": responses + [es_response]}
+
+        await self._update_documents(index_name_for_dataset(record.dataset), [str(record.id)], update_response)
+
+    async def update_records(self, dataset: Dataset, records_deltas: Iterable[RecordDelta]):
+        records_updates = {
+            str(record_delta.record_id): _normalize_document(
+                {
+                    "status": record_delta.status,
+                    "responses": [
+                        self._map_record_response_to_document(response) for response in record_delta.upserted_responses
+                    ],
+                    "responses_ids": [
+                        response.id for response in record_delta.upserted_responses + record_delta.deleted_responses
+                    ],
+                    "suggestions": self._map_record_suggestions_to_document(record_delta.upserted_suggestions),
+                    "deleted_suggestions": [
+                        suggestion.question.name for suggestion in record_delta.deleted_suggestions
+                    ],
+                }
+            )
+            for record_delta in records_deltas
+        }
+
+        def update_document(document: dict) -> dict:
+            update = records_updates[document["id"]]
+            document = dict(document)
+
+            if update["status"] is not None:
+                document["status"] = update["status"]
+
+            if update["responses_ids"]:
+                responses_ids = set(update["responses_ids"])
+                responses = [r for r in document.get("responses", []) if r["id"] not in responses_ids]
+                document["responses"] = responses + update["responses"]
+
+            if update["suggestions"] or update["deleted_suggestions"]:
+                suggestions = {
+                    name: value
+                    for name, value in document.get("suggestions", {}).items()
+                    if name not in update["deleted_suggestions"]
+                }
+                document["suggestions"] = {**suggestions, **update["suggestions"]}
+
+            return document
+
+        if records_updates:
+            await self._update_documents(index_name_for_dataset(dataset), list(records_updates.keys()), update_document)
+
+    async def delete_record_response(self, response: Response):
+        record = response.record
+        response_id = str(response.id)
+
+        def delete_response(document: dict) -> dict:
+            return {**document, "responses": [r for r in document.get("responses", []) if r["id"] != response_id]}
+
+        await self._update_documents(index_name_for_dataset(record.dataset), [str(record.id)], delete_response)
+
+    async def update_record_suggestion(self, suggestion: Suggestion):
+        es_suggestions = _normalize_document(self._map_record_suggestions_to_document([suggestion]))
+
+        def update_suggestion(document: dict) -> dict:
+            return {**document, "suggestions": {**document.get("suggestions", {}), **es_suggestions}}
+
+        await self._update_documents(
+            index_name_for_dataset(suggestion.record.dataset), [str(suggestion.record_id)], update_suggestion
+        )
+
+    async def delete_record_suggestion(self, suggestion: Suggestion):
+        question_name = suggestion.question.name
+
+        def delete_suggestion(document: dict) -> dict:
+            suggestions = {name: value for name, value in document.get("suggestions", {}).items()}
+            suggestions.pop(question_name, None)
+            return {**document, "suggestions": suggestions}
+
+        await self._update_documents(
+            index_name_for_dataset(suggestion.record.dataset), [str(suggestion.record_id)], delete_suggestion
+        )
+
+    async def get_dataset_progress(self, dataset: Dataset) -> dict:
+        if dataset.is_draft:
+            return {}
+
+        index_name = index_name_for_dataset(dataset)
+
+        def dataset_progress():
+            rows = self._connection.execute(
+                """
+                SELECT json_extract(document, '$.status') AS status, count(*)
+                FROM documents
+                WHERE index_name = ? AND status IS NOT NULL
+                GROUP BY status
+                """,
+                (index_name,),
+            )
+            statuses = dict(rows.fetchall())
+            return {"total": sum(statuses.values()), **statuses}
+
+        return await self._run(dataset_progress)
+
+    async def get_dataset_user_progress(self, dataset: Dataset, user: User) -> dict:
+        if dataset.is_draft:
+            return {}
+
+        index_name = index_name_for_dataset(dataset)
+        user_id = str(user.id)
+
+        def dataset_user_progress():
+            rows = self._connection.execute(
+                """
+                SELECT json_extract(response.value, '$.status') AS status, count(*)
+                FROM documents, json_each(documents.document, '$.responses') AS response
+                WHERE documents.index_name = ? AND json_extract(response.value, '$.user_id') = ?
+                GROUP BY status
+                """,
+                (index_name, user_id),
+            )
+            statuses = dict(rows.fetchall())
+            return {"total": sum(statuses.values()), **statuses}
+
+        return await self._run(dataset_user_progress)
+
+    async def search(
+        self,
+        dataset: Dataset,
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[List[Order]] = None,
+        offset: int = 0,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+        search_after: Optional[List[Any]] = None,
+        with_source: bool = False,
+        source_vectors_settings: Optional[List[VectorSettings]] = None,
+    ) -> SearchResponses:
+        index_name = index_name_for_dataset(dataset)
+        text_query = self._build_text_query(dataset, query)
+        documents_query = self._build_documents_query(index_name, text_query, filter)
+
+        if sort:
+            keys = [_sort_expression(order) for order in sort]
+            orders = [order.order for order in sort]
+        else:
+            score_sql = "text_scores.score" if text_query else "1.0"
+            score_params = []
+            if user_id:
+                score_sql, score_params = f"{score_sql} * random_score(?, documents.id)", [str(user_id)]
+            keys = [(score_sql, score_params)]
+            orders = [SortOrder.desc]
+
+        # NOTE: Hits with the same sort values are sorted by id, so pages never skip or repeat hits
+        keys.append(("documents.id", []))
+        orders.append(SortOrder.asc)
+
+        def search():
+            if documents_query is None:
+                return [], 0
+
+            from_sql, where_sql, params = documents_query
+            keys_sql = ", ".join(f"{key_sql} AS key_{idx}" for idx, (key_sql, _) in enumerate(keys))
+            keys_params = [param for _, key_params in keys for param in key_params]
+            hits_sql = f"SELECT {keys_sql} FROM {from_sql} WHERE {where_sql}"
+
+            total = self._connection.execute(f"SELECT count(*) FROM {from_sql} WHERE {where_sql}", params).fetchone()[0]
+
+            order_sql = ", ".join(
+                f"key_{idx} {'ASC' if order == SortOrder.asc else 'DESC'} NULLS LAST"
+                for idx, order in enumerate(orders)
+            )
+            if search_after:
+                after_sql, after_params = _search_after_filter(orders, search_after)
+                page_sql, page_params = f"WHERE {after_sql} ORDER BY {order_sql} LIMIT ?", [*after_params, limit]
+            else:
+                page_sql, page_params = f"ORDER BY {order_sql} LIMIT ? OFFSET ?", [limit, offset]
+
+            rows = self._connection.execute(
+                f"SELECT * FROM ({hits_sql}) {page_sql}", [*keys_params, *params, *page_params]
+            ).fetchall()
+            documents = self._get_documents(index_name, [row[-1] for row in rows]) if with_source else {}
+
+            return [(list(row), documents.get(row[-1])) for row in rows], total
+
+        hits, total = await self._run(search)
+
+        items = [SearchResponseItem(record_id=UUID(hit[-1]), score=None if sort else hit[0]) for hit, _ in hits]
+        if with_source:
+            for item, (_, document) in zip(items, hits):
+                item.record = self._map_document_to_record(dataset, document, source_vectors_settings or [])
+
+        return SearchResponses(items=items, total=total, next_search_after=hits[-1][0] if hits else None)
+
+    async def compute_metrics_for(self, metadata_property: MetadataProperty) -> MetadataMetrics:
+        index_name = index_name_for_dataset(metadata_property.dataset)
+        path = _json_path("metadata", metadata_property.name)
+
+        if metadata_property.type == MetadataPropertyType.terms:
+
+            def terms_counts() -> List[Tuple[Any, int]]:
+                return self._connection.execute(
+                    """
+                    SELECT value.value, count(*)
+                    FROM documents, json_each(documents.document, ?) AS value
+                    WHERE documents.index_name = ? AND value.type != 'null'
+                    GROUP BY value.value
+                    """,
+                    (path, index_name),
+                ).fetchall()
+
+            counts = Counter()
+            for value, count in await self._run(terms_counts):
+                counts[str(value)] += count
+
+            return TermsMetrics(
+                total=sum(counts.values()),
+                values=[
+                    TermsMetrics.TermCount(term=term, count=count)
+                    for term, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+                ],
+            )
+
+        if metadata_property.type in [MetadataPropertyType.float, MetadataPropertyType.integer]:
+
+            def min_max() -> Tuple[Any, Any]:
+                return self._connection.execute(
+                    """
+                    SELECT min(value.value), max(value.value)
+                    FROM documents, json_each(documents.document, ?) AS value
+                    WHERE documents.index_name = ? AND value.type IN ('integer', 'real')
+                    """,
+                    (path, index_name),
+                ).fetchone()
+
+            min_value, max_value = await self._run(min_max)
+            metrics_class = (
+                IntegerMetadataMetrics
+                if metadata_property.type == MetadataPropertyType.integer
+                else FloatMetadataMetrics
+            )
+            return metrics_class(min=min_value, max=max_value)
+
+    async def similarity_search(
+        self,
+        dataset: Dataset,
+        vector_settings: VectorSettings,
+        value: Optional[List[float]] = None,
+        record: Optional[Record] = None,
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+        max_results: int = 100,
+        order: SimilarityOrder = SimilarityOrder.most_similar,
+        threshold: Optional[float] = None,
+    ) -> SearchResponses:
+        if bool(value) == bool(record):
+            raise ValueError("Must provide either vector value or record to compute the similarity search")
+
+        vector_value = value
+        excluded_id = None
+
+        if not vector_value:
+            excluded_id = str(record.id)
+            vector_value = record.vector_value_by_vector_settings(vector_settings)
+
+        if not vector_value:
+            raise ValueError("Cannot find a vector value to apply with provided info")
+
+        if order == SimilarityOrder.least_similar:
+            vector_value = [-1 * x for x in vector_value]
+
+        index_name = index_name_for_dataset(dataset)
+        vector_path = _json_path("vectors", str(vector_settings.id))
+        text_query = self._build_text_query(dataset, query)
+        documents_query = self._build_documents_query(index_name, text_query, filter)
+
+        def similarity_search():
+            if documents_query is None:
+                return []
+
+            from_sql, where_sql, params = documents_query
+            rows = self._connection.execute(
+                f"""
+                SELECT documents.id, json_extract(documents.document, ?) AS vector
+                FROM {from_sql}
+                WHERE {where_sql} AND vector IS NOT NULL AND documents.id IS NOT ?
+                """,
+                [vector_path, *params, excluded_id],
+            )
+
+            # NOTE: Vectors are scored in batches, so only the best hits are kept in memory
+            hits = []
+            while batch := rows.fetchmany(SIMILARITY_SEARCH_BATCH_SIZE):
+                scores = _cosine_similarity_scores(vector_value, [json.loads(vector) for _, vector in batch])
+                hits = heapq.nsmallest(
+                    max_results,
+                    hits + [(score, id) for score, (id, _) in zip(scores, batch)],
+                    key=lambda hit: (-hit[0], hit[1]),
+                )
+
+            return hits
+
+        hits = await self._run(similarity_search)
+        if threshold is not None:
+            hits = [(score, id) for score, id in hits if score >= threshold]
+
+        return SearchResponses(
+            items=[SearchResponseItem(record_id=UUID(id), score=score) for score, id in hits],
+            total=len(hits),
+        )
+
+    async def _run(self, fn: Callable[[], T]) -> T:
+        def locked_fn():
+            with self._lock:
+                return fn()
+
+        return await asyncio.to_thread(locked_fn)
+
+    async def _update_documents(self, index_name: str, ids: List[str], update_fn: Callable[[dict], dict]):
+        def update_documents():
+            with self._connection:
+                documents = self._get_documents(index_name, ids)
+                self._connection.executemany(
+                    "UPDATE documents SET document = ? WHERE index_name = ? AND id = ?",
+                    [(json.dumps(update_fn(document)), index_name, id) for id, document in documents.items()],
+                )
+
+        await self._run(update_documents)
+
+    def _get_documents(self, index_name: str, ids: List[str]) -> Dict[str, dict]:
+        documents = {}
+        for id in ids:
+            row = self._connection.execute(
+                "SELECT document FROM documents WHERE index_name = ? AND id = ?", (index_name, id)
+            ).fetchone()
+            if row is not None:
+                documents[id] = json.loads(row[0])
+
+        return documents
+
+    def _build_documents_query(
+        self, index_name: str, text_query: Optional[Tuple[str, Optional[str]]], filter: Optional[Filter]
+    ) -> Optional[Tuple[str, str, List[Any]]]:
+        """Returns the FROM and WHERE clauses, with their parameters, of the documents matching a text query and a filter.
+
+        Returns None if the text query can't match any document.
+        """
+        from_sql, where_sql, params = "documents", "documents.index_name = ?", [index_name]
+
+        if text_query:
+            field, fts_query = text_query
+            if not fts_query:
+                return None
+
+            from_sql = """
+                documents JOIN (
+                    SELECT documents_text.id AS id, -bm25(documents_fts) AS score
+                    FROM documents_fts JOIN documents_text ON documents_text.rowid = documents_fts.rowid
+                    WHERE documents_fts MATCH ? AND documents_text.index_name = ? AND documents_text.field = ?
+                ) AS text_scores ON text_scores.id = documents.id
+            """
+            params = [fts_query, index_name, field, *params]
+
+        if filter:
+            filter_sql, filter_params = self._build_filter(filter)
+            where_sql = f"{where_sql} AND ({filter_sql})"
+            params += filter_params
+
+        return from_sql, where_sql, params
+
+    def _delete_documents_text(self, index_name: str, ids: List[str]) -> None:
+        params = [(index_name, id) for id in ids]
+
+        self._connection.executemany(
+            "DELETE FROM documents_fts WHERE rowid IN "
+            "(SELECT rowid FROM documents_text WHERE index_name = ? AND id = ?)",
+            params,
+        )
+        self._connection.executemany("DELETE FROM documents_text WHERE index_name = ? AND id = ?", params)
+
+    @staticmethod
+    def _build_text_query(
+        dataset: Dataset, text: Optional[Union[TextQuery, str]]
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        if text is None:
+            return None
+
+        if isinstance(text, str):
+            text = TextQuery(q=text)
+
+        if text.field and dataset.field_by_name(text.field) is None:
+            raise Exception(f"Field {text.field} not found in dataset {dataset.id}")
+
+        # All terms must be found, as the `AND` default operator used by the other search engines
+        terms = re.findall(r"\w+", text.q)
+        fts_query = " ".join(f'"{term}"' for term in terms) or None
+
+        return text.field or ALL_FIELDS_TEXT_NAME, fts_query
+
+    def _build_filter(self, filter: Filter) -> Tuple[str, List[Any]]:
+        if isinstance(filter, AndFilter):
+            filters = [self._build_filter(f) for f in filter.filters]
+            if not filters:
+                return "1", []
+
+            return " AND ".join(f"({sql})" for sql, _ in filters), [param for _, params in filters for param in params]
+
+        if isinstance(filter.scope, ResponseFilterScope):
+            return self._build_response_filter(filter)
+
+        values_sql, values_params = _build_values_filter(filter)
+
+        return (
+            f"EXISTS (SELECT 1 FROM json_each(documents.document, ?) AS value WHERE {values_sql})",
+            [_scope_path(filter.scope), *values_params],
+        )
+
+    @staticmethod
+    def _build_response_filter(filter: Filter) -> Tuple[str, List[Any]]:
+        scope: ResponseFilterScope = filter.scope
+        user_sql, user_params = _response_user_filter(scope)
+        responses_sql = f"SELECT 1 FROM json_each(documents.document, '$.responses') AS response WHERE {user_sql}"
+
+        if scope.question:
+            values_sql, values_params = _build_values_filter(filter)
+            return (
+                f"EXISTS (SELECT 1 FROM json_each(documents.document, '$.responses') AS response, "
+                f"json_each(response.value, ?) AS value WHERE {user_sql} AND {values_sql})",
+                [_json_path(scope.question), *user_params, *values_params],
+            )
+
+        if scope.property == "status" and isinstance(filter, TermsFilter):
+            statuses = set(filter.values)
+            with_pending = ResponseStatusFilter.pending in statuses
+            statuses.discard(ResponseStatusFilter.pending)
+
+            filters = []
+            if with_pending:
+                filters.append((f"NOT EXISTS ({responses_sql})", user_params))
+            if statuses:
+                statuses_sql = ", ".join("?" for _ in statuses)
+                filters.append(
+                    (
+                        f"EXISTS ({responses_sql} AND json_extract(response.value, '$.status') IN ({statuses_sql}))",
+                        [*user_params, *(_sql_value(status) for status in statuses)],
+                    )
+                )
+            elif not with_pending:
+                filters.append((f"EXISTS ({responses_sql})", user_params))
+
+            return " OR ".join(f"({sql})" for sql, _ in filters), [param for _, params in filters for param in params]
+
+        raise Exception(f"Cannot process filter scope {scope}")
+
+    def _map_record_to_document(self, record: Record) -> Dict[str, Any]:
+        dataset = record.dataset
+
+        document = {
+            "id": str(record.id),
+            "external_id": record.external_id,
+            "fields": self._map_record_fields_to_document(record.fields, dataset.fields),
+            "status": record.status,
+            "inserted_at": record.inserted_at,
+            "updated_at": record.updated_at,
+        }
+
+        if record.metadata_:
+            document["metadata"] = {
+                metadata_property.name: record.metadata_[metadata_property.name]
+                for metadata_property in dataset.metadata_properties
+                if record.metadata_.get(metadata_property.name) is not None
+            }
+        if record.responses:
+            document["responses"] = [self._map_record_response_to_document(response) for response in record.responses]
+        if record.suggestions:
+            document["suggestions"] = self._map_record_suggestions_to_document(record.suggestions)
+        if record.vectors:
+            document["vectors"] = {str(vector.vector_settings_id): vector.value for vector in record.vectors}
+
+        return document
+
+    @staticmethod
+    def _map_record_fields_to_document(fields: dict, dataset_fields: List[Field]) -> dict:
+        document_fields = {}
+        for field in dataset_fields:
+            if field.is_image:
+                continue
+
+            value = fields.get(field.name)
+            if field.is_custom and value is not None:
+                value = str(value)
+
+            document_fields[field.name] = value
+
+        return document_fields
+
+    @staticmethod
+    def _map_record_fields_to_texts(record: Record) -> Dict[str, str]:
+        texts = {}
+        for field in record.dataset.fields:
+            value = record.fields.get(field.name)
+            if value is None:
+                continue
+
+            if field.is_text or field.is_custom:
+                texts[field.name] = str(value)
+            elif field.is_chat:
+                texts[field.name] = "\n".join(str(message.get("content", "")) for message in value)
+
+        if texts:
+            texts[ALL_FIELDS_TEXT_NAME] = "\n".join(texts.values())
+
+        return texts
+
+    @staticmethod
+    def _map_record_response_to_document(response: Response) -> Dict[str, Any]:
+        return {
+            "id": response.id,
+            "status": response.status,
+            "user_id": response.user_id,
+            **{question: value.get("value") for question, value in (response.values or {}).items()},
+        }
+
+    @staticmethod
+    def _map_record_suggestions_to_document(suggestions: List[Suggestion]) -> Dict[str, Any]:
+        return {
+            suggestion.question.name: {
+                "type": suggestion.type,
+                "agent": suggestion.agent,
+                "score": suggestion.score,
+                "value": suggestion.value,
+            }
+            for suggestion in suggestions
+        }
+
+    @staticmethod
+    def _map_document_to_record(
+        dataset: Dataset, document: dict, vectors_settings: List[VectorSettings]
+    ) -> Dict[str, Any]:
+        record = {
+            "external_id": document.get("external_id"),
+            "status": document["status"],
+            "inserted_at": datetime.fromisoformat(document["inserted_at"]),
+            "updated_at": datetime.fromisoformat(document["updated_at"]),
+        }
+
+        # NOTE: Image fields are not stored and custom fields are stored as strings
+        if not any(field.is_image or field.is_custom for field in dataset.fields):
+            record["fields"] = document.get("fields", {})
+        # NOTE: Only metadata with a metadata property is stored
+        if not dataset.allow_extra_metadata:
+            record["metadata"] = document.get("metadata")
+
+        if vectors_settings:
+            vectors = document.get("vectors", {})
+            record["vectors"] = {
+                vector_settings.name: vectors[str(vector_settings.id)]
+                for vector_settings in vectors_settings
+                if str(vector_settings.id) in vectors
+            }
+
+        return record
+
+
+def _normalize_document(document: dict) -> dict:
+    return json.loads(json.dumps(document, default=_json_default))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        # NOTE: A fixed precision keeps dates sortable as strings
+        return value.isoformat(timespec="microseconds")
+    if isinstance(value, UUID):
+        return str(value)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_path(*keys: str) -> str:
+    return "$" + "".join(f'."{key}"' for key in keys)
+
+
+def _sql_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _scope_path(scope: FilterScope) -> str:
+    if isinstance(scope, MetadataFilterScope):
+        return _json_path("metadata", scope.metadata_property)
+    elif isinstance(scope, SuggestionFilterScope):
+        return _json_path("suggestions", scope.question, scope.property)
+    elif isinstance(scope, RecordFilterScope):
+        return _json_path(scope.property)
+
+    raise ValueError(f"Cannot process request for search scope {scope}")
+
+
+def _response_user_filter(scope: ResponseFilterScope) -> Tuple[str, List[Any]]:
+    if scope.user is None:
+        return "1", []
+
+    return "json_extract(response.value, '$.user_id') = ?", [str(scope.user.id)]
+
+
+def _build_values_filter(filter: Filter) -> Tuple[str, List[Any]]:
+    """Returns the condition matching the filter for the `value` rows of a `json_each` table."""
+    if isinstance(filter, TermsFilter):
+        if not filter.values:
+            return "0", []
+
+        terms = [str(value) for value in filter.values]
+        return f"CAST(value.value AS TEXT) IN ({', '.join('?' for _ in terms)})", terms
+    elif isinstance(filter, RangeFilter):
+        sql, params = "value.type IN ('integer', 'real')", []
+        if filter.ge is not None:
+            sql, params = f"{sql} AND value.value >= ?", [*params, filter.ge]
+        if filter.le is not None:
+            sql, params = f"{sql} AND value.value <= ?", [*params, filter.le]
+
+        return sql, params
+
+    raise ValueError(f"Cannot process request for filter {filter}")
+
+
+def _sort_expression(order: Order) -> Tuple[str, List[Any]]:
+    # NOTE: Values of different types are sorted as SQLite does: numbers first, then texts
+    aggregate = "min" if order.order == SortOrder.asc else "max"
+    scope = order.scope
+
+    if isinstance(scope, ResponseFilterScope):
+        user_sql, user_params = _response_user_filter(scope)
+        # Numeric values are averaged, as the `avg` sort mode used by the other search engines
+        return (
+            f"""
+            (
+                SELECT CASE
+                    WHEN count(value.value) = sum(value.type IN ('integer', 'real')) THEN avg(value.value)
+                    ELSE {aggregate}(value.value)
+                END
+                FROM json_each(documents.document, '$.responses') AS response, json_each(response.value, ?) AS value
+                WHERE {user_sql}
+            )
+            """,
+            [_json_path(scope.question or scope.property), *user_params],
+        )
+
+    return f"(SELECT {aggregate}(value.value) FROM json_each(documents.document, ?) AS value)", [_scope_path(scope)]
+
+
+def _search_after_filter(orders: List[SortOrder], search_after: List[Any]) -> Tuple[str, List[Any]]:
+    """Returns the condition matching the hits sorted after `search_after`, with missing values sorted last."""
+    filters, equal_sql, equal_params = [], [], []
+
+    for idx, (order, value) in enumerate(zip(orders, search_after)):
+        key = f"key_{idx}"
+
+        if value is None:
+            equal_sql.append(f"{key} IS NULL")
+            continue
+
+        operator = ">" if order == SortOrder.asc else "<"
+        filters.append((" AND ".join(equal_sql + [f"({key} {operator} ? OR {key} IS NULL)"]), [*equal_params, value]))
+
+        equal_sql.append(f"{key} = ?")
+        equal_params.append(value)
+
+    if not filters:
+        return "0", []
+
+    return " OR ".join(f"({sql})" for sql, _ in filters), [param for _, params in filters for param in params]
+
+
+def _random_score(seed: str, id: str) -> float:
+    digest = hashlib.sha256(f"{seed}:{id}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
+
+
+def _cosine_similarity_scores(value: List[float], vectors: List[List[float]]) -> List[float]:
+    # Scores are normalized to [0, 1] as done by Elasticsearch for the `cosine` similarity
+    if not vectors:
+        return []
+
+    if numpy is not None:
+        matrix = numpy.asarray(vectors, dtype=numpy.float32)
+        query = numpy.asarray(value, dtype=numpy.float32)
+        norms = numpy.linalg.norm(matrix, axis=1) * numpy.linalg.norm(query)
+        similarities = numpy.divide(matrix @ query, norms, out=numpy.zeros(len(vectors)), where=norms != 0)
+        return ((1 + similarities) / 2).tolist()
+
+    query_norm = math.sqrt(sum(x * x for x in value))
+    scores = []
+    for vector in vectors:
+        norm = math.sqrt(sum(x * x for x in vector)) * query_norm
+        similarity = sum(x * y for x, y in zip(vector, value)) / norm if norm else 0.0
+        scores.append((1 + similarity) / 2)
+
+    return scores
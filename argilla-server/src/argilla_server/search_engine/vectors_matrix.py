@@ -0,0 +1,418 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import contextlib
+import functools
+import heapq
+import os
+import threading
+import weakref
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from uuid import UUID
+
+from argilla_server.enums import SimilarityOrder
+from argilla_server.jobs.queues import REDIS_CONNECTION
+from argilla_server.models import VectorSettings
+from argilla_server.models.vectors import NUMPY_DTYPES, vector_value_buffer, vector_value_dtype
+from argilla_server.settings import settings
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+UUID_SIZE = 16
+FLOAT32_SIZE = 4
+
+# NOTE: Rows of deleted records keep their position with a nil id until the matrix is compacted
+NIL_ID = bytes(UUID_SIZE)
+
+
+class VectorsMatrix:
+    """Vectors of a vector settings stored as a contiguous float32 matrix in a file.
+
+    The record ids are stored in a companion file with one 16 bytes row per matrix row. The matrix is read
+    memory-mapped, so only the rows needed by a search are paged in, and it is reloaded when the files are changed
+    by any process.
+
+    Another companion file stores the version of the vectors the matrix holds. Upserts and deletes are only applied
+    to a matrix holding the previous version, so matrices missing changes done by processes without access to its
+    files are never updated and are rebuilt instead.
+    """
+
+    def __init__(self, path: str, vector_settings_id: UUID, dimensions: int):
+        self.vectors_path = os.path.join(path, f"{vector_settings_id}.vectors")
+        self.ids_path = os.path.join(path, f"{vector_settings_id}.ids")
+        self.version_path = os.path.join(path, f"{vector_settings_id}.version")
+        self.dimensions = dimensions
+
+        self._lock = threading.Lock()
+        self._lock_path = os.path.join(path, f"{vector_settings_id}.lock")
+        self._files_key = None
+        self._matrix = None
+        self._norms = None
+        self._ids_by_row: List[bytes] = []
+        self._rows_by_id: Dict[bytes, int] = {}
+
+    def exists(self) -> bool:
+        return os.path.exists(self.ids_path)
+
+    def version(self) -> Optional[int]:
+        try:
+            with open(self.version_path) as version_file:
+                return int(version_file.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def is_current(self, version: int) -> bool:
+        return self.exists() and self.version() == version
+
+    def rebuild(self, vectors: Iterable[Tuple[UUID, Union[List[float], bytes]]], version: int = 0) -> None:
+        """Writes the matrix again with the given vectors values, as lists of floats or packed vector values."""
+        with self._write_lock():
+            self._rebuild(vectors)
+            self._write_version(version)
+
+    def build(self, vectors: Iterable[Tuple[UUID, Union[List[float], bytes]]], version: int = 0) -> bool:
+        """Same as `rebuild` but keeping the matrix if another process has built this version. Returns if it was built."""
+        with self._write_lock():
+            if self.is_current(version):
+                return False
+
+            self._rebuild(vectors)
+            self._write_version(version)
+            return True
+
+    def upsert(self, vectors: Dict[UUID, List[float]], version: int) -> None:
+        """Upserts the vectors of the given version if the matrix holds the previous one."""
+        with self._write_lock():
+            # NOTE: Matrices not built yet or missing changes are built from the database on the next search
+            if not self.is_current(version - 1):
+                return
+
+            self._load()
+
+            new_vectors = []
+            with open(self.vectors_path, "r+b") as vectors_file:
+                for record_id, value in vectors.items():
+                    row = self._rows_by_id.get(record_id.bytes)
+                    if row is None:
+                        new_vectors.append((record_id, value))
+                        continue
+
+                    vectors_file.seek(row * self._row_size)
+                    vectors_file.write(self._to_row_bytes(value))
+
+                # NOTE: Vectors are appended before their ids so readers never see an id without its vector
+                vectors_file.seek(len(self._ids_by_row) * self._row_size)
+                vectors_file.truncate()
+                for _, value in new_vectors:
+                    vectors_file.write(self._to_row_bytes(value))
+
+            with open(self.ids_path, "ab") as ids_file:
+                for record_id, _ in new_vectors:
+                    ids_file.write(record_id.bytes)
+
+            self._write_version(version)
+
+    def delete(self, records_ids: Iterable[UUID], version: int) -> None:
+        """Deletes the vectors of the given records for the given version if the matrix holds the previous one."""
+        with self._write_lock():
+            if not self.is_current(version - 1):
+                return
+
+            self._load()
+
+            deleted_ids = {record_id.bytes for record_id in records_ids} & self._rows_by_id.keys()
+            alive_rows_by_id = {id: row for id, row in self._rows_by_id.items() if id not in deleted_ids}
+            if deleted_ids and len(alive_rows_by_id) * 2 < len(self._ids_by_row):
+                self._rebuild((UUID(bytes=id), self._matrix[row]) for id, row in alive_rows_by_id.items())
+            elif deleted_ids:
+                with open(self.ids_path, "r+b") as ids_file:
+                    for id in deleted_ids:
+                        ids_file.seek(self._rows_by_id[id] * UUID_SIZE)
+                        ids_file.write(NIL_ID)
+
+            self._write_version(version)
+
+    def drop(self) -> None:
+        if not os.path.exists(self._lock_path):
+            return
+
+        with self._write_lock():
+            for file_path in [self.ids_path, self.vectors_path, self.version_path, self._lock_path]:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(file_path)
+
+    def top_k(
+        self,
+        value: List[float],
+        k: int,
+        order: SimilarityOrder = SimilarityOrder.most_similar,
+        candidates_ids: Optional[Set[UUID]] = None,
+        excluded_id: Optional[UUID] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[Tuple[UUID, float]]:
+        """Returns the ids of the `k` most (or least) similar records to `value` with their similarity scores.
+
+        Scores are the cosine similarity normalized to [0, 1], like the `cosine` similarity of the search engines.
+        When `candidates_ids` is provided only those records are scored.
+        """
+        with self._lock:
+            self._load()
+            matrix, norms, ids_by_row, rows_by_id = self._matrix, self._norms, self._ids_by_row, self._rows_by_id
+
+        if k <= 0 or not rows_by_id:
+            return []
+
+        query = numpy.asarray(value, dtype=numpy.float32)
+        query_norm = numpy.linalg.norm(query)
+        if query_norm == 0:
+            return []
+        if order == SimilarityOrder.least_similar:
+            query = -query
+
+        if candidates_ids is None:
+            rows = numpy.fromiter(rows_by_id.values(), dtype=numpy.int64, count=len(rows_by_id))
+        else:
+            rows = numpy.fromiter(
+                (rows_by_id[record_id.bytes] for record_id in candidates_ids if record_id.bytes in rows_by_id),
+                dtype=numpy.int64,
+            )
+
+        if excluded_id is not None and excluded_id.bytes in rows_by_id:
+            rows = rows[rows != rows_by_id[excluded_id.bytes]]
+
+        rows.sort()
+        batch_size = batch_size or settings.exact_similarity_search_batch_size
+
+        top: List[Tuple[float, int]] = []
+        for start in range(0, len(rows), batch_size):
+            batch_rows = rows[start : start + batch_size]
+            batch_norms = norms[batch_rows]
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                similarities = (matrix[batch_rows] @ query) / (batch_norms * query_norm)
+            similarities[batch_norms == 0] = -numpy.inf
+
+            if len(similarities) > k:
+                best = numpy.argpartition(-similarities, k - 1)[:k]
+            else:
+                best = numpy.arange(len(similarities))
+
+            for idx in best:
+                if similarities[idx] != -numpy.inf:
+                    top.append((float(similarities[idx]), int(batch_rows[idx])))
+
+            top = heapq.nlargest(k, top)
+
+        return [(UUID(bytes=ids_by_row[row]), (1 + similarity) / 2) for similarity, row in top]
+
+    @property
+    def _row_size(self) -> int:
+        return self.dimensions * FLOAT32_SIZE
+
+    def _rebuild(self, vectors: Iterable[Tuple[UUID, Union[List[float], bytes]]]) -> None:
+        ids_tmp_path, vectors_tmp_path = f"{self.ids_path}.tmp", f"{self.vectors_path}.tmp"
+
+        with open(ids_tmp_path, "wb") as ids_file, open(vectors_tmp_path, "wb") as vectors_file:
+            for record_id, value in vectors:
+                vectors_file.write(self._to_row_bytes(value))
+                ids_file.write(record_id.bytes)
+
+        # NOTE: The ids file is replaced last because its presence marks the matrix as built
+        os.replace(vectors_tmp_path, self.vectors_path)
+        os.replace(ids_tmp_path, self.ids_path)
+
+    def _write_version(self, version: int) -> None:
+        # NOTE: The version is written after the matrix, so a failed write leaves a stale matrix to be rebuilt
+        version_tmp_path = f"{self.version_path}.tmp"
+        with open(version_tmp_path, "w") as version_file:
+            version_file.write(str(version))
+
+        os.replace(version_tmp_path, self.version_path)
+
+    def _to_row_bytes(self, value: Union[List[float], bytes]) -> bytes:
+        if isinstance(value, bytes):
+            row = numpy.frombuffer(vector_value_buffer(value), dtype=NUMPY_DTYPES[vector_value_dtype(value)])
+            row = row.astype(numpy.float32, copy=False)
+        else:
+            row = numpy.asarray(value, dtype=numpy.float32)
+        if row.shape != (self.dimensions,):
+            raise ValueError(f"Vector has {row.size} dimensions but {self.dimensions} were expected")
+
+        return row.tobytes()
+
+    def _load(self) -> None:
+        ids_stat, vectors_stat = os.stat(self.ids_path), os.stat(self.vectors_path)
+        files_key = (
+            ids_stat.st_ino,
+            ids_stat.st_size,
+            ids_stat.st_mtime_ns,
+            vectors_stat.st_ino,
+            vectors_stat.st_size,
+            vectors_stat.st_mtime_ns,
+        )
+        if files_key == self._files_key:
+            return
+
+        num_rows = min(ids_stat.st_size // UUID_SIZE, vectors_stat.st_size // self._row_size)
+        ids = numpy.fromfile(self.ids_path, dtype=numpy.uint8, count=num_rows * UUID_SIZE).reshape(num_rows, UUID_SIZE)
+
+        if num_rows:
+            self._matrix = numpy.memmap(
+                self.vectors_path, dtype=numpy.float32, mode="r", shape=(num_rows, self.dimensions)
+            )
+            self._norms = numpy.concatenate(
+                [
+                    numpy.linalg.norm(self._matrix[start : start + settings.exact_similarity_search_batch_size], axis=1)
+                    for start in range(0, num_rows, settings.exact_similarity_search_batch_size)
+                ]
+            )
+        else:
+            self._matrix = numpy.empty((0, self.dimensions), dtype=numpy.float32)
+            self._norms = numpy.empty(0, dtype=numpy.float32)
+
+        self._ids_by_row = [row.tobytes() for row in ids]
+        self._rows_by_id = {record_id: row for row, record_id in enumerate(self._ids_by_row) if record_id != NIL_ID}
+        self._files_key = files_key
+
+    @contextlib.contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        with self._lock, open(self._lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                self._files_key = None
+
+
+class VectorsMatrixStore:
+    """Stores a `VectorsMatrix` per vector settings under `path` and exposes them without blocking the event loop.
+
+    Every process writing vectors bumps the version of the vector settings in Redis, even if it has no matrix, so
+    the matrices of processes not sharing `path` are rebuilt instead of missing those vectors.
+    """
+
+    def __init__(self, path: str):
+        if numpy is None:
+            raise ImportError(
+                "numpy is required to use the exact similarity search. Install it with `pip install numpy`"
+            )
+
+        os.makedirs(path, exist_ok=True)
+
+        self.path = path
+        self._matrices: Dict[UUID, VectorsMatrix] = {}
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[UUID, asyncio.Lock]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def matrix_for(self, vector_settings: VectorSettings) -> VectorsMatrix:
+        matrix = self._matrices.get(vector_settings.id)
+        if matrix is None:
+            matrix = VectorsMatrix(self.path, vector_settings.id, vector_settings.dimensions)
+            self._matrices[vector_settings.id] = matrix
+
+        return matrix
+
+    async def exists(self, vector_settings: VectorSettings) -> bool:
+        return self.matrix_for(vector_settings).exists()
+
+    async def is_current(self, vector_settings: VectorSettings) -> bool:
+        return await asyncio.to_thread(self._is_current, vector_settings)
+
+    async def rebuild(
+        self, vector_settings: VectorSettings, vectors: Iterable[Tuple[UUID, Union[List[float], bytes]]]
+    ) -> None:
+        version = await asyncio.to_thread(_get_vectors_matrix_version, vector_settings.id)
+        await asyncio.to_thread(self.matrix_for(vector_settings).rebuild, vectors, version)
+
+    async def build(
+        self,
+        vector_settings: VectorSettings,
+        load_vectors: Callable[[], Awaitable[Iterable[Tuple[UUID, Union[List[float], bytes]]]]],
+    ) -> None:
+        """Builds the matrix with the vectors returned by `load_vectors` unless it holds the current version.
+
+        The version is read before loading the vectors, so vectors stored meanwhile are loaded or bump the version
+        again. Upserts are ignored while the matrix is not built, so upserts and deletes of the same process wait for
+        the build to finish, and the ones of vectors stored after loading them are applied to the built matrix.
+        """
+        matrix = self.matrix_for(vector_settings)
+
+        async with self._lock_for(vector_settings):
+            version = await asyncio.to_thread(_get_vectors_matrix_version, vector_settings.id)
+            if await asyncio.to_thread(matrix.is_current, version):
+                return
+
+            vectors = await load_vectors()
+            await asyncio.to_thread(matrix.build, vectors, version)
+
+    async def upsert(self, vector_settings: VectorSettings, vectors: Dict[UUID, List[float]]) -> None:
+        async with self._lock_for(vector_settings):
+            await asyncio.to_thread(self._upsert, vector_settings, vectors)
+
+    async def delete(self, vector_settings: VectorSettings, records_ids: Iterable[UUID]) -> None:
+        async with self._lock_for(vector_settings):
+            await asyncio.to_thread(self._delete, vector_settings, list(records_ids))
+
+    async def drop(self, vector_settings: VectorSettings) -> None:
+        async with self._lock_for(vector_settings):
+            await asyncio.to_thread(self.matrix_for(vector_settings).drop)
+            self._matrices.pop(vector_settings.id, None)
+
+    async def top_k(
+        self, vector_settings: VectorSettings, value: List[float], k: int, **kwargs
+    ) -> List[Tuple[UUID, float]]:
+        return await asyncio.to_thread(self.matrix_for(vector_settings).top_k, value, k, **kwargs)
+
+    def _is_current(self, vector_settings: VectorSettings) -> bool:
+        return self.matrix_for(vector_settings).is_current(_get_vectors_matrix_version(vector_settings.id))
+
+    def _upsert(self, vector_settings: VectorSettings, vectors: Dict[UUID, List[float]]) -> None:
+        self.matrix_for(vector_settings).upsert(vectors, _bump_vectors_matrix_version(vector_settings.id))
+
+    def _delete(self, vector_settings: VectorSettings, records_ids: List[UUID]) -> None:
+        self.matrix_for(vector_settings).delete(records_ids, _bump_vectors_matrix_version(vector_settings.id))
+
+    def _lock_for(self, vector_settings: VectorSettings) -> asyncio.Lock:
+        # NOTE: asyncio locks are bound to an event loop and jobs running in the worker process use a new one each
+        locks = self._locks.setdefault(asyncio.get_running_loop(), {})
+
+        return locks.setdefault(vector_settings.id, asyncio.Lock())
+
+
+def _get_vectors_matrix_version(vector_settings_id: UUID) -> int:
+    return int(REDIS_CONNECTION.get(_vectors_matrix_version_redis_key(vector_settings_id)) or 0)
+
+
+def _bump_vectors_matrix_version(vector_settings_id: UUID) -> int:
+    return REDIS_CONNECTION.incr(_vectors_matrix_version_redis_key(vector_settings_id))
+
+
+def _vectors_matrix_version_redis_key(vector_settings_id: UUID) -> str:
+    return f"vectors_settings:{vector_settings_id}:matrix:version"
+
+
+@functools.lru_cache(maxsize=None)
+def get_vectors_matrix_store() -> VectorsMatrixStore:
+    return VectorsMatrixStore(settings.exact_similarity_search_path or os.path.join(settings.home_path, "vectors"))
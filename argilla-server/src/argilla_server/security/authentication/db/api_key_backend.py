@@ -35,7 +35,7 @@ class APIKeyAuthenticationBackend(AuthenticationBackend):
             return None
 
         db = request.state.db
-        user = await accounts.get_user_by_api_key(db, api_key=api_key)
+        user = await accounts.get_cached_user_by_api_key(db, api_key=api_key)
         if not user:
             return None
 
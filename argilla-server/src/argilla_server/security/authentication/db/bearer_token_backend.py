@@ -38,7 +38,7 @@ class BearerTokenAuthenticationBackend(AuthenticationBackend):
         username = JWT.decode(token).get("username")
 
         db = request.state.db
-        user = await accounts.get_user_by_username(db, username)
+        user = await accounts.get_cached_user_by_username(db, username)
         if not user:
             return None
 
@@ -80,7 +80,7 @@ class AuthenticationProvider:
         if not userinfo:
             raise UnauthorizedError()
 
-        user = await accounts.get_user_by_username(db, userinfo.username)
+        user = await accounts.get_cached_user_by_username(db, userinfo.username)
         if not user:
             raise UnauthorizedError()
 
@@ -101,7 +101,7 @@ class AuthenticationProvider:
         if not userinfo:
             return None
 
-        user = await accounts.get_user_by_username(db, userinfo.username)
+        user = await accounts.get_cached_user_by_username(db, userinfo.username)
         if not user:
             return None
 
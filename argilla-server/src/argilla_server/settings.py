@@ -34,11 +34,26 @@ from argilla_server.constants import (
     DEFAULT_DATABASE_POSTGRESQL_MAX_OVERFLOW,
     DEFAULT_DATABASE_POSTGRESQL_POOL_SIZE,
     DEFAULT_DATABASE_SQLITE_TIMEOUT,
+    DEFAULT_DATASET_LAST_ACTIVITY_GRANULARITY,
+    DEFAULT_RECORDS_BULK_STREAM_CHUNK_SIZE,
+    DEFAULT_RECORDS_BULK_STREAM_MAX_LINE_SIZE,
+    DEFAULT_DATASET_PROGRESS_CACHE_TTL,
+    DEFAULT_DATASETS_SCHEMA_CACHE_SIZE,
+    DEFAULT_DATASETS_SCHEMA_CACHE_TTL,
+    DEFAULT_EXACT_SIMILARITY_SEARCH_BATCH_SIZE,
     DEFAULT_LABEL_SELECTION_OPTIONS_MAX_ITEMS,
+    DEFAULT_SEARCH_ENGINE_MAX_CONNECTIONS,
     DEFAULT_SPAN_OPTIONS_MAX_ITEMS,
+    DEFAULT_USERS_CACHE_TTL,
+    DEFAULT_WEBHOOKS_MAX_CONCURRENT_DELIVERIES,
+    DEFAULT_WEBHOOKS_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_WORKSPACE_MEMBERSHIP_CACHE_TTL,
+    RECORDS_BULK_UPSERT_MAX_ITEMS,
     SEARCH_ENGINE_ELASTICSEARCH,
+    SEARCH_ENGINE_EMBEDDED,
     SEARCH_ENGINE_OPENSEARCH,
 )
+from argilla_server.enums import SearchEngineRefreshPolicy, VectorsStorageDtype
 
 
 class Settings(BaseSettings):
@@ -122,6 +137,74 @@ class Settings(BaseSettings):
     redis_url: str = "redis://localhost:6379/0"
     redis_use_cluster: bool = False
 
+    webhooks_max_connections_per_host: int = Field(
+        default=DEFAULT_WEBHOOKS_MAX_CONNECTIONS_PER_HOST,
+        description="The number of HTTP connections to keep open per webhook host in each worker",
+    )
+    webhooks_max_concurrent_deliveries: int = Field(
+        default=DEFAULT_WEBHOOKS_MAX_CONCURRENT_DELIVERIES,
+        description="The maximum number of in-flight deliveries for a single webhook across all workers",
+    )
+    webhooks_max_deliveries_per_second: Optional[int] = Field(
+        default=None,
+        description="The maximum number of deliveries per second for a single webhook. Unlimited if not set",
+    )
+
+    datasets_schema_cache_size: int = Field(
+        default=DEFAULT_DATASETS_SCHEMA_CACHE_SIZE,
+        description="The maximum number of datasets schemas (fields, questions, metadata properties and vectors "
+        "settings) cached in memory by each server process. Set to 0 to disable the cache",
+    )
+    datasets_schema_cache_use_redis: bool = Field(
+        default=True,
+        description="Share the datasets schema cache versions through Redis, so schema changes done by one server "
+        "process are seen by the others straight away. Disable it only when running a single server process",
+    )
+    datasets_schema_cache_ttl: float = Field(
+        default=DEFAULT_DATASETS_SCHEMA_CACHE_TTL,
+        description="The maximum number of seconds a dataset schema is cached in memory. It bounds how long other "
+        "server processes can use a stale schema when the cache versions are not shared through Redis. Set to 0 to "
+        "keep cached schemas until they are changed",
+    )
+
+    dataset_progress_cache_ttl: float = Field(
+        default=DEFAULT_DATASET_PROGRESS_CACHE_TTL,
+        description="The number of seconds datasets progress and user metrics computed by the search engine are "
+        "cached in memory by each server process. Set to 0 to disable the cache",
+    )
+
+    dataset_last_activity_granularity: float = Field(
+        default=DEFAULT_DATASET_LAST_ACTIVITY_GRANULARITY,
+        description="The minimum number of seconds between updates of the last activity date of a dataset done by "
+        "each server process. Set to 0 to update it on every annotation",
+    )
+
+    records_bulk_stream_chunk_size: int = Field(
+        default=DEFAULT_RECORDS_BULK_STREAM_CHUNK_SIZE,
+        gt=0,
+        le=RECORDS_BULK_UPSERT_MAX_ITEMS,
+        description="The number of records of a streamed records bulk written to the database and indexed at once. "
+        f"It can't be greater than {RECORDS_BULK_UPSERT_MAX_ITEMS}, the maximum number of items of a records bulk",
+    )
+
+    records_bulk_stream_max_line_size: int = Field(
+        default=DEFAULT_RECORDS_BULK_STREAM_MAX_LINE_SIZE,
+        gt=0,
+        description="The maximum size in bytes of a line (a record) of a streamed records bulk",
+    )
+
+    workspace_membership_cache_ttl: float = Field(
+        default=DEFAULT_WORKSPACE_MEMBERSHIP_CACHE_TTL,
+        description="The number of seconds users workspaces memberships checked by the authorization policies are "
+        "cached in memory by each server process. Set to 0 to disable the cache",
+    )
+
+    users_cache_ttl: float = Field(
+        default=DEFAULT_USERS_CACHE_TTL,
+        description="The number of seconds the users resolved from API keys and access tokens are cached in memory "
+        "by each server process. Set to 0 to disable the cache",
+    )
+
     docs_enabled: bool = True
 
     # Analyzer configuration
@@ -131,6 +214,41 @@ class Settings(BaseSettings):
     es_mapping_total_fields_limit: int = 2000
 
     search_engine: str = SEARCH_ENGINE_ELASTICSEARCH
+    search_engine_max_connections: int = Field(
+        default=DEFAULT_SEARCH_ENGINE_MAX_CONNECTIONS,
+        description="The number of HTTP connections to keep open per search engine node in the shared client pool",
+    )
+    # https://www.elastic.co/guide/en/elasticsearch/reference/current/docs-refresh.html
+    search_engine_refresh_policy: SearchEngineRefreshPolicy = Field(
+        default=SearchEngineRefreshPolicy.true,
+        description="The refresh policy used by bulk indexing requests (`true`, `wait_for` or `false`)",
+    )
+    search_engine_refresh_interval: Optional[str] = Field(
+        default=None,
+        description="The periodic refresh interval (e.g. `5s`) configured for dataset indices. Uses the search engine default if not set",
+    )
+    search_engine_embedded_path: Optional[str] = Field(
+        default=None,
+        description="The SQLite database file used by the `embedded` search engine. Defaults to `search.db` in the home path",
+    )
+    exact_similarity_search_path: Optional[str] = Field(
+        default=None,
+        description="The folder storing the vectors used by datasets with exact similarity search. Defaults to `vectors` in the home path",
+    )
+    exact_similarity_search_batch_size: int = Field(
+        default=DEFAULT_EXACT_SIMILARITY_SEARCH_BATCH_SIZE,
+        description="The number of vectors scored at once by the exact similarity search",
+    )
+    search_engine_records_from_source: bool = Field(
+        default=False,
+        description="Serve records search results from the documents stored in the search engine instead of the database",
+    )
+
+    # Vectors settings
+    vectors_storage_dtype: VectorsStorageDtype = Field(
+        default=VectorsStorageDtype.float32,
+        description="The float type used to store vector values. `float16` halves the storage size losing precision",
+    )
 
     # Questions settings
     label_selection_options_max_items: int = Field(
@@ -275,6 +393,10 @@ class Settings(BaseSettings):
     def search_engine_is_opensearch(self) -> bool:
         return self.search_engine == SEARCH_ENGINE_OPENSEARCH
 
+    @property
+    def search_engine_is_embedded(self) -> bool:
+        return self.search_engine == SEARCH_ENGINE_EMBEDDED
+
     class Config:
         env_prefix = "ARGILLA_"
 
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List
+from typing import List, Optional, Tuple
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,8 +22,10 @@ from argilla_server.api.schemas.v1.responses import Response, ResponseBulk, Resp
 from argilla_server.contexts import datasets
 from argilla_server.database import get_async_db
 from argilla_server.errors import future as errors
-from argilla_server.models import User
+from argilla_server.models import Record, User
+from argilla_server.models import Response as ResponseModel
 from argilla_server.search_engine import SearchEngine, get_search_engine
+from argilla_server.validators.responses import ResponseUpsertValidator
 
 
 class UpsertResponsesInBulkUseCase:
@@ -32,27 +34,86 @@ class UpsertResponsesInBulkUseCase:
         self.search_engine = search_engine
 
     async def execute(self, responses: List[ResponseUpsert], user: User) -> List[ResponseBulk]:
-        responses_bulk_items = []
+        responses_bulk_items: List[Optional[ResponseBulk]] = [None] * len(responses)
 
         all_records = await datasets.get_records_by_ids(self.db, [item.record_id for item in responses])
         non_empty_records = [r for r in all_records if r is not None]
 
         await datasets.preload_records_relationships_before_validate(self.db, non_empty_records)
-        for item, record in zip(responses, all_records):
+
+        valid_items = []
+        for idx, (item, record) in enumerate(zip(responses, all_records)):
             try:
                 if record is None:
                     raise errors.NotFoundError(f"Record with id `{item.record_id}` not found")
 
                 await authorize(user, RecordPolicy.create_response(record))
 
-                response = await datasets.upsert_response(self.db, self.search_engine, record, user, item)
+                ResponseUpsertValidator.validate(item, record)
             except Exception as err:
-                responses_bulk_items.append(ResponseBulk(item=None, error=ResponseBulkError(detail=str(err))))
+                responses_bulk_items[idx] = ResponseBulk(item=None, error=ResponseBulkError(detail=str(err)))
             else:
-                responses_bulk_items.append(ResponseBulk(item=Response.model_validate(response), error=None))
+                valid_items.append((idx, item, record))
+
+        upserted_items = await self._upsert_valid_items(valid_items, user, responses_bulk_items)
+
+        try:
+            await self.db.commit()
+        except Exception as err:
+            await self.db.rollback()
+            for idx, _, _ in upserted_items:
+                responses_bulk_items[idx] = ResponseBulk(item=None, error=ResponseBulkError(detail=str(err)))
+
+            return responses_bulk_items
+
+        # NOTE: Responses are already committed here, so errors are not reported as items errors
+        await datasets.notify_upserted_responses(
+            self.db,
+            self.search_engine,
+            [record for _, record, _ in upserted_items],
+            [response for _, _, response in upserted_items],
+        )
+
+        for idx, _, response in upserted_items:
+            responses_bulk_items[idx] = ResponseBulk(item=Response.model_validate(response), error=None)
 
         return responses_bulk_items
 
+    async def _upsert_valid_items(
+        self,
+        valid_items: List[Tuple[int, ResponseUpsert, Record]],
+        user: User,
+        responses_bulk_items: List[Optional[ResponseBulk]],
+    ) -> List[Tuple[int, Record, ResponseModel]]:
+        try:
+            async with self.db.begin_nested():
+                responses = await datasets.upsert_responses(
+                    self.db,
+                    records=[record for _, _, record in valid_items],
+                    user=user,
+                    responses_upserts=[item for _, item, _ in valid_items],
+                    autocommit=False,
+                )
+        except Exception:
+            pass
+        else:
+            return [(idx, record, response) for (idx, _, record), response in zip(valid_items, responses)]
+
+        # NOTE: Responses are upserted again one at a time, each one in its own savepoint, to report the failing items
+        upserted_items = []
+        for idx, item, record in valid_items:
+            try:
+                async with self.db.begin_nested():
+                    [response] = await datasets.upsert_responses(
+                        self.db, records=[record], user=user, responses_upserts=[item], autocommit=False
+                    )
+            except Exception as err:
+                responses_bulk_items[idx] = ResponseBulk(item=None, error=ResponseBulkError(detail=str(err)))
+            else:
+                upserted_items.append((idx, record, response))
+
+        return upserted_items
+
 
 class UpsertResponsesInBulkUseCaseFactory:
     def __call__(
@@ -12,4 +12,4 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from .params import parse_query_param, parse_uuids
+from .params import decode_cursor, encode_cursor, parse_query_param, parse_uuids
@@ -13,6 +13,8 @@
 #  limitations under the License.
 
 import re
+import json
+import base64
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
 from uuid import UUID
@@ -30,6 +32,30 @@ def parse_uuids(uuids_str: str) -> List[UUID]:
         raise HTTPException(status_code=422, detail="Invalid UUID format")
 
 
+def encode_cursor(values: List[Any]) -> str:
+    """Encodes a list of JSON serializable values into an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str, length: Optional[int] = None) -> List[Any]:
+    """Decodes a pagination cursor generated with `encode_cursor`.
+
+    Cursors must be a list of `length` values, if provided, where every value is a string, a number, a boolean or null.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+
+    if not isinstance(values, list) or (length is not None and len(values) != length):
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+
+    if not all(value is None or isinstance(value, (str, int, float, bool)) for value in values):
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+
+    return values
+
+
 T = TypeVar("T", bound=BaseModel)
 
 # Matches key1,key2,key3 and key:value1,value2,value3, but not key1,key2,key3:value1,value2,value3
@@ -12,23 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import mimetypes
 from abc import ABC
-from typing import Dict, List, Union, Any, Optional
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Sequence, Tuple, Union, Any, Optional
 from urllib.parse import urlparse, ParseResult, ParseResultBytes
+from uuid import UUID
 
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server.api.schemas.v1.chat import ChatFieldValue
+from argilla_server.api.schemas.v1.questions import QuestionSettings
 from argilla_server.api.schemas.v1.records import RecordCreate, RecordUpsert, RecordUpdate
 from argilla_server.api.schemas.v1.records_bulk import RecordsBulkCreate
 from argilla_server.api.schemas.v1.responses import UserResponseCreate
 from argilla_server.api.schemas.v1.suggestions import SuggestionCreate
 from argilla_server.contexts import records
 from argilla_server.errors.future.base_errors import UnprocessableEntityError
-from argilla_server.models import Dataset, Record
+from argilla_server.models import Dataset, Record, VectorSettings
+from argilla_server.models.metadata_properties import MetadataPropertySettings
 from argilla_server.validators.responses import ResponseCreateValidator
 from argilla_server.validators.suggestions import SuggestionCreateValidator
 from argilla_server.validators.vectors import VectorValidator
@@ -48,16 +51,80 @@ IMAGE_FIELD_DATA_URL_VALID_MIME_TYPES = [
 CHAT_FIELD_MAX_LENGTH = 500
 
 
+class RecordsValidationPlan:
+    """Dataset settings needed to validate records, compiled once per dataset so bulk operations don't filter and
+    parse them again for every record.
+
+    Every part of the plan is compiled the first time a record needs it. When `users_ids` is set it contains the ids
+    of the existing users among the responses of the validated records, otherwise users are looked up per record.
+    """
+
+    def __init__(self, dataset: Dataset, users_ids: Optional[FrozenSet[UUID]] = None):
+        self.dataset = dataset
+        self.users_ids = users_ids
+
+    @cached_property
+    def fields_names(self) -> FrozenSet[str]:
+        return frozenset(field.name for field in self.dataset.fields)
+
+    @cached_property
+    def required_fields_names(self) -> Tuple[str, ...]:
+        return tuple(field.name for field in self.dataset.fields if field.required)
+
+    @cached_property
+    def text_fields_names(self) -> Tuple[str, ...]:
+        return tuple(field.name for field in self.dataset.fields if field.is_text)
+
+    @cached_property
+    def image_fields_names(self) -> Tuple[str, ...]:
+        return tuple(field.name for field in self.dataset.fields if field.is_image)
+
+    @cached_property
+    def chat_fields_names(self) -> Tuple[str, ...]:
+        return tuple(field.name for field in self.dataset.fields if field.is_chat)
+
+    @cached_property
+    def custom_fields_names(self) -> Tuple[str, ...]:
+        return tuple(field.name for field in self.dataset.fields if field.is_custom)
+
+    @cached_property
+    def metadata_properties_settings(self) -> Dict[str, MetadataPropertySettings]:
+        return {
+            metadata_property.name: metadata_property.parsed_settings
+            for metadata_property in reversed(self.dataset.metadata_properties)
+        }
+
+    @cached_property
+    def vectors_settings(self) -> Dict[str, VectorSettings]:
+        return {vector_settings.name: vector_settings for vector_settings in reversed(self.dataset.vectors_settings)}
+
+    @cached_property
+    def questions_settings(self) -> Dict[UUID, QuestionSettings]:
+        return {question.id: question.parsed_settings for question in self.dataset.questions}
+
+    @classmethod
+    async def compile_for_bulk(
+        cls, db: AsyncSession, dataset: Dataset, records: Sequence[Union[RecordCreate, RecordUpsert]]
+    ) -> "RecordsValidationPlan":
+        """Compiles the plan resolving the users of all the records responses with a single query."""
+        from argilla_server.contexts.accounts import list_users_by_ids
+
+        user_ids = {response.user_id for record in records for response in record.responses or []}
+        users = await list_users_by_ids(db, user_ids) if user_ids else []
+
+        return cls(dataset, users_ids=frozenset(user.id for user in users))
+
+
 class RecordValidatorBase(ABC):
     @classmethod
-    def _validate_fields(cls, fields: dict, dataset: Dataset) -> None:
+    def _validate_fields(cls, fields: dict, plan: RecordsValidationPlan) -> None:
         cls._validate_non_empty_fields(fields=fields)
-        cls._validate_required_fields(dataset=dataset, fields=fields)
-        cls._validate_extra_fields(dataset=dataset, fields=fields)
-        cls._validate_text_fields(dataset=dataset, fields=fields)
-        cls._validate_image_fields(dataset=dataset, fields=fields)
-        cls._validate_chat_fields(dataset=dataset, fields=fields)
-        cls._validate_custom_fields(dataset=dataset, fields=fields)
+        cls._validate_required_fields(plan=plan, fields=fields)
+        cls._validate_extra_fields(plan=plan, fields=fields)
+        cls._validate_text_fields(plan=plan, fields=fields)
+        cls._validate_image_fields(plan=plan, fields=fields)
+        cls._validate_chat_fields(plan=plan, fields=fields)
+        cls._validate_custom_fields(plan=plan, fields=fields)
 
     @classmethod
     def _validate_non_empty_fields(cls, fields: Dict[str, str]) -> None:
@@ -65,54 +132,54 @@ class RecordValidatorBase(ABC):
             raise UnprocessableEntityError("fields cannot be empty")
 
     @classmethod
-    def _validate_required_fields(cls, dataset: Dataset, fields: Dict[str, str]) -> None:
-        for field in dataset.fields:
-            if field.required and not (field.name in fields and fields.get(field.name) is not None):
-                raise UnprocessableEntityError(f"missing required value for field: {field.name!r}")
+    def _validate_required_fields(cls, plan: RecordsValidationPlan, fields: Dict[str, str]) -> None:
+        for field_name in plan.required_fields_names:
+            if fields.get(field_name) is None:
+                raise UnprocessableEntityError(f"missing required value for field: {field_name!r}")
 
     @classmethod
-    def _validate_extra_fields(cls, dataset: Dataset, fields: Dict[str, str]) -> None:
-        fields_copy = copy.copy(fields)
-        for field in dataset.fields:
-            fields_copy.pop(field.name, None)
-        if fields_copy:
-            raise UnprocessableEntityError(f"found fields values for non configured fields: {list(fields_copy.keys())}")
+    def _validate_extra_fields(cls, plan: RecordsValidationPlan, fields: Dict[str, str]) -> None:
+        extra_fields_names = [field_name for field_name in fields if field_name not in plan.fields_names]
+        if extra_fields_names:
+            raise UnprocessableEntityError(f"found fields values for non configured fields: {extra_fields_names}")
 
     @classmethod
-    def _validate_metadata(cls, metadata: dict, dataset: Dataset) -> None:
+    def _validate_metadata(cls, metadata: dict, plan: RecordsValidationPlan) -> None:
         metadata = metadata or {}
 
         for name, value in metadata.items():
-            metadata_property = dataset.metadata_property_by_name(name)
             # TODO(@frascuchon): Create a MetadataPropertyValidator instead of using the parsed_settings
-            if metadata_property and value is not None:
+            if name in plan.metadata_properties_settings:
+                if value is None:
+                    continue
+
                 try:
-                    metadata_property.parsed_settings.check_metadata(value)
+                    plan.metadata_properties_settings[name].check_metadata(value)
                 except UnprocessableEntityError as e:
                     raise UnprocessableEntityError(
                         f"metadata is not valid: '{name}' metadata property validation failed because {e}"
                     ) from e
 
-            elif metadata_property is None and not dataset.allow_extra_metadata:
+            elif not plan.dataset.allow_extra_metadata:
                 raise UnprocessableEntityError(
-                    f"metadata is not valid: '{name}' metadata property does not exists for dataset '{dataset.id}' "
-                    "and extra metadata is not allowed for this dataset"
+                    f"metadata is not valid: '{name}' metadata property does not exists for dataset "
+                    f"'{plan.dataset.id}' and extra metadata is not allowed for this dataset"
                 )
 
     @classmethod
-    def _validate_text_fields(cls, dataset: Dataset, fields: Dict[str, str]) -> None:
-        for field in filter(lambda field: field.is_text, dataset.fields):
-            cls._validate_text_field(field.name, fields.get(field.name))
+    def _validate_text_fields(cls, plan: RecordsValidationPlan, fields: Dict[str, str]) -> None:
+        for field_name in plan.text_fields_names:
+            cls._validate_text_field(field_name, fields.get(field_name))
 
     @classmethod
-    def _validate_image_fields(cls, dataset: Dataset, fields: Dict[str, str]) -> None:
-        for field in filter(lambda field: field.is_image, dataset.fields):
-            cls._validate_image_field(field.name, fields.get(field.name))
+    def _validate_image_fields(cls, plan: RecordsValidationPlan, fields: Dict[str, str]) -> None:
+        for field_name in plan.image_fields_names:
+            cls._validate_image_field(field_name, fields.get(field_name))
 
     @classmethod
-    def _validate_chat_fields(cls, dataset: Dataset, fields: Dict[str, Any]) -> None:
-        for field in filter(lambda field: field.is_chat, dataset.fields):
-            cls._validate_chat_field(field.name, fields.get(field.name))
+    def _validate_chat_fields(cls, plan: RecordsValidationPlan, fields: Dict[str, Any]) -> None:
+        for field_name in plan.chat_fields_names:
+            cls._validate_chat_field(field_name, fields.get(field_name))
 
     @classmethod
     def _validate_text_field(cls, field_name: str, field_value: Any) -> None:
@@ -179,9 +246,9 @@ class RecordValidatorBase(ABC):
             )
 
     @classmethod
-    def _validate_custom_fields(cls, dataset: Dataset, fields: Dict[str, Any]) -> None:
-        for field in filter(lambda field: field.is_custom, dataset.fields):
-            cls._validate_custom_field(field.name, fields.get(field.name))
+    def _validate_custom_fields(cls, plan: RecordsValidationPlan, fields: Dict[str, Any]) -> None:
+        for field_name in plan.custom_fields_names:
+            cls._validate_custom_field(field_name, fields.get(field_name))
 
     @classmethod
     def _validate_custom_field(cls, name: str, value: Any) -> None:
@@ -192,7 +259,9 @@ class RecordValidatorBase(ABC):
             raise UnprocessableEntityError(f"custom field {name!r} value must be a dictionary")
 
     @classmethod
-    def _validate_suggestions(cls, suggestions: List[SuggestionCreate], dataset: Dataset, record: Record):
+    def _validate_suggestions(
+        cls, suggestions: List[SuggestionCreate], plan: RecordsValidationPlan, record: Record
+    ) -> None:
         if not suggestions:
             return
 
@@ -200,12 +269,12 @@ class RecordValidatorBase(ABC):
             cls._validate_duplicated_suggestions(suggestions)
 
             for suggestion in suggestions:
-                question = dataset.question_by_id(suggestion.question_id)
+                question_settings = plan.questions_settings.get(suggestion.question_id)
 
-                if question is None:
+                if question_settings is None:
                     raise UnprocessableEntityError(f"question id={suggestion.question_id} does not exists")
 
-                SuggestionCreateValidator.validate(suggestion, question.parsed_settings, record)
+                SuggestionCreateValidator.validate(suggestion, question_settings, record)
         except (UnprocessableEntityError, ValueError, ValidationError) as ex:
             raise UnprocessableEntityError(f"record does not have valid suggestions: {ex}") from ex
 
@@ -217,17 +286,17 @@ class RecordValidatorBase(ABC):
             raise UnprocessableEntityError("found duplicate suggestions question IDs")
 
     @classmethod
-    def _validate_vectors(cls, vectors: Optional[dict], dataset: Dataset):
+    def _validate_vectors(cls, vectors: Optional[dict], plan: RecordsValidationPlan):
         if not vectors:
             return
 
         try:
             for name, value in vectors.items():
-                settings = dataset.vector_settings_by_name(name)
+                settings = plan.vectors_settings.get(name)
 
                 if not settings:
                     raise UnprocessableEntityError(
-                        f"vector with name={name} does not exist for dataset_id={dataset.id}"
+                        f"vector with name={name} does not exist for dataset_id={plan.dataset.id}"
                     )
 
                 VectorValidator.validate(value, settings)
@@ -235,18 +304,22 @@ class RecordValidatorBase(ABC):
             raise UnprocessableEntityError(f"record does not have valid vectors: {ex}") from ex
 
     @classmethod
-    async def _validate_responses(cls, responses: List[UserResponseCreate], dataset: Dataset, record: Record):
+    async def _validate_responses(
+        cls, responses: List[UserResponseCreate], plan: RecordsValidationPlan, record: Record
+    ) -> None:
         from argilla_server.contexts.accounts import list_users_by_ids
 
         if not responses:
             return
         try:
-            user_ids = [response_create.user_id for response_create in responses]
-            users = await list_users_by_ids(dataset.current_async_session, set(user_ids))
-            users_by_id = {user.id: user for user in users}
+            users_ids = plan.users_ids
+            if users_ids is None:
+                user_ids = [response_create.user_id for response_create in responses]
+                users = await list_users_by_ids(plan.dataset.current_async_session, set(user_ids))
+                users_ids = {user.id for user in users}
 
             for response_create in responses:
-                if response_create.user_id not in users_by_id:
+                if response_create.user_id not in users_ids:
                     raise ValueError(f"user with id {response_create.user_id} not found")
 
                 ResponseCreateValidator.validate(response_create, record)
@@ -256,42 +329,55 @@ class RecordValidatorBase(ABC):
 
 class RecordCreateValidator(RecordValidatorBase):
     @classmethod
-    async def validate(cls, record_create: RecordCreate, dataset: Dataset) -> None:
+    async def validate(
+        cls, record_create: RecordCreate, dataset: Dataset, plan: Optional[RecordsValidationPlan] = None
+    ) -> None:
+        plan = plan or RecordsValidationPlan(dataset)
         record = Record(fields=record_create.fields, dataset=dataset)
 
-        cls._validate_fields(record_create.fields, dataset)
-        cls._validate_metadata(record_create.metadata, dataset)
-        cls._validate_suggestions(record_create.suggestions, dataset, record=record)
-        cls._validate_vectors(record_create.vectors, dataset)
-        await cls._validate_responses(record_create.responses, dataset, record=record)
+        cls._validate_fields(record_create.fields, plan)
+        cls._validate_metadata(record_create.metadata, plan)
+        cls._validate_suggestions(record_create.suggestions, plan, record=record)
+        cls._validate_vectors(record_create.vectors, plan)
+        await cls._validate_responses(record_create.responses, plan, record=record)
 
 
 class RecordUpdateValidator(RecordValidatorBase):
     @classmethod
     async def validate(cls, record_update: RecordUpdate, dataset: Dataset, record: Record) -> None:
+        plan = RecordsValidationPlan(dataset)
+
         if record_update.is_set("fields"):
-            cls._validate_fields(record_update.fields, dataset)
+            cls._validate_fields(record_update.fields, plan)
 
-        cls._validate_metadata(record_update.metadata, dataset)
-        cls._validate_vectors(record_update.vectors, dataset)
-        cls._validate_suggestions(record_update.suggestions, dataset, record=record)
+        cls._validate_metadata(record_update.metadata, plan)
+        cls._validate_vectors(record_update.vectors, plan)
+        cls._validate_suggestions(record_update.suggestions, plan, record=record)
 
 
 class RecordUpsertValidator(RecordValidatorBase):
     @classmethod
-    async def validate(cls, record_upsert: RecordUpsert, dataset: Dataset, record: Optional[Record]) -> None:
+    async def validate(
+        cls,
+        record_upsert: RecordUpsert,
+        dataset: Dataset,
+        record: Optional[Record],
+        plan: Optional[RecordsValidationPlan] = None,
+    ) -> None:
+        plan = plan or RecordsValidationPlan(dataset)
+
         if record is None:
-            return await RecordCreateValidator.validate(record_upsert, dataset)
+            return await RecordCreateValidator.validate(record_upsert, dataset, plan)
 
         else:
             if record_upsert.is_set("fields"):
-                cls._validate_fields(record_upsert.fields, dataset)
+                cls._validate_fields(record_upsert.fields, plan)
 
-            cls._validate_metadata(record_upsert.metadata, dataset)
-            cls._validate_vectors(record_upsert.vectors, dataset)
-            cls._validate_suggestions(record_upsert.suggestions, dataset, record=record)
+            cls._validate_metadata(record_upsert.metadata, plan)
+            cls._validate_vectors(record_upsert.vectors, plan)
+            cls._validate_suggestions(record_upsert.suggestions, plan, record=record)
 
-            await cls._validate_responses(record_upsert.responses, dataset, record=record)
+            await cls._validate_responses(record_upsert.responses, plan, record=record)
 
 
 class RecordsBulkCreateValidator:
@@ -299,7 +385,7 @@ class RecordsBulkCreateValidator:
     async def validate(cls, db: AsyncSession, records_create: RecordsBulkCreate, dataset: Dataset) -> None:
         cls._validate_dataset_is_ready(dataset)
         await cls._validate_external_ids_are_not_present_in_db(db, records_create, dataset)
-        await cls._validate_all_bulk_records(dataset, records_create.items)
+        await cls._validate_all_bulk_records(db, dataset, records_create.items)
 
     @staticmethod
     def _validate_dataset_is_ready(dataset: Dataset) -> None:
@@ -318,9 +404,11 @@ class RecordsBulkCreateValidator:
             raise UnprocessableEntityError(f"found records with same external ids: {', '.join(found_records)}")
 
     @staticmethod
-    async def _validate_all_bulk_records(dataset: Dataset, records_create: List[RecordCreate]):
+    async def _validate_all_bulk_records(db: AsyncSession, dataset: Dataset, records_create: List[RecordCreate]):
+        plan = await RecordsValidationPlan.compile_for_bulk(db, dataset, records_create)
+
         for idx, record_create in enumerate(records_create):
             try:
-                await RecordCreateValidator.validate(record_create, dataset)
+                await RecordCreateValidator.validate(record_create, dataset, plan)
             except (UnprocessableEntityError, ValueError) as ex:
                 raise UnprocessableEntityError(f"Record at position {idx} is not valid because {ex}") from ex
@@ -14,30 +14,40 @@
 
 import json
 import secrets
+import importlib.util
 import httpx
 
 from math import floor
+from typing import Optional
 from typing_extensions import Dict
 from datetime import datetime, timezone
 from standardwebhooks.webhooks import Webhook
 
 from argilla_server.models import Webhook as WebhookModel
+from argilla_server.settings import settings
 
 MSG_ID_BYTES_LENGTH = 16
 
 NOTIFY_EVENT_DEFAULT_TIMEOUT = httpx.Timeout(timeout=20.0)
 
+# NOTE: HTTP/2 support requires the optional `h2` package (`pip install httpx[http2]`)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_http_clients: Dict[str, httpx.Client] = {}
+
 
 # NOTE: We are using standard webhooks implementation.
 # For more information take a look to https://www.standardwebhooks.com
-def notify_event(webhook: WebhookModel, event: str, timestamp: datetime, data: Dict) -> httpx.Response:
+def notify_event(
+    webhook: WebhookModel, event: str, timestamp: datetime, data: Dict, client: Optional[httpx.Client] = None
+) -> httpx.Response:
     timestamp_attempt = datetime.utcnow()
 
     msg_id = _generate_msg_id()
     payload = json.dumps(_build_payload(event, timestamp, data))
     signature = Webhook(webhook.secret).sign(msg_id, timestamp_attempt, payload)
 
-    return httpx.post(
+    return (client or httpx).post(
         webhook.url,
         headers=_build_headers(msg_id, timestamp_attempt, signature),
         content=payload,
@@ -45,6 +55,36 @@ def notify_event(webhook: WebhookModel, event: str, timestamp: datetime, data: D
     )
 
 
+def get_http_client(url: str) -> httpx.Client:
+    """Returns the process-wide HTTP client used to deliver events to the host of the given url.
+
+    Connections are kept alive between deliveries so they only pay the connection setup once per host.
+    """
+    parsed_url = httpx.URL(url)
+    host_key = f"{parsed_url.scheme}://{parsed_url.netloc.decode()}"
+
+    client = _http_clients.get(host_key)
+    if client is None or client.is_closed:
+        client = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=settings.webhooks_max_connections_per_host,
+                max_keepalive_connections=settings.webhooks_max_connections_per_host,
+            ),
+            timeout=NOTIFY_EVENT_DEFAULT_TIMEOUT,
+        )
+        _http_clients[host_key] = client
+
+    return client
+
+
+def close_http_clients() -> None:
+    for client in _http_clients.values():
+        client.close()
+
+    _http_clients.clear()
+
+
 def _generate_msg_id() -> str:
     return f"msg_{secrets.token_urlsafe(MSG_ID_BYTES_LENGTH)}"
 
@@ -28,6 +28,9 @@ class WebhookEvent(StrEnum):
     record_updated = "record.updated"
     record_deleted = "record.deleted"
     record_completed = "record.completed"
+    record_bulk_created = "record.bulk_created"
+    record_bulk_updated = "record.bulk_updated"
+    record_bulk_deleted = "record.bulk_deleted"
 
     response_created = "response.created"
     response_updated = "response.updated"
@@ -48,6 +51,12 @@ class RecordEvent(StrEnum):
     completed = WebhookEvent.record_completed.value
 
 
+class RecordBulkEvent(StrEnum):
+    created = WebhookEvent.record_bulk_created.value
+    updated = WebhookEvent.record_bulk_updated.value
+    deleted = WebhookEvent.record_bulk_deleted.value
+
+
 class ResponseEvent(StrEnum):
     created = WebhookEvent.response_created.value
     updated = WebhookEvent.response_updated.value
@@ -18,7 +18,7 @@ from datetime import datetime
 from rq.job import Job
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from argilla_server.jobs.webhook_jobs import enqueue_notify_events
+from argilla_server.jobs.webhook_jobs import enqueue_notify_events, enqueue_notify_events_many
 
 
 class Event:
@@ -34,3 +34,21 @@ class Event:
             timestamp=self.timestamp,
             data=self.data,
         )
+
+
+class Events:
+    def __init__(self, event: str, timestamp: datetime, data_items: List[dict]):
+        self.event = event
+        self.timestamp = timestamp
+        self.data_items = data_items
+
+    async def notify(self, db: AsyncSession) -> List[Job]:
+        if len(self.data_items) == 0:
+            return []
+
+        return await enqueue_notify_events_many(
+            db,
+            event=self.event,
+            timestamp=self.timestamp,
+            data_items=self.data_items,
+        )
@@ -13,7 +13,8 @@
 #  limitations under the License.
 
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Set
+from uuid import UUID
 
 from rq.job import Job
 from sqlalchemy import select
@@ -21,9 +22,15 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server.models import Record, Dataset
-from argilla_server.webhooks.v1.event import Event
-from argilla_server.webhooks.v1.enums import RecordEvent
-from argilla_server.webhooks.v1.schemas import RecordEventSchema
+from argilla_server.contexts import webhooks
+from argilla_server.webhooks.v1.event import Event, Events
+from argilla_server.webhooks.v1.enums import RecordEvent, RecordBulkEvent
+from argilla_server.webhooks.v1.schemas import (
+    DatasetEventSchema,
+    RecordBulkEventSchema,
+    RecordBulkItemEventSchema,
+    RecordEventSchema,
+)
 
 
 async def notify_record_event(db: AsyncSession, record_event: RecordEvent, record: Record) -> List[Job]:
@@ -32,12 +39,76 @@ async def notify_record_event(db: AsyncSession, record_event: RecordEvent, recor
     return await event.notify(db)
 
 
+async def notify_record_events(db: AsyncSession, record_event: RecordEvent, records: List[Record]) -> List[Job]:
+    events = await build_record_events(db, record_event, records)
+
+    return await events.notify(db)
+
+
+async def notify_record_bulk_event(
+    db: AsyncSession, record_bulk_event: RecordBulkEvent, dataset: Dataset, records: List[Record]
+) -> List[Job]:
+    event = await build_record_bulk_event(db, record_bulk_event, dataset, records)
+    if event is None:
+        return []
+
+    return await event.notify(db)
+
+
 async def build_record_event(db: AsyncSession, record_event: RecordEvent, record: Record) -> Event:
+    await _load_record_event_associations(db, {record.dataset_id})
+
+    return Event(
+        event=record_event,
+        timestamp=datetime.utcnow(),
+        data=RecordEventSchema.model_validate(record).model_dump(),
+    )
+
+
+async def build_record_events(db: AsyncSession, record_event: RecordEvent, records: List[Record]) -> Events:
+    timestamp = datetime.utcnow()
+
+    # NOTE: Skip building events payloads when no enabled webhook is listening to the event
+    if len(records) == 0 or not await _any_enabled_webhook_listening(db, record_event):
+        return Events(event=record_event, timestamp=timestamp, data_items=[])
+
+    await _load_record_event_associations(db, {record.dataset_id for record in records})
+
+    return Events(
+        event=record_event,
+        timestamp=timestamp,
+        data_items=[RecordEventSchema.model_validate(record).model_dump() for record in records],
+    )
+
+
+async def build_record_bulk_event(
+    db: AsyncSession, record_bulk_event: RecordBulkEvent, dataset: Dataset, records: List[Record]
+) -> Optional[Event]:
+    if len(records) == 0 or not await _any_enabled_webhook_listening(db, record_bulk_event):
+        return None
+
+    await _load_record_event_associations(db, {dataset.id})
+
+    return Event(
+        event=record_bulk_event,
+        timestamp=datetime.utcnow(),
+        data=RecordBulkEventSchema(
+            dataset=DatasetEventSchema.model_validate(dataset),
+            records=[RecordBulkItemEventSchema.model_validate(record) for record in records],
+        ).model_dump(),
+    )
+
+
+async def _any_enabled_webhook_listening(db: AsyncSession, event: str) -> bool:
+    return any(event in webhook.events for webhook in await webhooks.list_enabled_webhooks_cached(db))
+
+
+async def _load_record_event_associations(db: AsyncSession, dataset_ids: Set[UUID]) -> None:
     # NOTE: Force loading required association resources required by the event schema
     (
         await db.execute(
             select(Dataset)
-            .where(Dataset.id == record.dataset_id)
+            .where(Dataset.id.in_(dataset_ids))
             .options(
                 selectinload(Dataset.workspace),
                 selectinload(Dataset.fields),
@@ -46,10 +117,4 @@ async def build_record_event(db: AsyncSession, record_event: RecordEvent, record
                 selectinload(Dataset.vectors_settings),
             )
         )
-    ).scalar_one()
-
-    return Event(
-        event=record_event,
-        timestamp=datetime.utcnow(),
-        data=RecordEventSchema.model_validate(record).model_dump(),
-    )
+    ).scalars().all()
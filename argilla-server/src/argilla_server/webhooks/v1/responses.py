@@ -14,6 +14,7 @@
 
 from typing import List
 from datetime import datetime
+from uuid import UUID
 
 from rq.job import Job
 from sqlalchemy import select
@@ -21,7 +22,8 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server.models import Response, Record, Dataset
-from argilla_server.webhooks.v1.event import Event
+from argilla_server.contexts import webhooks
+from argilla_server.webhooks.v1.event import Event, Events
 from argilla_server.webhooks.v1.enums import ResponseEvent
 from argilla_server.webhooks.v1.schemas import ResponseEventSchema
 
@@ -32,12 +34,48 @@ async def notify_response_event(db: AsyncSession, response_event: ResponseEvent,
     return await event.notify(db)
 
 
+async def notify_response_events(
+    db: AsyncSession, response_event: ResponseEvent, responses: List[Response]
+) -> List[Job]:
+    events = await build_response_events(db, response_event, responses)
+
+    return await events.notify(db)
+
+
 async def build_response_event(db: AsyncSession, response_event: ResponseEvent, response: Response) -> Event:
+    await _load_response_event_associations(db, [response.id])
+
+    return Event(
+        event=response_event,
+        timestamp=datetime.utcnow(),
+        data=ResponseEventSchema.model_validate(response).model_dump(),
+    )
+
+
+async def build_response_events(db: AsyncSession, response_event: ResponseEvent, responses: List[Response]) -> Events:
+    timestamp = datetime.utcnow()
+
+    # NOTE: Skip building events payloads when no enabled webhook is listening to the event
+    if len(responses) == 0 or not any(
+        response_event in webhook.events for webhook in await webhooks.list_enabled_webhooks_cached(db)
+    ):
+        return Events(event=response_event, timestamp=timestamp, data_items=[])
+
+    await _load_response_event_associations(db, [response.id for response in responses])
+
+    return Events(
+        event=response_event,
+        timestamp=timestamp,
+        data_items=[ResponseEventSchema.model_validate(response).model_dump() for response in responses],
+    )
+
+
+async def _load_response_event_associations(db: AsyncSession, response_ids: List[UUID]) -> None:
     # NOTE: Force loading required association resources required by the event schema
     (
         await db.execute(
             select(Response)
-            .where(Response.id == response.id)
+            .where(Response.id.in_(response_ids))
             .options(
                 selectinload(Response.user),
                 selectinload(Response.record).options(
@@ -51,10 +89,4 @@ async def build_response_event(db: AsyncSession, response_event: ResponseEvent,
                 ),
             ),
         )
-    ).scalar_one()
-
-    return Event(
-        event=response_event,
-        timestamp=datetime.utcnow(),
-        data=ResponseEventSchema.model_validate(response).model_dump(),
-    )
+    ).scalars().all()
@@ -138,6 +138,24 @@ class RecordEventSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class RecordBulkItemEventSchema(BaseModel):
+    id: UUID
+    status: str
+    fields: dict
+    metadata: Optional[dict] = Field(None, alias="metadata_")
+    external_id: Optional[str] = None
+    inserted_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RecordBulkEventSchema(BaseModel):
+    dataset: DatasetEventSchema
+    # NOTE: Records don't include the dataset so it's only serialized once for the whole bulk.
+    records: List[RecordBulkItemEventSchema]
+
+
 class ResponseEventSchema(BaseModel):
     id: UUID
     values: Optional[dict] = None
@@ -30,8 +30,8 @@ from argilla_server.enums import (
 )
 from argilla_server.jobs.queues import HIGH_QUEUE
 from argilla_server.models.database import Record, Response, Suggestion, User
-from argilla_server.webhooks.v1.enums import RecordEvent
-from argilla_server.webhooks.v1.records import build_record_event
+from argilla_server.webhooks.v1.enums import RecordBulkEvent, RecordEvent
+from argilla_server.webhooks.v1.records import build_record_bulk_event, build_record_event
 from argilla_server.models.database import Record, Response, Suggestion, User
 
 from tests.factories import (
@@ -1040,3 +1040,39 @@ class TestCreateDatasetRecordsBulk:
         assert HIGH_QUEUE.jobs[1].args[0] == webhook.id
         assert HIGH_QUEUE.jobs[1].args[1] == RecordEvent.created
         assert HIGH_QUEUE.jobs[1].args[3] == jsonable_encoder(event_b.data)
+
+    async def test_create_dataset_records_bulk_enqueue_webhook_record_bulk_created_event(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="prompt", dataset=dataset)
+        await TextQuestionFactory.create(name="text-question", dataset=dataset)
+
+        webhook = await WebhookFactory.create(events=[RecordBulkEvent.created])
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={
+                "items": [
+                    {"fields": {"prompt": "You should exercise more."}},
+                    {"fields": {"prompt": "Do you like to exercise?"}},
+                    {"fields": {"prompt": "Do you like to run?"}},
+                ],
+            },
+        )
+
+        assert response.status_code == 201, response.json()
+
+        records = (await db.execute(select(Record).order_by(Record.inserted_at.asc()))).scalars().all()
+
+        event = await build_record_bulk_event(db, RecordBulkEvent.created, dataset, records)
+
+        assert HIGH_QUEUE.count == 1
+
+        assert HIGH_QUEUE.jobs[0].args[0] == webhook.id
+        assert HIGH_QUEUE.jobs[0].args[1] == RecordBulkEvent.created
+        assert HIGH_QUEUE.jobs[0].args[3] == jsonable_encoder(event.data)
+        assert [record["id"] for record in HIGH_QUEUE.jobs[0].args[3]["records"]] == [
+            str(record.id) for record in records
+        ]
@@ -14,10 +14,14 @@
 from uuid import UUID
 
 import pytest
+from argilla_server.bulk import records_bulk
 from argilla_server.enums import DatasetStatus
 from argilla_server.models import Dataset, Vector
+from argilla_server.search_engine import VectorsMatrixStore
 from httpx import AsyncClient
+from pytest_mock import MockerFixture
 from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.factories import (
@@ -171,6 +175,55 @@ class TestDatasetRecordsBulkWithVectors:
             assert vector.vector_settings_id == vector_settings.id
             assert record["vectors"] == {vector_settings.name: vector.value}
 
+    async def test_update_record_vectors_in_bulk_with_exact_similarity_search(
+        self,
+        async_client: AsyncClient,
+        vectors_matrix_store: VectorsMatrixStore,
+        owner_auth_header: dict,
+    ):
+        dataset = await self.test_dataset(exact_similarity_search=True)
+        vector_settings = dataset.vector_settings_by_name("prompt_embeddings")
+        record = await RecordFactory.create(dataset=dataset, fields={"prompt": "Does exercise help reduce stress?"})
+        await vectors_matrix_store.rebuild(vector_settings, [(record.id, [1.0] + [0.0] * 9)])
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={"items": [{"id": str(record.id), "vectors": {vector_settings.name: [0.0] * 9 + [1.0]}}]},
+        )
+
+        assert response.status_code == 200, response.json()
+        assert await vectors_matrix_store.top_k(vector_settings, [0.0] * 9 + [1.0], 1) == [
+            (record.id, pytest.approx(1.0))
+        ]
+
+    async def test_update_record_vectors_in_bulk_with_exact_similarity_search_and_failed_commit(
+        self,
+        mocker: MockerFixture,
+        async_client: AsyncClient,
+        vectors_matrix_store: VectorsMatrixStore,
+        owner_auth_header: dict,
+    ):
+        dataset = await self.test_dataset(exact_similarity_search=True)
+        vector_settings = dataset.vector_settings_by_name("prompt_embeddings")
+        record = await RecordFactory.create(dataset=dataset, fields={"prompt": "Does exercise help reduce stress?"})
+        await vectors_matrix_store.rebuild(vector_settings, [(record.id, [1.0] + [0.0] * 9)])
+
+        mocker.patch.object(
+            records_bulk.distribution, "unsafe_update_records_status", side_effect=SQLAlchemyError("write failed")
+        )
+
+        with pytest.raises(SQLAlchemyError):
+            await async_client.put(
+                self.url(dataset.id),
+                headers=owner_auth_header,
+                json={"items": [{"id": str(record.id), "vectors": {vector_settings.name: [0.0] * 9 + [1.0]}}]},
+            )
+
+        assert await vectors_matrix_store.top_k(vector_settings, [1.0] + [0.0] * 9, 1) == [
+            (record.id, pytest.approx(1.0))
+        ]
+
     async def test_update_record_with_vectors_with_new_vectors_in_bulk(
         self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
     ):
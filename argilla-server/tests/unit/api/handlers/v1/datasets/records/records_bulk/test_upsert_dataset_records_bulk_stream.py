@@ -0,0 +1,451 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+from typing import AsyncIterator, List
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.api.routes import api_v1
+from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.enums import DatasetStatus, RecordStatus, ResponseStatus
+from argilla_server.jobs.queues import HIGH_QUEUE
+from argilla_server.models import Record, Response, Suggestion, User
+from argilla_server.search_engine import EmbeddedSearchEngine, SearchEngine, get_search_engine
+from argilla_server.settings import settings
+from argilla_server.webhooks.v1.enums import RecordEvent
+from argilla_server.webhooks.v1.records import build_record_event
+
+from tests.factories import (
+    AnnotatorFactory,
+    DatasetFactory,
+    RecordFactory,
+    TextFieldFactory,
+    TextQuestionFactory,
+    WebhookFactory,
+)
+
+
+def _ndjson(items: List[dict]) -> bytes:
+    return "\n".join(json.dumps(item) for item in items).encode()
+
+
+async def _in_parts(content: bytes, part_size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(content), part_size):
+        yield content[start : start + part_size]
+
+
+@pytest.mark.asyncio
+class TestUpsertDatasetRecordsBulkStream:
+    def url(self, dataset_id: UUID) -> str:
+        return f"/api/v1/datasets/{dataset_id}/records/bulk/stream"
+
+    @pytest.fixture(autouse=True)
+    def chunk_size(self, mocker: MockerFixture) -> int:
+        mocker.patch.object(settings, "records_bulk_stream_chunk_size", 2)
+
+        return 2
+
+    async def test_upsert_dataset_records_bulk_stream(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        mock_search_engine: SearchEngine,
+        owner: User,
+        owner_auth_header: dict,
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+        question = await TextQuestionFactory.create(name="question", dataset=dataset)
+
+        record = await RecordFactory.create(fields={"text": "old value"}, external_id="1", dataset=dataset)
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers={**owner_auth_header, "Content-Type": "application/x-ndjson"},
+            content=_ndjson(
+                [
+                    {"external_id": "1", "fields": {"text": "new value"}},
+                    {
+                        "external_id": "2",
+                        "fields": {"text": "value"},
+                        "responses": [
+                            {
+                                "values": {"question": {"value": "answer"}},
+                                "status": ResponseStatus.submitted,
+                                "user_id": str(owner.id),
+                            }
+                        ],
+                    },
+                    {
+                        "external_id": "3",
+                        "fields": {"text": "value"},
+                        "suggestions": [{"question_id": str(question.id), "value": "suggestion"}],
+                    },
+                    {"external_id": "4", "fields": {"text": "value"}},
+                    {"external_id": "5", "fields": {"text": "value"}},
+                ]
+            ),
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"created_items": 4, "updated_items": 1}
+
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 5
+        assert (await db.execute(select(func.count(Response.id)))).scalar_one() == 1
+        assert (await db.execute(select(func.count(Suggestion.id)))).scalar_one() == 1
+
+        updated_record = (await db.execute(select(Record).filter_by(id=record.id))).scalar_one()
+        assert updated_record.fields == {"text": "new value"}
+
+        indexed_records = [call.args[1] for call in mock_search_engine.index_records.call_args_list]
+        assert [[record.external_id for record in records] for records in indexed_records] == [
+            ["1", "2"],
+            ["3", "4"],
+            ["5"],
+        ]
+
+        record_with_response, record_with_suggestion = indexed_records[0][1], indexed_records[1][0]
+        assert [response.user_id for response in record_with_response.responses] == [owner.id]
+        assert [response.user_id for response in record_with_response.responses_submitted] == [owner.id]
+        assert record_with_response.status == RecordStatus.completed
+        assert [suggestion.question.name for suggestion in record_with_suggestion.suggestions] == ["question"]
+
+    async def test_upsert_dataset_records_bulk_stream_indexes_chunks_one_at_a_time(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+
+        running_indexings, max_running_indexings, indexed_values = 0, 0, []
+
+        async def index_records(dataset, records):
+            nonlocal running_indexings, max_running_indexings
+            running_indexings += 1
+            max_running_indexings = max(max_running_indexings, running_indexings)
+
+            # NOTE: Slow indexing requests so the next chunks are written while they are running
+            await asyncio.sleep(0.05)
+            indexed_values.append([record.fields["text"] for record in records])
+
+            running_indexings -= 1
+
+        mock_search_engine.index_records.side_effect = index_records
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            content=_ndjson(
+                [
+                    {"external_id": "1", "fields": {"text": "first"}},
+                    {"external_id": "2", "fields": {"text": "value"}},
+                    {"external_id": "1", "fields": {"text": "second"}},
+                    {"external_id": "3", "fields": {"text": "value"}},
+                    {"external_id": "1", "fields": {"text": "third"}},
+                ]
+            ),
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"created_items": 3, "updated_items": 2}
+        assert indexed_values == [["first", "value"], ["second", "value"], ["third"]]
+        assert max_running_indexings == 1
+
+    async def test_upsert_dataset_records_bulk_stream_with_embedded_search_engine(
+        self, tmp_path, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+        await dataset.awaitable_attrs.fields
+        await dataset.awaitable_attrs.metadata_properties
+
+        search_engine = EmbeddedSearchEngine(path=str(tmp_path / "search.db"))
+        await search_engine.create_index(dataset)
+
+        async def override_get_search_engine():
+            yield search_engine
+
+        api_v1.dependency_overrides[get_search_engine] = override_get_search_engine
+
+        try:
+            response = await async_client.put(
+                self.url(dataset.id),
+                headers=owner_auth_header,
+                content=_ndjson(
+                    [
+                        {"external_id": "1", "fields": {"text": "first"}},
+                        {"external_id": "2", "fields": {"text": "value"}},
+                        {"external_id": "1", "fields": {"text": "second"}},
+                        {"external_id": "3", "fields": {"text": "value"}},
+                        {"external_id": "1", "fields": {"text": "third"}},
+                    ]
+                ),
+            )
+
+            assert response.status_code == 200
+            assert response.json() == {"created_items": 3, "updated_items": 2}
+
+            assert (await search_engine.search(dataset, query="third")).total == 1
+            assert (await search_engine.search(dataset, query="first")).total == 0
+            assert (await search_engine.search(dataset, query="second")).total == 0
+            assert (await search_engine.search(dataset, query="value")).total == 2
+        finally:
+            await search_engine.close()
+
+    async def test_upsert_dataset_records_bulk_stream_enqueue_webhook_record_events(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+        record = await RecordFactory.create(fields={"text": "old value"}, external_id="1", dataset=dataset)
+        webhook = await WebhookFactory.create(events=[RecordEvent.created, RecordEvent.updated])
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            content=_ndjson(
+                [
+                    {"external_id": "1", "fields": {"text": "new value"}},
+                    {"external_id": "2", "fields": {"text": "value"}},
+                    {"external_id": "3", "fields": {"text": "value"}},
+                ]
+            ),
+        )
+
+        assert response.status_code == 200
+
+        records = {
+            record.external_id: record
+            for record in (await db.execute(select(Record).filter_by(dataset_id=dataset.id))).scalars()
+        }
+        created_event_2 = await build_record_event(db, RecordEvent.created, records["2"])
+        updated_event_1 = await build_record_event(db, RecordEvent.updated, records["1"])
+        created_event_3 = await build_record_event(db, RecordEvent.created, records["3"])
+
+        # NOTE: Events of every chunk are enqueued once the chunk is indexed
+        assert HIGH_QUEUE.count == 3
+        assert [(job.args[0], job.args[1], job.args[3]) for job in HIGH_QUEUE.jobs] == [
+            (webhook.id, RecordEvent.created, jsonable_encoder(created_event_2.data)),
+            (webhook.id, RecordEvent.updated, jsonable_encoder(updated_event_1.data)),
+            (webhook.id, RecordEvent.created, jsonable_encoder(created_event_3.data)),
+        ]
+
+    async def test_upsert_dataset_records_bulk_stream_with_lines_split_between_parts(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            content=_in_parts(
+                _ndjson([{"external_id": str(idx), "fields": {"text": f"value {idx}"}} for idx in range(5)]),
+                part_size=7,
+            ),
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"created_items": 5, "updated_items": 0}
+
+        records = (await db.execute(select(Record).order_by(Record.external_id))).scalars().all()
+        assert [record.fields for record in records] == [{"text": f"value {idx}"} for idx in range(5)]
+
+    async def test_upsert_dataset_records_bulk_stream_with_too_large_line(
+        self,
+        mocker: MockerFixture,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        mock_search_engine: SearchEngine,
+        owner_auth_header: dict,
+    ):
+        mocker.patch.object(settings, "records_bulk_stream_max_line_size", 64)
+
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            content=_ndjson(
+                [
+                    {"fields": {"text": "value"}},
+                    {"fields": {"text": "value"}},
+                    {"fields": {"text": "value" * 20}},
+                    {"fields": {"text": "value"}},
+                ]
+            ),
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "Record at position 2 is not valid because it is larger than 64 bytes"}
+
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 2
+        mock_search_engine.index_records.assert_called_once()
+
+    async def test_upsert_dataset_records_bulk_stream_with_too_large_line_without_new_line(
+        self, mocker: MockerFixture, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        mocker.patch.object(settings, "records_bulk_stream_max_line_size", 64)
+
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            content=_in_parts(b'{"fields": {"text": "' + b"value" * 1000, part_size=16),
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "Record at position 0 is not valid because it is larger than 64 bytes"}
+
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 0
+
+    async def test_upsert_dataset_records_bulk_stream_with_blank_lines(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            content=b'\n{"fields": {"text": "value"}}\n\n{"fields": {"text": "value"}}\n',
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"created_items": 2, "updated_items": 0}
+
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 2
+
+    async def test_upsert_dataset_records_bulk_stream_with_invalid_line(
+        self, db: AsyncSession, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            content=_ndjson(
+                [
+                    {"fields": {"text": "value"}},
+                    {"fields": {"text": "value"}},
+                    {"fields": {"text": "value"}, "external_id": ["invalid"]},
+                ]
+            ),
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {
+            "detail": {
+                "code": "argilla.api.errors::ValidationError",
+                "params": {
+                    "errors": [
+                        {
+                            "type": "string_type",
+                            "loc": ["body", 2, "external_id"],
+                            "msg": "Input should be a valid string",
+                        }
+                    ]
+                },
+            }
+        }
+
+        # NOTE: Chunks before the invalid record are kept
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 2
+        mock_search_engine.index_records.assert_called_once()
+
+    async def test_upsert_dataset_records_bulk_stream_with_invalid_record(
+        self, db: AsyncSession, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            content=_ndjson(
+                [
+                    {"fields": {"text": "value"}},
+                    {"fields": {"text": "value"}},
+                    {"fields": {"text": "value"}},
+                    {"fields": {"unknown": "value"}},
+                ]
+            ),
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {
+            "detail": "Record at position 3 is not valid because found fields values for non configured fields: "
+            "['unknown']"
+        }
+
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 2
+        mock_search_engine.index_records.assert_called_once()
+
+    async def test_upsert_dataset_records_bulk_stream_with_duplicated_external_ids_in_chunk(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="text", dataset=dataset)
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            content=_ndjson(
+                [
+                    {"external_id": "1", "fields": {"text": "value"}},
+                    {"external_id": "1", "fields": {"text": "value"}},
+                ]
+            ),
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {
+            "detail": "Records from position 0 to 1 are not valid because Value error, External IDs must be unique"
+        }
+
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 0
+
+    async def test_upsert_dataset_records_bulk_stream_as_annotator(self, async_client: AsyncClient):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        annotator = await AnnotatorFactory.create(workspaces=[dataset.workspace])
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers={API_KEY_HEADER_NAME: annotator.api_key},
+            content=_ndjson([{"fields": {"text": "value"}}]),
+        )
+
+        assert response.status_code == 403
+
+    async def test_upsert_dataset_records_bulk_stream_with_non_existent_dataset(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        response = await async_client.put(
+            self.url(uuid4()),
+            headers=owner_auth_header,
+            content=_ndjson([{"fields": {"text": "value"}}]),
+        )
+
+        assert response.status_code == 404
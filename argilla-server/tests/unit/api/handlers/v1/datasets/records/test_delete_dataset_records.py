@@ -20,8 +20,8 @@ from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server.jobs.queues import HIGH_QUEUE
-from argilla_server.webhooks.v1.enums import RecordEvent
-from argilla_server.webhooks.v1.records import build_record_event
+from argilla_server.webhooks.v1.enums import RecordBulkEvent, RecordEvent
+from argilla_server.webhooks.v1.records import build_record_bulk_event, build_record_event
 
 from tests.factories import DatasetFactory, RecordFactory, WebhookFactory
 
@@ -58,3 +58,26 @@ class TestDeleteDatasetRecords:
         assert HIGH_QUEUE.jobs[1].args[0] == webhook.id
         assert HIGH_QUEUE.jobs[1].args[1] == RecordEvent.deleted
         assert HIGH_QUEUE.jobs[1].args[3] == jsonable_encoder(event_b.data)
+
+    async def test_delete_dataset_records_enqueue_webhook_record_bulk_deleted_event(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(3, dataset=dataset)
+        webhook = await WebhookFactory.create(events=[RecordBulkEvent.deleted])
+
+        event = await build_record_bulk_event(db, RecordBulkEvent.deleted, dataset, records)
+
+        response = await async_client.delete(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"ids": ",".join(str(record.id) for record in records)},
+        )
+
+        assert response.status_code == 204
+
+        assert HIGH_QUEUE.count == 1
+
+        assert HIGH_QUEUE.jobs[0].args[0] == webhook.id
+        assert HIGH_QUEUE.jobs[0].args[1] == RecordBulkEvent.deleted
+        assert HIGH_QUEUE.jobs[0].args[3] == jsonable_encoder(event.data)
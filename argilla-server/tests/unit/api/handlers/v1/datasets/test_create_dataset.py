@@ -56,6 +56,7 @@ class TestCreateDataset:
             "name": "Dataset Name",
             "guidelines": None,
             "allow_extra_metadata": True,
+            "exact_similarity_search": False,
             "status": DatasetStatus.draft,
             "distribution": {
                 "strategy": DatasetDistributionStrategy.overlap,
@@ -94,6 +95,7 @@ class TestCreateDataset:
             "name": "Dataset Name",
             "guidelines": None,
             "allow_extra_metadata": True,
+            "exact_similarity_search": False,
             "status": DatasetStatus.draft,
             "distribution": {
                 "strategy": DatasetDistributionStrategy.overlap,
@@ -15,6 +15,7 @@
 from uuid import UUID
 
 import pytest
+from argilla_server.api.policies.v1 import RecordPolicy
 from argilla_server.constants import API_KEY_HEADER_NAME
 from argilla_server.enums import UserRole, RecordStatus
 from argilla_server.search_engine import SearchEngine, SearchResponseItem, SearchResponses
@@ -189,6 +190,45 @@ class TestSearchCurrentUserDatasetRecords:
             "total": 1,
         }
 
+    async def test_search_with_filtered_metadata_for_several_records_as_annotator(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, mocker
+    ):
+        user = await AnnotatorFactory.create()
+        dataset = await DatasetFactory.create()
+        await WorkspaceUserFactory.create(user_id=user.id, workspace_id=dataset.workspace_id)
+
+        await TextFieldFactory.create(name="input", dataset=dataset)
+        await TermsMetadataPropertyFactory.create(
+            name="annotator_meta", dataset=dataset, allowed_roles=[UserRole.admin, UserRole.annotator]
+        )
+        await TermsMetadataPropertyFactory.create(name="admin_meta", dataset=dataset, allowed_roles=[UserRole.admin])
+        records = await RecordFactory.create_batch(
+            3, metadata_={"admin_meta": "value", "annotator_meta": "value", "extra": "value"}, dataset=dataset
+        )
+        records.append(await RecordFactory.create(metadata_=None, dataset=dataset))
+
+        mock_search_engine.search.return_value = SearchResponses(
+            items=[SearchResponseItem(record_id=record.id, score=1.0) for record in records],
+            total=len(records),
+        )
+
+        get_metadata_spy = mocker.spy(RecordPolicy, "get_metadata")
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers={API_KEY_HEADER_NAME: user.api_key},
+            json={"query": {}},
+        )
+
+        assert response.status_code == 200
+        assert [item["record"]["metadata"] for item in response.json()["items"]] == [
+            {"annotator_meta": "value"},
+            {"annotator_meta": "value"},
+            {"annotator_meta": "value"},
+            None,
+        ]
+        assert get_metadata_spy.call_count == 3
+
     async def test_with_vector_query_using_record_without_vector(
         self, async_client: AsyncClient, owner_auth_header: dict
     ):
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import List, Optional
 from uuid import UUID, uuid4
 
 import pytest
@@ -29,6 +30,7 @@ from argilla_server.search_engine import (
     SuggestionFilterScope,
     TermsFilter,
 )
+from argilla_server.utils import encode_cursor
 from httpx import AsyncClient
 
 from tests.factories import (
@@ -369,6 +371,142 @@ class TestSearchDatasetRecords:
             query=None,
         )
 
+    async def test_with_cursor(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(4, dataset=dataset)
+
+        mock_search_engine.search.return_value = SearchResponses(
+            items=[
+                SearchResponseItem(record_id=records[0].id, score=1.0),
+                SearchResponseItem(record_id=records[1].id, score=0.5),
+            ],
+            total=4,
+            next_search_after=[0.5, str(records[1].id)],
+        )
+
+        response = await async_client.post(
+            self.url(dataset.id), headers=owner_auth_header, params={"limit": 2}, json={}
+        )
+
+        assert response.status_code == 200
+
+        next_cursor = response.json()["next_cursor"]
+
+        mock_search_engine.search.reset_mock()
+        mock_search_engine.search.return_value = SearchResponses(
+            items=[SearchResponseItem(record_id=records[2].id, score=0.2)],
+            total=4,
+            next_search_after=[0.2, str(records[2].id)],
+        )
+
+        response = await async_client.post(
+            self.url(dataset.id), headers=owner_auth_header, params={"limit": 2, "cursor": next_cursor}, json={}
+        )
+
+        assert response.status_code == 200
+        assert "next_cursor" not in response.json()
+
+        mock_search_engine.search.assert_called_once_with(
+            dataset=dataset,
+            offset=0,
+            limit=2,
+            query=None,
+            search_after=[0.5, str(records[1].id)],
+        )
+
+    async def test_with_records_from_search_engine_source(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict, mocker
+    ):
+        mocker.patch("argilla_server.api.handlers.v1.datasets.records.settings.search_engine_records_from_source", True)
+
+        dataset = await DatasetFactory.create()
+        record_a = await RecordFactory.create(dataset=dataset, fields={"text": "database"})
+        record_b = await RecordFactory.create(dataset=dataset, fields={"text": "database"})
+
+        mock_search_engine.search.return_value = SearchResponses(
+            items=[
+                SearchResponseItem(
+                    record_id=record.id,
+                    score=1.0,
+                    record={
+                        "external_id": record.external_id,
+                        "status": RecordStatus.pending,
+                        "fields": {"text": "search engine"},
+                        "inserted_at": record.inserted_at,
+                        "updated_at": record.updated_at,
+                    },
+                )
+                for record in [record_a, record_b]
+            ],
+            total=2,
+        )
+
+        response = await async_client.post(self.url(dataset.id), headers=owner_auth_header, json={})
+
+        assert response.status_code == 200
+        assert [item["record"]["id"] for item in response.json()["items"]] == [str(record_a.id), str(record_b.id)]
+        assert [item["record"]["fields"] for item in response.json()["items"]] == [{"text": "search engine"}] * 2
+        assert [item["record"]["metadata"] for item in response.json()["items"]] == [None, None]
+
+        mock_search_engine.search.assert_called_once_with(
+            dataset=dataset,
+            offset=0,
+            limit=50,
+            query=None,
+            with_source=True,
+            source_vectors_settings=[],
+        )
+
+    async def test_with_cursor_and_offset(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"offset": 1, "cursor": "WzAuNV0="},
+            json={},
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "`offset` cannot be used together with `cursor`."}
+
+    @pytest.mark.parametrize(
+        "sort, cursor_values",
+        [
+            (None, [0.5]),
+            (None, [0.5, str(uuid4()), 1]),
+            (None, ["0.5", str(uuid4())]),
+            (None, [0.5, "not-a-record-id"]),
+            (None, [0.5, None]),
+            ([{"scope": {"entity": "record", "property": "inserted_at"}, "order": "asc"}], [0.5]),
+            ([{"scope": {"entity": "record", "property": "inserted_at"}, "order": "asc"}], [[1], str(uuid4())]),
+            ([{"scope": {"entity": "record", "property": "inserted_at"}, "order": "asc"}], [{"a": 1}, str(uuid4())]),
+        ],
+    )
+    async def test_with_invalid_cursor(
+        self,
+        async_client: AsyncClient,
+        mock_search_engine: SearchEngine,
+        owner_auth_header: dict,
+        sort: Optional[List[dict]],
+        cursor_values: list,
+    ):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"cursor": encode_cursor(cursor_values)},
+            json={"sort": sort} if sort else {},
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "Invalid cursor"}
+
+        mock_search_engine.search.assert_not_called()
+
     async def test_with_invalid_filter(self, async_client: AsyncClient, owner_auth_header: dict):
         dataset = await DatasetFactory.create()
 
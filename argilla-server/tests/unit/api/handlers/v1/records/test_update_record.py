@@ -17,13 +17,17 @@ import pytest
 from uuid import UUID
 from httpx import AsyncClient
 from fastapi.encoders import jsonable_encoder
+from pytest_mock import MockerFixture
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server.jobs.queues import HIGH_QUEUE
+from argilla_server.models import Record
+from argilla_server.search_engine import VectorsMatrixStore
 from argilla_server.webhooks.v1.enums import RecordEvent
 from argilla_server.webhooks.v1.records import build_record_event
 
-from tests.factories import RecordFactory, WebhookFactory
+from tests.factories import DatasetFactory, RecordFactory, VectorFactory, VectorSettingsFactory, WebhookFactory
 
 
 @pytest.mark.asyncio
@@ -51,3 +55,54 @@ class TestUpdateRecord:
         assert HIGH_QUEUE.jobs[0].args[0] == webhook.id
         assert HIGH_QUEUE.jobs[0].args[1] == RecordEvent.updated
         assert HIGH_QUEUE.jobs[0].args[3] == jsonable_encoder(event.data)
+
+    async def test_update_record_vectors_with_exact_similarity_search(
+        self, async_client: AsyncClient, vectors_matrix_store: VectorsMatrixStore, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(exact_similarity_search=True)
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+        values = [[1.0, 0.0], [0.0, 1.0]]
+        for record, value in zip(records, values):
+            await VectorFactory.create(vector_settings=vector_settings, record=record, value=value)
+
+        await vectors_matrix_store.rebuild(
+            vector_settings, [(record.id, value) for record, value in zip(records, values)]
+        )
+
+        response = await async_client.patch(
+            self.url(records[1].id),
+            headers=owner_auth_header,
+            json={"vectors": {vector_settings.name: [1.0, 0.1]}},
+        )
+
+        assert response.status_code == 200
+
+        assert await vectors_matrix_store.top_k(vector_settings, [1.0, 0.1], 1) == [
+            (records[1].id, pytest.approx(1.0)),
+        ]
+
+    async def test_update_record_vectors_with_exact_similarity_search_and_failed_commit(
+        self,
+        mocker: MockerFixture,
+        async_client: AsyncClient,
+        vectors_matrix_store: VectorsMatrixStore,
+        owner_auth_header: dict,
+    ):
+        dataset = await DatasetFactory.create(exact_similarity_search=True)
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        record = await RecordFactory.create(dataset=dataset)
+        await VectorFactory.create(vector_settings=vector_settings, record=record, value=[1.0, 0.0])
+
+        await vectors_matrix_store.rebuild(vector_settings, [(record.id, [1.0, 0.0])])
+
+        mocker.patch.object(Record, "save", side_effect=SQLAlchemyError("commit failed"))
+
+        with pytest.raises(SQLAlchemyError):
+            await async_client.patch(
+                self.url(record.id),
+                headers=owner_auth_header,
+                json={"vectors": {vector_settings.name: [0.0, 1.0]}},
+            )
+
+        assert await vectors_matrix_store.top_k(vector_settings, [1.0, 0.0], 1) == [(record.id, pytest.approx(1.0))]
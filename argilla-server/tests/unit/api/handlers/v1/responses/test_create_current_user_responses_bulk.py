@@ -17,7 +17,6 @@ import pytest
 
 from uuid import UUID, uuid4
 from datetime import datetime
-from unittest.mock import call
 from httpx import AsyncClient
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,7 +26,7 @@ from argilla_server.constants import API_KEY_HEADER_NAME
 from argilla_server.enums import DatasetDistributionStrategy, ResponseStatus, RecordStatus
 from argilla_server.jobs.queues import HIGH_QUEUE
 from argilla_server.models import Response, User
-from argilla_server.search_engine import SearchEngine
+from argilla_server.search_engine import RecordDelta, SearchEngine
 from argilla_server.use_cases.responses.upsert_responses_in_bulk import UpsertResponsesInBulkUseCase
 from argilla_server.webhooks.v1.enums import RecordEvent, ResponseEvent
 from argilla_server.webhooks.v1.responses import build_response_event
@@ -166,11 +165,20 @@ class TestCreateCurrentUserResponsesBulk:
 
         response_to_create = (await db.execute(select(Response).filter_by(id=response_to_create_id))).scalar_one()
         await db.refresh(response_to_update)
-        expected_calls = [
-            call(response_to_create),
-            call(response_to_update),
-        ]
-        mock_search_engine.update_record_response.assert_has_calls(expected_calls)
+        mock_search_engine.update_records.assert_called_once()
+        dataset_arg, records_deltas_arg = mock_search_engine.update_records.call_args.args
+        assert dataset_arg.id == dataset.id
+        assert sorted(records_deltas_arg, key=lambda record_delta: record_delta.record_id) == sorted(
+            [
+                RecordDelta(
+                    record_id=records[0].id, status=RecordStatus.completed, upserted_responses=[response_to_create]
+                ),
+                RecordDelta(
+                    record_id=records[1].id, status=RecordStatus.completed, upserted_responses=[response_to_update]
+                ),
+            ],
+            key=lambda record_delta: record_delta.record_id,
+        )
 
     async def test_response_to_create(
         self,
@@ -227,7 +235,10 @@ class TestCreateCurrentUserResponsesBulk:
         assert dataset.users == [owner]
 
         response = (await db.execute(select(Response).filter_by(id=response_id))).scalar_one()
-        mock_search_engine.update_record_response.assert_called_once_with(response)
+        mock_search_engine.update_records.assert_called_once()
+        assert mock_search_engine.update_records.call_args.args[1] == [
+            RecordDelta(record_id=record.id, status=RecordStatus.completed, upserted_responses=[response])
+        ]
 
     async def test_response_to_create_with_non_existent_record(
         self, async_client: AsyncClient, db: AsyncSession, mock_search_engine: SearchEngine, owner_auth_header: dict
@@ -260,7 +271,7 @@ class TestCreateCurrentUserResponsesBulk:
         }
 
         assert (await db.execute(select(func.count(Response.id)))).scalar() == 0
-        assert not mock_search_engine.update_record_response.called
+        assert not mock_search_engine.update_records.called
 
     async def test_response_to_update(
         self,
@@ -318,7 +329,10 @@ class TestCreateCurrentUserResponsesBulk:
         assert (await db.execute(select(func.count(Response.id)))).scalar() == 1
 
         await db.refresh(response)
-        mock_search_engine.update_record_response.assert_called_once_with(response)
+        mock_search_engine.update_records.assert_called_once()
+        assert mock_search_engine.update_records.call_args.args[1] == [
+            RecordDelta(record_id=record.id, status=RecordStatus.completed, upserted_responses=[response])
+        ]
 
     async def test_invalid_response(
         self, async_client: AsyncClient, db: AsyncSession, mock_search_engine: SearchEngine, owner_auth_header: dict
@@ -353,7 +367,7 @@ class TestCreateCurrentUserResponsesBulk:
         }
 
         assert (await db.execute(select(func.count(Response.id)))).scalar() == 0
-        assert not mock_search_engine.update_record_response.called
+        assert not mock_search_engine.update_records.called
 
     async def test_unauthorized_response(
         self, async_client: AsyncClient, mock_search_engine: SearchEngine, db: AsyncSession
@@ -388,7 +402,120 @@ class TestCreateCurrentUserResponsesBulk:
         }
 
         assert (await db.execute(select(func.count(Response.id)))).scalar() == 0
-        assert not mock_search_engine.update_record_response.called
+        assert not mock_search_engine.update_records.called
+
+    async def test_responses_with_database_error(
+        self,
+        async_client: AsyncClient,
+        db: AsyncSession,
+        mock_search_engine: SearchEngine,
+        owner_auth_header: dict,
+        mocker,
+    ):
+        dataset = await DatasetFactory.create()
+        await RatingQuestionFactory.create(name="prompt-quality", required=True, dataset=dataset)
+
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+
+        mocker.patch.object(Response, "upsert_many", side_effect=Exception("database error"))
+
+        resp = await async_client.post(
+            self.url(),
+            headers=owner_auth_header,
+            json={
+                "items": [
+                    {
+                        "values": {"prompt-quality": {"value": 10}},
+                        "status": ResponseStatus.submitted,
+                        "record_id": str(record.id),
+                    }
+                    for record in records
+                ],
+            },
+        )
+
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "items": [
+                {"item": None, "error": {"detail": "database error"}},
+                {"item": None, "error": {"detail": "database error"}},
+            ],
+        }
+
+        mock_search_engine.update_records.assert_not_called()
+
+    async def test_responses_with_database_error_for_one_response(
+        self,
+        async_client: AsyncClient,
+        db: AsyncSession,
+        mock_search_engine: SearchEngine,
+        owner_auth_header: dict,
+        mocker,
+    ):
+        dataset = await DatasetFactory.create()
+        await RatingQuestionFactory.create(name="prompt-quality", required=True, dataset=dataset)
+
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+
+        upsert_many = Response.upsert_many
+
+        async def upsert_many_failing_for_second_record(db, objects, **kwargs):
+            if any(obj["record_id"] == records[1].id for obj in objects):
+                raise Exception("database error")
+            return await upsert_many(db, objects, **kwargs)
+
+        mocker.patch.object(Response, "upsert_many", side_effect=upsert_many_failing_for_second_record)
+
+        resp = await async_client.post(
+            self.url(),
+            headers=owner_auth_header,
+            json={
+                "items": [
+                    {
+                        "values": {"prompt-quality": {"value": 10}},
+                        "status": ResponseStatus.submitted,
+                        "record_id": str(record.id),
+                    }
+                    for record in records
+                ],
+            },
+        )
+
+        assert resp.status_code == 200
+
+        response = (await db.execute(select(Response))).scalar_one()
+        assert response.record_id == records[0].id
+        assert resp.json()["items"][0]["item"]["id"] == str(response.id)
+        assert resp.json()["items"][1] == {"item": None, "error": {"detail": "database error"}}
+
+        mock_search_engine.update_records.assert_called_once()
+
+    async def test_responses_with_search_engine_error(
+        self, async_client: AsyncClient, db: AsyncSession, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        await RatingQuestionFactory.create(name="prompt-quality", required=True, dataset=dataset)
+
+        record = await RecordFactory.create(dataset=dataset)
+
+        mock_search_engine.update_records.side_effect = Exception("search engine error")
+
+        with pytest.raises(Exception, match="search engine error"):
+            await async_client.post(
+                self.url(),
+                headers=owner_auth_header,
+                json={
+                    "items": [
+                        {
+                            "values": {"prompt-quality": {"value": 10}},
+                            "status": ResponseStatus.submitted,
+                            "record_id": str(record.id),
+                        },
+                    ],
+                },
+            )
+
+        assert (await db.execute(select(func.count(Response.id)))).scalar() == 1
 
     async def test_no_responses(self, async_client: AsyncClient, owner_auth_header: dict):
         resp = await async_client.post(
@@ -31,6 +31,7 @@ from argilla_server.api.schemas.v1.vector_settings import (
     VECTOR_SETTINGS_CREATE_TITLE_MAX_LENGTH,
 )
 from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.contexts.search import EXACT_SIMILARITY_SEARCH_CANDIDATES_PAGE_SIZE
 from argilla_server.enums import (
     DatasetDistributionStrategy,
     DatasetStatus,
@@ -66,6 +67,7 @@ from argilla_server.search_engine import (
     SearchResponses,
     TermsFilter,
     TextQuery,
+    VectorsMatrixStore,
 )
 from tests.factories import (
     AdminFactory,
@@ -113,6 +115,7 @@ class TestSuiteDatasets:
                     "name": "dataset-a",
                     "guidelines": None,
                     "allow_extra_metadata": True,
+                    "exact_similarity_search": False,
                     "status": "draft",
                     "distribution": {
                         "strategy": DatasetDistributionStrategy.overlap,
@@ -129,6 +132,7 @@ class TestSuiteDatasets:
                     "name": "dataset-b",
                     "guidelines": "guidelines",
                     "allow_extra_metadata": True,
+                    "exact_similarity_search": False,
                     "status": "draft",
                     "distribution": {
                         "strategy": DatasetDistributionStrategy.overlap,
@@ -145,6 +149,7 @@ class TestSuiteDatasets:
                     "name": "dataset-c",
                     "guidelines": None,
                     "allow_extra_metadata": True,
+                    "exact_similarity_search": False,
                     "status": "ready",
                     "distribution": {
                         "strategy": DatasetDistributionStrategy.overlap,
@@ -680,6 +685,7 @@ class TestSuiteDatasets:
             "name": "dataset",
             "guidelines": None,
             "allow_extra_metadata": True,
+            "exact_similarity_search": False,
             "status": "draft",
             "distribution": {
                 "strategy": DatasetDistributionStrategy.overlap,
@@ -744,13 +750,14 @@ class TestSuiteDatasets:
         dataset = await DatasetFactory.create()
         records = await RecordFactory.create_batch(size=8, dataset=dataset)
 
-        mock_search_engine.get_dataset_progress.return_value = {"total": len(records)}
-
-        mock_search_engine.get_dataset_user_progress.return_value = {
-            "total": 6,
-            "submitted": 3,
-            "discarded": 3,
-        }
+        mock_search_engine.get_dataset_and_user_progress.return_value = (
+            {"total": len(records)},
+            {
+                "total": 6,
+                "submitted": 3,
+                "discarded": 3,
+            },
+        )
 
         response = await async_client.get(
             f"/api/v1/me/datasets/{dataset.id}/metrics",
@@ -776,8 +783,7 @@ class TestSuiteDatasets:
     ):
         dataset = await DatasetFactory.create()
 
-        mock_search_engine.get_dataset_progress.return_value = {}
-        mock_search_engine.get_dataset_user_progress.return_value = {}
+        mock_search_engine.get_dataset_and_user_progress.return_value = ({}, {})
 
         response = await async_client.get(
             f"/api/v1/me/datasets/{dataset.id}/metrics",
@@ -807,16 +813,17 @@ class TestSuiteDatasets:
 
         user = await UserFactory.create(workspaces=[dataset.workspace], role=role)
 
-        mock_search_engine.get_dataset_progress.return_value = {
-            "total": len(records),
-        }
-
-        mock_search_engine.get_dataset_user_progress.return_value = {
-            "submitted": 2,
-            "discarded": 1,
-            "draft": 1,
-            "pending": 2,
-        }
+        mock_search_engine.get_dataset_and_user_progress.return_value = (
+            {
+                "total": len(records),
+            },
+            {
+                "submitted": 2,
+                "discarded": 1,
+                "draft": 1,
+                "pending": 2,
+            },
+        )
 
         response = await async_client.get(
             f"/api/v1/me/datasets/{dataset.id}/metrics",
@@ -892,6 +899,7 @@ class TestSuiteDatasets:
             "name": "name",
             "guidelines": "guidelines",
             "allow_extra_metadata": False,
+            "exact_similarity_search": False,
             "status": "draft",
             "distribution": {
                 "strategy": DatasetDistributionStrategy.overlap,
@@ -2957,21 +2965,21 @@ class TestSuiteDatasets:
 
         # Record 0
         await records[0].awaitable_attrs.vectors
-        assert records[0].vectors[0].value == [0.1, 0.1, 0.1, 0.1, 0.1]
-        assert records[0].vectors[1].value == [1.1, 1.1, 1.1, 1.1, 1.1]
-        assert records[0].vectors[2].value == [2.1, 2.1, 2.1, 2.1, 2.1]
+        assert records[0].vectors[0].value == pytest.approx([0.1, 0.1, 0.1, 0.1, 0.1])
+        assert records[0].vectors[1].value == pytest.approx([1.1, 1.1, 1.1, 1.1, 1.1])
+        assert records[0].vectors[2].value == pytest.approx([2.1, 2.1, 2.1, 2.1, 2.1])
 
         # Record 1
         await records[1].awaitable_attrs.vectors
-        assert records[1].vectors[0].value == [3.1, 3.1, 3.1, 3.1, 3.1]
+        assert records[1].vectors[0].value == pytest.approx([3.1, 3.1, 3.1, 3.1, 3.1])
         assert records[1].vectors[1].value == [4, 4, 4, 4, 4]
         assert records[1].vectors[2].value == [5, 5, 5, 5, 5]
 
         # Record 2
         await records[2].awaitable_attrs.vectors
-        assert records[2].vectors[0].value == [4.1, 4.1, 4.1, 4.1, 4.1]
-        assert records[2].vectors[1].value == [5.1, 5.1, 5.1, 5.1, 5.1]
-        assert records[2].vectors[2].value == [6.1, 6.1, 6.1, 6.1, 6.1]
+        assert records[2].vectors[0].value == pytest.approx([4.1, 4.1, 4.1, 4.1, 4.1])
+        assert records[2].vectors[1].value == pytest.approx([5.1, 5.1, 5.1, 5.1, 5.1])
+        assert records[2].vectors[2].value == pytest.approx([6.1, 6.1, 6.1, 6.1, 6.1])
 
         mock_search_engine.index_records.assert_called_once_with(dataset, records[:3])
 
@@ -4119,6 +4127,94 @@ class TestSuiteDatasets:
             max_results=4,
         )
 
+    async def test_search_current_user_dataset_records_with_exact_similarity_search(
+        self,
+        async_client: "AsyncClient",
+        db: "AsyncSession",
+        mock_search_engine: SearchEngine,
+        vectors_matrix_store: VectorsMatrixStore,
+        owner: User,
+        owner_auth_header: dict,
+    ):
+        workspace = await WorkspaceFactory.create()
+        dataset, _, records, *_ = await self.create_dataset_with_user_responses(owner, workspace)
+        await dataset.update(db, exact_similarity_search=True)
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        for record, value in zip(records, [[1.0, 0.0], [0.0, 1.0], [0.8, 0.2]]):
+            await VectorFactory.create(vector_settings=vector_settings, record=record, value=value)
+
+        query_json = {"query": {"vector": {"name": vector_settings.name, "record_id": str(records[0].id)}}}
+        response = await async_client.post(
+            f"/api/v1/me/datasets/{dataset.id}/records/search",
+            headers=owner_auth_header,
+            json=query_json,
+            params={"offset": 0, "limit": 2},
+        )
+
+        assert response.status_code == 200
+        response_json = response.json()
+        assert [item["record"]["id"] for item in response_json["items"]] == [str(records[2].id), str(records[1].id)]
+        assert response_json["total"] == 2
+
+        mock_search_engine.search.assert_not_called()
+        mock_search_engine.similarity_search.assert_not_called()
+        assert await vectors_matrix_store.exists(vector_settings)
+
+    async def test_search_current_user_dataset_records_with_exact_similarity_search_and_filters(
+        self,
+        async_client: "AsyncClient",
+        db: "AsyncSession",
+        mock_search_engine: SearchEngine,
+        vectors_matrix_store: VectorsMatrixStore,
+        owner: User,
+        owner_auth_header: dict,
+    ):
+        workspace = await WorkspaceFactory.create()
+        dataset, _, records, *_ = await self.create_dataset_with_user_responses(owner, workspace)
+        await dataset.update(db, exact_similarity_search=True)
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        for record, value in zip(records, [[1.0, 0.0], [0.0, 1.0], [0.8, 0.2]]):
+            await VectorFactory.create(vector_settings=vector_settings, record=record, value=value)
+
+        mock_search_engine.search.return_value = SearchResponses(
+            items=[SearchResponseItem(record_id=records[1].id, score=1.0)], total=1
+        )
+
+        query_json = {
+            "query": {"vector": {"name": vector_settings.name, "value": [1.0, 0.0]}},
+            "filters": {
+                "and": [
+                    {
+                        "type": "terms",
+                        "scope": {"entity": "response", "property": "status"},
+                        "values": [ResponseStatus.submitted],
+                    }
+                ]
+            },
+        }
+        response = await async_client.post(
+            f"/api/v1/me/datasets/{dataset.id}/records/search", headers=owner_auth_header, json=query_json
+        )
+
+        assert response.status_code == 200
+        assert [item["record"]["id"] for item in response.json()["items"]] == [str(records[1].id)]
+
+        mock_search_engine.search.assert_called_once_with(
+            dataset,
+            query=None,
+            filter=AndFilter(
+                filters=[
+                    TermsFilter(
+                        scope=ResponseFilterScope(property="status", user=owner),
+                        values=[ResponseStatusFilter.submitted],
+                    )
+                ]
+            ),
+            limit=EXACT_SIMILARITY_SEARCH_CANDIDATES_PAGE_SIZE,
+            search_after=None,
+        )
+        mock_search_engine.similarity_search.assert_not_called()
+
     async def test_search_current_user_dataset_records_with_vector_value_and_max_results_offset(
         self, async_client: "AsyncClient", mock_search_engine: SearchEngine, owner: User, owner_auth_header: dict
     ):
@@ -4486,6 +4582,7 @@ class TestSuiteDatasets:
             "name": name,
             "guidelines": guidelines,
             "allow_extra_metadata": allow_extra_metadata,
+            "exact_similarity_search": False,
             "status": "ready",
             "distribution": {
                 "strategy": DatasetDistributionStrategy.overlap,
@@ -13,12 +13,14 @@
 # limitations under the License.
 
 import io
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Generator
 from unittest.mock import patch, MagicMock
 import os
 
 import pytest
-from argilla_server.contexts.files import ListObjectsResponse, ObjectMetadata
+from argilla_server.api.routes import api_v1
+from argilla_server.contexts import files
+from argilla_server.contexts.files import ListObjectsResponse, LocalFileStorage, ObjectMetadata
 from argilla_server.constants import API_KEY_HEADER_NAME
 
 from tests.factories import (
@@ -35,13 +37,17 @@ if TYPE_CHECKING:
 @pytest.mark.asyncio
 async def test_get_file(async_client: "AsyncClient"):
     # Mock the Minio client and the response
-    with patch("argilla_server.contexts.files.get_object") as mock_get_object:
+    with (
+        patch("argilla_server.contexts.files.stat_object") as mock_stat_object,
+        patch("argilla_server.contexts.files.get_object") as mock_get_object,
+    ):
         # Set up mock response
         mock_response = MagicMock()
         mock_response.data = b"test data"
         mock_get_object.return_value = mock_response
 
         file = MinioFileFactory.build()
+        mock_stat_object.return_value = file
 
         response = await async_client.get(f"/api/v1/file/{file.bucket_name}/{file.object_name}")
 
@@ -52,6 +58,87 @@ async def test_get_file(async_client: "AsyncClient"):
         # assert response.content == b"test data"
 
 
+@pytest.fixture
+def local_file_storage(tmp_path) -> Generator[LocalFileStorage, None, None]:
+    storage = LocalFileStorage(tmp_path)
+    api_v1.dependency_overrides[files.get_minio_client] = lambda: storage
+
+    yield storage
+
+    api_v1.dependency_overrides.pop(files.get_minio_client, None)
+
+
+@pytest.mark.asyncio
+async def test_get_file_with_range(async_client: "AsyncClient", local_file_storage: LocalFileStorage):
+    content = b"0123456789" * 10
+    write_result = local_file_storage.put_object("workspace", "pdf/document", content, content_type="application/pdf")
+
+    response = await async_client.get("/api/v1/file/workspace/pdf/document", headers={"Range": "bytes=10-29"})
+
+    assert response.status_code == 206
+    assert response.content == content[10:30]
+    assert response.headers["Content-Range"] == "bytes 10-29/100"
+    assert response.headers["Content-Length"] == "20"
+    assert response.headers["ETag"] == write_result.etag
+    assert response.headers["Accept-Ranges"] == "bytes"
+
+    response = await async_client.get("/api/v1/file/workspace/pdf/document", headers={"Range": "bytes=-5"})
+
+    assert response.status_code == 206
+    assert response.content == content[-5:]
+    assert response.headers["Content-Range"] == "bytes 95-99/100"
+
+
+@pytest.mark.asyncio
+async def test_get_file_with_not_satisfiable_range(async_client: "AsyncClient", local_file_storage: LocalFileStorage):
+    local_file_storage.put_object("workspace", "pdf/document", b"0123456789")
+
+    response = await async_client.get("/api/v1/file/workspace/pdf/document", headers={"Range": "bytes=10-"})
+
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == "bytes */10"
+
+
+@pytest.mark.asyncio
+async def test_get_file_with_if_none_match(async_client: "AsyncClient", local_file_storage: LocalFileStorage):
+    write_result = local_file_storage.put_object("workspace", "pdf/document", b"0123456789")
+
+    response = await async_client.get("/api/v1/file/workspace/pdf/document")
+
+    assert response.status_code == 200
+    assert response.content == b"0123456789"
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = await async_client.get(
+        "/api/v1/file/workspace/pdf/document", headers={"If-None-Match": f'"{write_result.etag}"'}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == write_result.etag
+
+    response = await async_client.get("/api/v1/file/workspace/pdf/document", headers={"If-None-Match": '"other"'})
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_get_file_lists_versions_only_for_versioned_objects(
+    async_client: "AsyncClient", local_file_storage: LocalFileStorage
+):
+    local_file_storage.put_object("workspace", "schemas/schema", b"first")
+    local_file_storage.put_object("workspace", "pdf/document", b"first")
+
+    with patch("argilla_server.contexts.files.list_objects", wraps=files.list_objects) as list_objects_spy:
+        response = await async_client.get("/api/v1/file/workspace/schemas/schema")
+        assert response.status_code == 200
+        assert list_objects_spy.call_count == 1
+
+        response = await async_client.get("/api/v1/file/workspace/pdf/document")
+        assert response.status_code == 200
+        assert list_objects_spy.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_put_file(async_client: "AsyncClient", owner_auth_header: dict):
     bucket_name = "workspace"
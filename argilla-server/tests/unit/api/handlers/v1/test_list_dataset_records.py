@@ -383,6 +383,61 @@ class TestSuiteListDatasetRecords:
         response_body = response.json()
         assert [item["id"] for item in response_body["items"]] == [str(record_c.id)]
 
+    async def test_list_dataset_records_with_cursor(self, async_client: "AsyncClient", owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(size=5, dataset=dataset)
+        await RecordFactory.create_batch(size=2, dataset=await DatasetFactory.create())
+
+        record_ids, cursor = [], None
+        for _ in range(3):
+            params = {"limit": 2, "include_total": False}
+            if cursor:
+                params["cursor"] = cursor
+
+            response = await async_client.get(
+                f"/api/v1/datasets/{dataset.id}/records", headers=owner_auth_header, params=params
+            )
+
+            assert response.status_code == 200
+
+            response_body = response.json()
+            assert "total" not in response_body
+
+            record_ids.extend(item["id"] for item in response_body["items"])
+            cursor = response_body.get("next_cursor")
+
+        assert cursor is None
+        assert record_ids == [str(record.id) for record in sorted(records, key=lambda r: (r.inserted_at, r.id))]
+
+    async def test_list_dataset_records_with_cursor_and_offset(
+        self, async_client: "AsyncClient", owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        await RecordFactory.create_batch(size=2, dataset=dataset)
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/records", headers=owner_auth_header, params={"limit": 1}
+        )
+        cursor = response.json()["next_cursor"]
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/records",
+            headers=owner_auth_header,
+            params={"offset": 1, "cursor": cursor},
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "`offset` cannot be used together with `cursor`."}
+
+    async def test_list_dataset_records_with_invalid_cursor(self, async_client: "AsyncClient", owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/records", headers=owner_auth_header, params={"cursor": "invalid"}
+        )
+
+        assert response.status_code == 422
+
     async def create_records_with_response(
         self,
         num_records: int,
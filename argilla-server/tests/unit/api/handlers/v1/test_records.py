@@ -14,7 +14,6 @@
 
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Type
-from unittest.mock import call
 from uuid import UUID, uuid4
 
 import pytest
@@ -778,7 +777,9 @@ class TestSuiteRecords:
         }
 
         response = (await db.execute(select(Response).where(Response.record_id == record.id))).scalar_one()
-        mock_search_engine.update_record_response.assert_called_once_with(response)
+        mock_search_engine.update_records.assert_called_once()
+        [record_delta] = mock_search_engine.update_records.call_args.args[1]
+        assert record_delta.upserted_responses == [response]
 
         assert dataset.users == [owner]
 
@@ -838,7 +839,9 @@ class TestSuiteRecords:
         }
 
         response = (await db.execute(select(Response).where(Response.record_id == record.id))).scalar_one()
-        mock_search_engine.update_record_response.assert_called_once_with(response)
+        mock_search_engine.update_records.assert_called_once()
+        [record_delta] = mock_search_engine.update_records.call_args.args[1]
+        assert record_delta.upserted_responses == [response]
 
         assert dataset.users == [owner]
 
@@ -1682,6 +1685,7 @@ class TestSuiteRecords:
         record = await RecordFactory.create(dataset=dataset)
         suggestions = await SuggestionFactory.create_batch(10, record=record)
         random_uuids = [str(uuid4()) for _ in range(0, 5)]
+        record_previous_updated_at = record.updated_at
 
         suggestions_ids = [str(suggestion.id) for suggestion in suggestions]
 
@@ -1696,8 +1700,13 @@ class TestSuiteRecords:
         assert response.status_code == 204
         assert (await db.execute(select(func.count(Suggestion.id)))).scalar() == 0
 
-        expected_calls = [call(suggestion) for suggestion in suggestions]
-        mock_search_engine.delete_record_suggestion.assert_has_calls(expected_calls)
+        await db.refresh(record)
+        assert record.updated_at > record_previous_updated_at
+
+        mock_search_engine.update_records.assert_called_once()
+        [record_delta] = mock_search_engine.update_records.call_args.args[1]
+        assert record_delta.record_id == record.id
+        assert set(record_delta.deleted_suggestions) == set(suggestions)
 
     async def test_delete_record_suggestions_with_no_ids(
         self, async_client: "AsyncClient", owner_auth_header: dict
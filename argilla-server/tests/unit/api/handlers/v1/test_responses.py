@@ -20,6 +20,7 @@ import pytest
 from argilla_server.constants import API_KEY_HEADER_NAME
 from argilla_server.models import DatasetStatus, Response, ResponseStatus, UserRole
 from argilla_server.search_engine import SearchEngine
+from argilla_server.settings import settings
 from sqlalchemy import func, select
 
 from tests.factories import (
@@ -106,7 +107,55 @@ class TestSuiteResponses:
         assert dataset.last_activity_at > dataset_previous_last_activity_at
         assert dataset.updated_at == dataset_previous_updated_at
 
-        mock_search_engine.update_record_response.assert_called_once_with(response)
+        mock_search_engine.update_records.assert_called_once()
+        [record_delta] = mock_search_engine.update_records.call_args.args[1]
+        assert record_delta.upserted_responses == [response]
+
+    async def test_update_response_does_not_touch_recently_active_dataset(
+        self, async_client: "AsyncClient", db: "AsyncSession", owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextQuestionFactory.create(name="input_ok", dataset=dataset)
+        response = await ResponseFactory.create(
+            record=await RecordFactory.create(dataset=dataset), values={"input_ok": {"value": "no"}}
+        )
+        response_json = {"values": {"input_ok": {"value": "yes"}}, "status": "submitted"}
+
+        resp = await async_client.put(f"/api/v1/responses/{response.id}", headers=owner_auth_header, json=response_json)
+        assert resp.status_code == 200
+
+        await db.refresh(dataset)
+        dataset_previous_last_activity_at = dataset.last_activity_at
+
+        resp = await async_client.put(f"/api/v1/responses/{response.id}", headers=owner_auth_header, json=response_json)
+        assert resp.status_code == 200
+
+        await db.refresh(dataset)
+        assert dataset.last_activity_at == dataset_previous_last_activity_at
+
+    async def test_update_response_with_dataset_last_activity_granularity_disabled(
+        self, async_client: "AsyncClient", db: "AsyncSession", owner_auth_header: dict, mocker
+    ):
+        mocker.patch.object(settings, "dataset_last_activity_granularity", 0)
+
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextQuestionFactory.create(name="input_ok", dataset=dataset)
+        response = await ResponseFactory.create(
+            record=await RecordFactory.create(dataset=dataset), values={"input_ok": {"value": "no"}}
+        )
+        response_json = {"values": {"input_ok": {"value": "yes"}}, "status": "submitted"}
+
+        resp = await async_client.put(f"/api/v1/responses/{response.id}", headers=owner_auth_header, json=response_json)
+        assert resp.status_code == 200
+
+        await db.refresh(dataset)
+        dataset_previous_last_activity_at = dataset.last_activity_at
+
+        resp = await async_client.put(f"/api/v1/responses/{response.id}", headers=owner_auth_header, json=response_json)
+        assert resp.status_code == 200
+
+        await db.refresh(dataset)
+        assert dataset.last_activity_at > dataset_previous_last_activity_at
 
     async def test_update_response_without_authentication(self, async_client: "AsyncClient", db: "AsyncSession"):
         response = await ResponseFactory.create(
@@ -412,8 +461,10 @@ class TestSuiteResponses:
         self, async_client: "AsyncClient", mock_search_engine: SearchEngine, db: "AsyncSession", owner_auth_header: dict
     ):
         response = await ResponseFactory.create()
-        dataset = response.record.dataset
+        record = response.record
+        dataset = record.dataset
 
+        record_previous_updated_at = record.updated_at
         dataset_previous_last_activity_at = dataset.last_activity_at
         dataset_previous_updated_at = dataset.updated_at
 
@@ -422,11 +473,16 @@ class TestSuiteResponses:
         assert resp.status_code == 200
         assert (await db.execute(select(func.count(Response.id)))).scalar() == 0
 
+        await db.refresh(record)
+        assert record.updated_at > record_previous_updated_at
+
         await db.refresh(dataset)
         assert dataset.last_activity_at > dataset_previous_last_activity_at
         assert dataset.updated_at == dataset_previous_updated_at
 
-        mock_search_engine.delete_record_response.assert_called_once_with(response)
+        mock_search_engine.update_records.assert_called_once()
+        [record_delta] = mock_search_engine.update_records.call_args.args[1]
+        assert record_delta.deleted_responses == [response]
 
     async def test_delete_response_without_authentication(self, async_client: "AsyncClient", db: "AsyncSession"):
         response = await ResponseFactory.create()
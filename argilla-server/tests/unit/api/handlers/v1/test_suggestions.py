@@ -36,7 +36,9 @@ class TestSuiteSuggestions:
         self, async_client: "AsyncClient", mock_search_engine: SearchEngine, db: "AsyncSession", role: UserRole
     ) -> None:
         suggestion = await SuggestionFactory.create()
-        user = await UserFactory.create(role=role, workspaces=[suggestion.record.dataset.workspace])
+        record = suggestion.record
+        record_previous_updated_at = record.updated_at
+        user = await UserFactory.create(role=role, workspaces=[record.dataset.workspace])
 
         response = await async_client.delete(
             f"/api/v1/suggestions/{suggestion.id}",
@@ -59,6 +61,9 @@ class TestSuiteSuggestions:
 
         assert (await db.execute(select(func.count(Suggestion.id)))).scalar() == 0
 
+        await db.refresh(record)
+        assert record.updated_at > record_previous_updated_at
+
         mock_search_engine.delete_record_suggestion.assert_called_once_with(suggestion)
 
     async def test_delete_suggestion_non_existent(self, async_client: "AsyncClient", owner_auth_header: dict) -> None:
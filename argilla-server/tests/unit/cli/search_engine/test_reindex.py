@@ -12,13 +12,74 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from uuid import uuid4
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncGenerator, Dict, Iterable, Optional, Set
+from uuid import UUID, uuid4
 
+import pytest
 from typer import Typer
 from typer.testing import CliRunner
 
+from argilla_server.cli.search_engine import reindex
+from argilla_server.models import Dataset, Record, Workspace
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+    from sqlalchemy.orm import Session
+
+
+class InMemoryShadowIndexSearchEngine:
+    """Search engine keeping the indexed records fields by index name, with live indices named after the dataset"""
+
+    def __init__(self):
+        self.indices: Dict[str, Dict[UUID, dict]] = {}
+
+    @asynccontextmanager
+    async def shadow_index(self, dataset: Dataset) -> AsyncGenerator[str, None]:
+        index_name = f"{dataset.id}.shadow"
+        self.indices[index_name] = {}
+
+        yield index_name
+
+        self.indices[str(dataset.id)] = self.indices.pop(index_name)
+
+    async def index_records(self, dataset: Dataset, records: Iterable[Record], index_name: Optional[str] = None):
+        self.indices[index_name or str(dataset.id)].update({record.id: dict(record.fields) for record in records})
+
+    async def delete_records_not_in(
+        self, dataset: Dataset, records_ids: Set[UUID], index_name: Optional[str] = None
+    ) -> int:
+        index = self.indices[index_name or str(dataset.id)]
+        stale_ids = [id for id in index if id not in records_ids]
+        for id in stale_ids:
+            del index[id]
+
+        return len(stale_ids)
+
+
+def _create_dataset_with_records(sync_db: "Session", workspace: Workspace, num_records: int) -> Dataset:
+    dataset = Dataset(
+        name=f"dataset-{uuid4()}", workspace=workspace, distribution={"strategy": "overlap", "min_submitted": 1}
+    )
+    dataset.records = [Record(fields={"text": f"text {i}"}, dataset=dataset) for i in range(num_records)]
+    sync_db.add(dataset)
+    sync_db.commit()
+
+    return dataset
+
 
 class TestCliServerSearchEngineReindex:
+    @pytest.fixture
+    def search_engine(self, mocker: "MockerFixture") -> InMemoryShadowIndexSearchEngine:
+        search_engine = InMemoryShadowIndexSearchEngine()
+
+        async def get_search_engine():
+            yield search_engine
+
+        mocker.patch.object(reindex, "get_search_engine", get_search_engine)
+
+        return search_engine
+
     # TODO: This test should create multiple datasets and records so they are reindexed.
     # In order to do that right now we need to duplicate all async test factories to be synchronous.
     # Instead of do that we can (once we move away from asynchronous requests) use regular factories here and improve
@@ -32,3 +93,48 @@ class TestCliServerSearchEngineReindex:
         result = cli_runner.invoke(cli, f"search-engine reindex --dataset-id {uuid4()}")
 
         assert result.exit_code == 1
+
+    def test_reindex_with_multiple_workers(
+        self, sync_db: "Session", cli_runner: CliRunner, cli: Typer, search_engine: InMemoryShadowIndexSearchEngine
+    ):
+        workspace = Workspace(name="workspace")
+        datasets = [_create_dataset_with_records(sync_db, workspace, num_records=3) for _ in range(3)]
+
+        result = cli_runner.invoke(cli, "search-engine reindex --num-workers 2")
+
+        assert result.exit_code == 0, result.output
+        assert search_engine.indices == {
+            str(dataset.id): {record.id: record.fields for record in dataset.records} for dataset in datasets
+        }
+
+    def test_reindex_with_records_changed_during_reindex(
+        self,
+        mocker: "MockerFixture",
+        sync_db: "Session",
+        cli_runner: CliRunner,
+        cli: Typer,
+        search_engine: InMemoryShadowIndexSearchEngine,
+    ):
+        dataset = _create_dataset_with_records(sync_db, Workspace(name="workspace"), num_records=3)
+        deleted_record, updated_record, record = dataset.records
+
+        mocker.patch.object(reindex.Reindexer, "YIELD_PER", 2)
+        index_records = search_engine.index_records
+
+        async def index_records_changing_records(dataset, records, index_name=None):
+            await index_records(dataset, records, index_name)
+
+            if [record.id for record in records] == [deleted_record.id, updated_record.id]:
+                # NOTE: Records indexed into the shadow index are changed before the reindex finishes
+                sync_db.delete(deleted_record)
+                updated_record.fields = {"text": "updated text"}
+                sync_db.commit()
+
+        mocker.patch.object(search_engine, "index_records", index_records_changing_records)
+
+        result = cli_runner.invoke(cli, f"search-engine reindex --dataset-id {dataset.id}")
+
+        assert result.exit_code == 0, result.output
+        assert search_engine.indices == {
+            str(dataset.id): {updated_record.id: {"text": "updated text"}, record.id: {"text": "text 2"}}
+        }
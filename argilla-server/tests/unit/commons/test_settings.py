@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import pytest
+from pydantic import ValidationError
 
 from argilla_server.settings import Settings
 
@@ -96,3 +97,16 @@ def test_disable_enable_share_your_progress(monkeypatch):
     monkeypatch.setenv("ARGILLA_ENABLE_SHARE_YOUR_PROGRESS", "false")
 
     assert Settings().enable_share_your_progress is False
+
+
+def test_settings_records_bulk_stream_chunk_size(monkeypatch):
+    monkeypatch.setenv("ARGILLA_RECORDS_BULK_STREAM_CHUNK_SIZE", "100")
+
+    assert Settings().records_bulk_stream_chunk_size == 100
+
+
+def test_settings_records_bulk_stream_chunk_size_greater_than_records_bulk_max_items(monkeypatch):
+    monkeypatch.setenv("ARGILLA_RECORDS_BULK_STREAM_CHUNK_SIZE", "1000")
+
+    with pytest.raises(ValidationError, match="records_bulk_stream_chunk_size"):
+        Settings()
@@ -22,12 +22,12 @@ from httpx import AsyncClient
 from opensearchpy import OpenSearch
 from sqlalchemy.engine.interfaces import IsolationLevel
 
-from argilla_server.contexts import distribution, datasets, records
+from argilla_server.contexts import accounts, distribution, datasets, records
 from argilla_server.api.routes import api_v1
 from argilla_server.constants import API_KEY_HEADER_NAME, DEFAULT_API_KEY
 from argilla_server.database import get_async_db
 from argilla_server.models import User, UserRole, Workspace
-from argilla_server.search_engine import SearchEngine, get_search_engine
+from argilla_server.search_engine import SearchEngine, VectorsMatrixStore, get_search_engine, get_vectors_matrix_store
 from argilla_server.settings import settings
 from argilla_server.telemetry import TelemetryClient
 
@@ -57,6 +57,16 @@ def mock_search_engine(mocker) -> Generator["SearchEngine", None, None]:
     return mocker.AsyncMock(SearchEngine)
 
 
+@pytest.fixture(scope="function")
+def vectors_matrix_store(tmp_path, mocker: "MockerFixture") -> Generator[VectorsMatrixStore, None, None]:
+    mocker.patch.object(settings, "exact_similarity_search_path", str(tmp_path / "vectors"))
+    get_vectors_matrix_store.cache_clear()
+
+    yield get_vectors_matrix_store()
+
+    get_vectors_matrix_store.cache_clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def owner() -> User:
     return await OwnerFactory.create(first_name="Owner", username="owner", api_key="owner.apikey")
@@ -111,6 +121,13 @@ async def async_client(
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_users_cache() -> Generator[None, None, None]:
+    # NOTE: The database is reset between tests, so the same usernames and API keys can belong to different users
+    yield
+    accounts._users_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def test_telemetry(mocker: "MockerFixture") -> "TelemetryClient":
     # Create a real instance TelemetryClient
@@ -0,0 +1,80 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+from argilla_server.contexts import accounts
+from argilla_server.enums import UserRole
+from argilla_server.settings import settings
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import UserFactory
+
+
+@pytest.mark.asyncio
+class TestGetCachedUser:
+    async def test_get_cached_user_by_api_key(self, db: AsyncSession, mocker):
+        user = await UserFactory.create()
+
+        get_user_spy = mocker.spy(accounts, "get_user_by_api_key")
+
+        assert await accounts.get_cached_user_by_api_key(db, user.api_key) == user
+        db.expunge_all()
+
+        cached_user = await accounts.get_cached_user_by_api_key(db, user.api_key)
+
+        assert get_user_spy.call_count == 1
+        assert cached_user is not user
+        assert cached_user.id == user.id
+        assert cached_user.username == user.username
+        assert cached_user in db
+
+    async def test_get_cached_user_by_username(self, db: AsyncSession, mocker):
+        user = await UserFactory.create()
+
+        get_user_spy = mocker.spy(accounts, "get_user_by_username")
+
+        await accounts.get_cached_user_by_username(db, user.username)
+        await accounts.get_cached_user_by_username(db, user.username)
+
+        assert get_user_spy.call_count == 1
+
+    async def test_get_cached_user_by_api_key_with_non_existent_api_key(self, db: AsyncSession):
+        assert await accounts.get_cached_user_by_api_key(db, "non-existent") is None
+
+    async def test_get_cached_user_by_username_after_update_user(self, db: AsyncSession):
+        user = await UserFactory.create(role=UserRole.annotator)
+
+        await accounts.get_cached_user_by_username(db, user.username)
+        await accounts.update_user(db, user, {"role": UserRole.admin})
+        db.expunge_all()
+
+        assert (await accounts.get_cached_user_by_username(db, user.username)).role == UserRole.admin
+
+    async def test_get_cached_user_by_api_key_after_delete_user(self, db: AsyncSession):
+        user = await UserFactory.create()
+
+        await accounts.get_cached_user_by_api_key(db, user.api_key)
+        await accounts.delete_user(db, user)
+
+        assert await accounts.get_cached_user_by_api_key(db, user.api_key) is None
+
+    async def test_get_cached_user_by_username_with_cache_disabled(self, db: AsyncSession, mocker):
+        mocker.patch.object(settings, "users_cache_ttl", 0)
+        user = await UserFactory.create()
+
+        get_user_spy = mocker.spy(accounts, "get_user_by_username")
+
+        await accounts.get_cached_user_by_username(db, user.username)
+        await accounts.get_cached_user_by_username(db, user.username)
+
+        assert get_user_spy.call_count == 2
@@ -0,0 +1,45 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla_server.contexts import datasets
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import DatasetFactory
+
+
+@pytest.mark.asyncio
+class TestTouchDatasetLastActivityAt:
+    async def test_touch_dataset_last_activity_at(self, db: AsyncSession):
+        dataset = await DatasetFactory.create()
+        previous_last_activity_at = dataset.last_activity_at
+
+        await datasets._touch_dataset_last_activity_at(db, dataset)
+        assert dataset.id not in datasets._datasets_last_activity_touches
+
+        await db.commit()
+        assert dataset.id in datasets._datasets_last_activity_touches
+
+        await db.refresh(dataset)
+        assert dataset.last_activity_at > previous_last_activity_at
+
+    async def test_touch_dataset_last_activity_at_with_rollback(self, db: AsyncSession):
+        dataset = await DatasetFactory.create()
+        dataset_id = dataset.id
+
+        await datasets._touch_dataset_last_activity_at(db, dataset)
+        await db.rollback()
+
+        assert dataset_id not in datasets._datasets_last_activity_touches
+        assert datasets.DATASETS_LAST_ACTIVITY_TOUCHES_SESSION_INFO_KEY not in db.info
@@ -0,0 +1,71 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla_server.contexts import datasets_progress
+from argilla_server.search_engine import SearchEngine
+from argilla_server.settings import settings
+
+from tests.factories import DatasetFactory, UserFactory
+
+
+@pytest.mark.asyncio
+class TestGetDatasetProgress:
+    async def test_get_dataset_progress(self, mock_search_engine: SearchEngine):
+        dataset = await DatasetFactory.create()
+        mock_search_engine.get_dataset_progress.return_value = {"total": 2, "pending": 2}
+
+        assert await datasets_progress.get_dataset_progress(mock_search_engine, dataset) == {"total": 2, "pending": 2}
+        assert await datasets_progress.get_dataset_progress(mock_search_engine, dataset) == {"total": 2, "pending": 2}
+
+        mock_search_engine.get_dataset_progress.assert_called_once_with(dataset)
+
+    async def test_get_dataset_progress_after_expire_dataset_progress(self, mock_search_engine: SearchEngine):
+        dataset = await DatasetFactory.create()
+        mock_search_engine.get_dataset_progress.return_value = {"total": 2, "pending": 2}
+
+        await datasets_progress.get_dataset_progress(mock_search_engine, dataset)
+        datasets_progress.expire_dataset_progress(dataset.id)
+
+        mock_search_engine.get_dataset_progress.return_value = {"total": 2, "pending": 1, "completed": 1}
+
+        assert await datasets_progress.get_dataset_progress(mock_search_engine, dataset) == {
+            "total": 2,
+            "pending": 1,
+            "completed": 1,
+        }
+        assert mock_search_engine.get_dataset_progress.call_count == 2
+
+    async def test_get_dataset_progress_with_cache_disabled(self, mock_search_engine: SearchEngine, mocker):
+        mocker.patch.object(settings, "dataset_progress_cache_ttl", 0)
+        dataset = await DatasetFactory.create()
+        mock_search_engine.get_dataset_progress.return_value = {}
+
+        await datasets_progress.get_dataset_progress(mock_search_engine, dataset)
+        await datasets_progress.get_dataset_progress(mock_search_engine, dataset)
+
+        assert mock_search_engine.get_dataset_progress.call_count == 2
+
+    async def test_get_dataset_and_user_progress(self, mock_search_engine: SearchEngine):
+        dataset = await DatasetFactory.create()
+        user, other_user = await UserFactory.create_batch(2)
+        mock_search_engine.get_dataset_and_user_progress.return_value = ({"total": 2}, {"total": 1, "submitted": 1})
+
+        await datasets_progress.get_dataset_and_user_progress(mock_search_engine, dataset, user)
+        await datasets_progress.get_dataset_and_user_progress(mock_search_engine, dataset, user)
+        await datasets_progress.get_dataset_and_user_progress(mock_search_engine, dataset, other_user)
+
+        assert mock_search_engine.get_dataset_and_user_progress.call_count == 2
+        mock_search_engine.get_dataset_and_user_progress.assert_any_call(dataset, user)
+        mock_search_engine.get_dataset_and_user_progress.assert_any_call(dataset, other_user)
@@ -0,0 +1,133 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from uuid import uuid4
+
+import pytest
+from argilla_server.api.schemas.v1.fields import FieldCreate
+from argilla_server.contexts import datasets, datasets_schemas
+from argilla_server.errors.future import NotFoundError
+from argilla_server.jobs.queues import REDIS_CONNECTION
+from argilla_server.settings import settings
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import (
+    DatasetFactory,
+    IntegerMetadataPropertyFactory,
+    TextFieldFactory,
+    TextQuestionFactory,
+    VectorSettingsFactory,
+)
+
+
+@pytest.mark.asyncio
+class TestGetDatasetWithSchema:
+    async def test_get_dataset_with_schema(self, db: AsyncSession, mocker):
+        dataset = await DatasetFactory.create()
+        field = await TextFieldFactory.create(dataset=dataset)
+        question = await TextQuestionFactory.create(dataset=dataset)
+        metadata_property = await IntegerMetadataPropertyFactory.create(dataset=dataset)
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset)
+
+        get_from_db_spy = mocker.spy(datasets_schemas, "_get_dataset_with_schema_from_db")
+
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+        db.expunge_all()
+
+        cached_dataset = await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+
+        assert get_from_db_spy.call_count == 1
+        assert cached_dataset.id == dataset.id
+        assert [field.id for field in cached_dataset.fields] == [field.id]
+        assert cached_dataset.field_by_name(field.name).settings == field.settings
+        assert cached_dataset.question_by_id(question.id).dataset == cached_dataset
+        assert cached_dataset.metadata_property_by_name(metadata_property.name).id == metadata_property.id
+        assert cached_dataset.vector_settings_by_name(vector_settings.name).dimensions == vector_settings.dimensions
+
+    async def test_get_dataset_with_schema_after_schema_change(self, db: AsyncSession):
+        dataset = await DatasetFactory.create()
+        await TextFieldFactory.create(name="text", dataset=dataset)
+
+        assert [field.name for field in (await datasets_schemas.get_dataset_with_schema(db, dataset.id)).fields] == [
+            "text"
+        ]
+
+        await datasets.create_field(db, dataset, FieldCreate(name="other", title="Other", settings={"type": "text"}))
+        db.expunge_all()
+
+        dataset = await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+
+        assert [field.name for field in dataset.fields] == ["text", "other"]
+
+    async def test_get_dataset_with_schema_after_schema_change_in_other_process(self, db: AsyncSession, mocker):
+        get_from_db_spy = mocker.spy(datasets_schemas, "_get_dataset_with_schema_from_db")
+
+        dataset = await DatasetFactory.create()
+
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+
+        assert get_from_db_spy.call_count == 1
+
+        # NOTE: Other server processes only bump the version shared through Redis
+        REDIS_CONNECTION.incr(datasets_schemas._dataset_schema_version_redis_key(dataset.id))
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+
+        assert get_from_db_spy.call_count == 2
+
+    async def test_get_dataset_with_schema_with_cache_disabled(self, db: AsyncSession, mocker):
+        mocker.patch.object(settings, "datasets_schema_cache_size", 0)
+        get_from_db_spy = mocker.spy(datasets_schemas, "_get_dataset_with_schema_from_db")
+
+        dataset = await DatasetFactory.create()
+
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+
+        assert get_from_db_spy.call_count == 2
+
+    async def test_get_dataset_with_schema_after_cache_ttl(self, db: AsyncSession, mocker):
+        mocker.patch.object(settings, "datasets_schema_cache_ttl", 60)
+        monotonic_mock = mocker.patch.object(datasets_schemas.time, "monotonic", return_value=1000)
+        get_from_db_spy = mocker.spy(datasets_schemas, "_get_dataset_with_schema_from_db")
+
+        dataset = await DatasetFactory.create()
+
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+        monotonic_mock.return_value = 1059
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+
+        assert get_from_db_spy.call_count == 1
+
+        monotonic_mock.return_value = 1060
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+
+        assert get_from_db_spy.call_count == 2
+
+    async def test_get_dataset_with_schema_with_cache_ttl_disabled(self, db: AsyncSession, mocker):
+        mocker.patch.object(settings, "datasets_schema_cache_ttl", 0)
+        monotonic_mock = mocker.patch.object(datasets_schemas.time, "monotonic", return_value=1000)
+        get_from_db_spy = mocker.spy(datasets_schemas, "_get_dataset_with_schema_from_db")
+
+        dataset = await DatasetFactory.create()
+
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+        monotonic_mock.return_value = 1000000
+        await datasets_schemas.get_dataset_with_schema(db, dataset.id)
+
+        assert get_from_db_spy.call_count == 1
+
+    async def test_get_dataset_with_schema_with_non_existent_dataset(self, db: AsyncSession):
+        with pytest.raises(NotFoundError):
+            await datasets_schemas.get_dataset_with_schema(db, uuid4())
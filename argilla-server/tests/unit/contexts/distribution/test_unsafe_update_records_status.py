@@ -0,0 +1,57 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.contexts import distribution
+from argilla_server.enums import DatasetDistributionStrategy, RecordStatus, ResponseStatus
+from argilla_server.models import Record
+
+from tests.factories import DatasetFactory, RecordFactory, ResponseFactory
+
+
+@pytest.mark.asyncio
+class TestUnsafeUpdateRecordsStatus:
+    async def test_unsafe_update_records_status(self, db: AsyncSession):
+        dataset = await DatasetFactory.create(
+            distribution={"strategy": DatasetDistributionStrategy.overlap, "min_submitted": 2}
+        )
+
+        record_completed = await RecordFactory.create(dataset=dataset)
+        await ResponseFactory.create_batch(2, record=record_completed, status=ResponseStatus.submitted)
+
+        record_pending = await RecordFactory.create(dataset=dataset, status=RecordStatus.completed)
+        await ResponseFactory.create(record=record_pending, status=ResponseStatus.discarded)
+
+        record_without_responses = await RecordFactory.create(dataset=dataset)
+
+        records = [record_completed, record_pending, record_without_responses]
+
+        await distribution.unsafe_update_records_status(db, records)
+
+        assert [record.status for record in records] == [
+            RecordStatus.completed,
+            RecordStatus.pending,
+            RecordStatus.pending,
+        ]
+        assert not any(db.is_modified(record) for record in records)
+
+        statuses = (await db.execute(select(Record.id, Record.status).where(Record.dataset_id == dataset.id))).all()
+        assert dict(statuses) == {
+            record_completed.id: RecordStatus.completed,
+            record_pending.id: RecordStatus.pending,
+            record_without_responses.id: RecordStatus.pending,
+        }
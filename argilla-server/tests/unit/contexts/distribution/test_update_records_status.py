@@ -0,0 +1,95 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.contexts import distribution
+from argilla_server.enums import DatasetDistributionStrategy, RecordStatus, ResponseStatus
+from argilla_server.jobs.queues import HIGH_QUEUE
+from argilla_server.search_engine import SearchEngine
+from argilla_server.webhooks.v1.enums import RecordEvent
+
+from tests.database import TestSession
+from tests.factories import DatasetFactory, RecordFactory, ResponseFactory, WebhookFactory
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.asyncio
+class TestUpdateRecordsStatus:
+    @pytest.fixture(autouse=True)
+    def mock_get_async_db(self, mocker: "MockerFixture") -> None:
+        async def override_get_async_db(isolation_level=None):
+            yield TestSession()
+
+        mocker.patch.object(distribution, "_get_async_db", override_get_async_db)
+
+    async def test_update_records_status(self, db: AsyncSession, mock_search_engine: SearchEngine):
+        dataset = await DatasetFactory.create(
+            distribution={"strategy": DatasetDistributionStrategy.overlap, "min_submitted": 2}
+        )
+
+        record_completed = await RecordFactory.create(dataset=dataset)
+        await ResponseFactory.create_batch(2, record=record_completed, status=ResponseStatus.submitted)
+
+        record_pending = await RecordFactory.create(dataset=dataset, status=RecordStatus.completed)
+        await ResponseFactory.create(record=record_pending, status=ResponseStatus.submitted)
+        await ResponseFactory.create(record=record_pending, status=ResponseStatus.draft)
+
+        record_unchanged = await RecordFactory.create(dataset=dataset)
+
+        records = await distribution.update_records_status(
+            mock_search_engine, dataset.id, [record_completed.id, record_pending.id, record_unchanged.id]
+        )
+
+        assert {record.id: record.status for record in records} == {
+            record_completed.id: RecordStatus.completed,
+            record_pending.id: RecordStatus.pending,
+        }
+
+        mock_search_engine.partial_records_update.assert_awaited_once_with(
+            dataset,
+            {
+                record_completed.id: {"status": RecordStatus.completed},
+                record_pending.id: {"status": RecordStatus.pending},
+            },
+        )
+
+    async def test_update_records_status_without_changes(self, db: AsyncSession, mock_search_engine: SearchEngine):
+        dataset = await DatasetFactory.create()
+        record = await RecordFactory.create(dataset=dataset)
+
+        records = await distribution.update_records_status(mock_search_engine, dataset.id, [record.id])
+
+        assert records == []
+        mock_search_engine.partial_records_update.assert_not_called()
+
+    async def test_update_records_status_notifies_record_events(
+        self, db: AsyncSession, mock_search_engine: SearchEngine
+    ):
+        await WebhookFactory.create(events=[RecordEvent.updated, RecordEvent.completed])
+
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(3, dataset=dataset)
+        for record in records:
+            await ResponseFactory.create(record=record, status=ResponseStatus.submitted)
+
+        await distribution.update_records_status(mock_search_engine, dataset.id, [record.id for record in records])
+
+        assert HIGH_QUEUE.count == 6
+        assert [job.args[1] for job in HIGH_QUEUE.jobs] == [RecordEvent.updated] * 3 + [RecordEvent.completed] * 3
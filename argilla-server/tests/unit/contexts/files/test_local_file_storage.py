@@ -0,0 +1,116 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import hashlib
+import io
+
+import pytest
+from argilla_server.contexts import files
+from argilla_server.contexts.files import LocalFileStorage
+from minio import S3Error
+
+
+class TestLocalFileStorage:
+    def test_put_object_from_file(self, tmp_path):
+        storage = LocalFileStorage(tmp_path)
+        content = b"%PDF" * (files.OBJECT_CHUNK_SIZE // 2)
+
+        result = storage.put_object("workspace", "pdf/document", io.BytesIO(content), content_type="application/pdf")
+
+        assert result.etag == hashlib.md5(content).hexdigest()
+        assert (tmp_path / "workspace" / "pdf" / "document").read_bytes() == content
+
+    def test_get_object_is_streamed_in_chunks(self, tmp_path):
+        storage = LocalFileStorage(tmp_path)
+        content = b"0123456789" * 10
+        storage.put_object("workspace", "object", content)
+
+        response = storage.get_object("workspace", "object")
+        chunks = list(files.iter_object(response, chunk_size=30))
+
+        assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+        assert b"".join(chunks) == content
+        assert response.closed
+
+    def test_get_object_with_version_id(self, tmp_path):
+        storage = LocalFileStorage(tmp_path)
+        first_version = storage.put_object("workspace", "object", b"first")
+        storage.put_object("workspace", "object", b"second")
+
+        response = storage.get_object("workspace", "object", version_id=first_version.version_id)
+
+        assert b"".join(files.iter_object(response)) == b"first"
+
+    def test_get_object_with_non_existent_object(self, tmp_path):
+        storage = LocalFileStorage(tmp_path)
+
+        with pytest.raises(S3Error):
+            storage.get_object("workspace", "object")
+
+    def test_list_objects_with_prefix(self, tmp_path):
+        storage = LocalFileStorage(tmp_path)
+        for object_name in ["pdf/a", "pdf/b", "pdf/c/d", "pdfs/e", "schemas/f"]:
+            storage.put_object("workspace", object_name, object_name.encode())
+
+        assert [obj.object_name for obj in storage.list_objects("workspace", prefix="pdf/", recursive=True)] == [
+            "pdf/a",
+            "pdf/b",
+            "pdf/c/d",
+        ]
+        assert [obj.object_name for obj in storage.list_objects("workspace", prefix="pdf/")] == ["pdf/a", "pdf/b"]
+        assert [
+            obj.object_name
+            for obj in storage.list_objects("workspace", prefix="pdf", recursive=True, start_after="pdf/b")
+        ] == ["pdf/c/d", "pdfs/e"]
+
+    def test_list_objects_with_versions(self, tmp_path):
+        storage = LocalFileStorage(tmp_path)
+        first_version = storage.put_object("workspace", "object", b"first")
+        second_version = storage.put_object("workspace", "object", b"second")
+
+        [latest] = storage.list_objects("workspace", prefix="object")
+        assert latest.etag == second_version.etag
+        assert latest.size == len(b"second")
+        assert latest.version_id is None
+
+        versions = list(storage.list_objects("workspace", prefix="object", include_version=True))
+        assert [(obj.version_id, obj.is_latest) for obj in versions] == [
+            (first_version.version_id, "false"),
+            (second_version.version_id, "true"),
+        ]
+
+        storage.remove_object("workspace", "object", version_id=first_version.version_id)
+        storage.remove_object("workspace", "object")
+
+        assert list(storage.list_objects("workspace", prefix="object")) == []
+        assert [obj.version_id for obj in storage.list_objects("workspace", include_version=True)] == [
+            second_version.version_id
+        ]
+
+    def test_list_objects_builds_index_of_existing_buckets(self, tmp_path):
+        storage = LocalFileStorage(tmp_path)
+        result = storage.put_object("workspace", "pdf/document", b"%PDF", content_type="application/pdf")
+        (tmp_path / "workspace" / files.OBJECTS_INDEX_FILE_NAME).unlink()
+
+        [obj] = storage.list_objects("workspace", prefix="pdf/", include_version=True)
+
+        assert obj.object_name == "pdf/document"
+        assert obj.version_id == result.version_id
+        assert obj.etag == result.etag
+        assert obj.content_type == "application/pdf"
+
+    def test_list_objects_with_non_existent_bucket(self, tmp_path):
+        storage = LocalFileStorage(tmp_path)
+
+        with pytest.raises(S3Error):
+            list(storage.list_objects("workspace"))
@@ -1392,5 +1392,5 @@ class TestHubDatasetExporter:
         exported_dataset = load_dataset(path=hf_dataset_name, name="default", split="train")
 
         assert exported_dataset[0]["vector.vector-a"] == [1.0, 2.0, 3.0]
-        assert exported_dataset[0]["vector.vector-b"] == [3.14, 3.15]
+        assert exported_dataset[0]["vector.vector-b"] == pytest.approx([3.14, 3.15])
         assert exported_dataset[0]["vector.vector-c"] == None
@@ -0,0 +1,53 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from argilla_server.jobs import workers
+from argilla_server.jobs.queues import REDIS_CONNECTION
+from argilla_server.jobs.workers import InProcessJob, InProcessWorker
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+async def _get_running_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def _sum(a: int, b: int) -> int:
+    return a + b
+
+
+class TestInProcessJob:
+    def test_in_process_job_closes_event_loop_and_releases_database_connections(self, mocker: "MockerFixture"):
+        dispose_mock = mocker.patch.object(workers, "async_engine", mocker.AsyncMock()).dispose
+
+        first_loop = InProcessJob.create(_get_running_loop, connection=REDIS_CONNECTION)._execute()
+        second_loop = InProcessJob.create(_get_running_loop, connection=REDIS_CONNECTION)._execute()
+
+        assert first_loop is not second_loop
+        assert first_loop.is_closed()
+        assert second_loop.is_closed()
+        assert dispose_mock.await_count == 2
+
+    def test_in_process_job_with_sync_function(self, mocker: "MockerFixture"):
+        dispose_mock = mocker.patch.object(workers, "async_engine", mocker.AsyncMock()).dispose
+
+        assert InProcessJob.create(_sum, args=(1, 2), connection=REDIS_CONNECTION)._execute() == 3
+        dispose_mock.assert_not_called()
+
+    def test_in_process_worker_job_class(self):
+        assert InProcessWorker.job_class is InProcessJob
@@ -18,8 +18,9 @@ import pytest
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.contexts import webhooks as webhooks_context
 from argilla_server.jobs.queues import HIGH_QUEUE
-from argilla_server.jobs.webhook_jobs import enqueue_notify_events
+from argilla_server.jobs.webhook_jobs import enqueue_notify_events, enqueue_notify_events_many
 from argilla_server.webhooks.v1.enums import ResponseEvent
 from argilla_server.webhooks.v1.responses import build_response_event
 
@@ -56,3 +57,55 @@ class TestEnqueueNotifyEvents:
         assert HIGH_QUEUE.jobs[1].args[1] == ResponseEvent.created
         assert HIGH_QUEUE.jobs[1].args[2] == event.timestamp
         assert HIGH_QUEUE.jobs[1].args[3] == jsonable_data
+
+    async def test_enqueue_notify_events_many(self, db: AsyncSession):
+        responses = await ResponseFactory.create_batch(2)
+
+        webhooks = await WebhookFactory.create_batch(2, events=[ResponseEvent.created])
+        await WebhookFactory.create(events=[ResponseEvent.created], enabled=False)
+        await WebhookFactory.create(events=[ResponseEvent.deleted])
+
+        events = [await build_response_event(db, ResponseEvent.created, response) for response in responses]
+        jsonable_data_items = [jsonable_encoder(event.data) for event in events]
+
+        await enqueue_notify_events_many(
+            db=db,
+            event=ResponseEvent.created,
+            timestamp=events[0].timestamp,
+            data_items=jsonable_data_items,
+        )
+
+        assert HIGH_QUEUE.count == 4
+        assert [(job.args[0], job.args[3]) for job in HIGH_QUEUE.jobs] == [
+            (webhooks[0].id, jsonable_data_items[0]),
+            (webhooks[1].id, jsonable_data_items[0]),
+            (webhooks[0].id, jsonable_data_items[1]),
+            (webhooks[1].id, jsonable_data_items[1]),
+        ]
+        assert all(job.retries_left == 3 for job in HIGH_QUEUE.jobs)
+
+    async def test_enqueue_notify_events_many_without_enabled_webhooks(self, db: AsyncSession):
+        await WebhookFactory.create(events=[ResponseEvent.created], enabled=False)
+
+        jobs = await enqueue_notify_events_many(
+            db=db,
+            event=ResponseEvent.created,
+            timestamp=datetime.utcnow(),
+            data_items=[{"id": "1"}],
+        )
+
+        assert jobs == []
+        assert HIGH_QUEUE.count == 0
+
+    async def test_enqueue_notify_events_reuses_enabled_webhooks_until_a_webhook_changes(self, db: AsyncSession):
+        webhook = await WebhookFactory.create(events=[ResponseEvent.created])
+
+        await enqueue_notify_events(db, ResponseEvent.created, datetime.utcnow(), {"id": "1"})
+        assert await webhooks_context.list_enabled_webhooks_cached(db) == [webhook]
+
+        other_webhook = await WebhookFactory.create(events=[ResponseEvent.created])
+
+        jobs = await enqueue_notify_events(db, ResponseEvent.created, datetime.utcnow(), {"id": "2"})
+
+        assert [job.args[0] for job in jobs] == [webhook.id, other_webhook.id]
+        assert HIGH_QUEUE.count == 3
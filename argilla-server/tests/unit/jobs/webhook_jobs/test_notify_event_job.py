@@ -0,0 +1,95 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from httpx import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.contexts import webhooks
+from argilla_server.jobs import webhook_jobs
+from argilla_server.jobs.queues import HIGH_QUEUE, REDIS_CONNECTION
+from argilla_server.jobs.webhook_jobs import notify_event_job
+from argilla_server.models import Webhook
+from argilla_server.settings import settings
+from argilla_server.webhooks.v1.commons import get_http_client
+from argilla_server.webhooks.v1.enums import ResponseEvent
+
+from tests.database import TestSession
+from tests.factories import WebhookFactory
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.asyncio
+class TestNotifyEventJob:
+    @pytest.fixture(autouse=True)
+    def use_test_session(self, mocker: "MockerFixture"):
+        @asynccontextmanager
+        async def test_session():
+            # NOTE: Closing the test session would roll back the data created by the test
+            yield TestSession()
+
+        mocker.patch.object(webhook_jobs, "AsyncSessionLocal", test_session)
+        webhooks.expire_webhooks_cache()
+
+    async def test_notify_event_job(self, respx_mock):
+        webhook = await WebhookFactory.create()
+        route = respx_mock.post(webhook.url).mock(return_value=Response(200))
+
+        await notify_event_job(webhook.id, ResponseEvent.created, datetime.utcnow(), {"id": "1"})
+        await notify_event_job(webhook.id, ResponseEvent.created, datetime.utcnow(), {"id": "2"})
+
+        assert route.call_count == 2
+        assert get_http_client(webhook.url) is get_http_client(f"{webhook.url}/other/path")
+        assert int(REDIS_CONNECTION.get(f"webhooks:{webhook.id}:in_flight_deliveries")) == 0
+
+    async def test_notify_event_job_reuses_cached_webhook_until_expired(
+        self, db: AsyncSession, mocker: "MockerFixture", respx_mock
+    ):
+        webhook = await WebhookFactory.create()
+        respx_mock.post(webhook.url).mock(return_value=Response(200))
+        get_or_raise_spy = mocker.spy(Webhook, "get_or_raise")
+
+        await notify_event_job(webhook.id, ResponseEvent.created, datetime.utcnow(), {"id": "1"})
+        await notify_event_job(webhook.id, ResponseEvent.created, datetime.utcnow(), {"id": "2"})
+
+        assert get_or_raise_spy.call_count == 1
+
+        await webhooks.update_webhook(db, webhook, {"description": "updated"})
+        await notify_event_job(webhook.id, ResponseEvent.created, datetime.utcnow(), {"id": "3"})
+
+        assert get_or_raise_spy.call_count == 2
+
+    async def test_notify_event_job_postpones_delivery_when_webhook_is_busy(self, respx_mock):
+        webhook = await WebhookFactory.create()
+        route = respx_mock.post(webhook.url).mock(return_value=Response(200))
+
+        in_flight_key = f"webhooks:{webhook.id}:in_flight_deliveries"
+        REDIS_CONNECTION.set(in_flight_key, settings.webhooks_max_concurrent_deliveries)
+
+        try:
+            await notify_event_job(webhook.id, ResponseEvent.created, datetime.utcnow(), {"id": "1"})
+
+            assert route.call_count == 0
+            assert int(REDIS_CONNECTION.get(in_flight_key)) == settings.webhooks_max_concurrent_deliveries
+            assert HIGH_QUEUE.scheduled_job_registry.count == 1
+        finally:
+            REDIS_CONNECTION.delete(in_flight_key)
+            for job_id in HIGH_QUEUE.scheduled_job_registry.get_job_ids():
+                HIGH_QUEUE.scheduled_job_registry.remove(job_id, delete_job=True)
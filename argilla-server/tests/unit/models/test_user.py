@@ -0,0 +1,85 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+from argilla_server.contexts import accounts
+from argilla_server.models import memberships
+from argilla_server.settings import settings
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import UserFactory, WorkspaceFactory, WorkspaceUserFactory
+
+
+@pytest.mark.asyncio
+class TestUser:
+    async def test_is_member(self):
+        workspace = await WorkspaceFactory.create()
+        user = await UserFactory.create(workspaces=[workspace])
+        other_user = await UserFactory.create()
+
+        assert await user.is_member(workspace.id)
+        assert not await other_user.is_member(workspace.id)
+
+    async def test_is_member_is_cached(self, db: AsyncSession, mocker):
+        workspace = await WorkspaceFactory.create()
+        user = await UserFactory.create(workspaces=[workspace])
+
+        await user.is_member(workspace.id)
+        scalar_spy = mocker.spy(db, "scalar")
+
+        assert await user.is_member(workspace.id)
+        scalar_spy.assert_not_called()
+
+    async def test_is_member_with_cache_disabled(self, db: AsyncSession, mocker):
+        mocker.patch.object(settings, "workspace_membership_cache_ttl", 0)
+        workspace = await WorkspaceFactory.create()
+        user = await UserFactory.create()
+
+        assert not await user.is_member(workspace.id)
+
+        await WorkspaceUserFactory.create(workspace_id=workspace.id, user_id=user.id)
+
+        assert await user.is_member(workspace.id)
+
+    async def test_is_member_after_create_workspace_user(self, db: AsyncSession):
+        workspace = await WorkspaceFactory.create()
+        user = await UserFactory.create()
+
+        assert not await user.is_member(workspace.id)
+
+        await accounts.create_workspace_user(db, {"workspace_id": workspace.id, "user_id": user.id})
+
+        assert await user.is_member(workspace.id)
+
+    async def test_is_member_after_delete_workspace_user(self, db: AsyncSession):
+        workspace = await WorkspaceFactory.create()
+        user = await UserFactory.create()
+        workspace_user = await WorkspaceUserFactory.create(workspace_id=workspace.id, user_id=user.id)
+
+        assert await user.is_member(workspace.id)
+
+        await accounts.delete_workspace_user(db, workspace_user)
+
+        assert not await user.is_member(workspace.id)
+
+    async def test_is_member_of_workspace_name(self):
+        workspace = await WorkspaceFactory.create()
+        user = await UserFactory.create(workspaces=[workspace])
+        other_user = await UserFactory.create()
+
+        assert await user.is_member_of_workspace_name(workspace.name)
+        assert not await other_user.is_member_of_workspace_name(workspace.name)
+        assert not await user.is_member_of_workspace_name("missing")
+
+        assert memberships.get_cached_workspace_membership(user.id, workspace.id) is True
+        assert memberships.get_cached_workspace_membership(other_user.id, workspace.id) is False
@@ -0,0 +1,65 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla_server.enums import VectorsStorageDtype
+from argilla_server.models import Vector
+from argilla_server.models.vectors import pack_vector_value, unpack_vector_value, vector_value_buffer
+from argilla_server.settings import settings
+from sqlalchemy import LargeBinary, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import VectorFactory, VectorSettingsFactory
+
+
+class TestPackVectorValue:
+    def test_pack_vector_value(self):
+        value = pack_vector_value([1.5, -2.0, 0.25])
+
+        assert value == b"f" + b"\x00\x00\xc0?" + b"\x00\x00\x00\xc0" + b"\x00\x00\x80>"
+        assert unpack_vector_value(value) == [1.5, -2.0, 0.25]
+        assert bytes(vector_value_buffer(value)) == value[1:]
+
+    def test_pack_vector_value_with_float16(self):
+        value = pack_vector_value([1.5, -2.0, 0.1], VectorsStorageDtype.float16)
+
+        assert len(value) == 1 + 3 * 2
+        assert unpack_vector_value(value) == pytest.approx([1.5, -2.0, 0.1], abs=1e-3)
+
+    def test_unpack_vector_value_with_unknown_format(self):
+        with pytest.raises(ValueError, match="Unknown packed vector value format b'x'"):
+            unpack_vector_value(b"x\x00\x00\x00\x00")
+
+
+@pytest.mark.asyncio
+class TestVector:
+    async def test_value_is_stored_packed(self, db: AsyncSession):
+        vector = await VectorFactory.create(
+            vector_settings=await VectorSettingsFactory.create(dimensions=2), value=[0.5, 2.0]
+        )
+
+        stored_value = (await db.execute(select(type_coerce(Vector.value, LargeBinary)))).scalar_one()
+        db.expunge_all()
+
+        assert stored_value == pack_vector_value([0.5, 2.0])
+        assert (await db.get(Vector, vector.id)).value == [0.5, 2.0]
+
+    async def test_value_is_stored_packed_with_float16(self, db: AsyncSession, mocker):
+        mocker.patch.object(settings, "vectors_storage_dtype", VectorsStorageDtype.float16)
+
+        await VectorFactory.create(vector_settings=await VectorSettingsFactory.create(dimensions=2), value=[0.5, 2.0])
+
+        stored_value = (await db.execute(select(type_coerce(Vector.value, LargeBinary)))).scalar_one()
+
+        assert stored_value == pack_vector_value([0.5, 2.0], VectorsStorageDtype.float16)
@@ -16,7 +16,7 @@ from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
-from argilla_server.search_engine import ElasticSearchEngine, OpenSearchEngine
+from argilla_server.search_engine import ElasticSearchEngine, EmbeddedSearchEngine, OpenSearchEngine
 from argilla_server.settings import settings
 
 
@@ -26,6 +26,8 @@ def search_engine(request):
         engine = "elasticsearch_engine"
     elif settings.search_engine == "opensearch":
         engine = "opensearch_engine"
+    elif settings.search_engine == "embedded":
+        engine = "embedded_engine"
     else:
         raise Exception(f"Unknown search engine: {settings.search_engine}")
 
@@ -46,3 +48,11 @@ async def opensearch_engine(elasticsearch_config: dict) -> AsyncGenerator[OpenSe
     yield engine
 
     await engine.client.close()
+
+
+@pytest_asyncio.fixture()
+async def embedded_engine(tmp_path) -> AsyncGenerator[EmbeddedSearchEngine, None]:
+    engine = EmbeddedSearchEngine(path=str(tmp_path / "search.db"))
+    yield engine
+
+    await engine.close()
@@ -0,0 +1,59 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import TYPE_CHECKING
+
+import pytest
+from argilla_server.constants import SEARCH_ENGINE_ELASTICSEARCH
+from argilla_server.search_engine import ElasticSearchEngine, SearchEngine
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.asyncio
+class TestSearchEngine:
+    async def test_get_by_name_creates_and_closes_a_new_instance(self, mocker: "MockerFixture"):
+        engine = mocker.AsyncMock(SearchEngine)
+        mocker.patch.object(ElasticSearchEngine, "new_instance", return_value=engine)
+
+        async with SearchEngine.get_by_name(SEARCH_ENGINE_ELASTICSEARCH) as search_engine:
+            assert search_engine is engine
+
+        engine.close.assert_awaited_once()
+
+    async def test_get_by_name_reuses_the_shared_instance(self, mocker: "MockerFixture"):
+        engine = mocker.AsyncMock(SearchEngine)
+        new_instance_mock = mocker.patch.object(ElasticSearchEngine, "new_instance", return_value=engine)
+
+        try:
+            shared_engine = await SearchEngine.open_shared_instance(SEARCH_ENGINE_ELASTICSEARCH)
+            assert await SearchEngine.open_shared_instance(SEARCH_ENGINE_ELASTICSEARCH) is shared_engine
+
+            for _ in range(3):
+                async with SearchEngine.get_by_name(SEARCH_ENGINE_ELASTICSEARCH) as search_engine:
+                    assert search_engine is shared_engine
+
+            new_instance_mock.assert_awaited_once()
+            engine.close.assert_not_awaited()
+        finally:
+            await SearchEngine.close_shared_instances()
+
+        engine.close.assert_awaited_once()
+        assert SearchEngine.get_shared_instance(SEARCH_ENGINE_ELASTICSEARCH) is None
+
+    async def test_get_by_name_with_unknown_engine(self):
+        with pytest.raises(ValueError, match="No engine class registered for 'unknown'"):
+            async with SearchEngine.get_by_name("unknown"):
+                pass
@@ -42,6 +42,7 @@ from argilla_server.search_engine import (
     RangeFilter,
     Order,
     RecordFilterScope,
+    RecordDelta,
     AndFilter,
 )
 from argilla_server.search_engine.commons import (
@@ -815,6 +816,24 @@ class TestBaseElasticAndOpenSearchEngine:
         result_scores = set([item.score for item in result.items])
         assert result_scores == {1.0}
 
+    async def test_search_with_source(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        test_banking_sentiment_dataset: Dataset,
+    ):
+        result = await search_engine.search(test_banking_sentiment_dataset, with_source=True)
+
+        records_by_id = {record.id: record for record in test_banking_sentiment_dataset.records}
+        for item in result.items:
+            record = records_by_id[item.record_id]
+
+            assert item.record["external_id"] == record.external_id
+            assert item.record["status"] == record.status
+            assert item.record["fields"] == record.fields
+            assert item.record["inserted_at"] == record.inserted_at
+            assert "vectors" not in item.record
+
     async def test_search_with_response_status_filter_does_not_affect_the_result_scores(
         self,
         search_engine: BaseElasticAndOpenSearchEngine,
@@ -984,6 +1003,59 @@ class TestBaseElasticAndOpenSearchEngine:
             for record in records
         ]
 
+    async def test_index_records_with_bulk_load(
+        self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch
+    ):
+        text_field = await TextFieldFactory.create(name="text")
+        dataset = await DatasetFactory.create(fields=[text_field], questions=[])
+        records = await RecordFactory.create_batch(size=10, dataset=dataset, fields={"text": "value"}, responses=[])
+
+        await refresh_dataset(dataset)
+        await refresh_records(records)
+
+        await search_engine.create_index(dataset)
+
+        index_name = es_index_name_for_dataset(dataset)
+
+        async with search_engine.bulk_load(dataset):
+            index = opensearch.indices.get_settings(index=index_name, flat_settings=True)[index_name]
+            assert index["settings"]["index.refresh_interval"] == "-1"
+
+            await search_engine.index_records(dataset, records)
+
+        index = opensearch.indices.get_settings(index=index_name, flat_settings=True)[index_name]
+        assert "index.refresh_interval" not in index["settings"]
+
+        assert opensearch.count(index=index_name)["count"] == len(records)
+
+    async def test_index_records_with_shadow_index(
+        self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch
+    ):
+        text_field = await TextFieldFactory.create(name="text")
+        dataset = await DatasetFactory.create(fields=[text_field], questions=[])
+        records = await RecordFactory.create_batch(size=10, dataset=dataset, fields={"text": "value"}, responses=[])
+
+        await refresh_dataset(dataset)
+        await refresh_records(records)
+
+        await search_engine.create_index(dataset)
+        await search_engine.index_records(dataset, records[:5])
+
+        index_name = es_index_name_for_dataset(dataset)
+
+        async with search_engine.shadow_index(dataset) as shadow_index_name:
+            await search_engine.index_records(dataset, records, index_name=shadow_index_name)
+
+            assert opensearch.count(index=index_name)["count"] == 5
+
+        assert list(opensearch.indices.get_alias(name=index_name)) == [shadow_index_name]
+        assert opensearch.count(index=index_name)["count"] == len(records)
+
+        await search_engine.delete_index(dataset)
+
+        assert not opensearch.indices.exists(index=index_name)
+        assert not opensearch.indices.exists(index=shadow_index_name)
+
     async def test_index_records_with_none_field_values(
         self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch
     ):
@@ -1247,6 +1319,32 @@ class TestBaseElasticAndOpenSearchEngine:
         ]
         assert len(records_to_keep) == 5
 
+    async def test_delete_records_not_in_shadow_index(
+        self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch
+    ):
+        text_field = await TextFieldFactory.create(name="text")
+        dataset = await DatasetFactory.create(fields=[text_field], questions=[])
+        records = await RecordFactory.create_batch(size=10, dataset=dataset, fields={"text": "value"}, responses=[])
+
+        await refresh_dataset(dataset)
+        await refresh_records(records)
+
+        await search_engine.create_index(dataset)
+
+        records_to_keep = records[:5]
+        async with search_engine.shadow_index(dataset) as shadow_index_name:
+            await search_engine.index_records(dataset, records, index_name=shadow_index_name)
+
+            deleted_records_count = await search_engine.delete_records_not_in(
+                dataset, {record.id for record in records_to_keep}, index_name=shadow_index_name
+            )
+
+        assert deleted_records_count == 5
+
+        index_name = es_index_name_for_dataset(dataset)
+        es_ids = [hit["_id"] for hit in opensearch.search(index=index_name, body={"size": 20})["hits"]["hits"]]
+        assert sorted(es_ids) == sorted(str(record.id) for record in records_to_keep)
+
     async def test_update_record_response(
         self,
         search_engine: BaseElasticAndOpenSearchEngine,
@@ -1283,6 +1381,56 @@ class TestBaseElasticAndOpenSearchEngine:
             "type": "nested",
         }
 
+    async def test_update_records(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        test_banking_sentiment_dataset: Dataset,
+    ):
+        records = test_banking_sentiment_dataset.records
+        question = test_banking_sentiment_dataset.questions[0]
+
+        deleted_response = await ResponseFactory.create(record=records[1], values={question.name: {"value": "old"}})
+        await (await deleted_response.awaitable_attrs.record).awaitable_attrs.dataset
+        await search_engine.update_record_response(deleted_response)
+
+        response = await ResponseFactory.create(record=records[0], values={question.name: {"value": "new"}})
+        await search_engine.update_records(
+            test_banking_sentiment_dataset,
+            [
+                RecordDelta(record_id=records[0].id, status=RecordStatus.completed, upserted_responses=[response]),
+                RecordDelta(record_id=records[1].id, deleted_responses=[deleted_response]),
+                RecordDelta(record_id=records[2].id, status=RecordStatus.completed),
+            ],
+        )
+
+        index_name = es_index_name_for_dataset(test_banking_sentiment_dataset)
+
+        first_source = opensearch.get(index=index_name, id=records[0].id)["_source"]
+        assert first_source["status"] == RecordStatus.completed
+        assert first_source["responses"] == [
+            {"id": str(response.id), "status": "submitted", "text": "new", "user_id": str(response.user_id)},
+        ]
+
+        second_source = opensearch.get(index=index_name, id=records[1].id)["_source"]
+        assert second_source["status"] == RecordStatus.pending
+        assert second_source["responses"] == []
+
+        third_source = opensearch.get(index=index_name, id=records[2].id)["_source"]
+        assert third_source["status"] == RecordStatus.completed
+
+    async def test_update_records_with_non_indexed_record(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        test_banking_sentiment_dataset: Dataset,
+    ):
+        with pytest.raises(Exception, match="1 document\\(s\\) failed to index"):
+            await search_engine.update_records(
+                test_banking_sentiment_dataset,
+                [RecordDelta(record_id=uuid.uuid4(), status=RecordStatus.completed)],
+            )
+
     @pytest.mark.parametrize("annotators_size", [20, 200, 400])
     async def test_annotators_limits(
         self,
@@ -1477,6 +1625,32 @@ class TestBaseElasticAndOpenSearchEngine:
         progress = await search_engine.get_dataset_progress(dataset)
         assert progress == {}
 
+    async def test_get_dataset_and_user_progress(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        test_banking_sentiment_dataset: Dataset,
+    ):
+        dataset = test_banking_sentiment_dataset
+        record = dataset.records[0]
+        question = dataset.questions[0]
+
+        response = await ResponseFactory.create(record=record, values={question.name: {"value": "test"}})
+        record = await response.awaitable_attrs.record
+        await record.awaitable_attrs.dataset
+        await search_engine.update_record_response(response)
+
+        progress, user_progress = await search_engine.get_dataset_and_user_progress(dataset, user=response.user)
+
+        assert progress == await search_engine.get_dataset_progress(dataset)
+        assert user_progress == {"total": 1, "submitted": 1}
+
+    async def test_get_dataset_and_user_progress_for_draft_dataset(self, search_engine: BaseElasticAndOpenSearchEngine):
+        dataset = await DatasetFactory.create(status=DatasetStatus.draft)
+        user = await UserFactory.create()
+
+        assert await search_engine.get_dataset_and_user_progress(dataset, user=user) == ({}, {})
+
     @pytest.mark.parametrize(
         ("property_name", "expected_metrics"),
         [
@@ -0,0 +1,352 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import List
+
+import pytest
+import pytest_asyncio
+from argilla_server.enums import DatasetStatus, RecordStatus, ResponseStatus, SimilarityOrder, SortOrder
+from argilla_server.models import Dataset, Record, Suggestion
+from argilla_server.search_engine import (
+    AndFilter,
+    EmbeddedSearchEngine,
+    IntegerMetadataMetrics,
+    MetadataFilterScope,
+    Order,
+    RangeFilter,
+    RecordDelta,
+    ResponseFilterScope,
+    SuggestionFilterScope,
+    TermsFilter,
+    TermsMetrics,
+    TextQuery,
+)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from tests.factories import (
+    DatasetFactory,
+    IntegerMetadataPropertyFactory,
+    LabelSelectionQuestionFactory,
+    RecordFactory,
+    ResponseFactory,
+    SuggestionFactory,
+    TermsMetadataPropertyFactory,
+    TextFieldFactory,
+    UserFactory,
+    VectorFactory,
+    VectorSettingsFactory,
+)
+
+
+async def _index_dataset_records(db: AsyncSession, engine: EmbeddedSearchEngine, dataset: Dataset) -> List[Record]:
+    await dataset.awaitable_attrs.fields
+    await dataset.awaitable_attrs.metadata_properties
+
+    result = await db.execute(
+        select(Record)
+        .where(Record.dataset_id == dataset.id)
+        .order_by(Record.inserted_at.asc())
+        .options(
+            selectinload(Record.responses),
+            selectinload(Record.suggestions).selectinload(Suggestion.question),
+            selectinload(Record.vectors),
+        )
+        .execution_options(populate_existing=True)
+    )
+    records = result.scalars().all()
+
+    await engine.create_index(dataset)
+    await engine.index_records(dataset, records)
+
+    return records
+
+
+@pytest_asyncio.fixture(scope="function")
+async def dataset() -> Dataset:
+    dataset = await DatasetFactory.create(status=DatasetStatus.ready, allow_extra_metadata=False)
+    await TextFieldFactory.create(name="text", dataset=dataset)
+    await TextFieldFactory.create(name="title", dataset=dataset)
+    await TermsMetadataPropertyFactory.create(name="label", dataset=dataset)
+    await IntegerMetadataPropertyFactory.create(name="length", dataset=dataset)
+
+    for text, title, label, length in [
+        ("The cat sat on the mat", "Cats", "animal", 10),
+        ("A dog in the park", "Dogs", "animal", 20),
+        ("Cars on the road", "Cars", "vehicle", 30),
+    ]:
+        await RecordFactory.create(
+            dataset=dataset, fields={"text": text, "title": title}, metadata_={"label": label, "length": length}
+        )
+
+    return dataset
+
+
+@pytest.mark.asyncio
+class TestEmbeddedSearchEngine:
+    async def test_search_with_text_query(
+        self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset
+    ):
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+
+        result = await embedded_engine.search(dataset, query="the cat")
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+        result = await embedded_engine.search(dataset, query=TextQuery(q="cars", field="title"))
+        assert [item.record_id for item in result.items] == [records[2].id]
+
+        result = await embedded_engine.search(dataset, query=TextQuery(q="dog", field="title"))
+        assert result.items == []
+        assert result.total == 0
+
+    async def test_search_with_metadata_filters(
+        self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset
+    ):
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+
+        result = await embedded_engine.search(
+            dataset,
+            filter=AndFilter(
+                filters=[
+                    TermsFilter(scope=MetadataFilterScope(metadata_property="label"), values=["animal"]),
+                    RangeFilter(scope=MetadataFilterScope(metadata_property="length"), ge=15),
+                ]
+            ),
+        )
+
+        assert [item.record_id for item in result.items] == [records[1].id]
+        assert result.total == 1
+
+    async def test_search_with_response_and_suggestion_filters(
+        self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        question = await LabelSelectionQuestionFactory.create(name="sentiment", dataset=dataset)
+        user = await UserFactory.create()
+        records = await RecordFactory.create_batch(3, dataset=dataset)
+
+        await ResponseFactory.create(
+            record=records[0], user=user, status=ResponseStatus.submitted, values={"sentiment": {"value": "positive"}}
+        )
+        await ResponseFactory.create(record=records[1], status=ResponseStatus.draft)
+        await SuggestionFactory.create(record=records[2], question=question, value="negative", score=0.5)
+
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+
+        result = await embedded_engine.search(
+            dataset,
+            filter=TermsFilter(scope=ResponseFilterScope(property="status", user=user), values=["pending"]),
+        )
+        assert {item.record_id for item in result.items} == {records[1].id, records[2].id}
+
+        result = await embedded_engine.search(
+            dataset,
+            filter=TermsFilter(scope=ResponseFilterScope(property="status"), values=["draft", "submitted"]),
+        )
+        assert {item.record_id for item in result.items} == {records[0].id, records[1].id}
+
+        result = await embedded_engine.search(
+            dataset,
+            filter=TermsFilter(scope=ResponseFilterScope(question="sentiment", user=user), values=["positive"]),
+        )
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+        result = await embedded_engine.search(
+            dataset,
+            filter=RangeFilter(scope=SuggestionFilterScope(question="sentiment", property="score"), ge=0.5),
+        )
+        assert [item.record_id for item in result.items] == [records[2].id]
+
+    async def test_search_with_sort_and_search_after(
+        self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset
+    ):
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+        sort = [Order(scope=MetadataFilterScope(metadata_property="length"), order=SortOrder.desc)]
+
+        result = await embedded_engine.search(dataset, sort=sort, limit=2)
+        assert [item.record_id for item in result.items] == [records[2].id, records[1].id]
+        assert result.total == 3
+
+        result = await embedded_engine.search(dataset, sort=sort, limit=2, search_after=result.next_search_after)
+        assert [item.record_id for item in result.items] == [records[0].id]
+        assert result.total == 3
+
+    @pytest.mark.parametrize("order", [SortOrder.asc, SortOrder.desc])
+    async def test_search_with_sort_by_mixed_types_and_missing_values(
+        self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset, order: SortOrder
+    ):
+        await RecordFactory.create(
+            dataset=dataset, fields={"text": "Number", "title": "Number"}, metadata_={"label": 5}
+        )
+        await RecordFactory.create(dataset=dataset, fields={"text": "Missing", "title": "Missing"}, metadata_={})
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+        sort = [Order(scope=MetadataFilterScope(metadata_property="label"), order=order)]
+
+        record_ids = []
+        result = await embedded_engine.search(dataset, sort=sort, limit=2)
+        while result.items:
+            record_ids += [item.record_id for item in result.items]
+            result = await embedded_engine.search(dataset, sort=sort, limit=2, search_after=result.next_search_after)
+
+        # Numbers are sorted before texts and missing values are always sorted last
+        if order == SortOrder.asc:
+            assert record_ids == [records[3].id, records[0].id, records[1].id, records[2].id, records[4].id]
+        else:
+            assert record_ids == [records[2].id, records[0].id, records[1].id, records[3].id, records[4].id]
+
+    async def test_search_with_source(self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset):
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+
+        result = await embedded_engine.search(dataset, query="cat", with_source=True)
+
+        assert result.items[0].record == {
+            "external_id": records[0].external_id,
+            "status": RecordStatus.pending,
+            "fields": records[0].fields,
+            "metadata": records[0].metadata_,
+            "inserted_at": records[0].inserted_at,
+            "updated_at": records[0].updated_at,
+        }
+
+    async def test_partial_records_update_and_delete_records(
+        self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset
+    ):
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+
+        await embedded_engine.partial_records_update(dataset, {records[0].id: {"status": RecordStatus.completed}})
+        await embedded_engine.delete_records(dataset, [records[1]])
+
+        assert await embedded_engine.get_dataset_progress(dataset) == {"total": 2, "completed": 1, "pending": 1}
+
+        result = await embedded_engine.search(dataset, query="dog")
+        assert result.total == 0
+
+    async def test_delete_records_not_in(
+        self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset
+    ):
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+
+        assert await embedded_engine.delete_records_not_in(dataset, {records[0].id, records[2].id}) == 1
+
+        result = await embedded_engine.search(dataset)
+        assert {item.record_id for item in result.items} == {records[0].id, records[2].id}
+
+    async def test_update_records(self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset):
+        question = await LabelSelectionQuestionFactory.create(name="sentiment", dataset=dataset)
+        records = await dataset.awaitable_attrs.records
+        deleted_response = await ResponseFactory.create(record=records[1], status=ResponseStatus.submitted)
+        deleted_suggestion = await SuggestionFactory.create(record=records[1], question=question, value="negative")
+
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+        response = await ResponseFactory.create(record=records[0], status=ResponseStatus.submitted)
+        suggestion = await SuggestionFactory.create(record=records[0], question=question, value="positive")
+
+        await embedded_engine.update_records(
+            dataset,
+            [
+                RecordDelta(
+                    record_id=records[0].id,
+                    status=RecordStatus.completed,
+                    upserted_responses=[response],
+                    upserted_suggestions=[suggestion],
+                ),
+                RecordDelta(
+                    record_id=records[1].id,
+                    status=RecordStatus.completed,
+                    deleted_responses=[deleted_response],
+                    deleted_suggestions=[deleted_suggestion],
+                ),
+            ],
+        )
+
+        assert await embedded_engine.get_dataset_progress(dataset) == {"total": 3, "completed": 2, "pending": 1}
+
+        result = await embedded_engine.search(
+            dataset, filter=TermsFilter(scope=ResponseFilterScope(property="status"), values=["submitted"])
+        )
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+        result = await embedded_engine.search(
+            dataset,
+            filter=TermsFilter(
+                scope=SuggestionFilterScope(question="sentiment", property="value"), values=["positive", "negative"]
+            ),
+        )
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+    async def test_changes_from_other_connections_are_visible(
+        self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset
+    ):
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+        assert (await embedded_engine.search(dataset)).total == 3
+
+        other_engine = EmbeddedSearchEngine(path=embedded_engine.path)
+        try:
+            await other_engine.delete_records(dataset, records[:2])
+        finally:
+            await other_engine.close()
+
+        assert [item.record_id for item in (await embedded_engine.search(dataset)).items] == [records[2].id]
+
+    async def test_get_dataset_user_progress(
+        self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset
+    ):
+        user = await UserFactory.create()
+        records = await dataset.awaitable_attrs.records
+        await ResponseFactory.create(record=records[0], user=user, status=ResponseStatus.submitted)
+        await ResponseFactory.create(record=records[1], user=user, status=ResponseStatus.draft)
+        await ResponseFactory.create(record=records[2], status=ResponseStatus.submitted)
+
+        await _index_dataset_records(db, embedded_engine, dataset)
+
+        assert await embedded_engine.get_dataset_user_progress(dataset, user) == {
+            "total": 2,
+            "submitted": 1,
+            "draft": 1,
+        }
+
+        assert await embedded_engine.get_dataset_and_user_progress(dataset, user) == (
+            {"total": 3, "pending": 3},
+            {"total": 2, "submitted": 1, "draft": 1},
+        )
+
+    async def test_compute_metrics_for(self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset):
+        await _index_dataset_records(db, embedded_engine, dataset)
+        label, length = await dataset.awaitable_attrs.metadata_properties
+
+        assert await embedded_engine.compute_metrics_for(label) == TermsMetrics(
+            total=3,
+            values=[TermsMetrics.TermCount(term="animal", count=2), TermsMetrics.TermCount(term="vehicle", count=1)],
+        )
+        assert await embedded_engine.compute_metrics_for(length) == IntegerMetadataMetrics(min=10, max=30)
+
+    async def test_similarity_search(self, db: AsyncSession, embedded_engine: EmbeddedSearchEngine, dataset: Dataset):
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        records = await dataset.awaitable_attrs.records
+        for record, value in zip(records, [[1.0, 0.0], [0.8, 0.2], [0.0, 1.0]]):
+            await VectorFactory.create(record=record, vector_settings=vector_settings, value=value)
+
+        records = await _index_dataset_records(db, embedded_engine, dataset)
+
+        result = await embedded_engine.similarity_search(dataset, vector_settings, record=records[0], max_results=2)
+        assert [item.record_id for item in result.items] == [records[1].id, records[2].id]
+
+        result = await embedded_engine.similarity_search(
+            dataset, vector_settings, value=[1.0, 0.0], order=SimilarityOrder.least_similar, max_results=1
+        )
+        assert [item.record_id for item in result.items] == [records[2].id]
+
+        result = await embedded_engine.similarity_search(dataset, vector_settings, value=[1.0, 0.0], threshold=0.9)
+        assert [item.record_id for item in result.items] == [records[0].id, records[1].id]
@@ -0,0 +1,213 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+from argilla_server.enums import SimilarityOrder
+from argilla_server.models import VectorSettings
+from argilla_server.search_engine.vectors_matrix import VectorsMatrix, VectorsMatrixStore
+
+
+@pytest.fixture
+def records_ids():
+    return [uuid4() for _ in range(4)]
+
+
+@pytest.fixture
+def matrix(tmp_path, records_ids) -> VectorsMatrix:
+    matrix = VectorsMatrix(str(tmp_path), uuid4(), dimensions=2)
+    matrix.rebuild(zip(records_ids, [[1.0, 0.0], [0.8, 0.2], [0.0, 1.0], [-1.0, 0.0]]))
+
+    return matrix
+
+
+class TestVectorsMatrix:
+    def test_top_k(self, matrix: VectorsMatrix, records_ids):
+        assert [record_id for record_id, _ in matrix.top_k([1.0, 0.0], 3)] == records_ids[:3]
+        assert [score for _, score in matrix.top_k([1.0, 0.0], 4)] == pytest.approx([1.0, 0.985, 0.5, 0.0], abs=1e-3)
+
+    def test_top_k_with_least_similar_order(self, matrix: VectorsMatrix, records_ids):
+        result = matrix.top_k([1.0, 0.0], 2, order=SimilarityOrder.least_similar)
+
+        assert [record_id for record_id, _ in result] == [records_ids[3], records_ids[2]]
+
+    def test_top_k_with_candidates_and_excluded_id(self, matrix: VectorsMatrix, records_ids):
+        result = matrix.top_k(
+            [1.0, 0.0], 2, candidates_ids={records_ids[0], records_ids[2], records_ids[3]}, excluded_id=records_ids[0]
+        )
+
+        assert [record_id for record_id, _ in result] == [records_ids[2], records_ids[3]]
+
+    def test_top_k_with_several_batches(self, matrix: VectorsMatrix, records_ids):
+        assert [record_id for record_id, _ in matrix.top_k([0.0, 1.0], 2, batch_size=1)] == [
+            records_ids[2],
+            records_ids[1],
+        ]
+
+    def test_upsert(self, matrix: VectorsMatrix, records_ids):
+        new_record_id = uuid4()
+
+        matrix.upsert({records_ids[0]: [0.2, 1.0], new_record_id: [0.5, 1.0]}, version=1)
+
+        assert [record_id for record_id, _ in matrix.top_k([0.0, 1.0], 3)] == [
+            records_ids[2],
+            records_ids[0],
+            new_record_id,
+        ]
+
+    def test_upsert_without_built_matrix(self, tmp_path):
+        matrix = VectorsMatrix(str(tmp_path), uuid4(), dimensions=2)
+
+        matrix.upsert({uuid4(): [1.0, 0.0]}, version=1)
+
+        assert not matrix.exists()
+
+    def test_upsert_with_missing_versions(self, matrix: VectorsMatrix, records_ids):
+        matrix.upsert({records_ids[0]: [0.0, 1.0]}, version=2)
+
+        assert not matrix.is_current(2)
+        assert matrix.is_current(0)
+        assert matrix.top_k([0.0, 1.0], 1)[0][0] == records_ids[2]
+
+    def test_upsert_with_invalid_dimensions(self, matrix: VectorsMatrix, records_ids):
+        with pytest.raises(ValueError, match="Vector has 3 dimensions but 2 were expected"):
+            matrix.upsert({records_ids[0]: [1.0, 0.0, 0.0]}, version=1)
+
+    def test_delete(self, matrix: VectorsMatrix, records_ids):
+        matrix.delete([records_ids[0]], version=1)
+
+        assert [record_id for record_id, _ in matrix.top_k([1.0, 0.0], 4)] == records_ids[1:]
+        assert os.path.getsize(matrix.ids_path) == 4 * 16
+
+    def test_delete_compacts_matrix(self, matrix: VectorsMatrix, records_ids):
+        matrix.delete(records_ids[:3], version=1)
+
+        assert [record_id for record_id, _ in matrix.top_k([1.0, 0.0], 4)] == [records_ids[3]]
+        assert os.path.getsize(matrix.ids_path) == 16
+        assert os.path.getsize(matrix.vectors_path) == 2 * 4
+
+    def test_changes_from_other_instances_are_visible(self, tmp_path, matrix: VectorsMatrix, records_ids):
+        assert len(matrix.top_k([1.0, 0.0], 10)) == 4
+
+        other_matrix = VectorsMatrix(str(tmp_path), os.path.basename(matrix.ids_path)[:-4], dimensions=2)
+        other_matrix.delete([records_ids[1]], version=1)
+
+        assert [record_id for record_id, _ in matrix.top_k([1.0, 0.0], 10)] == [
+            records_ids[0],
+            records_ids[2],
+            records_ids[3],
+        ]
+
+    def test_build_with_already_built_matrix(self, matrix: VectorsMatrix, records_ids):
+        assert not matrix.build([(records_ids[0], [1.0, 0.0])])
+        assert len(matrix.top_k([1.0, 0.0], 10)) == len(records_ids)
+
+    def test_drop(self, matrix: VectorsMatrix):
+        matrix.drop()
+
+        assert not matrix.exists()
+        assert not os.path.exists(matrix.vectors_path)
+
+
+@pytest.mark.asyncio
+class TestVectorsMatrixStore:
+    async def test_build_with_concurrent_upsert(self, tmp_path, records_ids):
+        store = VectorsMatrixStore(str(tmp_path))
+        vector_settings = VectorSettings(id=uuid4(), dimensions=2)
+        upserting = None
+
+        async def load_vectors():
+            nonlocal upserting
+            # NOTE: A vector stored after the vectors were loaded is upserted while the matrix is being built
+            upserting = asyncio.create_task(store.upsert(vector_settings, {records_ids[1]: [0.0, 1.0]}))
+            await asyncio.sleep(0.1)
+
+            return [(records_ids[0], [1.0, 0.0])]
+
+        await store.build(vector_settings, load_vectors)
+        await upserting
+
+        assert [record_id for record_id, _ in await store.top_k(vector_settings, [0.0, 1.0], 2)] == [
+            records_ids[1],
+            records_ids[0],
+        ]
+
+    async def test_build_with_concurrent_upserts_and_busy_executor(self, tmp_path, records_ids):
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=1))
+        store = VectorsMatrixStore(str(tmp_path))
+        vector_settings = VectorSettings(id=uuid4(), dimensions=2)
+        upsertings = []
+
+        async def load_vectors():
+            upsertings.extend(
+                asyncio.create_task(store.upsert(vector_settings, {record_id: [0.0, 1.0]}))
+                for record_id in records_ids[1:]
+            )
+            await asyncio.sleep(0.1)
+
+            return [(records_ids[0], [1.0, 0.0])]
+
+        await asyncio.wait_for(store.build(vector_settings, load_vectors), timeout=5)
+        await asyncio.wait_for(asyncio.gather(*upsertings), timeout=5)
+
+        assert len(await store.top_k(vector_settings, [0.0, 1.0], 10)) == len(records_ids)
+
+    async def test_build_after_upsert_from_other_path(self, tmp_path, records_ids):
+        store = VectorsMatrixStore(str(tmp_path / "server"))
+        other_store = VectorsMatrixStore(str(tmp_path / "worker"))
+        vector_settings = VectorSettings(id=uuid4(), dimensions=2)
+        await store.rebuild(vector_settings, [(records_ids[0], [1.0, 0.0])])
+
+        # NOTE: Vectors upserted by a process not sharing the matrices path are not applied to the other matrices
+        await other_store.upsert(vector_settings, {records_ids[1]: [0.0, 1.0]})
+
+        assert not await store.is_current(vector_settings)
+
+        async def load_vectors():
+            return [(records_ids[0], [1.0, 0.0]), (records_ids[1], [0.0, 1.0])]
+
+        await store.build(vector_settings, load_vectors)
+
+        assert await store.is_current(vector_settings)
+        assert [record_id for record_id, _ in await store.top_k(vector_settings, [0.0, 1.0], 2)] == [
+            records_ids[1],
+            records_ids[0],
+        ]
+
+    async def test_upsert_from_other_store_with_the_same_path(self, tmp_path, records_ids):
+        store = VectorsMatrixStore(str(tmp_path))
+        other_store = VectorsMatrixStore(str(tmp_path))
+        vector_settings = VectorSettings(id=uuid4(), dimensions=2)
+        await store.rebuild(vector_settings, [(records_ids[0], [1.0, 0.0])])
+
+        await other_store.upsert(vector_settings, {records_ids[1]: [0.0, 1.0]})
+
+        assert await store.is_current(vector_settings)
+        assert len(await store.top_k(vector_settings, [0.0, 1.0], 2)) == 2
+
+    async def test_build_with_already_built_matrix(self, tmp_path, records_ids):
+        store = VectorsMatrixStore(str(tmp_path))
+        vector_settings = VectorSettings(id=uuid4(), dimensions=2)
+        await store.rebuild(vector_settings, [(records_ids[0], [1.0, 0.0])])
+
+        async def load_vectors():
+            raise AssertionError("Vectors of built matrices must not be loaded")
+
+        await store.build(vector_settings, load_vectors)
+
+        assert [record_id for record_id, _ in await store.top_k(vector_settings, [1.0, 0.0], 2)] == [records_ids[0]]
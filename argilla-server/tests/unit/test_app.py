@@ -26,6 +26,9 @@ from argilla_server._app import (
     _create_oauth_allowed_workspaces,
     track_server_startup,
 )
+from argilla_server.api.routes import api_v1
+from argilla_server.contexts import files
+from argilla_server.contexts.files import LocalFileStorage
 from argilla_server.models import Workspace
 from argilla_server.security.authentication.oauth2 import OAuth2Settings
 from argilla_server.security.authentication.oauth2.settings import AllowedWorkspace
@@ -68,6 +71,27 @@ class TestApp:
         assert len(app.routes) == 1
         assert cast(Mount, app.routes[0]).path == base_url
 
+    def test_create_app_with_base_url_does_not_compress_files(self, test_settings: Settings, tmp_path):
+        base_url = "/base/url"
+        settings.base_url = base_url
+
+        content = b"0123456789" * 1024
+        storage = LocalFileStorage(tmp_path)
+        storage.put_object("workspace", "pdf/document", content, content_type="application/pdf")
+        api_v1.dependency_overrides[files.get_minio_client] = lambda: storage
+
+        try:
+            client = TestClient(create_server_app())
+
+            response = client.get(f"{base_url}/api/v1/file/workspace/pdf/document", headers={"Accept-Encoding": "br"})
+        finally:
+            api_v1.dependency_overrides.pop(files.get_minio_client, None)
+
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Content-Length"] == str(len(content))
+        assert response.content == content
+
     def test_server_timing_header(self):
         client = TestClient(create_server_app())
 
@@ -12,15 +12,27 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from uuid import uuid4
+
 import pytest
 from argilla_server.api.schemas.v1.records import RecordCreate, RecordUpsert
 from argilla_server.api.schemas.v1.records_bulk import RecordsBulkCreate, RecordsBulkUpsert
+from argilla_server.contexts import accounts
 from argilla_server.errors.future import UnprocessableEntityError
 from argilla_server.models import Dataset
-from argilla_server.validators.records import RecordsBulkCreateValidator
+from argilla_server.validators.records import RecordsBulkCreateValidator, RecordsValidationPlan
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from tests.factories import DatasetFactory, RecordFactory, TextFieldFactory
+from tests.factories import (
+    DatasetFactory,
+    ImageFieldFactory,
+    IntegerMetadataPropertyFactory,
+    RecordFactory,
+    TextFieldFactory,
+    TextQuestionFactory,
+    UserFactory,
+    VectorSettingsFactory,
+)
 
 
 @pytest.mark.asyncio
@@ -95,3 +107,83 @@ class TestRecordsBulkValidators:
             match="Record at position 1 is not valid because",
         ):
             await RecordsBulkCreateValidator.validate(db, records_create, dataset)
+
+    async def test_records_bulk_create_validator_lists_responses_users_once(self, db: AsyncSession, mocker):
+        dataset = await self.configure_dataset()
+        await dataset.awaitable_attrs.questions
+        await dataset.awaitable_attrs.vectors_settings
+        user = await UserFactory.create()
+
+        list_users_by_ids_spy = mocker.spy(accounts, "list_users_by_ids")
+
+        records_create = RecordsBulkCreate(
+            items=[
+                RecordCreate(
+                    fields={"text": "hello world"},
+                    responses=[{"user_id": str(user.id), "status": "discarded"}],
+                ),
+                RecordCreate(
+                    fields={"text": "hello world"},
+                    responses=[{"user_id": str(user.id), "status": "discarded"}],
+                ),
+            ]
+        )
+
+        await RecordsBulkCreateValidator.validate(db, records_create, dataset)
+
+        list_users_by_ids_spy.assert_called_once_with(db, {user.id})
+
+    async def test_records_bulk_create_validator_with_non_existent_response_user(self, db: AsyncSession):
+        dataset = await self.configure_dataset()
+        await dataset.awaitable_attrs.questions
+        await dataset.awaitable_attrs.vectors_settings
+        user = await UserFactory.create()
+        user_id = uuid4()
+
+        records_create = RecordsBulkCreate(
+            items=[
+                RecordCreate(
+                    fields={"text": "hello world"},
+                    responses=[{"user_id": str(user.id), "status": "discarded"}],
+                ),
+                RecordCreate(
+                    fields={"text": "hello world"},
+                    responses=[{"user_id": str(user_id), "status": "discarded"}],
+                ),
+            ]
+        )
+
+        with pytest.raises(
+            UnprocessableEntityError,
+            match=f"Record at position 1 is not valid because record does not have valid responses: user with id {user_id} not found",
+        ):
+            await RecordsBulkCreateValidator.validate(db, records_create, dataset)
+
+
+@pytest.mark.asyncio
+class TestRecordsValidationPlan:
+    async def test_records_validation_plan(self):
+        dataset = await DatasetFactory.create(status="ready")
+        text_field = await TextFieldFactory.create(name="text", dataset=dataset, required=True)
+        optional_field = await TextFieldFactory.create(name="optional", dataset=dataset, required=False)
+        image_field = await ImageFieldFactory.create(name="image", dataset=dataset, required=False)
+        question = await TextQuestionFactory.create(dataset=dataset)
+        metadata_property = await IntegerMetadataPropertyFactory.create(name="age", dataset=dataset)
+        vector_settings = await VectorSettingsFactory.create(name="vector", dimensions=3, dataset=dataset)
+        await dataset.awaitable_attrs.fields
+        await dataset.awaitable_attrs.questions
+        await dataset.awaitable_attrs.metadata_properties
+        await dataset.awaitable_attrs.vectors_settings
+
+        plan = RecordsValidationPlan(dataset)
+
+        assert plan.fields_names == {text_field.name, optional_field.name, image_field.name}
+        assert plan.required_fields_names == (text_field.name,)
+        assert plan.text_fields_names == (text_field.name, optional_field.name)
+        assert plan.image_fields_names == (image_field.name,)
+        assert plan.chat_fields_names == ()
+        assert plan.custom_fields_names == ()
+        assert plan.metadata_properties_settings == {metadata_property.name: metadata_property.parsed_settings}
+        assert plan.vectors_settings == {vector_settings.name: vector_settings}
+        assert plan.questions_settings == {question.id: question.parsed_settings}
+        assert plan.users_ids is None
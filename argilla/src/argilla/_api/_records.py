@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Dict, Tuple, Union, Optional
+import json
+from typing import Iterable, List, Dict, Tuple, Union, Optional
 from uuid import UUID
 
 import httpx
@@ -82,6 +83,39 @@ class RecordsAPI(ResourceAPI[RecordModel]):
             with_suggestions: Whether to include suggestions
             with_responses: Whether to include responses
         """
+        records, _ = self.list_page(
+            dataset_id=dataset_id,
+            offset=offset,
+            limit=limit,
+            with_suggestions=with_suggestions,
+            with_responses=with_responses,
+            with_vectors=with_vectors,
+        )
+        return records
+
+    @api_error_handler
+    def list_page(
+        self,
+        dataset_id: UUID,
+        offset: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        with_suggestions: bool = True,
+        with_responses: bool = True,
+        with_vectors: Optional[Union[List, bool]] = None,
+    ) -> Tuple[List[RecordModel], Optional[str]]:
+        """List a page of records in a dataset, skipping the total count of records
+        Args:
+            dataset_id: The ID of the dataset
+            offset: The offset to start from. Cannot be used together with `cursor`
+            limit: The number of records to return
+            cursor: The cursor returned by the previous page
+            with_vectors: The name of vectors to include
+            with_suggestions: Whether to include suggestions
+            with_responses: Whether to include responses
+        Returns:
+            The records and the cursor to fetch the next page, if any
+        """
         include = []
         if with_suggestions:
             include.append("suggestions")
@@ -94,13 +128,16 @@ class RecordsAPI(ResourceAPI[RecordModel]):
             "offset": offset,
             "limit": limit,
             "include": include,
+            "include_total": False,
         }
+        if cursor is not None:
+            params["cursor"] = cursor
 
         response = self.http_client.get(f"/api/v1/datasets/{dataset_id}/records", params=params)
         response.raise_for_status()
         response_json = response.json()
         json_records = response_json["items"]
-        return self._model_from_jsons(json_records)
+        return self._model_from_jsons(json_records), response_json.get("next_cursor")
 
     @api_error_handler
     def search(
@@ -201,6 +238,26 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         )
         return self._model_from_jsons(response_jsons=response_json["items"]), updated
 
+    @api_error_handler
+    def bulk_upsert_stream(self, dataset_id: UUID, records: Iterable[RecordModel]) -> Tuple[int, int]:
+        """Upsert records streaming them as NDJSON in a single request, so there is no limit of records per request.
+        Args:
+            dataset_id: The ID of the dataset
+            records: The records to upsert, consumed lazily while the request is sent
+        Returns:
+            The number of created and updated records
+        """
+        response = self.http_client.put(
+            url=f"/api/v1/datasets/{dataset_id}/records/bulk/stream",
+            content=(f"{json.dumps(record.model_dump())}\n".encode() for record in records),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        response.raise_for_status()
+        response_json = response.json()
+        created, updated = response_json["created_items"], response_json["updated_items"]
+        self._log_message(message=f"Updated {updated} records and create {created} records in dataset {dataset_id}")
+        return created, updated
+
     ####################
     # Response methods #
     ####################
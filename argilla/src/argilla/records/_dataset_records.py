@@ -64,6 +64,7 @@ class DatasetRecordsIterator:
         self.__with_vectors = with_vectors
         self.__records_batch = []
         self.__limit = limit
+        self.__next_cursor = None
 
         if self.__limit is not None and self.__limit <= 0:
             warnings.warn(f"Limit {self.__limit} is invalid: must be greater than 0. Setting limit to 1.")
@@ -123,14 +124,18 @@ class DatasetRecordsIterator:
                 yield Record.from_model(model=record_model, dataset=self.__dataset)
 
     def _fetch_from_server_with_list(self) -> List[RecordModel]:
-        return self.__client.api.records.list(
+        # NOTE: Pages after the first one are fetched using the cursor returned by the server so deep pages are as
+        # cheap as the first one. Servers not returning a cursor keep being paginated by offset.
+        records, self.__next_cursor = self.__client.api.records.list_page(
             dataset_id=self.__dataset.id,
             limit=self.__batch_size,
-            offset=self.__offset,
+            offset=0 if self.__next_cursor else self.__offset,
+            cursor=self.__next_cursor,
             with_responses=self.__with_responses,
             with_suggestions=self.__with_suggestions,
             with_vectors=self.__with_vectors,
         )
+        return records
 
     def _fetch_from_server_with_search(self) -> List[Tuple[RecordModel, float]]:
         search_items, total = self.__client.api.records.search(
@@ -0,0 +1,48 @@
+# Copyright 2024-present, Extralit Labs, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from argilla._api._records import RecordsAPI
+from argilla._models import RecordModel
+
+
+@pytest.fixture
+def records_api():
+    http_client = MagicMock()
+    return RecordsAPI(http_client=http_client)
+
+
+def test_bulk_upsert_stream(records_api):
+    dataset_id = uuid4()
+    records = [RecordModel(fields={"text": f"text {idx}"}, external_id=str(idx)) for idx in range(3)]
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"created_items": 2, "updated_items": 1}
+    records_api.http_client.put.return_value = mock_response
+
+    created, updated = records_api.bulk_upsert_stream(dataset_id, iter(records))
+
+    assert (created, updated) == (2, 1)
+
+    call = records_api.http_client.put.call_args
+    assert call.kwargs["url"] == f"/api/v1/datasets/{dataset_id}/records/bulk/stream"
+    assert call.kwargs["headers"] == {"Content-Type": "application/x-ndjson"}
+
+    lines = b"".join(call.kwargs["content"]).decode().splitlines()
+    assert [json.loads(line) for line in lines] == [json.loads(json.dumps(record.model_dump())) for record in records]